@@ -0,0 +1,109 @@
+"""
+Archive Reference Index - Preflight check for texture paths in generated mods
+"""
+import os
+import re
+import posixpath
+
+# Every "<something>Map": "<path>" pair in a materials file (baseColorMap, normalMap, ...)
+# Matching the raw text keeps comments and trailing commas from breaking the check
+_TEXTURE_REF_PATTERN = re.compile(r'"(\w*Map)"\s*:\s*"([^"]+)"')
+
+
+def normalize_archive_path(path):
+    """
+    Normalize a path the way BeamNG resolves it inside the virtual filesystem.
+    Leading slashes are dropped, separators are unified and case is ignored.
+    Example: "/vehicles/etk800/Skin/etk800_skin_a.dds" -> "vehicles/etk800/skin/etk800_skin_a.dds"
+    """
+    return path.replace("\\", "/").lstrip("/").lower()
+
+
+class ArchiveIndex:
+    """In-memory set of every entry path written to a mod archive"""
+
+    def __init__(self, paths=None):
+        self._entries = set()
+        if paths:
+            for path in paths:
+                self.add(path)
+
+    def add(self, path):
+        self._entries.add(normalize_archive_path(path))
+
+    def __contains__(self, path):
+        return normalize_archive_path(path) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+
+def find_material_references(content):
+    """
+    Extract texture references from the raw text of a materials file.
+
+    Returns:
+        list: [(property_name, path), ...] in file order
+    """
+    return _TEXTURE_REF_PATTERN.findall(content)
+
+
+def resolve_material_references(mod_root, archive_index, install_index=None):
+    """
+    Resolve every texture path referenced by every materials file in a built mod.
+
+    A reference resolves if it exists in the mod archive or in the BeamNG install.
+    Without an install index only references into the skin's own folder can be
+    checked, since those must ship inside the mod.
+
+    Args:
+        mod_root: Root directory the archive was built from
+        archive_index: ArchiveIndex of the entries written to the archive
+        install_index: Optional container of normalized game content paths
+
+    Returns:
+        dict: {(car_id, skin_folder): [(materials_file, property_name, path), ...]}
+              Only skins with broken references are included.
+    """
+    broken = {}
+    vehicles_path = os.path.join(mod_root, "vehicles")
+
+    if not os.path.exists(vehicles_path):
+        return broken
+
+    for root_dir, _, files in os.walk(vehicles_path):
+        for filename in files:
+            if not (filename.endswith('.materials.json') or filename == 'materials.json'):
+                continue
+
+            file_path = os.path.join(root_dir, filename)
+            rel_file = os.path.relpath(file_path, mod_root).replace(os.sep, "/")
+            parts = rel_file.split("/")
+            skin_key = (parts[1], parts[2]) if len(parts) >= 4 else (parts[1], "")
+            skin_prefix = normalize_archive_path(posixpath.dirname(rel_file)) + "/"
+
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+            except Exception as e:
+                print(f"[WARNING] Could not read {rel_file} for reference check: {e}")
+                continue
+
+            for prop_name, ref_path in find_material_references(content):
+                normalized = normalize_archive_path(ref_path)
+
+                if normalized in archive_index:
+                    continue
+
+                if install_index is not None:
+                    if normalized in install_index:
+                        continue
+                elif not normalized.startswith(skin_prefix):
+                    continue
+
+                broken.setdefault(skin_key, []).append((rel_file, prop_name, ref_path))
+
+    return broken
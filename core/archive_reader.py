@@ -0,0 +1,444 @@
+"""
+Archive Reader - Memory-mapped random access to large game archives
+
+zipfile re-reads an archive's central directory every time a ZipFile is
+opened, which adds up when single files are pulled out of 500 MB vehicle zips
+over and over. MappedArchive memory-maps the file and parses the central
+directory once; stored members are returned as zero-copy memoryviews into the
+mapping and deflated members are inflated in a streaming fashion straight from
+it. ArchivePool keeps mapped archives open per process with an LRU cap on open
+files, reopens an archive when it changes on disk and leases archives out so
+an evicted one stays open until its last holder releases it.
+"""
+import mmap
+import os
+import struct
+import threading
+import zipfile
+import zlib
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+
+ArchiveEntry = namedtuple("ArchiveEntry", "name method flags crc compressed_size file_size header_offset")
+
+_EOCD = struct.Struct("<4sHHHHIIH")
+_EOCD64_LOCATOR = struct.Struct("<4sIQI")
+_EOCD64 = struct.Struct("<4sQHHIIQQQQ")
+_CENTRAL_HEADER = struct.Struct("<4sHHHHHHIIIHHHHHII")
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_EOCD64_SIGNATURE = b"PK\x06\x06"
+_CENTRAL_SIGNATURE = b"PK\x01\x02"
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+
+_ZIP64_EXTRA_ID = 0x0001
+_FLAG_ENCRYPTED = 0x1
+_FLAG_UTF8 = 0x800
+
+STORED = zipfile.ZIP_STORED
+DEFLATED = zipfile.ZIP_DEFLATED
+
+INFLATE_CHUNK = 256 * 1024
+
+
+def _parse_zip64_extra(extra, file_size, compressed_size, header_offset):
+    """Replace 0xFFFFFFFF placeholders with values from the ZIP64 extra field"""
+    pos = 0
+    while pos + 4 <= len(extra):
+        header_id, size = struct.unpack_from("<HH", extra, pos)
+        if header_id == _ZIP64_EXTRA_ID:
+            values = iter(struct.unpack_from(f"<{size // 8}Q", extra, pos + 4))
+            if file_size == 0xFFFFFFFF:
+                file_size = next(values)
+            if compressed_size == 0xFFFFFFFF:
+                compressed_size = next(values)
+            if header_offset == 0xFFFFFFFF:
+                header_offset = next(values)
+            break
+        pos += 4 + size
+    return file_size, compressed_size, header_offset
+
+
+class MemberReader:
+    """Streaming, file-like reader for one member (inflates deflated data chunk by chunk)"""
+
+    def __init__(self, view, entry):
+        self._view = view
+        self._entry = entry
+        self._pos = 0
+        self._crc = 0
+        self._inflater = zlib.decompressobj(-15) if entry.method == DEFLATED else None
+        self._pending = b""
+        self._produced = 0
+        self._done = False
+
+    def _check_crc(self):
+        if (self._crc & 0xFFFFFFFF) != self._entry.crc:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {self._entry.name!r}")
+
+    def _read_stored(self, size):
+        end = len(self._view) if size < 0 else min(len(self._view), self._pos + size)
+        data = bytes(self._view[self._pos:end])
+        self._pos = end
+        self._crc = zlib.crc32(data, self._crc)
+        if self._pos >= len(self._view) and not self._done:
+            self._done = True
+            self._check_crc()
+        return data
+
+    def _read_deflated(self, size):
+        want = self._entry.file_size - self._produced if size < 0 else size
+        parts = []
+        have = 0
+        if self._pending:
+            chunk, self._pending = self._pending[:want], self._pending[want:]
+            parts.append(chunk)
+            have += len(chunk)
+
+        while have < want and not self._done:
+            if self._inflater.unconsumed_tail:
+                source = self._inflater.unconsumed_tail
+            elif self._pos < len(self._view):
+                source = self._view[self._pos:self._pos + INFLATE_CHUNK]
+                self._pos += len(source)
+            else:
+                source = None
+
+            if source is None:
+                chunk = self._inflater.flush()
+                self._done = True
+            else:
+                chunk = self._inflater.decompress(source, max(want - have, INFLATE_CHUNK))
+                if self._inflater.eof:
+                    self._done = True
+
+            if have + len(chunk) > want:
+                self._pending = chunk[want - have:]
+                chunk = chunk[:want - have]
+            parts.append(chunk)
+            have += len(chunk)
+
+        data = b"".join(parts)
+        self._crc = zlib.crc32(data, self._crc)
+        self._produced += len(data)
+        if self._done and not self._pending and self._produced >= self._entry.file_size:
+            self._check_crc()
+        return data
+
+    def read(self, size=-1):
+        if size == 0:
+            return b""
+        if self._inflater is None:
+            return self._read_stored(size)
+        return self._read_deflated(size)
+
+    def close(self):
+        self._view = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MappedArchive:
+    """A zip whose central directory is parsed once and whose data is read from a buffer"""
+
+    def __init__(self, buffer, name="", owner=None):
+        """
+        Args:
+            buffer: Object supporting the buffer protocol (an mmap, bytes or memoryview)
+            name: Path or spec used in error messages
+            owner: Object keeping the buffer alive (file/mmap), closed with the archive
+        """
+        self.name = name
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._owner = owner
+        self._data_offsets = {}
+        self._entries = self._read_central_directory()
+
+    @classmethod
+    def from_file(cls, path):
+        """Memory-map an archive on disk"""
+        f = open(path, "rb")
+        try:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise zipfile.BadZipFile(f"File is empty: {path}")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            f.close()
+            raise
+        try:
+            return cls(mapped, path, owner=(mapped, f))
+        except BaseException:
+            mapped.close()
+            f.close()
+            raise
+
+    def _read_central_directory(self):
+        view = self._view
+        size = len(view)
+        tail_start = max(0, size - _EOCD.size - 0xFFFF)
+        eocd_pos = bytes(view[tail_start:]).rfind(_EOCD_SIGNATURE)
+        if eocd_pos < 0:
+            raise zipfile.BadZipFile(f"File is not a zip file: {self.name}")
+        eocd_pos += tail_start
+
+        _, _, _, _, count, cd_size, cd_offset, _ = _EOCD.unpack_from(view, eocd_pos)
+        eocd_start = eocd_pos
+
+        locator_pos = eocd_pos - _EOCD64_LOCATOR.size
+        if locator_pos >= 0 and view[locator_pos:locator_pos + 4] == _EOCD64_LOCATOR_SIGNATURE:
+            _, _, eocd64_offset, _ = _EOCD64_LOCATOR.unpack_from(view, locator_pos)
+            eocd64_pos = locator_pos - _EOCD64.size
+            if eocd64_pos >= 0 and view[eocd64_pos:eocd64_pos + 4] == _EOCD64_SIGNATURE:
+                (_, _, _, _, _, _, _, count, cd_size, cd_offset) = _EOCD64.unpack_from(view, eocd64_pos)
+                eocd_start = eocd64_pos
+
+        # Data prepended to the archive (self-extractors) shifts every offset
+        concat = eocd_start - cd_size - cd_offset
+        if concat < 0:
+            raise zipfile.BadZipFile(f"Bad central directory offset: {self.name}")
+
+        entries = {}
+        pos = cd_offset + concat
+        for _ in range(count):
+            if view[pos:pos + 4] != _CENTRAL_SIGNATURE:
+                raise zipfile.BadZipFile(f"Bad central directory entry in {self.name}")
+            (_, _, _, flags, method, _, _, crc, compressed_size, file_size,
+             name_len, extra_len, comment_len, _, _, _, header_offset) = _CENTRAL_HEADER.unpack_from(view, pos)
+
+            name_start = pos + _CENTRAL_HEADER.size
+            raw_name = bytes(view[name_start:name_start + name_len])
+            name = raw_name.decode("utf-8" if flags & _FLAG_UTF8 else "cp437")
+
+            if 0xFFFFFFFF in (file_size, compressed_size, header_offset):
+                extra = bytes(view[name_start + name_len:name_start + name_len + extra_len])
+                file_size, compressed_size, header_offset = _parse_zip64_extra(
+                    extra, file_size, compressed_size, header_offset)
+
+            if not name.endswith("/"):
+                entries[name] = ArchiveEntry(name, method, flags, crc, compressed_size,
+                                             file_size, header_offset + concat)
+            pos = name_start + name_len + extra_len + comment_len
+
+        return entries
+
+    # -------------------------------------------------------------------------
+    # Listing
+    # -------------------------------------------------------------------------
+
+    def names(self):
+        return list(self._entries)
+
+    def entries(self):
+        return list(self._entries.values())
+
+    def getinfo(self, name):
+        """
+        Raises:
+            KeyError: if the member does not exist
+        """
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(f"There is no item named {name!r} in the archive") from None
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def _raw_view(self, entry):
+        """The member's (possibly compressed) bytes as a view into the buffer"""
+        start = self._data_offsets.get(entry.name)
+        if start is None:
+            pos = entry.header_offset
+            if self._view[pos:pos + 4] != _LOCAL_SIGNATURE:
+                raise zipfile.BadZipFile(f"Bad local header for {entry.name!r} in {self.name}")
+            header = _LOCAL_HEADER.unpack_from(self._view, pos)
+            start = pos + _LOCAL_HEADER.size + header[9] + header[10]
+            self._data_offsets[entry.name] = start
+        return self._view[start:start + entry.compressed_size]
+
+    def _check_readable(self, entry):
+        if entry.flags & _FLAG_ENCRYPTED:
+            raise NotImplementedError(f"{entry.name!r} is encrypted")
+        if entry.method not in (STORED, DEFLATED):
+            raise NotImplementedError(f"Compression method {entry.method} is not supported for {entry.name!r}")
+
+    def read_view(self, name):
+        """
+        A member's content without copying when possible: stored members are
+        memoryviews into the mapping, deflated members are inflated into bytes.
+        Views stay valid until the archive is closed.
+        """
+        entry = self.getinfo(name)
+        self._check_readable(entry)
+        raw = self._raw_view(entry)
+        if entry.method == STORED:
+            return raw
+        return zlib.decompress(raw, -15, entry.file_size or zlib.DEF_BUF_SIZE)
+
+    def read(self, name):
+        """A member's content as bytes (CRC checked)"""
+        data = bytes(self.read_view(name))
+        if zlib.crc32(data) & 0xFFFFFFFF != self.getinfo(name).crc:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {name!r}")
+        return data
+
+    def open(self, name):
+        """A streaming reader for a member (see MemberReader)"""
+        entry = self.getinfo(name)
+        self._check_readable(entry)
+        return MemberReader(self._raw_view(entry), entry)
+
+    def open_nested(self, name, spec=None):
+        """
+        Open a zip stored inside this one. Stored inner archives are read in
+        place from the mapping; deflated ones are inflated into memory.
+        """
+        return MappedArchive(self.read_view(name), spec or f"{self.name}::{name}")
+
+    def close(self):
+        """Release the mapping (fails with BufferError while member views are still in use)"""
+        if self._owner is not None:
+            self._view.release()
+            mapped, f = self._owner
+            mapped.close()
+            f.close()
+            self._owner = None
+
+
+class _PooledArchive:
+    """Pool bookkeeping for one mapped archive"""
+
+    __slots__ = ("archive", "stamp", "leases", "evicted")
+
+    def __init__(self, archive, stamp):
+        self.archive = archive
+        self.stamp = stamp
+        self.leases = 0
+        self.evicted = False
+
+
+class ArchivePool:
+    """
+    Process-wide pool of mapped archives with an LRU cap on open files.
+
+    Archives are leased: acquire() hands one out and release() gives it back.
+    Evicting a leased archive (LRU cap or a newer version on disk) only drops
+    it from the pool; it is closed once the last lease is released, so a
+    holder can keep reading while other threads open more archives.
+    """
+
+    def __init__(self, max_open=16):
+        self.max_open = max_open
+        # path -> _PooledArchive for the current version of each open archive
+        self._archives = OrderedDict()
+        # id(archive) -> _PooledArchive for every archive that is open (cached or evicted but leased)
+        self._open = {}
+        self._retired = []
+        self._lock = threading.Lock()
+
+    def _close(self, pooled):
+        """Close an evicted archive with no leases left (lock held)"""
+        self._open.pop(id(pooled.archive), None)
+        try:
+            pooled.archive.close()
+        except BufferError:
+            # A caller still holds a member view; try again on a later acquire
+            self._retired.append(pooled.archive)
+
+    def _evict(self, pooled):
+        pooled.evicted = True
+        if pooled.leases == 0:
+            self._close(pooled)
+
+    def acquire(self, path):
+        """
+        Lease the mapped archive for a path, opened (or reopened if changed on
+        disk) as needed. Every acquire() needs a matching release().
+
+        Raises:
+            OSError, zipfile.BadZipFile
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            cached = self._archives.get(key)
+            if cached is not None and cached.stamp == stamp:
+                self._archives.move_to_end(key)
+                cached.leases += 1
+                return cached.archive
+
+        archive = MappedArchive.from_file(key)
+        pooled = _PooledArchive(archive, stamp)
+        pooled.leases = 1
+
+        with self._lock:
+            previous = self._archives.pop(key, None)
+            if previous is not None:
+                self._evict(previous)
+            self._archives[key] = pooled
+            self._open[id(archive)] = pooled
+
+            while len(self._archives) > self.max_open:
+                _, evicted = self._archives.popitem(last=False)
+                self._evict(evicted)
+
+            still_retired = []
+            for retired in self._retired:
+                try:
+                    retired.close()
+                except BufferError:
+                    still_retired.append(retired)
+            self._retired = still_retired
+
+        return archive
+
+    def release(self, archive):
+        """Return a lease taken with acquire(); closes the archive if it was evicted meanwhile"""
+        with self._lock:
+            pooled = self._open.get(id(archive))
+            if pooled is None or pooled.archive is not archive:
+                return
+            pooled.leases = max(0, pooled.leases - 1)
+            if pooled.leases == 0 and pooled.evicted:
+                self._close(pooled)
+
+    @contextmanager
+    def lease(self, path):
+        """acquire() / release() around a with block"""
+        archive = self.acquire(path)
+        try:
+            yield archive
+        finally:
+            self.release(archive)
+
+    def close_all(self):
+        with self._lock:
+            archives = [pooled.archive for pooled in self._open.values()] + self._retired
+            self._archives.clear()
+            self._open.clear()
+            self._retired = []
+        for archive in archives:
+            try:
+                archive.close()
+            except BufferError:
+                pass
+
+
+# Shared by every code path that reads from the game install
+archive_pool = ArchivePool()
@@ -0,0 +1,279 @@
+"""
+Content Index - Persistent central-directory index of BeamNG content zips
+
+Reading a zip's central directory is cheap compared to scanning or reopening
+multi-hundred-MB archives over and over. ContentIndex records, for every zip
+under the BeamNG install's content folder, each entry's name, uncompressed
+size, CRC-32 and local header offset. The index is stored compactly on disk
+(gzip-compressed JSON columns) and an archive is re-read only when its size or
+modification time changes.
+"""
+import gzip
+import json
+import os
+import threading
+import zipfile
+from collections import namedtuple
+
+from core.archive_index import normalize_archive_path
+from core.archive_reader import archive_pool
+
+CONTENT_INDEX_FILE = os.path.join("cache", "content_index.json.gz")
+CONTENT_INDEX_VERSION = 1
+
+ZipEntry = namedtuple("ZipEntry", "name size crc offset")
+
+
+class _ArchiveRecord:
+    """Central directory of one archive, stored as parallel columns"""
+
+    __slots__ = ("size", "mtime_ns", "names", "sizes", "crcs", "offsets")
+
+    def __init__(self, size, mtime_ns, names, sizes, crcs, offsets):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.names = names
+        self.sizes = sizes
+        self.crcs = crcs
+        self.offsets = offsets
+
+    @classmethod
+    def read(cls, zip_path, stat):
+        with archive_pool.lease(zip_path) as archive:
+            entries = archive.entries()
+        return cls(
+            stat.st_size,
+            stat.st_mtime_ns,
+            [entry.name for entry in entries],
+            [entry.file_size for entry in entries],
+            [entry.crc for entry in entries],
+            [entry.header_offset for entry in entries],
+        )
+
+    def is_current(self, stat):
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+    def entries(self):
+        return [ZipEntry(*row) for row in zip(self.names, self.sizes, self.crcs, self.offsets)]
+
+    def to_dict(self):
+        return {
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "names": self.names,
+            "sizes": self.sizes,
+            "crcs": self.crcs,
+            "offsets": self.offsets,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["size"], data["mtime_ns"], data["names"], data["sizes"], data["crcs"], data["offsets"])
+
+
+class ContentIndex:
+    """
+    Index of every zip under a BeamNG content folder.
+
+    Lookups for a single archive (names(), entries()) index that archive on
+    demand if it is missing or stale, so callers never see outdated listings.
+    """
+
+    def __init__(self, cache_path=CONTENT_INDEX_FILE):
+        self.cache_path = cache_path
+        self._archives = {}
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._dirty = False
+        self._install_paths = None
+        self._refresh_thread = None
+        self.ready = False
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def load(self):
+        """Load the on-disk index (missing or incompatible files start empty)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+            if not os.path.exists(self.cache_path):
+                return
+
+            try:
+                with gzip.open(self.cache_path, "rt", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != CONTENT_INDEX_VERSION:
+                    print(f"[DEBUG] Content index version changed, rebuilding")
+                    return
+                self._archives = {path: _ArchiveRecord.from_dict(record)
+                                  for path, record in data.get("archives", {}).items()}
+                print(f"[DEBUG] Loaded content index: {len(self._archives)} archives")
+            except Exception as e:
+                print(f"[WARNING] Could not read content index, rebuilding: {e}")
+                self._archives = {}
+
+    def save(self):
+        """Write the index atomically if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": CONTENT_INDEX_VERSION,
+                "archives": {path: record.to_dict() for path, record in self._archives.items()},
+            }
+            self._dirty = False
+
+        try:
+            folder = os.path.dirname(self.cache_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            temp_path = self.cache_path + ".tmp"
+            with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, self.cache_path)
+            print(f"[DEBUG] Saved content index: {len(data['archives'])} archives")
+        except Exception as e:
+            print(f"[WARNING] Could not save content index: {e}")
+
+    # -------------------------------------------------------------------------
+    # Indexing
+    # -------------------------------------------------------------------------
+
+    def _record(self, zip_path):
+        """Return an up-to-date record for one archive, re-reading it only if stale"""
+        self.load()
+        key = os.path.abspath(zip_path)
+        stat = os.stat(key)
+
+        with self._lock:
+            record = self._archives.get(key)
+            if record is not None and record.is_current(stat):
+                return record
+
+        record = _ArchiveRecord.read(key, stat)
+
+        with self._lock:
+            self._archives[key] = record
+            self._dirty = True
+            self._install_paths = None
+        return record
+
+    def refresh(self, content_root, cancel_event=None, progress_callback=None):
+        """
+        Bring the index up to date for every zip under content_root.
+
+        Args:
+            content_root: "<BeamNG install>/content"
+            cancel_event: Optional threading.Event to stop early
+            progress_callback: Optional callable(done, total)
+
+        Returns:
+            int: Number of archives that had to be (re)read
+        """
+        self.load()
+
+        zip_paths = []
+        for root_dir, _, files in os.walk(content_root):
+            for filename in files:
+                if filename.lower().endswith(".zip"):
+                    zip_paths.append(os.path.abspath(os.path.join(root_dir, filename)))
+
+        reread = 0
+        for done, zip_path in enumerate(zip_paths, 1):
+            if cancel_event is not None and cancel_event.is_set():
+                print(f"[DEBUG] Content index refresh cancelled")
+                break
+            try:
+                with self._lock:
+                    before = self._archives.get(zip_path)
+                if self._record(zip_path) is not before:
+                    reread += 1
+            except (OSError, zipfile.BadZipFile) as e:
+                print(f"[WARNING] Could not index {zip_path}: {e}")
+            if progress_callback:
+                progress_callback(done, len(zip_paths))
+        else:
+            # Forget archives that no longer exist under this root
+            root_key = os.path.abspath(content_root)
+            present = set(zip_paths)
+            with self._lock:
+                for stale in [p for p in self._archives if p.startswith(root_key) and p not in present]:
+                    del self._archives[stale]
+                    self._dirty = True
+                    self._install_paths = None
+                self.ready = True
+
+        self.save()
+        print(f"[DEBUG] Content index refreshed: {len(zip_paths)} archives, {reread} re-read")
+        return reread
+
+    def start_background_refresh(self, beamng_install, on_complete=None):
+        """
+        Refresh the index for an install in a daemon thread.
+
+        Args:
+            beamng_install: BeamNG.drive installation folder
+            on_complete: Optional callable(reread_count), called from the worker thread
+        """
+        content_root = os.path.join(beamng_install, "content")
+        if not beamng_install or not os.path.isdir(content_root):
+            print(f"[DEBUG] Content index: no content folder at {content_root}, skipping")
+            return None
+
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return self._refresh_thread
+
+        def worker():
+            try:
+                reread = self.refresh(content_root)
+            except Exception as e:
+                print(f"[ERROR] Content index refresh failed: {e}")
+                reread = 0
+            if on_complete:
+                on_complete(reread)
+
+        self._refresh_thread = threading.Thread(target=worker, daemon=True, name="ContentIndexRefresh")
+        self._refresh_thread.start()
+        return self._refresh_thread
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def names(self, zip_path):
+        """All file entry names in an archive (indexes it first if needed)"""
+        return self._record(zip_path).names
+
+    def entries(self, zip_path):
+        """All file entries of an archive as ZipEntry(name, size, crc, offset)"""
+        return self._record(zip_path).entries()
+
+    def find(self, zip_path, predicate):
+        """Names in an archive for which predicate(name) is true"""
+        return [name for name in self.names(zip_path) if predicate(name)]
+
+    def archives(self):
+        """Paths of every indexed archive"""
+        with self._lock:
+            return list(self._archives)
+
+    def install_paths(self):
+        """
+        Set of normalized entry paths across all indexed archives.
+        Suitable as the install_index for core.archive_index.resolve_material_references.
+        """
+        with self._lock:
+            if self._install_paths is None:
+                paths = set()
+                for record in self._archives.values():
+                    paths.update(normalize_archive_path(name) for name in record.names)
+                self._install_paths = paths
+            return self._install_paths
+
+
+# Shared instance used by the UI
+content_index = ContentIndex()
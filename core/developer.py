@@ -2,19 +2,27 @@
 Core Developer Module - Vehicle File Processing
 """
 import os
+import re
 import shutil
-from typing import Optional
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional
 
 from utils.file_ops import (
     create_vehicle_folders,
     delete_vehicle_folders,
     edit_material_json,
+    edit_material_json_content,
     edit_jbeam_material,
     add_vehicle_to_json,
     remove_vehicle_from_json,
     VEHICLE_FOLDER
 )
 
+# added_vehicles.json is read-modify-written; parallel imports must not interleave
+_added_vehicles_lock = threading.Lock()
+
 
 def process_custom_vehicle(
     carid: str,
@@ -152,6 +160,215 @@ def process_custom_vehicle(
         return False
 
 
+def _select_stock_members(carid: str, names: list, read: Callable[[str], bytes]) -> Dict[str, Optional[str]]:
+    """
+    Pick the members needed for a template from a vehicle source listing.
+
+    Returns:
+        dict: {"materials": member or None, "jbeam": member or None,
+               "info": member or None, "image": member or None}
+    """
+    vehicle_dir = f"vehicles/{carid}/"
+    skin_ref_pattern = re.compile(rf'"{re.escape(carid)}(?:_\w+)?\.skin')
+
+    materials_candidates = [n for n in names if n.startswith(vehicle_dir)
+                            and (n.endswith(".materials.json") or n.endswith("/materials.json"))]
+    jbeam_candidates = [n for n in names if n.startswith(vehicle_dir) and n.endswith(".jbeam")]
+
+    # The materials file with the most skin entries is the skin materials file
+    best_materials, best_count = None, 0
+    for member in sorted(materials_candidates, key=lambda n: "skin" not in os.path.basename(n)):
+        count = len(skin_ref_pattern.findall(read(member).decode("utf-8", errors="replace")))
+        if count > best_count:
+            best_materials, best_count = member, count
+
+    # Only the name of the skin jbeam is used; prefer files that define paint designs
+    best_jbeam = None
+    for member in sorted(jbeam_candidates, key=lambda n: "skin" not in os.path.basename(n)):
+        if b"paint_design" in read(member):
+            best_jbeam = member
+            break
+
+    info = f"{vehicle_dir}info.json"
+    image = next((f"{vehicle_dir}{name}" for name in ("default.jpg", "default.jpeg")
+                  if f"{vehicle_dir}{name}" in names), None)
+
+    return {
+        "materials": best_materials,
+        "jbeam": best_jbeam,
+        "info": info if info in names else None,
+        "image": image,
+    }
+
+
+def _read_stock_vehicle_name(carid: str, info_bytes: bytes) -> str:
+    """Display name from a vehicle's info.json ("Brand Name"), falling back to the car ID"""
+    from core.materials_writer import parse_relaxed_json
+    from core.vehicle_discovery import vehicle_display_name
+
+    try:
+        return vehicle_display_name(carid, parse_relaxed_json(info_bytes.decode("utf-8", errors="replace")))
+    except Exception as e:
+        print(f"[WARNING] Could not read info.json for {carid}: {e}")
+    return carid
+
+
+def _find_vehicle_source(carid: str, beamng_install: str) -> Optional[str]:
+    """Source spec for a vehicle: its install archive, else wherever discovery found it"""
+    from core.vehicle_discovery import vehicle_discovery
+
+    zip_path = os.path.join(beamng_install, "content", "vehicles", f"{carid}.zip") if beamng_install else ""
+    if zip_path and os.path.exists(zip_path):
+        return zip_path
+
+    info = vehicle_discovery.vehicles().get(carid)
+    return info.source if info else None
+
+
+def import_stock_vehicle(
+    carid: str,
+    beamng_install: str,
+    carname: Optional[str] = None,
+    register: bool = True,
+    source_spec: Optional[str] = None
+) -> bool:
+    """
+    Build the SKINNAME template for a vehicle straight from its game or mod files.
+
+    The source is content/vehicles/<carid>.zip, or for modded cars the zip,
+    unpacked folder or nested zip vehicle discovery found them in. Members are
+    read into memory; nothing is extracted to disk. The template is built in a
+    staging folder and only replaces vehicles/<carid>/SKINNAME once it
+    succeeded, so re-importing a vehicle after a game update never leaves a
+    half-written template behind.
+
+    Args:
+        carid: Vehicle ID
+        beamng_install: BeamNG.drive installation folder
+        carname: Display name (defaults to Brand + Name from info.json)
+        register: Add the vehicle to added_vehicles.json if it is not built in
+        source_spec: Explicit source (see core.vehicle_sources); looked up if omitted
+
+    Returns:
+        True if successful, False otherwise
+    """
+    from core.config import VEHICLE_IDS
+    from core.vehicle_sources import open_source
+
+    print(f"[DEBUG] import_stock_vehicle called: {carid}")
+
+    source_spec = source_spec or _find_vehicle_source(carid, beamng_install)
+    if not source_spec:
+        print(f"[ERROR] No game archive or discovered mod contains vehicle '{carid}'")
+        return False
+
+    staging_folder = tempfile.mkdtemp(prefix=f"import_{carid}_")
+
+    try:
+        with open_source(source_spec) as source:
+            members = _select_stock_members(carid, source.names(), source.read)
+
+            if not members["materials"]:
+                print(f"[ERROR] No skin materials found for {carid} in {os.path.basename(source_spec)}")
+                return False
+
+            materials_text = source.read(members["materials"]).decode("utf-8", errors="replace")
+            info_bytes = source.read(members["info"]) if members["info"] else b""
+            image_bytes = source.read(members["image"]) if members["image"] else None
+
+        print(f"[DEBUG]   Materials: {members['materials']}")
+        print(f"[DEBUG]   JBeam: {members['jbeam']}")
+
+        skinname_folder = os.path.join(VEHICLE_FOLDER, carid, "SKINNAME")
+
+        # Keep the existing file names so a rebuild replaces them instead of adding second copies
+        output_name = None
+        jbeam_name = os.path.basename(members["jbeam"]) if members["jbeam"] else f"{carid}.jbeam"
+        if os.path.isdir(skinname_folder):
+            existing_files = os.listdir(skinname_folder)
+            for existing in ("skin.materials.json", "materials.json"):
+                if existing in existing_files:
+                    output_name = existing
+                    break
+            jbeam_name = next((f for f in existing_files if f.endswith(".jbeam")), jbeam_name)
+
+        edit_material_json_content(
+            materials_text,
+            os.path.basename(members["materials"]),
+            staging_folder,
+            carid,
+            output_name=output_name
+        )
+        edit_jbeam_material(jbeam_name, staging_folder, carid)
+
+        create_vehicle_folders(carid)
+        for filename in os.listdir(staging_folder):
+            shutil.copy2(os.path.join(staging_folder, filename), os.path.join(skinname_folder, filename))
+        print(f"[DEBUG]   ✓ Template written to {skinname_folder}")
+
+        if image_bytes:
+            preview_folder = os.path.join("imagesforgui", "vehicles", carid)
+            image_target = os.path.join(preview_folder, "default.jpg")
+            if not os.path.exists(image_target):
+                os.makedirs(preview_folder, exist_ok=True)
+                with open(image_target, "wb") as f:
+                    f.write(image_bytes)
+                print(f"[DEBUG]   ✓ Preview image written to {image_target}")
+
+        if register and carid not in VEHICLE_IDS:
+            with _added_vehicles_lock:
+                add_vehicle_to_json(carid, carname or _read_stock_vehicle_name(carid, info_bytes))
+
+        print(f"[DEBUG] ✓ Imported {carid} from {source_spec}")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to import {carid} from {source_spec}: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        shutil.rmtree(staging_folder, ignore_errors=True)
+
+
+def import_stock_vehicles(
+    carids: Iterable[str],
+    beamng_install: str,
+    max_workers: int = 4,
+    progress_callback: Optional[Callable[[str, bool, int, int], None]] = None
+) -> Dict[str, bool]:
+    """
+    Import many vehicles from the game archives in parallel
+    (e.g. to rebuild every template after a game update).
+
+    Args:
+        carids: Vehicle IDs to import
+        beamng_install: BeamNG.drive installation folder
+        max_workers: Thread pool size
+        progress_callback: Optional callable(carid, success, done, total), called from worker threads
+
+    Returns:
+        dict: {carid: success}
+    """
+    carids = list(dict.fromkeys(carids))
+    results = {}
+    results_lock = threading.Lock()
+
+    def run(carid):
+        success = import_stock_vehicle(carid, beamng_install)
+        with results_lock:
+            results[carid] = success
+            done = len(results)
+        if progress_callback:
+            progress_callback(carid, success, done, len(carids))
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="VehicleImport") as pool:
+        list(pool.map(run, carids))
+
+    print(f"[DEBUG] Imported {sum(results.values())}/{len(carids)} vehicles from game archives")
+    return results
+
+
 def delete_custom_vehicle(carid: str) -> bool:
     """
     Delete a custom vehicle and all its files
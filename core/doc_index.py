@@ -0,0 +1,146 @@
+"""
+Doc Index - Inverted word index over documentation chapters
+
+Each chapter is split into lines and tokenized once. Words map to the
+(chapter, line) pairs they occur on, so a search touches only the postings
+of the query's words instead of lowercasing and scanning every chapter.
+Query words match as prefixes ("tex" finds "texture", "textures"); a line
+matches when it contains every query word. Results carry the matching lines
+as snippets with the character spans to highlight.
+"""
+import bisect
+import re
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Set, Tuple
+
+_WORD = re.compile(r"\w+")
+
+SNIPPET_WIDTH = 140
+
+
+class Snippet(NamedTuple):
+    line: int                      # line number in the chapter content (0-based)
+    text: str                      # the line, trimmed to SNIPPET_WIDTH around the first match
+    spans: List[Tuple[int, int]]   # (start, end) of each match within text
+
+
+class DocHit(NamedTuple):
+    doc_id: Hashable
+    score: int                     # number of matching lines
+    snippets: List[Snippet]
+
+
+def tokenize(text: str) -> List[str]:
+    return [word.lower() for word in _WORD.findall(text)]
+
+
+class DocIndex:
+    """word -> {(doc_id, line)} postings with a sorted vocabulary for prefix lookup"""
+
+    def __init__(self):
+        self._lines: Dict[Hashable, List[str]] = {}
+        self._postings: Dict[str, Set[Tuple[Hashable, int]]] = {}
+        self._vocabulary: List[str] = []
+
+    def __len__(self):
+        return len(self._lines)
+
+    def build(self, documents: Iterable[Tuple[Hashable, str]]):
+        """
+        Index documents, replacing the previous contents.
+
+        Args:
+            documents: Iterable of (doc_id, text)
+        """
+        self._lines.clear()
+        self._postings.clear()
+        for doc_id, text in documents:
+            lines = text.split("\n")
+            self._lines[doc_id] = lines
+            for line_no, line in enumerate(lines):
+                for word in set(tokenize(line)):
+                    self._postings.setdefault(word, set()).add((doc_id, line_no))
+        self._vocabulary = sorted(self._postings)
+
+    def _prefix_postings(self, prefix: str) -> Set[Tuple[Hashable, int]]:
+        found = set()
+        index = bisect.bisect_left(self._vocabulary, prefix)
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(prefix):
+            found |= self._postings[self._vocabulary[index]]
+            index += 1
+        return found
+
+    def matching_lines(self, query: str) -> Dict[Hashable, List[int]]:
+        """{doc_id: sorted line numbers} of lines containing every query word"""
+        words = tokenize(query)
+        if not words:
+            return {}
+        # Rarest prefix first keeps the intersections small
+        postings = sorted((self._prefix_postings(word) for word in set(words)), key=len)
+        lines = set(postings[0])
+        for posting in postings[1:]:
+            lines &= posting
+            if not lines:
+                break
+
+        by_doc: Dict[Hashable, List[int]] = {}
+        for doc_id, line_no in lines:
+            by_doc.setdefault(doc_id, []).append(line_no)
+        for line_numbers in by_doc.values():
+            line_numbers.sort()
+        return by_doc
+
+    @staticmethod
+    def match_spans(text: str, query: str) -> List[Tuple[int, int]]:
+        """Spans of the words in text that start with one of the query words"""
+        words = set(tokenize(query))
+        spans = []
+        for match in _WORD.finditer(text):
+            lowered = match.group().lower()
+            for word in words:
+                if lowered.startswith(word):
+                    spans.append((match.start(), match.start() + len(word)))
+                    break
+        return spans
+
+    def document_spans(self, doc_id: Hashable, query: str) -> List[Tuple[int, int]]:
+        """Match spans as offsets into the whole text the document was built from"""
+        line_numbers = self.matching_lines(query).get(doc_id)
+        if not line_numbers:
+            return []
+        lines = self._lines[doc_id]
+        spans = []
+        offset = 0
+        next_line = 0
+        for line_no in line_numbers:
+            while next_line < line_no:
+                offset += len(lines[next_line]) + 1
+                next_line += 1
+            spans.extend((offset + start, offset + end) for start, end in self.match_spans(lines[line_no], query))
+        return spans
+
+    def search(self, query: str, max_snippets: int = 3) -> List[DocHit]:
+        """
+        Documents with lines matching the query, most matching lines first.
+
+        Args:
+            query: Search text
+            max_snippets: Snippets returned per document
+        """
+        hits = []
+        for doc_id, line_numbers in self.matching_lines(query).items():
+            snippets = []
+            for line_no in line_numbers[:max_snippets]:
+                text = self._lines[doc_id][line_no].strip()
+                spans = self.match_spans(text, query)
+                if len(text) > SNIPPET_WIDTH and spans:
+                    start = max(0, min(spans[0][0] - SNIPPET_WIDTH // 4, len(text) - SNIPPET_WIDTH))
+                    prefix = "…" if start else ""
+                    suffix = "…" if start + SNIPPET_WIDTH < len(text) else ""
+                    text = prefix + text[start:start + SNIPPET_WIDTH] + suffix
+                    spans = self.match_spans(text, query)
+                snippets.append(Snippet(line_no, text, spans))
+            hits.append(DocHit(doc_id, len(line_numbers), snippets))
+
+        order = {doc_id: position for position, doc_id in enumerate(self._lines)}
+        hits.sort(key=lambda hit: (-hit.score, order[hit.doc_id]))
+        return hits
@@ -2,13 +2,21 @@
 # Complete file operations module for BeamNG Skin Studio project tab
 
 
+import logging
 import os
 import shutil
 import tempfile
 import zipfile
 import getpass
 import re
-import json  # ADDED: Required for process_material_properties
+
+from core.archive_index import ArchiveIndex, resolve_material_references
+from core.materials_writer import MaterialsDocument, MaterialsParseError
+from core.material_table import StagePropertyTable
+from core.mods_inventory import GENERATED_MOD_COMMENT
+from utils.log import get_logger
+
+log = get_logger(__name__)
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -51,12 +59,12 @@ def get_beamng_mods_path():
         from core.settings import get_mods_folder_path
         configured_path = get_mods_folder_path()
         if configured_path and os.path.exists(configured_path):
-            print(f"[DEBUG] Using configured mods path: {configured_path}")
+            log.debug("Using configured mods path: %s", configured_path)
             return configured_path
         else:
-            print(f"[DEBUG] Configured mods path not set or doesn't exist")
+            log.debug("Configured mods path not set or doesn't exist")
     except ImportError:
-        print(f"[DEBUG] Could not import settings module")
+        log.debug("Could not import settings module")
     
     # Fallback to default path
     username = getpass.getuser()
@@ -69,23 +77,28 @@ def get_beamng_mods_path():
         "0.33",
         "mods"
     )
-    print(f"[DEBUG] Using default mods path: {default_path}")
+    log.debug("Using default mods path: %s", default_path)
     return default_path
 
-def zip_folder(source_dir, zip_path):
+def zip_folder(source_dir, zip_path, archive_index=None):
     """
     Create a ZIP file from a directory.
     
     Args:
         source_dir: Directory to zip
         zip_path: Path where ZIP file should be created
+        archive_index: Optional ArchiveIndex that records every entry as it is written
     """
     with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+        # Lets the mods inventory tell our generated mods apart from others
+        zipf.comment = GENERATED_MOD_COMMENT
         for root_dir, _, files in os.walk(source_dir):
             for file in files:
                 full_path = os.path.join(root_dir, file)
                 relative_path = os.path.relpath(full_path, source_dir)
                 zipf.write(full_path, relative_path)
+                if archive_index is not None:
+                    archive_index.add(relative_path)
 
 # =============================================================================
 # DDS FILE VALIDATION AND CORRECTION
@@ -128,12 +141,12 @@ def validate_and_fix_dds_filenames(skin_folder_path, car_id):
         
         # Check if filename already has correct car_id prefix
         if correct_pattern.match(filename):
-            print(f"[DEBUG] DDS file already correct: {filename}")
+            log.debug("DDS file already correct: %s", filename)
             results['already_correct'].append(filename)
             continue
         
         # File needs to be renamed
-        print(f"[DEBUG] DDS file needs correction: {filename}")
+        log.debug("DDS file needs correction: %s", filename)
         
         # Extract the skin name portion
         skin_name = None
@@ -174,7 +187,7 @@ def validate_and_fix_dds_filenames(skin_folder_path, car_id):
         # Rename the file
         try:
             os.rename(file_path, new_file_path)
-            print(f"[DEBUG] Renamed: {filename} -> {new_filename}")
+            log.debug("Renamed: %s -> %s", filename, new_filename)
             results['renamed'].append((filename, new_filename))
         except Exception as e:
             results['errors'].append((filename, f"Rename failed: {str(e)}"))
@@ -202,7 +215,7 @@ def process_dds_files_in_mod(temp_mod_root):
     vehicles_path = os.path.join(temp_mod_root, "vehicles")
     
     if not os.path.exists(vehicles_path):
-        print("[WARNING] No vehicles folder found in mod")
+        log.warning("No vehicles folder found in mod")
         return total_results
     
     # Iterate through each car folder
@@ -212,7 +225,7 @@ def process_dds_files_in_mod(temp_mod_root):
         if not os.path.isdir(car_path):
             continue
         
-        print(f"[DEBUG] Processing DDS files for car: {car_id}")
+        log.debug("Processing DDS files for car: %s", car_id)
         
         # Iterate through each skin folder
         for item in os.listdir(car_path):
@@ -223,7 +236,7 @@ def process_dds_files_in_mod(temp_mod_root):
                 continue
             
             # This is a skin folder - validate and fix DDS files
-            print(f"[DEBUG]   Processing skin folder: {item}")
+            log.debug("  Processing skin folder: %s", item)
             results = validate_and_fix_dds_filenames(item_path, car_id)
             
             # Aggregate results
@@ -233,21 +246,21 @@ def process_dds_files_in_mod(temp_mod_root):
             total_results['skins_processed'] += 1
     
     # Print summary
-    print(f"\n[DEBUG] DDS File Processing Summary:")
-    print(f"[DEBUG]   Skins processed: {total_results['skins_processed']}")
-    print(f"[DEBUG]   Files renamed: {len(total_results['renamed'])}")
-    print(f"[DEBUG]   Files already correct: {len(total_results['already_correct'])}")
-    print(f"[DEBUG]   Errors: {len(total_results['errors'])}")
+    log.debug("DDS File Processing Summary:")
+    log.debug("  Skins processed: %s", total_results['skins_processed'])
+    log.debug("  Files renamed: %s", len(total_results['renamed']))
+    log.debug("  Files already correct: %s", len(total_results['already_correct']))
+    log.debug("  Errors: %s", len(total_results['errors']))
     
-    if total_results['renamed']:
-        print(f"[DEBUG] Renamed files:")
+    if total_results['renamed'] and log.isEnabledFor(logging.DEBUG):
+        log.debug("Renamed files:")
         for car_id, skin, old, new in total_results['renamed']:
-            print(f"[DEBUG]   {car_id}/{skin}: {old} -> {new}")
+            log.debug("  %s/%s: %s -> %s", car_id, skin, old, new)
     
-    if total_results['errors']:
-        print(f"[DEBUG] Errors:")
+    if total_results['errors'] and log.isEnabledFor(logging.DEBUG):
+        log.debug("Errors:")
         for car_id, skin, filename, error in total_results['errors']:
-            print(f"[DEBUG]   {car_id}/{skin}/{filename}: {error}")
+            log.debug("  %s/%s/%s: %s", car_id, skin, filename, error)
     
     return total_results
 
@@ -265,7 +278,7 @@ def update_info_json_fields(json_path, config_type, config_name):
         config_name: Value for "Configuration" field (e.g., "Highway Patrol Unit 23")
     """
     try:
-        print(f"[DEBUG] Updating info JSON fields in: {os.path.basename(json_path)}")
+        log.debug("Updating info JSON fields in: %s", os.path.basename(json_path))
         
         with open(json_path, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -274,17 +287,17 @@ def update_info_json_fields(json_path, config_type, config_name):
         config_type_pattern = r'("Config Type"\s*:\s*")[^"]*(")'
         if re.search(config_type_pattern, content):
             content = re.sub(config_type_pattern, rf'\g<1>{config_type}\g<2>', content)
-            print(f"[DEBUG]   ✓ Set Config Type to: {config_type}")
+            log.debug("  ✓ Set Config Type to: %s", config_type)
         else:
-            print(f"[WARNING]   'Config Type' key not found")
+            log.warning("  'Config Type' key not found")
         
         # Update "Configuration" - NOW USES CUSTOM NAME
         configuration_pattern = r'("Configuration"\s*:\s*")[^"]*(")'
         if re.search(configuration_pattern, content):
             content = re.sub(configuration_pattern, rf'\g<1>{config_name}\g<2>', content)
-            print(f"[DEBUG]   ✓ Set Configuration to: {config_name}")
+            log.debug("  ✓ Set Configuration to: %s", config_name)
         else:
-            print(f"[WARNING]   'Configuration' key not found")
+            log.warning("  'Configuration' key not found")
         
         # Write back to file
         with open(json_path, 'w', encoding='utf-8') as f:
@@ -293,7 +306,7 @@ def update_info_json_fields(json_path, config_type, config_name):
         return True
         
     except Exception as e:
-        print(f"[ERROR] Failed to update info JSON fields: {e}")
+        log.error("Failed to update info JSON fields: %s", e)
         return False
 
 def process_skin_config_data(skin_data, base_carid, skin_name, temp_mod_root, template_path):
@@ -311,47 +324,47 @@ def process_skin_config_data(skin_data, base_carid, skin_name, temp_mod_root, te
     pc_path = config_data.get("pc_file_path")  # FIXED: Changed from "pc_path" to "pc_file_path"
     jpg_path = config_data.get("jpg_file_path")  # FIXED: Changed from "jpg_path" to "jpg_file_path"
     
-    print(f"[DEBUG] ===== Processing config data for {skin_name} =====")
-    print(f"[DEBUG]   Config Type: {config_type}")
-    print(f"[DEBUG]   Config Name (in-game): {config_name}")  # NEW: Show custom name
-    print(f"[DEBUG]   .pc file: {pc_path}")
-    print(f"[DEBUG]   .jpg file: {jpg_path}")
-    print(f"[DEBUG]   Template path: {template_path}")
-    print(f"[DEBUG]   Template exists: {os.path.exists(template_path)}")
+    log.debug("===== Processing config data for %s =====", skin_name)
+    log.debug("  Config Type: %s", config_type)
+    log.debug("  Config Name (in-game): %s", config_name)  # NEW: Show custom name
+    log.debug("  .pc file: %s", pc_path)
+    log.debug("  .jpg file: %s", jpg_path)
+    log.debug("  Template path: %s", template_path)
+    log.debug("  Template exists: %s", os.path.exists(template_path))
     
     # Validate file existence before processing
     has_errors = False
     if pc_path and not os.path.exists(pc_path):
-        print(f"[ERROR]   .pc file not found: {pc_path}")
+        log.error("  .pc file not found: %s", pc_path)
         has_errors = True
     if jpg_path and not os.path.exists(jpg_path):
-        print(f"[ERROR]   .jpg file not found: {jpg_path}")
+        log.error("  .jpg file not found: %s", jpg_path)
         has_errors = True
     
     if has_errors:
-        print(f"[ERROR] Config data validation failed for {skin_name}")
+        log.error("Config data validation failed for %s", skin_name)
         return False
     
     try:
         # Destination: vehicles/<carid>/
         vehicle_root = os.path.join(temp_mod_root, "vehicles", base_carid)
         os.makedirs(vehicle_root, exist_ok=True)
-        print(f"[DEBUG]   Vehicle root: {vehicle_root}")
+        log.debug("  Vehicle root: %s", vehicle_root)
         
         # 1. Copy and Rename .pc file
         if pc_path:
             dest_pc = os.path.join(vehicle_root, f"{skin_name}.pc")
             shutil.copy2(pc_path, dest_pc)
-            print(f"[DEBUG]   ✓ Exported .pc: {dest_pc}")
+            log.debug("  ✓ Exported .pc: %s", dest_pc)
 
         # 2. Copy and Rename .jpg file
         if jpg_path:
             dest_jpg = os.path.join(vehicle_root, f"{skin_name}.jpg")
             shutil.copy2(jpg_path, dest_jpg)
-            print(f"[DEBUG]   ✓ Exported .jpg: {dest_jpg}")
+            log.debug("  ✓ Exported .jpg: %s", dest_jpg)
 
         # 3. Handle info_skinname.json
-        print(f"[DEBUG]   Searching for info template...")
+        log.debug("  Searching for info template...")
         
         # The info file is in vehicles/<carid>/, not in vehicles/<carid>/SKINNAME/
         # So we need to go up one level from template_path
@@ -362,22 +375,23 @@ def process_skin_config_data(skin_data, base_carid, skin_name, temp_mod_root, te
         
         # First check if vehicle template root exists
         if not os.path.exists(vehicle_template_root):
-            print(f"[ERROR]   Vehicle template root does not exist: {vehicle_template_root}")
+            log.error("  Vehicle template root does not exist: %s", vehicle_template_root)
             return False
         
-        print(f"[DEBUG]   Vehicle template root: {vehicle_template_root}")
+        log.debug("  Vehicle template root: %s", vehicle_template_root)
         
         # List all files in vehicle root for debugging
-        print(f"[DEBUG]   Files in vehicle root:")
-        for f in os.listdir(vehicle_template_root):
-            print(f"[DEBUG]     - {f}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("  Files in vehicle root:")
+            for f in os.listdir(vehicle_template_root):
+                log.debug("    - %s", f)
         
         # Check for standard names
         for filename in ["info.json", "info_template.json"]:
             potential_path = os.path.join(vehicle_template_root, filename)
             if os.path.exists(potential_path):
                 source_info_file = potential_path
-                print(f"[DEBUG]   Found info file: {filename}")
+                log.debug("  Found info file: %s", filename)
                 break
         
         # If no specific name found, grab the first .json starting with 'info'
@@ -385,41 +399,41 @@ def process_skin_config_data(skin_data, base_carid, skin_name, temp_mod_root, te
             for filename in os.listdir(vehicle_template_root):
                 if filename.startswith("info") and filename.endswith(".json"):
                     source_info_file = os.path.join(vehicle_template_root, filename)
-                    print(f"[DEBUG]   Found info file (wildcard): {filename}")
+                    log.debug("  Found info file (wildcard): %s", filename)
                     break
 
         if source_info_file:
             dest_info = os.path.join(vehicle_root, f"info_{skin_name}.json")
-            print(f"[DEBUG]   Copying: {source_info_file}")
-            print(f"[DEBUG]   To: {dest_info}")
+            log.debug("  Copying: %s", source_info_file)
+            log.debug("  To: %s", dest_info)
             
             shutil.copy2(source_info_file, dest_info)
             
             # Verify the file was created
             if os.path.exists(dest_info):
-                print(f"[DEBUG]   ✓ File copied successfully")
+                log.debug("  ✓ File copied successfully")
                 
                 # Edit the "Config Type" and "Configuration" fields inside the newly created file
                 # Use custom config_name instead of skin_display_name
                 result = update_info_json_fields(dest_info, config_type, config_name)
                 
                 if result:
-                    print(f"[DEBUG]   ✓ FINAL: Exported info_{skin_name}.json")
-                    print(f"[DEBUG]   ✓ Set Configuration to: '{config_name}'")  # NEW: Confirm custom name
+                    log.debug("  ✓ FINAL: Exported info_%s.json", skin_name)
+                    log.debug("  ✓ Set Configuration to: '%s'", config_name)  # NEW: Confirm custom name
                 else:
-                    print(f"[WARNING]   Info JSON fields update failed")
+                    log.warning("  Info JSON fields update failed")
             else:
-                print(f"[ERROR]   File copy failed - destination does not exist!")
+                log.error("  File copy failed - destination does not exist!")
                 return False
         else:
-            print(f"[ERROR]   No info.json template found in {template_path}")
+            log.error("  No info.json template found in %s", template_path)
             return False
         
-        print(f"[DEBUG] ===== Config data processing complete =====")
+        log.debug("===== Config data processing complete =====")
         return True
         
     except Exception as e:
-        print(f"[ERROR] process_skin_config_data: {e}")
+        log.error("process_skin_config_data: %s", e)
         import traceback
         traceback.print_exc()
         return False
@@ -438,18 +452,19 @@ def process_material_properties(skin_data, base_carid, skin_id, dest_skin_folder
         return True
     
     material_props = skin_data["material_properties"]
-    print(f"[DEBUG] ===== Processing material properties for {skin_id} =====")
-    print(f"[DEBUG]   Materials to update: {len(material_props)}")
-    print(f"[DEBUG]   Destination folder: {dest_skin_folder}")
+    log.debug("===== Processing material properties for %s =====", skin_id)
+    log.debug("  Materials to update: %s", len(material_props))
+    log.debug("  Destination folder: %s", dest_skin_folder)
+    
+    # Flatten to (material, stage, property, value) columns; stage keys are converted once here
+    try:
+        table = StagePropertyTable.from_nested(material_props)
+    except (ValueError, TypeError, AttributeError) as e:
+        log.error("  Invalid material properties for %s: %s", skin_id, e)
+        return False
     
-    # ENHANCED DEBUG: Print the actual data structure
-    print(f"[DEBUG]   Material properties data structure (from skin_data):")
-    import json as json_module
-    print(f"[DEBUG]   {json_module.dumps(material_props, indent=4)}")
-    for mat_name, stages in material_props.items():
-        print(f"[DEBUG]     Material: {mat_name}")
-        for stage_key, props in stages.items():
-            print(f"[DEBUG]       Stage {stage_key} (type: {type(stage_key)}): {props}")
+    rows_by_material = table.grouped_by_material()
+    log.debug("  %s property value(s) across %s material(s)", len(table), len(rows_by_material))
     
     try:
         # Find all .materials.json files in the destination skin folder
@@ -461,37 +476,33 @@ def process_material_properties(skin_data, base_carid, skin_id, dest_skin_folder
                     materials_files.append(os.path.join(root, filename))
         
         if not materials_files:
-            print(f"[WARNING]   No .materials.json files found in {dest_skin_folder}")
+            log.warning("  No .materials.json files found in %s", dest_skin_folder)
             return False
         
-        print(f"[DEBUG]   Found {len(materials_files)} material file(s)")
-        for mf in materials_files:
-            print(f"[DEBUG]     - {mf}")
+        log.debug("  Found %s material file(s)", len(materials_files))
+        if log.isEnabledFor(logging.DEBUG):
+            for mf in materials_files:
+                log.debug("    - %s", mf)
         
         # Process each material file
         for material_file in materials_files:
-            print(f"[DEBUG]   Processing: {os.path.basename(material_file)}")
-            
-            # Load the material file
-            with open(material_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Handle trailing commas (BeamNG allows them, Python doesn't)
-            content = re.sub(r',(\s*[}\]])', r'\1', content)
+            log.debug("  Processing: %s", os.path.basename(material_file))
             
+            # Load the material file with span tracking so only changed values are rewritten
             try:
-                materials_data = json.loads(content)
-            except json.JSONDecodeError as e:
-                print(f"[ERROR]     JSON decode error in {os.path.basename(material_file)}: {e}")
-                print(f"[ERROR]     Line {e.lineno}, column {e.colno}")
+                document = MaterialsDocument.from_file(material_file)
+            except MaterialsParseError as e:
+                log.error("    Parse error in %s: %s", os.path.basename(material_file), e)
                 continue
             
-            print(f"[DEBUG]     Materials in file: {list(materials_data.keys())}")
+            if document.root.kind != "object":
+                log.warning("    %s is not a materials object, skipping", os.path.basename(material_file))
+                continue
             
-            file_modified = False
+            log.debug("    Materials in file: %s", document.root.keys())
             
             # Update the properties
-            for material_name_template, stages in material_props.items():
+            for material_name_template, material_rows in rows_by_material.items():
                 # Extract the base material name (everything before .skin.)
                 # e.g., "ccf_main.skin.skinname" → "ccf_main"
                 if '.skin.' in material_name_template:
@@ -499,90 +510,67 @@ def process_material_properties(skin_data, base_carid, skin_id, dest_skin_folder
                 else:
                     base_material = material_name_template
                 
-                print(f"[DEBUG]     Looking for materials starting with: {base_material}.skin.")
+                log.debug("    Looking for materials starting with: %s.skin.", base_material)
                 
                 # Find matching material in the file (any material that starts with base_material.skin.)
                 actual_material_name = None
-                for mat_name in materials_data.keys():
+                material_node = None
+                for mat_name, mat_node in document.root.members:
                     if mat_name.startswith(f"{base_material}.skin."):
                         actual_material_name = mat_name
-                        print(f"[DEBUG]     Found match: {material_name_template} → {actual_material_name}")
+                        material_node = mat_node
+                        log.debug("    Found match: %s → %s", material_name_template, actual_material_name)
                         break
                 
                 if actual_material_name is None:
-                    print(f"[DEBUG]     No material found matching '{base_material}.skin.*', skipping")
+                    log.debug("    No material found matching '%s.skin.*', skipping", base_material)
                     continue
                 
-                print(f"[DEBUG]     Found material '{actual_material_name}' in file")
+                log.debug("    Found material '%s' in file", actual_material_name)
                 
-                if "Stages" not in materials_data[actual_material_name]:
-                    print(f"[DEBUG]     Material '{actual_material_name}' has no Stages, skipping")
+                stages_node = material_node.get("Stages")
+                if stages_node is None or stages_node.kind != "array":
+                    log.debug("    Material '%s' has no Stages, skipping", actual_material_name)
                     continue
                 
-                material_stages = materials_data[actual_material_name]["Stages"]
-                print(f"[DEBUG]     Material has {len(material_stages)} stages")
+                material_stages = stages_node.items
+                log.debug("    Material has %s stages", len(material_stages))
                 
-                # Update each stage's properties
-                for stage_num_str, properties in stages.items():
-                    print(f"[DEBUG]     Processing stage_num_str: '{stage_num_str}' (type: {type(stage_num_str).__name__})")
-                    
-                    # Convert stage number to integer
-                    try:
-                        stage_num = int(stage_num_str)
-                        print(f"[DEBUG]     Converted to stage_num: {stage_num} (type: int)")
-                    except (ValueError, TypeError) as e:
-                        print(f"[ERROR]     Cannot convert stage number '{stage_num_str}' to int: {e}")
-                        continue
-                    
+                # Update each (stage, property) cell in place, or append it after the stage's last key
+                for stage_num, prop_name, prop_value in material_rows:
                     if stage_num >= len(material_stages):
-                        print(f"[WARNING]     Stage {stage_num} does not exist for {actual_material_name} (material has {len(material_stages)} stages)")
+                        log.warning("    Stage %s does not exist for %s (material has %s stages)", stage_num, actual_material_name, len(material_stages))
                         continue
                     
                     stage = material_stages[stage_num]
-                    print(f"[DEBUG]     Updating stage {stage_num} with {len(properties)} properties")
-                    print(f"[DEBUG]     Stage {stage_num} current keys: {list(stage.keys())}")
-                    print(f"[DEBUG]     Properties to update: {properties}")
+                    if stage.kind != "object":
+                        log.warning("    Stage %s of %s is not an object, skipping", stage_num, actual_material_name)
+                        continue
                     
-                    # Update each property in this stage
-                    for prop_name, prop_value in properties.items():
-                        old_value = stage.get(prop_name, "NOT_FOUND")
-                        stage[prop_name] = prop_value
-                        print(f"[DEBUG]       ✓ Set {actual_material_name}.Stages[{stage_num}].{prop_name}")
-                        print(f"[DEBUG]         Old: {old_value}")
-                        print(f"[DEBUG]         New: {prop_value}")
-                        file_modified = True
+                    old_node = stage.get(prop_name)
+                    old_value = old_node.to_python() if old_node is not None else "NOT_FOUND"
+                    if old_node is not None and old_node.kind != "scalar":
+                        log.warning("      Cannot replace non-scalar %s.Stages[%s].%s", actual_material_name, stage_num, prop_name)
+                        continue
+                    document.set_property(stage, prop_name, prop_value)
+                    log.debug("      ✓ Set %s.Stages[%s].%s", actual_material_name, stage_num, prop_name)
+                    log.debug("        Old: %s", old_value)
+                    log.debug("        New: %s", prop_value)
             
             # Save the updated material file if any changes were made
-            if file_modified:
-                # Show what we're about to write
-                print(f"[DEBUG]   Writing updated material data to file...")
-                print(f"[DEBUG]   Sample of updated materials (first material only):")
-                first_material = list(materials_data.keys())[0] if materials_data else None
-                if first_material and "Stages" in materials_data[first_material]:
-                    import json as json_module
-                    print(f"[DEBUG]   {first_material}:")
-                    print(f"[DEBUG]   {json_module.dumps(materials_data[first_material]['Stages'], indent=6)}")
-                
+            if document.modified:
+                log.debug("  Writing patched material data to file...")
                 with open(material_file, 'w', encoding='utf-8') as f:
-                    json.dump(materials_data, f, indent=2)
-                print(f"[DEBUG]   ✓ Updated {os.path.basename(material_file)}")
-                
-                # Verify by reading back
-                print(f"[DEBUG]   Verifying file was written correctly...")
-                with open(material_file, 'r', encoding='utf-8') as f:
-                    verify_content = f.read()
-                    if "0.69" in verify_content:
-                        print(f"[DEBUG]   ✓ Verification: Found '0.69' in saved file")
-                    else:
-                        print(f"[WARNING]   Verification: Did NOT find '0.69' in saved file")
+                    f.write(document.render())
+                log.debug("  ✓ Updated %s", os.path.basename(material_file))
             else:
-                print(f"[DEBUG]   No changes needed for {os.path.basename(material_file)}")
+                log.debug("  No changes needed for %s", os.path.basename(material_file))
         
-        print(f"[DEBUG] ===== Material properties processing complete =====")
+        log.debug("===== Material properties processing complete =====")
         return True
         
     except Exception as e:
-        print(f"[ERROR] process_material_properties: {e}")
+        log.error("process_material_properties: %s", e)
         import traceback
         traceback.print_exc()
         return False
@@ -663,10 +651,17 @@ def generate_mod(
 def generate_multi_skin_mod(
     project_data,
     output_path=None,
-    progress_callback=None
+    progress_callback=None,
+    install_index=None,
+    reference_callback=None
 ):
     """
     Generate a mod with multiple cars and multiple skins per car.
+
+    After the ZIP is written, every texture path referenced from the generated
+    materials files is resolved against the archive entries (and the optional
+    BeamNG install index). Broken references are printed per skin and passed
+    to reference_callback as {(car_id, skin_folder): [(file, prop, path), ...]}.
     """
     print(f"\n{'='*60}")
     print(f"MULTI-SKIN MOD GENERATION")
@@ -686,6 +681,15 @@ def generate_multi_skin_mod(
     print(f"Total Cars: {total_cars}")
     print(f"Total Skins: {total_skins}")
     
+    # Fail before doing any work if the output name is taken
+    mods_path = output_path or get_beamng_mods_path()
+    zip_path = os.path.join(mods_path, f"{mod_name}.zip")
+    if os.path.exists(zip_path):
+        raise FileExistsError(
+            f"A mod named '{mod_name}.zip' already exists.\n"
+            f"Please choose a different name or delete the existing file."
+        )
+    
     # Create temporary directory
     temp_dir = tempfile.mkdtemp()
     print(f"Temp directory: {temp_dir}")
@@ -769,7 +773,7 @@ def generate_multi_skin_mod(
                         template_path
                     )
                     if not success:
-                        print(f"  [WARNING] Config data processing failed for {skin_folder}")
+                        log.warning("  Config data processing failed for %s", skin_folder)
                 
                 # Process material properties (if present)
                 if "material_properties" in skin:
@@ -781,7 +785,7 @@ def generate_multi_skin_mod(
                         dest_skin_folder
                     )
                     if not success:
-                        print(f"  [WARNING] Material properties processing failed for {skin_folder}")
+                        log.warning("  Material properties processing failed for %s", skin_folder)
                 
                 # Update progress
                 processed_skins += 1
@@ -824,7 +828,7 @@ def generate_multi_skin_mod(
                             print(f"  Updated {car_id}/{skin_folder}/skin.materials.json")
                             print(f"    {old_path} -> {new_path}")
                     except Exception as e:
-                        print(f"  [WARNING] Failed to update materials.json for {car_id}/{skin_folder}: {e}")
+                        log.warning("  Failed to update materials.json for %s/%s: %s", car_id, skin_folder, e)
         
         if dds_results['errors']:
             print(f"\n⚠ {len(dds_results['errors'])} DDS file(s) had errors")
@@ -835,12 +839,11 @@ def generate_multi_skin_mod(
         if progress_callback:
             progress_callback(0.9)
         
-        mods_path = output_path or get_beamng_mods_path()
         os.makedirs(mods_path, exist_ok=True)
-        zip_path = os.path.join(mods_path, f"{mod_name}.zip")
         
         print(f"ZIP path: {zip_path}")
         
+        # Re-checked in case the file appeared while the build was running
         if os.path.exists(zip_path):
             raise FileExistsError(
                 f"A mod named '{mod_name}.zip' already exists.\n"
@@ -848,14 +851,32 @@ def generate_multi_skin_mod(
             )
         
         # List all files being zipped for verification
-        print(f"\n[DEBUG] Files being zipped from {temp_dir}:")
-        for root, dirs, files in os.walk(temp_dir):
-            for file in files:
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, temp_dir)
-                print(f"[DEBUG]   {rel_path}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Files being zipped from %s:", temp_dir)
+            for root, dirs, files in os.walk(temp_dir):
+                for file in files:
+                    full_path = os.path.join(root, file)
+                    rel_path = os.path.relpath(full_path, temp_dir)
+                    log.debug("  %s", rel_path)
         
-        zip_folder(temp_dir, zip_path)
+        archive_index = ArchiveIndex()
+        zip_folder(temp_dir, zip_path, archive_index)
+        
+        # ===== MATERIAL REFERENCE PREFLIGHT =====
+        broken_references = resolve_material_references(temp_dir, archive_index, install_index)
+        
+        if broken_references:
+            broken_total = sum(len(refs) for refs in broken_references.values())
+            print(f"\n⚠ {broken_total} texture reference(s) do not resolve to a file:")
+            for (car_id, skin_folder), refs in broken_references.items():
+                print(f"  {car_id}/{skin_folder}:")
+                for rel_file, prop_name, ref_path in refs:
+                    print(f"    {os.path.basename(rel_file)} {prop_name}: {ref_path}")
+        else:
+            print(f"\n✓ All texture references resolved ({len(archive_index)} archive entries)")
+        
+        if reference_callback:
+            reference_callback(broken_references)
         
         if progress_callback:
             progress_callback(1.0)
@@ -974,25 +995,29 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
             
             file_path = os.path.join(root_dir, file)
             
-            # Try to parse as JSON first for proper Stage 2 handling
+            with open(file_path, "r", encoding="utf-8") as f:
+                content = f.read()
+            
+            # Parse with span tracking so Stage 2 can be patched in place.
+            # Comments, key order and formatting of the template are preserved.
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                document = MaterialsDocument(content)
                 
                 # Process each material
-                for material_key, material_data in data.items():
-                    if not isinstance(material_data, dict):
+                for material_key, material_node in (document.root.members or []):
+                    if material_node.kind != "object":
                         continue
                     
                     # Update Stages - ONLY modify Stage 2 baseColorMap
-                    if "Stages" in material_data and isinstance(material_data["Stages"], list):
-                        stages = material_data["Stages"]
+                    stages_node = material_node.get("Stages")
+                    if stages_node is not None and stages_node.kind == "array":
+                        stages = stages_node.items
                         
                         # ONLY update Stage 2 (index 1) baseColorMap
-                        if len(stages) > 1 and isinstance(stages[1], dict):
-                            stage2 = stages[1]
-                            if "baseColorMap" in stage2:
-                                old_path = stage2["baseColorMap"]
+                        if len(stages) > 1 and stages[1].kind == "object":
+                            base_color_node = stages[1].get("baseColorMap")
+                            if base_color_node is not None and isinstance(base_color_node.value, str):
+                                old_path = base_color_node.value
                                 
                                 # Check if path contains SKINNAME placeholder (case-insensitive)
                                 if "SKINNAME" in old_path.upper():
@@ -1006,24 +1031,22 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
                                     new_path = re.sub(r'_skin_SKINNAME(\.\w+)', f"_skin_{dds_identifier}\\1", new_path, flags=re.IGNORECASE)
                                     # Also replace carid placeholder
                                     new_path = re.sub(r'(?<![a-zA-Z0-9])carid', vehicle_id, new_path, flags=re.IGNORECASE)
-                                    print(f"[DEBUG] Replaced SKINNAME placeholder in baseColorMap for {material_key}:")
+                                    log.debug("Replaced SKINNAME placeholder in baseColorMap for %s:", material_key)
                                 else:
                                     # Build new path from parameters (legacy behavior)
                                     new_path = f"vehicles/{vehicle_id}/{skin_folder_name}/{dds_filename}"
-                                    print(f"[DEBUG] Updated Stage 2 baseColorMap in {material_key}:")
+                                    log.debug("Updated Stage 2 baseColorMap in %s:", material_key)
                                 
-                                stage2["baseColorMap"] = new_path
-                                print(f"[DEBUG]   From: {old_path}")
-                                print(f"[DEBUG]   To:   {new_path}")
+                                document.set_value(base_color_node, new_path)
+                                log.debug("  From: %s", old_path)
+                                log.debug("  To:   %s", new_path)
                 
-                # Now handle skin name replacements with regex on the JSON string
-                content = json.dumps(data, indent=2)
+                # Now handle skin name replacements with regex on the patched text
+                content = document.render()
                 
-            except json.JSONDecodeError:
-                # If JSON parsing fails, fall back to regex on raw text
-                print(f"[DEBUG] JSON parse failed for {file_path}, using regex fallback")
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+            except MaterialsParseError as e:
+                # If even the relaxed parser fails, fall back to regex on raw text
+                log.debug("JSON parse failed for %s (%s), using regex fallback", file_path, e)
             
             # Update generic .skin. references (ALL occurrences)
             def replace_skin_ref(match):
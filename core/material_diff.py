@@ -0,0 +1,216 @@
+"""
+Material Diff - Structural comparison of BeamNG materials files
+
+Compares two materials documents material by material, stage by stage and
+property by property. Parsed documents are cached by (path, size, mtime) so
+switching between generated skins only parses files that actually changed.
+"""
+import json
+import os
+import re
+import threading
+from collections import OrderedDict, namedtuple
+
+from core.materials_writer import MaterialsParseError, parse_relaxed_json
+from core.vehicle_sources import open_source, member_stamp
+
+# kind: "added" (only on the right), "removed" (only on the left) or "changed"
+# stage: None for material-level properties, otherwise the Stages index
+MaterialDiffEntry = namedtuple("MaterialDiffEntry", "material stage prop kind left right")
+
+# "etk800_main.skin.MySkin" / "etk800.skin_lbe.SKINNAME" -> "etk800_main.skin.*"
+_SKIN_KEY_PATTERN = re.compile(r'^(.+?\.skin)[^.]*\..+$')
+
+_MISSING = object()
+
+
+def skin_material_key(material_name):
+    """Normalize a skin material name so templates and generated skins pair up"""
+    match = _SKIN_KEY_PATTERN.match(material_name)
+    return f"{match.group(1)}.*" if match else material_name
+
+
+class MaterialParseCache:
+    """Thread-safe LRU cache of parsed materials files keyed by path, size and mtime"""
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _stamp(self, path, member):
+        if member is None:
+            stat = os.stat(path)
+            return (os.path.abspath(path), member, stat.st_size, stat.st_mtime_ns)
+        return (os.path.abspath(path), member) + member_stamp(path, member)
+
+    def get(self, path, member=None):
+        """
+        Return parsed data for a materials file, or for a member inside a zip.
+
+        Args:
+            path: Path to a .json file, or a source spec when member is given
+                  (a .zip, an unpacked mod folder or "outer.zip::inner.zip")
+            member: Optional entry name inside the source (e.g. "vehicles/etk800/skin.materials.json")
+
+        Raises:
+            OSError, KeyError, MaterialsParseError
+        """
+        key = self._stamp(path, member)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        if member is None:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+        else:
+            with open_source(path) as source:
+                content = source.read(member).decode("utf-8", errors="replace")
+
+        data = parse_relaxed_json(content)
+        if not isinstance(data, dict):
+            raise MaterialsParseError("Materials file root is not an object", 0)
+
+        with self._lock:
+            # Drop stale versions of the same file before inserting the new one
+            for stale in [k for k in self._entries if k[:2] == key[:2]]:
+                del self._entries[stale]
+            self._entries[key] = data
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every diff view so reopening the viewer keeps its parses
+parse_cache = MaterialParseCache()
+
+
+def pair_materials(left, right, match_skins=True):
+    """
+    Pair material names between two documents.
+    Exact names pair first; with match_skins, remaining skin materials pair by
+    prefix, so template "ccf_main.skin.SKINNAME" pairs with "ccf_main.skin.MySkin".
+
+    Returns:
+        list: [(left_name or None, right_name or None), ...] in left-then-right order
+    """
+    pairs = []
+    unmatched_right = OrderedDict((name, None) for name in right if name not in left)
+
+    right_by_skin_key = {}
+    if match_skins:
+        for name in unmatched_right:
+            right_by_skin_key.setdefault(skin_material_key(name), []).append(name)
+
+    for name in left:
+        if name in right:
+            pairs.append((name, name))
+            continue
+        candidates = right_by_skin_key.get(skin_material_key(name)) if match_skins else None
+        if candidates:
+            match = candidates.pop(0)
+            unmatched_right.pop(match, None)
+            pairs.append((name, match))
+        else:
+            pairs.append((name, None))
+
+    for name in unmatched_right:
+        pairs.append((None, name))
+
+    return pairs
+
+
+def _diff_mapping(material, stage, left, right, entries):
+    for prop in left:
+        right_value = right.get(prop, _MISSING)
+        if right_value is _MISSING:
+            entries.append(MaterialDiffEntry(material, stage, prop, "removed", left[prop], None))
+        elif right_value != left[prop]:
+            entries.append(MaterialDiffEntry(material, stage, prop, "changed", left[prop], right_value))
+    for prop in right:
+        if prop not in left:
+            entries.append(MaterialDiffEntry(material, stage, prop, "added", None, right[prop]))
+
+
+def diff_materials(left, right, match_skins=True):
+    """
+    Structurally diff two parsed materials documents.
+
+    Args:
+        left: Parsed materials dict (e.g. the SKINNAME template or stock file)
+        right: Parsed materials dict (e.g. the generated skin.materials.json)
+        match_skins: Pair skin materials whose names differ only by skin name
+
+    Returns:
+        list: MaterialDiffEntry items. Material names are shown as "left → right"
+              when a pair was made by skin matching.
+    """
+    entries = []
+
+    for left_name, right_name in pair_materials(left, right, match_skins):
+        if right_name is None:
+            entries.append(MaterialDiffEntry(left_name, None, None, "removed", left[left_name], None))
+            continue
+        if left_name is None:
+            entries.append(MaterialDiffEntry(right_name, None, None, "added", None, right[right_name]))
+            continue
+
+        left_material = left[left_name]
+        right_material = right[right_name]
+        label = left_name if left_name == right_name else f"{left_name} → {right_name}"
+
+        if not isinstance(left_material, dict) or not isinstance(right_material, dict):
+            if left_material != right_material:
+                entries.append(MaterialDiffEntry(label, None, None, "changed", left_material, right_material))
+            continue
+
+        left_props = {k: v for k, v in left_material.items() if k != "Stages"}
+        right_props = {k: v for k, v in right_material.items() if k != "Stages"}
+        _diff_mapping(label, None, left_props, right_props, entries)
+
+        left_stages = left_material.get("Stages") or []
+        right_stages = right_material.get("Stages") or []
+        for stage_index in range(max(len(left_stages), len(right_stages))):
+            left_stage = left_stages[stage_index] if stage_index < len(left_stages) else None
+            right_stage = right_stages[stage_index] if stage_index < len(right_stages) else None
+            if isinstance(left_stage, dict) and isinstance(right_stage, dict):
+                _diff_mapping(label, stage_index, left_stage, right_stage, entries)
+            elif left_stage is None:
+                entries.append(MaterialDiffEntry(label, stage_index, None, "added", None, right_stage))
+            elif right_stage is None:
+                entries.append(MaterialDiffEntry(label, stage_index, None, "removed", left_stage, None))
+            elif left_stage != right_stage:
+                entries.append(MaterialDiffEntry(label, stage_index, None, "changed", left_stage, right_stage))
+
+    return entries
+
+
+def diff_material_files(left_path, right_path, left_member=None, right_member=None, match_skins=True):
+    """Diff two materials files (or zip members) through the shared parse cache"""
+    left = parse_cache.get(left_path, left_member)
+    right = parse_cache.get(right_path, right_member)
+    return diff_materials(left, right, match_skins)
+
+
+def format_diff_entry(entry):
+    """One-line, human readable description of a diff entry"""
+    location = entry.material
+    if entry.stage is not None:
+        location += f" / Stage {entry.stage}"
+    if entry.prop is not None:
+        location += f" / {entry.prop}"
+
+    if entry.kind == "added":
+        return f"+ {location}: {json.dumps(entry.right, ensure_ascii=False)[:200]}"
+    if entry.kind == "removed":
+        return f"- {location}: {json.dumps(entry.left, ensure_ascii=False)[:200]}"
+    return (f"~ {location}: {json.dumps(entry.left, ensure_ascii=False)[:100]}"
+            f" → {json.dumps(entry.right, ensure_ascii=False)[:100]}")
@@ -0,0 +1,250 @@
+"""
+Material Table - Columnar storage for per-stage material property overrides
+
+Skins store material overrides as nested dicts:
+    {"ccf_main.skin.x": {"1": {"metallicFactor": 0.5, "roughnessFactor": None}}}
+
+StagePropertyTable keeps the same data as parallel columns (material id,
+stage index, property id, value, value kind) backed by the array module, with
+material and property names interned into small lookup lists. Values are
+stored as doubles (null as NaN) plus the kind they were set with, so an int
+comes back as an int and 1.0 stays 1.0.
+"""
+import base64
+import math
+import sys
+from array import array
+from utils.log import get_logger
+
+log = get_logger(__name__)
+
+COMPACT_FORMAT_VERSION = 2
+
+# Stage indices fit the "B" column
+MAX_STAGE = 255
+
+# Value kinds
+KIND_FLOAT = 0
+KIND_INT = 1
+KIND_BOOL = 2
+
+_COLUMN_TYPECODES = (("material_ids", "H"), ("stages", "B"), ("property_ids", "H"), ("values", "d"),
+                     ("kinds", "B"))
+
+
+def _to_value(number, kind):
+    """Convert a stored double back to the value it was set with"""
+    if math.isnan(number):
+        return None
+    if kind == KIND_INT:
+        return int(number)
+    if kind == KIND_BOOL:
+        return bool(number)
+    return number
+
+
+def _from_value(value):
+    """
+    (double, kind) for a value
+
+    Raises:
+        ValueError, TypeError: value is not a number, bool or None
+    """
+    if value is None:
+        return math.nan, KIND_FLOAT
+    if isinstance(value, bool):
+        return float(value), KIND_BOOL
+    if isinstance(value, int):
+        return float(value), KIND_INT
+    if isinstance(value, float):
+        return value, KIND_FLOAT
+    raise TypeError(f"Unsupported material property value {value!r}")
+
+
+def _stage_index(stage):
+    """
+    Stage index from an int or a key like "2" / "Stage_2"
+
+    Raises:
+        ValueError, TypeError, AttributeError
+    """
+    index = stage if isinstance(stage, int) else int(str(stage).rsplit("_", 1)[-1])
+    if not 0 <= index <= MAX_STAGE:
+        raise ValueError(f"stage {index} is outside 0-{MAX_STAGE}")
+    return index
+
+
+class StagePropertyTable:
+    """Columnar (material, stage, property) -> value table"""
+
+    def __init__(self):
+        self.materials = []
+        self.properties = []
+        self._material_lookup = {}
+        self._property_lookup = {}
+        self._row_lookup = {}
+
+        self.material_ids = array("H")
+        self.stages = array("B")
+        self.property_ids = array("H")
+        self.values = array("d")
+        self.kinds = array("B")
+
+    # -------------------------------------------------------------------------
+    # Interning / row access
+    # -------------------------------------------------------------------------
+
+    def _intern(self, names, lookup, name):
+        index = lookup.get(name)
+        if index is None:
+            index = len(names)
+            names.append(name)
+            lookup[name] = index
+        return index
+
+    def __len__(self):
+        return len(self.values)
+
+    def __bool__(self):
+        return len(self.values) > 0
+
+    def set(self, material, stage, prop, value):
+        """
+        Insert or update a single cell (value None means null)
+
+        Raises:
+            ValueError, TypeError: Bad stage (not 0-255) or a value that is not a number
+        """
+        stage = _stage_index(stage)
+        number, kind = _from_value(value)
+        material_id = self._intern(self.materials, self._material_lookup, material)
+        property_id = self._intern(self.properties, self._property_lookup, prop)
+        key = (material_id, stage, property_id)
+
+        row = self._row_lookup.get(key)
+        if row is None:
+            self._row_lookup[key] = len(self.values)
+            self.material_ids.append(material_id)
+            self.stages.append(stage)
+            self.property_ids.append(property_id)
+            self.values.append(number)
+            self.kinds.append(kind)
+        else:
+            self.values[row] = number
+            self.kinds[row] = kind
+
+    def get(self, material, stage, prop, default=None):
+        material_id = self._material_lookup.get(material)
+        property_id = self._property_lookup.get(prop)
+        if material_id is None or property_id is None:
+            return default
+        row = self._row_lookup.get((material_id, int(stage), property_id))
+        if row is None:
+            return default
+        return _to_value(self.values[row], self.kinds[row])
+
+    def rows(self):
+        """Yield (material, stage, property, value) in insertion order"""
+        materials = self.materials
+        properties = self.properties
+        for material_id, stage, property_id, number, kind in zip(
+            self.material_ids, self.stages, self.property_ids, self.values, self.kinds
+        ):
+            yield materials[material_id], stage, properties[property_id], _to_value(number, kind)
+
+    def grouped_by_material(self):
+        """
+        Group rows per material for builders.
+
+        Returns:
+            dict: {material: [(stage, property, value), ...]}
+        """
+        grouped = {}
+        for material, stage, prop, value in self.rows():
+            grouped.setdefault(material, []).append((stage, prop, value))
+        return grouped
+
+    # -------------------------------------------------------------------------
+    # Nested dict conversion (the shape stored on skins)
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_nested(cls, material_props):
+        """
+        Build a table from {material: {stage: {prop: value}}}. Stages with a bad
+        key and values that are not numbers are skipped (and logged), so one bad
+        entry does not drop the rest of the skin.
+        """
+        table = cls()
+        for material, stages in (material_props or {}).items():
+            for stage_key, properties in stages.items():
+                try:
+                    stage = _stage_index(stage_key)
+                except (ValueError, TypeError, AttributeError) as e:
+                    log.error("Cannot use stage '%s' of %s: %s", stage_key, material, e)
+                    continue
+                for prop, value in properties.items():
+                    try:
+                        table.set(material, stage, prop, value)
+                    except (ValueError, TypeError) as e:
+                        log.error("Skipping %s stage %s %s: %s", material, stage, prop, e)
+        return table
+
+    def to_nested(self):
+        """Convert back to {material: {"<stage>": {prop: value}}}"""
+        nested = {}
+        for material, stage, prop, value in self.rows():
+            nested.setdefault(material, {}).setdefault(str(stage), {})[prop] = value
+        return nested
+
+    # -------------------------------------------------------------------------
+    # Compact serialization for .bsproject files
+    # -------------------------------------------------------------------------
+
+    def to_compact(self):
+        """Serialize to a small JSON-compatible dict (columns as little-endian base64)"""
+        compact = {
+            "format": COMPACT_FORMAT_VERSION,
+            "materials": list(self.materials),
+            "properties": list(self.properties),
+        }
+        for name, _ in _COLUMN_TYPECODES:
+            column = getattr(self, name)
+            if sys.byteorder == "big":
+                column = array(column.typecode, column)
+                column.byteswap()
+            compact[name] = base64.b64encode(column.tobytes()).decode("ascii")
+        return compact
+
+    @classmethod
+    def from_compact(cls, compact):
+        """Inverse of to_compact (also reads format 1, which had no kinds column)"""
+        version = compact.get("format")
+        if version not in (1, COMPACT_FORMAT_VERSION):
+            raise ValueError(f"Unsupported material table format: {version}")
+
+        table = cls()
+        for name in compact["materials"]:
+            table._intern(table.materials, table._material_lookup, name)
+        for name in compact["properties"]:
+            table._intern(table.properties, table._property_lookup, name)
+
+        for name, typecode in _COLUMN_TYPECODES:
+            if name == "kinds" and version == 1:
+                # Format 1 read whole numbers back as ints
+                table.kinds = array("B", (KIND_INT if not math.isnan(number) and number.is_integer() else KIND_FLOAT
+                                          for number in table.values))
+                continue
+            column = array(typecode)
+            column.frombytes(base64.b64decode(compact[name]))
+            if sys.byteorder == "big":
+                column.byteswap()
+            setattr(table, name, column)
+
+        lengths = {len(getattr(table, name)) for name, _ in _COLUMN_TYPECODES}
+        if len(lengths) != 1:
+            raise ValueError("Material table columns have mismatched lengths")
+
+        for row, key in enumerate(zip(table.material_ids, table.stages, table.property_ids)):
+            table._row_lookup[key] = row
+        return table
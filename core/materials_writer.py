@@ -0,0 +1,305 @@
+"""
+Materials Writer - Comment- and order-preserving edits of BeamNG materials files
+
+BeamNG materials files are "relaxed" JSON: they may contain // and /* */
+comments, trailing commas and missing commas between members. Instead of
+round-tripping through json.load/json.dumps (which drops comments and
+reformats everything), MaterialsDocument parses the text once, remembers the
+character span of every value and patches only the spans that change.
+Untouched bytes are written back exactly as they were read.
+"""
+import json
+import re
+from json.decoder import scanstring
+
+_SKIP_PATTERN = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.DOTALL)
+_NUMBER_PATTERN = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+_LITERALS = (("true", True), ("false", False), ("null", None))
+
+# Strings are matched (and kept) so "//" inside paths is never treated as a comment;
+# group 1 is a comment or trailing comma to drop
+_RELAXED_NOISE_PATTERN = re.compile(r'"(?:[^"\\\n]|\\.)*"|(//[^\n]*|/\*.*?\*/|,(?=\s*[}\]]))', re.DOTALL)
+
+
+class MaterialsParseError(ValueError):
+    """Raised when a materials file cannot be parsed even with relaxed rules"""
+
+    def __init__(self, message, pos):
+        super().__init__(f"{message} at char {pos}")
+        self.pos = pos
+
+
+class SpanNode:
+    """A parsed value and the [start, end) span of its text in the document"""
+
+    __slots__ = ("kind", "start", "end", "value", "members", "items")
+
+    def __init__(self, kind, start):
+        self.kind = kind
+        self.start = start
+        self.end = start
+        self.value = None
+        self.members = None
+        self.items = None
+
+    def get(self, key):
+        """Return the child node for an object key, or None"""
+        if self.kind != "object":
+            return None
+        for member_key, node in self.members:
+            if member_key == key:
+                return node
+        return None
+
+    def keys(self):
+        return [member_key for member_key, _ in self.members] if self.kind == "object" else []
+
+    def to_python(self):
+        """Convert this node (recursively) to plain Python data"""
+        if self.kind == "object":
+            return {key: node.to_python() for key, node in self.members}
+        if self.kind == "array":
+            return [node.to_python() for node in self.items]
+        return self.value
+
+
+class _Parser:
+
+    def __init__(self, text):
+        self.text = text
+        self.length = len(text)
+
+    def skip(self, pos):
+        return _SKIP_PATTERN.match(self.text, pos).end()
+
+    def parse(self):
+        pos = self.skip(0)
+        node, pos = self.parse_value(pos)
+        pos = self.skip(pos)
+        if pos != self.length:
+            raise MaterialsParseError("Unexpected trailing content", pos)
+        return node
+
+    def parse_value(self, pos):
+        if pos >= self.length:
+            raise MaterialsParseError("Unexpected end of document", pos)
+
+        char = self.text[pos]
+
+        if char == "{":
+            return self.parse_object(pos)
+        if char == "[":
+            return self.parse_array(pos)
+
+        node = SpanNode("scalar", pos)
+
+        if char == '"':
+            try:
+                node.value, pos = scanstring(self.text, pos + 1)
+            except json.JSONDecodeError as e:
+                raise MaterialsParseError(e.msg, e.pos)
+            node.end = pos
+            return node, pos
+
+        for literal, value in _LITERALS:
+            if self.text.startswith(literal, pos):
+                node.value = value
+                node.end = pos + len(literal)
+                return node, node.end
+
+        match = _NUMBER_PATTERN.match(self.text, pos)
+        if match:
+            number_text = match.group()
+            if any(c in number_text for c in ".eE"):
+                node.value = float(number_text)
+            else:
+                node.value = int(number_text)
+            node.end = match.end()
+            return node, node.end
+
+        raise MaterialsParseError(f"Unexpected character {char!r}", pos)
+
+    def parse_object(self, pos):
+        node = SpanNode("object", pos)
+        node.members = []
+        pos = self.skip(pos + 1)
+
+        while True:
+            if pos >= self.length:
+                raise MaterialsParseError("Unterminated object", node.start)
+            if self.text[pos] == "}":
+                node.end = pos + 1
+                return node, node.end
+            if self.text[pos] != '"':
+                raise MaterialsParseError("Expected object key", pos)
+
+            try:
+                key, pos = scanstring(self.text, pos + 1)
+            except json.JSONDecodeError as e:
+                raise MaterialsParseError(e.msg, e.pos)
+
+            pos = self.skip(pos)
+            if pos >= self.length or self.text[pos] != ":":
+                raise MaterialsParseError("Expected ':' after object key", pos)
+            pos = self.skip(pos + 1)
+
+            value, pos = self.parse_value(pos)
+            node.members.append((key, value))
+
+            pos = self.skip(pos)
+            if pos < self.length and self.text[pos] == ",":
+                pos = self.skip(pos + 1)
+
+    def parse_array(self, pos):
+        node = SpanNode("array", pos)
+        node.items = []
+        pos = self.skip(pos + 1)
+
+        while True:
+            if pos >= self.length:
+                raise MaterialsParseError("Unterminated array", node.start)
+            if self.text[pos] == "]":
+                node.end = pos + 1
+                return node, node.end
+
+            value, pos = self.parse_value(pos)
+            node.items.append(value)
+
+            pos = self.skip(pos)
+            if pos < self.length and self.text[pos] == ",":
+                pos = self.skip(pos + 1)
+
+
+def _format_value(value):
+    """Serialize a scalar the way json.dumps would, keeping non-ASCII text readable"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+class MaterialsDocument:
+    """
+    Parsed materials file that supports in-place value edits.
+
+    Example:
+        doc = MaterialsDocument(text)
+        stage = doc.root.get("etk800.skin.SKINNAME").get("Stages").items[1]
+        doc.set_value(stage.get("baseColorMap"), "vehicles/etk800/a/etk800_skin_a.dds")
+        new_text = doc.render()
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.root = _Parser(text).parse()
+        self._edits = []
+        # id(node) -> (edit index, prefix, key) of members added by set_property
+        self._appended = {}
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f.read())
+
+    @property
+    def modified(self):
+        return bool(self._edits)
+
+    def set_value(self, node, value):
+        """Replace the text of a scalar node with a new serialized value"""
+        if node.kind != "scalar":
+            raise ValueError("Only scalar values can be replaced in place")
+        if node.value == value and type(node.value) is type(value):
+            return False
+        appended = self._appended.get(id(node))
+        if appended is not None:
+            # Member added by set_property: rewrite its pending insertion instead
+            edit_index, prefix, key = appended
+            start, end, _ = self._edits[edit_index]
+            self._edits[edit_index] = (start, end, f'{prefix}"{key}": {_format_value(value)}')
+        else:
+            self._edits.append((node.start, node.end, _format_value(value)))
+        node.value = value
+        return True
+
+    def set_property(self, object_node, key, value):
+        """
+        Set a property on an object node, replacing the existing value in place
+        or appending a new member after the last one (matching its indentation).
+        Members appended to the same object are inserted at the same position,
+        in call order.
+        """
+        existing = object_node.get(key)
+        if existing is not None:
+            return self.set_value(existing, value)
+
+        # Anchor on the last member parsed from the text; appended members have no span
+        parsed = [(member_key, node) for member_key, node in object_node.members
+                  if id(node) not in self._appended]
+
+        if parsed:
+            last_key, last_node = parsed[-1]
+            key_start = self._find_key_start(last_key, last_node.start)
+            line_start = self.text.rfind("\n", 0, key_start) + 1
+            indent = self.text[line_start:key_start]
+            prefix = ", " if indent.strip() else f",\n{indent}"
+            position = last_node.end
+        else:
+            prefix = ", " if object_node.members else ""
+            position = object_node.start + 1
+
+        placeholder = SpanNode("scalar", position)
+        placeholder.value = value
+        self._appended[id(placeholder)] = (len(self._edits), prefix, key)
+        self._edits.append((position, position, f'{prefix}"{key}": {_format_value(value)}'))
+        object_node.members.append((key, placeholder))
+        return True
+
+    def _find_key_start(self, key, value_start):
+        """Locate the opening quote of a member key that precedes value_start"""
+        quoted = json.dumps(key, ensure_ascii=False)
+        position = self.text.rfind(quoted, 0, value_start)
+        return position if position != -1 else value_start
+
+    def render(self):
+        """Return the document text with all edits applied"""
+        if not self._edits:
+            return self.text
+
+        pieces = []
+        cursor = 0
+        for start, end, replacement in sorted(self._edits, key=lambda edit: (edit[0], edit[1])):
+            pieces.append(self.text[cursor:start])
+            pieces.append(replacement)
+            cursor = max(cursor, end)
+        pieces.append(self.text[cursor:])
+        return "".join(pieces)
+
+    def to_python(self):
+        return self.root.to_python()
+
+
+def parse_relaxed_json(content):
+    """
+    Parse BeamNG-style relaxed JSON (materials, info.json, ...) to plain Python data.
+    Strict JSON is tried first (C parser, fast on multi-MB files), then the same
+    after stripping comments and trailing commas. Anything still rejected (e.g.
+    missing commas) goes through the slower span parser.
+
+    Raises:
+        MaterialsParseError
+    """
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        pass
+
+    pieces = []
+    last = 0
+    for match in _RELAXED_NOISE_PATTERN.finditer(content):
+        if match.group(1) is not None:
+            pieces.append(content[last:match.start()])
+            last = match.end()
+    pieces.append(content[last:])
+
+    try:
+        return json.loads("".join(pieces))
+    except json.JSONDecodeError:
+        return MaterialsDocument(content).to_python()
@@ -0,0 +1,234 @@
+"""
+Mods Inventory - Index of the zips in a BeamNG mods folder
+
+Records every mod zip's name, size, mtime, the vehicle skin folders it ships
+("vehicles/<carid>/<folder>/...") and whether BeamSkin Studio generated it.
+A refresh is a cheap stat scan; only zips whose size or mtime changed have
+their central directory re-read. Used to catch name and skin-path collisions
+before a build starts instead of after the ZIP step, and to show how much
+space our generated mods take up.
+"""
+import json
+import os
+import re
+import threading
+import zipfile
+from collections import namedtuple
+
+from core.vehicle_sources import is_unpacked_mod
+
+MODS_INVENTORY_FILE = os.path.join("cache", "mods_inventory.json")
+MODS_INVENTORY_VERSION = 1
+
+# Written as the zip comment of every generated mod so we can recognize our own output
+GENERATED_MOD_COMMENT = b"Generated by BeamSkin Studio"
+
+_SKIN_PATH_PATTERN = re.compile(r'^vehicles/([^/]+)/([^/]+)/[^/]')
+
+ModArchive = namedtuple("ModArchive", "name path size mtime_ns generated skins")
+
+# name_taken: an archive with the output name already exists
+# skin_collisions: [(carid, skin_folder, other_mod_name), ...]
+ModPreflight = namedtuple("ModPreflight", "zip_path name_taken skin_collisions")
+
+
+def _read_archive(path, stat):
+    with zipfile.ZipFile(path, "r") as zf:
+        skins = set()
+        for name in zf.namelist():
+            match = _SKIN_PATH_PATTERN.match(name)
+            if match:
+                skins.add(f"{match.group(1)}/{match.group(2)}")
+        generated = zf.comment.startswith(GENERATED_MOD_COMMENT)
+    return ModArchive(os.path.basename(path), path, stat.st_size, stat.st_mtime_ns, generated, sorted(skins))
+
+
+class ModsInventory:
+    """Incrementally refreshed index of mod zips, keyed by absolute path"""
+
+    def __init__(self, cache_path=MODS_INVENTORY_FILE):
+        self.cache_path = cache_path
+        self._archives = {}
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._dirty = False
+        self._listeners = []
+
+    def load(self):
+        """Load the cached index (missing or incompatible files start empty)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+            if not os.path.exists(self.cache_path):
+                return
+
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != MODS_INVENTORY_VERSION:
+                    return
+                self._archives = {path: ModArchive(*record) for path, record in data.get("archives", {}).items()}
+                print(f"[DEBUG] Loaded mods inventory: {len(self._archives)} archives")
+            except Exception as e:
+                print(f"[WARNING] Could not read mods inventory: {e}")
+                self._archives = {}
+
+    def save(self):
+        """Write the index atomically if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": MODS_INVENTORY_VERSION,
+                "archives": {path: list(record) for path, record in self._archives.items()},
+            }
+            self._dirty = False
+
+        try:
+            folder = os.path.dirname(self.cache_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            temp_path = self.cache_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            print(f"[WARNING] Could not save mods inventory: {e}")
+
+    def add_listener(self, callback):
+        """Register callable(mods_folder), called (from the refreshing thread) after each refresh"""
+        self._listeners.append(callback)
+
+    def refresh(self, mods_folder):
+        """
+        Stat every zip under mods_folder and re-read only new or changed ones.
+
+        Returns:
+            int: Number of archives that had to be read
+        """
+        self.load()
+        if not mods_folder or not os.path.isdir(mods_folder):
+            return 0
+
+        root = os.path.abspath(mods_folder)
+        present = {}
+        for root_dir, dirs, files in os.walk(root):
+            # Unpacked mods hold no zips of ours and can be huge; don't walk them
+            dirs[:] = [d for d in dirs if not is_unpacked_mod(os.path.join(root_dir, d))]
+            for filename in files:
+                if not filename.lower().endswith(".zip"):
+                    continue
+                path = os.path.join(root_dir, filename)
+                try:
+                    present[path] = os.stat(path)
+                except OSError:
+                    continue
+
+        reread = 0
+        for path, stat in present.items():
+            with self._lock:
+                record = self._archives.get(path)
+            if record is not None and record.size == stat.st_size and record.mtime_ns == stat.st_mtime_ns:
+                continue
+            try:
+                record = _read_archive(path, stat)
+            except (OSError, zipfile.BadZipFile) as e:
+                print(f"[WARNING] Mods inventory: could not read {os.path.basename(path)}: {e}")
+                record = ModArchive(os.path.basename(path), path, stat.st_size, stat.st_mtime_ns, False, [])
+            with self._lock:
+                self._archives[path] = record
+                self._dirty = True
+            reread += 1
+
+        with self._lock:
+            for stale in [p for p in self._archives if p.startswith(root + os.sep) and p not in present]:
+                del self._archives[stale]
+                self._dirty = True
+
+        self.save()
+        print(f"[DEBUG] Mods inventory: {len(present)} archives in {root}, {reread} re-read")
+
+        for callback in self._listeners:
+            try:
+                callback(mods_folder)
+            except Exception as e:
+                print(f"[WARNING] Mods inventory listener failed: {e}")
+        return reread
+
+    def start_background_refresh(self, mods_folder):
+        """Run refresh() in a daemon thread"""
+        def worker():
+            try:
+                self.refresh(mods_folder)
+            except Exception as e:
+                print(f"[ERROR] Mods inventory refresh failed: {e}")
+
+        thread = threading.Thread(target=worker, daemon=True, name="ModsInventoryRefresh")
+        thread.start()
+        return thread
+
+    def archives(self, mods_folder):
+        """Indexed archives under mods_folder"""
+        self.load()
+        root = os.path.abspath(mods_folder) + os.sep
+        with self._lock:
+            return [record for path, record in self._archives.items() if path.startswith(root)]
+
+    def usage(self, mods_folder, generated_only=True):
+        """
+        Storage used by mods in a folder.
+
+        Returns:
+            tuple: (archive_count, total_bytes)
+        """
+        records = [r for r in self.archives(mods_folder) if r.generated or not generated_only]
+        return len(records), sum(r.size for r in records)
+
+    def preflight(self, project_data, mod_name, mods_folder):
+        """
+        Check a project against the indexed mods folder before building it.
+        Only the cached inventory is consulted (plus one stat for the output
+        name); call refresh() first, off the UI thread, for a current result.
+
+        Args:
+            project_data: Generator project data ({"cars": {...}})
+            mod_name: Mod name as entered (sanitized the same way the build does)
+            mods_folder: Output folder
+
+        Returns:
+            ModPreflight
+        """
+        from core.file_ops import sanitize_mod_name, sanitize_folder_name
+
+        zip_path = os.path.join(mods_folder, f"{sanitize_mod_name(mod_name)}.zip")
+
+        owners = {}
+        for record in self.archives(mods_folder):
+            for skin in record.skins:
+                owners.setdefault(skin.lower(), record.name)
+
+        collisions = []
+        for car_instance_id, car_info in project_data.get("cars", {}).items():
+            base_carid = car_info.get("base_carid", car_instance_id)
+            for skin in car_info.get("skins", []):
+                skin_folder = sanitize_folder_name(skin["name"])
+                owner = owners.get(f"{base_carid}/{skin_folder}".lower())
+                if owner is not None:
+                    collisions.append((base_carid, skin_folder, owner))
+
+        return ModPreflight(zip_path, os.path.exists(zip_path), collisions)
+
+
+def format_size(num_bytes):
+    """Human readable size ("12.3 MB")"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+# Shared instance used by the UI
+mods_inventory = ModsInventory()
@@ -0,0 +1,94 @@
+"""
+Project Model - Generator project data with change notifications
+
+Wraps the project dict ({"mod_name", "author", "cars": {instance_id: {...}}})
+that is saved, loaded and built, and routes every edit through methods that
+bump a per-car version and notify listeners. Views use the versions to redraw
+only the cars that changed. Not thread safe; call it from the UI thread.
+"""
+
+PROJECT_RESET = "reset"
+CAR_ADDED = "car_added"
+CAR_REMOVED = "car_removed"
+SKINS_CHANGED = "skins_changed"
+
+
+def empty_project():
+    return {"mod_name": "", "author": "", "cars": {}}
+
+
+class ProjectModel:
+    """Observable generator project"""
+
+    def __init__(self, data=None):
+        self.data = data if data is not None else empty_project()
+        self._versions = {}
+        self._next_version = 1
+        self._listeners = []
+
+    @property
+    def cars(self):
+        return self.data["cars"]
+
+    def subscribe(self, callback):
+        """Register callable(event, car_instance_id); car_instance_id is None for PROJECT_RESET"""
+        self._listeners.append(callback)
+
+    def _changed(self, event, car_instance_id=None):
+        if car_instance_id is not None:
+            self._versions[car_instance_id] = self._next_version
+            self._next_version += 1
+        for callback in list(self._listeners):
+            try:
+                callback(event, car_instance_id)
+            except Exception as e:
+                print(f"[WARNING] Project model listener failed on {event}: {e}")
+
+    def version(self, car_instance_id):
+        """Change counter of one car; differs after any edit of the car or its skins"""
+        return self._versions.get(car_instance_id, 0)
+
+    def replace(self, data):
+        """Swap in a whole project (load / clear)"""
+        self.data = data
+        # Fresh versions for every car: a loaded project can reuse instance IDs of the previous one,
+        # and views must not mistake those cars for the ones they already drew
+        self._versions = {}
+        for car_instance_id in self.cars:
+            self._versions[car_instance_id] = self._next_version
+            self._next_version += 1
+        self._changed(PROJECT_RESET)
+
+    def clear(self):
+        self.replace(empty_project())
+
+    def add_car(self, car_instance_id, base_carid):
+        self.cars[car_instance_id] = {
+            "base_carid": base_carid,
+            "skins": [],
+            "temp_skin_name": "",
+            "temp_dds_path": ""
+        }
+        self._changed(CAR_ADDED, car_instance_id)
+
+    def remove_car(self, car_instance_id):
+        if self.cars.pop(car_instance_id, None) is not None:
+            self._versions.pop(car_instance_id, None)
+            self._changed(CAR_REMOVED, car_instance_id)
+
+    def add_skin(self, car_instance_id, skin_data):
+        self.cars[car_instance_id]["skins"].append(skin_data)
+        self._changed(SKINS_CHANGED, car_instance_id)
+
+    def skin_updated(self, car_instance_id):
+        """Report a skin of this car that was edited in place"""
+        self._changed(SKINS_CHANGED, car_instance_id)
+
+    def remove_skin(self, car_instance_id, skin_index):
+        """
+        Returns:
+            dict: The removed skin
+        """
+        skin = self.cars[car_instance_id]["skins"].pop(skin_index)
+        self._changed(SKINS_CHANGED, car_instance_id)
+        return skin
@@ -0,0 +1,129 @@
+"""
+Search Index - Substring search over item names with a trigram index
+
+Each item is indexed under one lowercase key (its searchable texts joined).
+Queries keep the substring semantics of the old per-widget scans: items whose
+key contains the query. Queries of three or more characters only verify the
+items found under all of the query's trigrams; shorter queries scan the
+precomputed keys. Narrowing a query (typing one more character) only re-checks
+the previous result. An optional fuzzy fallback matches the query as a
+subsequence and returns the hits ranked, best first.
+"""
+from typing import Collection, Dict, Hashable, Iterable, List, Optional, Set
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _fuzzy_score(query: str, key: str) -> Optional[int]:
+    """Lower is better; None if query is not a subsequence of key"""
+    position = -1
+    gaps = 0
+    for char in query:
+        found = key.find(char, position + 1)
+        if found < 0:
+            return None
+        if position >= 0:
+            gaps += found - position - 1
+        position = found
+    return gaps + key.find(query[0])
+
+
+class SearchIndex:
+    """item_id -> lowercase key, with trigram postings for fast candidate lookup"""
+
+    def __init__(self):
+        self._keys: Dict[Hashable, str] = {}
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._last_query: Optional[str] = None
+        self._last_result: Set[Hashable] = set()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, item_id):
+        return item_id in self._keys
+
+    def add(self, item_id: Hashable, *texts: str):
+        """Index an item (replacing its previous texts)"""
+        self.remove(item_id)
+        key = "\n".join(text.lower() for text in texts if text)
+        self._keys[item_id] = key
+        for trigram in _trigrams(key):
+            self._postings.setdefault(trigram, set()).add(item_id)
+        self._last_query = None
+
+    def remove(self, item_id: Hashable):
+        key = self._keys.pop(item_id, None)
+        if key is None:
+            return
+        for trigram in _trigrams(key):
+            posting = self._postings.get(trigram)
+            if posting is not None:
+                posting.discard(item_id)
+                if not posting:
+                    del self._postings[trigram]
+        self._last_query = None
+
+    def clear(self):
+        self._keys.clear()
+        self._postings.clear()
+        self._last_query = None
+
+    def rebuild(self, items: Iterable):
+        """
+        Replace the whole index.
+
+        Args:
+            items: Iterable of (item_id, text, ...) tuples
+        """
+        self.clear()
+        for item_id, *texts in items:
+            self.add(item_id, *texts)
+
+    def query(self, query: str, fuzzy: bool = False) -> Optional[Collection[Hashable]]:
+        """
+        Items matching a query.
+
+        Args:
+            query: Text to look for (case-insensitive, surrounding spaces ignored)
+            fuzzy: If nothing contains the query, fall back to subsequence matches
+
+        Returns:
+            set of item ids, a list ranked best first when the fuzzy fallback
+            was used, or None for an empty query (everything matches)
+        """
+        query = query.lower().strip()
+        if not query:
+            return None
+
+        if self._last_query is not None and query.startswith(self._last_query):
+            candidates = self._last_result
+        elif len(query) >= 3:
+            postings = sorted((self._postings.get(t, set()) for t in _trigrams(query)), key=len)
+            candidates = set.intersection(*postings) if postings else set()
+        else:
+            candidates = self._keys.keys()
+
+        result = {item_id for item_id in candidates if query in self._keys[item_id]}
+        self._last_query = query
+        self._last_result = result
+
+        if not result and fuzzy:
+            return self.rank(query)
+        return result
+
+    def rank(self, query: str, limit: Optional[int] = None) -> List[Hashable]:
+        """Fuzzy (subsequence) matches, best first: tighter and earlier matches rank higher"""
+        query = query.lower().strip()
+        if not query:
+            return []
+        scored = []
+        for item_id, key in self._keys.items():
+            score = _fuzzy_score(query, key)
+            if score is not None:
+                scored.append((score, len(key), item_id))
+        scored.sort(key=lambda entry: entry[:2])
+        ids = [item_id for _, _, item_id in scored]
+        return ids[:limit] if limit is not None else ids
@@ -0,0 +1,193 @@
+"""
+UV Catalog - UV map templates for every installed vehicle
+
+Scans all content/vehicles/*.zip archives in a thread pool (listings come from
+the persistent content index) and records, per car ID, the UV map files found
+by the UV-name heuristics. Vehicles whose textures live in a shared archive
+(e.g. the ambulance using vehicles/common/pickup/ in common.zip) get those
+entries too. Results are keyed by archive size/mtime, so a rebuild after a game
+update only re-scans archives that changed.
+"""
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from core.content_index import content_index
+
+UV_MAP_EXTENSIONS = ('.dds', '.png', '.jpg', '.jpeg')
+
+# Keyword found in a vehicle's file names -> folder in common.zip holding its UV maps
+COMMON_UV_SOURCES = {
+    "ambulance": "vehicles/common/pickup/",
+}
+
+_SKIN_VARIANT_UV_PATTERN = re.compile(r'_skin_\w+_uv\d*\.')
+
+
+def is_uv_map_name(filename_lower):
+    """
+    UV map filename heuristics (lowercase basename).
+    Accepts skin+uv, uvmap and uv(1)_layout images; rejects color maps,
+    skin_* files and per-skin UV variants like "<car>_skin_<name>_uv1.dds".
+    """
+    if "color" in filename_lower:
+        return False
+    if filename_lower.startswith("skin_"):
+        return False
+    if _SKIN_VARIANT_UV_PATTERN.search(filename_lower):
+        return False
+
+    has_skin_and_uv = "skin" in filename_lower and "uv" in filename_lower
+    has_uvmap = "uvmap" in filename_lower
+    has_uv_layout = "uv1_layout" in filename_lower or "uv_layout" in filename_lower
+
+    return (has_skin_and_uv or has_uvmap or has_uv_layout) and filename_lower.endswith(UV_MAP_EXTENSIONS)
+
+
+def _uv_maps_in(names, folder, source_zip):
+    found = []
+    for file_path in names:
+        if file_path.startswith(folder) and is_uv_map_name(os.path.basename(file_path).lower()):
+            found.append((file_path, source_zip))
+    return found
+
+
+class UVCatalog:
+    """Per-carid UV map lookup for the configured BeamNG install"""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 2) + 2)
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._build_thread = None
+
+    def _stamp(self, path):
+        try:
+            stat = os.stat(path)
+            return (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return None
+
+    def _scan_vehicle(self, carid, zip_file_path, common_zip_path):
+        """
+        Scan one vehicle archive.
+
+        Returns:
+            tuple: (stamp, common_stamp, [(member, source_zip), ...])
+        """
+        stamp = self._stamp(zip_file_path)
+        all_files = content_index.names(zip_file_path)
+        found_files = _uv_maps_in(all_files, f"vehicles/{carid}/", zip_file_path)
+
+        common_dirs = []
+        for file_path in all_files:
+            filename_lower = os.path.basename(file_path).lower()
+            for keyword, common_dir in COMMON_UV_SOURCES.items():
+                if keyword in filename_lower and common_dir not in common_dirs:
+                    common_dirs.append(common_dir)
+
+        common_stamp = None
+        if common_dirs and os.path.exists(common_zip_path):
+            print(f"[DEBUG] {carid}: also searching common.zip in {common_dirs}")
+            common_stamp = self._stamp(common_zip_path)
+            common_files = content_index.names(common_zip_path)
+            for common_dir in common_dirs:
+                found_files.extend(_uv_maps_in(common_files, common_dir, common_zip_path))
+
+        return stamp, common_stamp, found_files
+
+    def _is_current(self, entry, zip_file_path, common_zip_path):
+        stamp, common_stamp, _ = entry
+        if stamp != self._stamp(zip_file_path):
+            return False
+        return common_stamp is None or common_stamp == self._stamp(common_zip_path)
+
+    def lookup(self, carid, beamng_install):
+        """
+        UV maps for one vehicle, scanning it now if the catalog has no current entry.
+
+        Returns:
+            list: [(member_path, source_zip_path), ...] (empty if none found)
+
+        Raises:
+            FileNotFoundError: if the vehicle archive does not exist
+        """
+        vehicles_path = os.path.join(beamng_install, "content", "vehicles")
+        zip_file_path = os.path.join(vehicles_path, f"{carid}.zip")
+        common_zip_path = os.path.join(vehicles_path, "common.zip")
+
+        if not os.path.exists(zip_file_path):
+            raise FileNotFoundError(zip_file_path)
+
+        with self._lock:
+            entry = self._entries.get(carid)
+        if entry is not None and self._is_current(entry, zip_file_path, common_zip_path):
+            return list(entry[2])
+
+        entry = self._scan_vehicle(carid, zip_file_path, common_zip_path)
+        with self._lock:
+            self._entries[carid] = entry
+        return list(entry[2])
+
+    def build(self, beamng_install, cancel_event=None):
+        """
+        Catalog every vehicle archive in parallel, re-scanning only stale entries.
+
+        Returns:
+            int: Number of vehicles (re)scanned
+        """
+        vehicles_path = os.path.join(beamng_install, "content", "vehicles")
+        if not os.path.isdir(vehicles_path):
+            return 0
+
+        common_zip_path = os.path.join(vehicles_path, "common.zip")
+        pending = []
+        for filename in os.listdir(vehicles_path):
+            if not filename.lower().endswith(".zip") or filename.lower() == "common.zip":
+                continue
+            carid = filename[:-4]
+            zip_file_path = os.path.join(vehicles_path, filename)
+            with self._lock:
+                entry = self._entries.get(carid)
+            if entry is None or not self._is_current(entry, zip_file_path, common_zip_path):
+                pending.append((carid, zip_file_path))
+
+        def scan(item):
+            carid, zip_file_path = item
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            try:
+                entry = self._scan_vehicle(carid, zip_file_path, common_zip_path)
+            except Exception as e:
+                print(f"[WARNING] UV catalog: could not scan {carid}: {e}")
+                return
+            with self._lock:
+                self._entries[carid] = entry
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="UVCatalog") as pool:
+            list(pool.map(scan, pending))
+
+        # Newly read archive listings are worth keeping for the next launch
+        content_index.save()
+        print(f"[DEBUG] UV catalog: {len(pending)} vehicle(s) scanned, {len(self._entries)} cataloged")
+        return len(pending)
+
+    def start_background_build(self, beamng_install):
+        """Run build() in a daemon thread (no-op if one is already running)"""
+        if self._build_thread is not None and self._build_thread.is_alive():
+            return self._build_thread
+
+        def worker():
+            try:
+                self.build(beamng_install)
+            except Exception as e:
+                print(f"[ERROR] UV catalog build failed: {e}")
+
+        self._build_thread = threading.Thread(target=worker, daemon=True, name="UVCatalogBuild")
+        self._build_thread.start()
+        return self._build_thread
+
+
+# Shared instance used by the UI
+uv_catalog = UVCatalog()
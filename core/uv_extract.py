@@ -0,0 +1,226 @@
+"""
+UV Extract - Background extraction of UV maps from BeamNG vehicle archives
+
+Members are streamed out of the zip in chunks (DDS UV maps can be tens of MB),
+written to a ".part" file and renamed into place only when complete, so a
+cancelled or failed extraction never leaves a truncated texture behind.
+Archives come from the shared memory-mapped archive pool, so multiple maps are
+extracted in parallel straight from one mapping. DDS maps can optionally be converted to PNG in a process pool, since
+decoding block-compressed textures is CPU bound.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+from core.archive_reader import archive_pool
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ExtractionCancelled(Exception):
+    """Raised inside a worker when the job's cancel event is set"""
+
+
+def can_convert_dds():
+    """True if Pillow is available to convert DDS maps to PNG"""
+    return Image is not None
+
+
+def convert_dds_to_png(dds_path, png_path=None):
+    """
+    Convert one DDS file to PNG. Runs in a worker process, so it only takes
+    and returns plain values.
+
+    Returns:
+        str: Path of the written PNG
+
+    Raises:
+        RuntimeError: if Pillow is not installed
+    """
+    if Image is None:
+        raise RuntimeError("Pillow is required to convert DDS files")
+
+    png_path = png_path or os.path.splitext(dds_path)[0] + ".png"
+    with Image.open(dds_path) as image:
+        image.load()
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        image.save(png_path, "PNG")
+    return png_path
+
+
+class UVExtractionJob:
+    """
+    Extract a set of UV maps in the background.
+
+    Each item is (member_path, source_zip, destination). A destination ending in
+    ".png" for a ".dds" member extracts the DDS next to it and converts it.
+    """
+
+    def __init__(self, items, convert_to_png=False, max_workers=None, progress_callback=None):
+        """
+        Args:
+            items: [(member_path, source_zip, destination), ...]
+            convert_to_png: Also write a PNG copy of every extracted DDS
+            max_workers: Parallel extractions (defaults to min(4, len(items)))
+            progress_callback: Optional callable(done_bytes, total_bytes, message),
+                               called from worker threads
+        """
+        self.items = list(items)
+        self.convert_to_png = convert_to_png and can_convert_dds()
+        self.max_workers = max_workers or max(1, min(4, len(self.items)))
+        self.progress_callback = progress_callback
+        self.cancel_event = threading.Event()
+
+        self._lock = threading.Lock()
+        self._done_bytes = 0
+        self._total_bytes = 0
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def _report(self, added_bytes, message):
+        with self._lock:
+            self._done_bytes += added_bytes
+            done, total = self._done_bytes, self._total_bytes
+        if self.progress_callback:
+            self.progress_callback(done, total, message)
+
+    def _plan(self):
+        """Resolve the DDS target and PNG target of every item and size the job"""
+        plan = []
+        for member, source_zip, destination in self.items:
+            png_target = None
+            if member.lower().endswith(".dds"):
+                if destination.lower().endswith(".png"):
+                    png_target = destination
+                    destination = os.path.splitext(destination)[0] + ".dds"
+                elif self.convert_to_png:
+                    png_target = os.path.splitext(destination)[0] + ".png"
+            plan.append((member, source_zip, destination, png_target))
+
+            with archive_pool.lease(source_zip) as archive:
+                self._total_bytes += archive.getinfo(member).file_size
+        return plan
+
+    def _extract_one(self, member, source_zip, destination):
+        """Stream one member to destination via a .part file"""
+        part_path = destination + ".part"
+        try:
+            with archive_pool.lease(source_zip) as archive:
+                with archive.open(member) as source, open(part_path, "wb") as target:
+                    while True:
+                        if self.cancel_event.is_set():
+                            raise ExtractionCancelled()
+                        chunk = source.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        target.write(chunk)
+                        self._report(len(chunk), os.path.basename(member))
+            os.replace(part_path, destination)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        print(f"[DEBUG] UV Map extracted: {os.path.basename(member)} from {os.path.basename(source_zip)} to {destination}")
+        return destination
+
+    def run(self):
+        """
+        Run the job (blocking; call from a worker thread).
+
+        Returns:
+            dict: {"extracted": [paths], "converted": [png paths],
+                   "failed": [(name, error)], "cancelled": bool}
+        """
+        result = {"extracted": [], "converted": [], "failed": [], "cancelled": False}
+        plan = self._plan()
+        self._report(0, "Extracting...")
+
+        conversions = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="UVExtract") as pool:
+            futures = {pool.submit(self._extract_one, member, source_zip, destination): (member, png_target)
+                       for member, source_zip, destination, png_target in plan}
+            for future in as_completed(futures):
+                member, png_target = futures[future]
+                try:
+                    extracted = future.result()
+                except ExtractionCancelled:
+                    result["cancelled"] = True
+                    continue
+                except Exception as e:
+                    print(f"[ERROR] Failed to extract {os.path.basename(member)}: {e}")
+                    result["failed"].append((os.path.basename(member), str(e)))
+                    continue
+                result["extracted"].append(extracted)
+                if png_target:
+                    conversions.append((extracted, png_target))
+
+        if self.cancel_event.is_set():
+            result["cancelled"] = True
+            return result
+
+        if conversions:
+            self._convert(conversions, result)
+
+        return result
+
+    def _convert(self, conversions, result):
+        """Convert extracted DDS maps to PNG in a process pool"""
+        if not can_convert_dds():
+            for dds_path, _ in conversions:
+                result["failed"].append((os.path.basename(dds_path), "Pillow is not installed"))
+            return
+
+        self._report(0, f"Converting {len(conversions)} DDS map(s) to PNG...")
+        workers = max(1, min(len(conversions), os.cpu_count() or 1))
+        # Spawn, not fork: this runs on a worker thread of the Tk process, and forking a
+        # process with Tk and other threads running can deadlock the child
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = {pool.submit(convert_dds_to_png, dds_path, png_path): dds_path
+                       for dds_path, png_path in conversions}
+            for future in as_completed(futures):
+                dds_path = futures[future]
+                if self.cancel_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    result["cancelled"] = True
+                    break
+                try:
+                    png_path = future.result()
+                    result["converted"].append(png_path)
+                    self._report(0, f"Converted {os.path.basename(png_path)}")
+                    print(f"[DEBUG] Converted {os.path.basename(dds_path)} to PNG")
+                except Exception as e:
+                    print(f"[WARNING] Could not convert {os.path.basename(dds_path)} to PNG: {e}")
+                    result["failed"].append((os.path.basename(dds_path), f"PNG conversion: {e}"))
+
+    def start(self, on_complete=None):
+        """
+        Run the job in a daemon thread.
+
+        Args:
+            on_complete: Optional callable(result), called from the worker thread
+        """
+        def worker():
+            try:
+                result = self.run()
+            except Exception as e:
+                print(f"[ERROR] UV extraction failed: {e}")
+                result = {"extracted": [], "converted": [], "failed": [("", str(e))], "cancelled": False}
+            if on_complete:
+                on_complete(result)
+
+        thread = threading.Thread(target=worker, daemon=True, name="UVExtractJob")
+        thread.start()
+        return thread
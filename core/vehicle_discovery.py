@@ -0,0 +1,325 @@
+"""
+Vehicle Discovery - Find vehicles in the BeamNG install and mods folder
+
+Every vehicle zip (content/vehicles/*.zip in the install, and any zip under the
+mods folder), every unpacked mod folder and every zip nested one level inside
+a mod zip is checked for "vehicles/<carid>/info.json", and the car ID and
+display name ("Brand Name") are recorded together with the source spec it was
+found in (see core.vehicle_sources). Results are cached per source by its
+stamp in cache/vehicle_discovery.json, so after the first run only new or
+changed sources are opened. Refreshes run in a background thread and report
+newly found vehicles in batches so the UI can add them as they arrive.
+"""
+import json
+import os
+import re
+import threading
+import time
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from core.materials_writer import parse_relaxed_json
+from core.vehicle_sources import ZipSource, open_source, is_unpacked_mod, source_stamp
+
+VEHICLE_DISCOVERY_FILE = os.path.join("cache", "vehicle_discovery.json")
+VEHICLE_DISCOVERY_VERSION = 2
+
+# kind: "install" (content/vehicles) or "mod" (mods folder)
+# source: spec accepted by core.vehicle_sources.open_source
+VehicleInfo = namedtuple("VehicleInfo", "carid name kind source")
+
+_INFO_JSON_PATTERN = re.compile(r'^vehicles/([^/]+)/info\.json$', re.IGNORECASE)
+
+# Folders under content/vehicles that hold shared parts, not drivable vehicles
+_NON_VEHICLE_IDS = {"common"}
+
+# Seconds between batched on_update calls during a refresh
+UPDATE_INTERVAL = 0.25
+
+
+def vehicle_display_name(carid, info):
+    """Display name from a parsed info.json ("Brand Name"), falling back to the car ID"""
+    if not isinstance(info, dict):
+        return carid
+    name = str(info.get("Name", "")).strip()
+    brand = str(info.get("Brand", "")).strip()
+    if not name:
+        return carid
+    return f"{brand} {name}" if brand and not name.startswith(brand) else name
+
+
+def read_vehicles(source, nested=True):
+    """
+    Car IDs and names of every vehicle with an info.json in a source.
+    Zips stored inside a zip source are searched too (one level deep).
+
+    Returns:
+        list: [(carid, name, source_spec), ...]
+    """
+    vehicles = []
+    for member in source.names():
+        match = _INFO_JSON_PATTERN.match(member)
+        if not match or match.group(1).lower() in _NON_VEHICLE_IDS:
+            continue
+        carid = match.group(1)
+        try:
+            info = parse_relaxed_json(source.read(member).decode("utf-8", errors="replace"))
+        except Exception as e:
+            print(f"[WARNING] Could not read {member} in {os.path.basename(source.spec)}: {e}")
+            info = None
+        vehicles.append((carid, vehicle_display_name(carid, info), source.spec))
+
+    if nested and isinstance(source, ZipSource):
+        for member in source.nested_archives():
+            try:
+                with source.open_nested(member) as inner:
+                    vehicles.extend(read_vehicles(inner, nested=False))
+            except (OSError, zipfile.BadZipFile) as e:
+                print(f"[WARNING] Could not open nested archive {member}: {e}")
+
+    return vehicles
+
+
+class VehicleDiscovery:
+    """Cached catalog of vehicles found in game and mod archives"""
+
+    def __init__(self, cache_path=VEHICLE_DISCOVERY_FILE, max_workers=4):
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self._sources = {}
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._dirty = False
+        self._refresh_thread = None
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def load(self):
+        """Load cached results (cheap; gives the UI last session's vehicles immediately)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+            if not os.path.exists(self.cache_path):
+                return
+
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != VEHICLE_DISCOVERY_VERSION:
+                    print(f"[DEBUG] Vehicle discovery cache version changed, rescanning")
+                    return
+                self._sources = data.get("sources", {})
+                print(f"[DEBUG] Loaded vehicle discovery cache: {len(self._sources)} archives")
+            except Exception as e:
+                print(f"[WARNING] Could not read vehicle discovery cache: {e}")
+                self._sources = {}
+
+    def save(self):
+        """Write the cache atomically if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": VEHICLE_DISCOVERY_VERSION, "sources": dict(self._sources)}
+            self._dirty = False
+
+        try:
+            folder = os.path.dirname(self.cache_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            temp_path = self.cache_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            print(f"[WARNING] Could not save vehicle discovery cache: {e}")
+
+    # -------------------------------------------------------------------------
+    # Scanning
+    # -------------------------------------------------------------------------
+
+    def _list_sources(self, beamng_install, mods_folder):
+        """All zips and unpacked mod folders to check as {abspath: kind}"""
+        sources = {}
+
+        vehicles_path = os.path.join(beamng_install, "content", "vehicles") if beamng_install else ""
+        if vehicles_path and os.path.isdir(vehicles_path):
+            for filename in os.listdir(vehicles_path):
+                if filename.lower().endswith(".zip"):
+                    sources[os.path.abspath(os.path.join(vehicles_path, filename))] = "install"
+
+        if mods_folder and os.path.isdir(mods_folder):
+            for root_dir, dirs, files in os.walk(mods_folder):
+                # Unpacked mods are sources of their own; never walk their (large) trees here
+                for dirname in list(dirs):
+                    folder = os.path.join(root_dir, dirname)
+                    if is_unpacked_mod(folder):
+                        sources[os.path.abspath(folder)] = "mod"
+                        dirs.remove(dirname)
+                for filename in files:
+                    if filename.lower().endswith(".zip"):
+                        sources[os.path.abspath(os.path.join(root_dir, filename))] = "mod"
+
+        return sources
+
+    def refresh(self, beamng_install, mods_folder="", cancel_event=None, on_update=None):
+        """
+        Bring the catalog up to date, opening only new or changed archives.
+
+        Args:
+            beamng_install: BeamNG.drive installation folder
+            mods_folder: BeamNG mods folder (optional)
+            cancel_event: Optional threading.Event to stop early
+            on_update: Optional callable(list of VehicleInfo) with newly found
+                       vehicles, called in batches from the worker thread
+
+        Returns:
+            int: Number of archives that had to be opened
+        """
+        self.load()
+        sources = self._list_sources(beamng_install, mods_folder)
+
+        pending = []
+        for path, kind in sources.items():
+            try:
+                stamp = source_stamp(path)
+            except OSError:
+                continue
+            with self._lock:
+                record = self._sources.get(path)
+            if (record is None or (record["size"], record["mtime_ns"]) != stamp or record["kind"] != kind):
+                pending.append((path, kind, stamp))
+
+        with self._lock:
+            known = set(self.vehicles())
+            for stale in [p for p in self._sources if p not in sources]:
+                del self._sources[stale]
+                self._dirty = True
+
+        batch = []
+        last_update = time.monotonic()
+
+        def scan(path, kind, stamp):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            with open_source(path) as source:
+                return read_vehicles(source)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="VehicleDiscovery") as pool:
+            futures = {pool.submit(scan, *item): item for item in pending}
+            for future in as_completed(futures):
+                path, kind, stamp = futures[future]
+                try:
+                    vehicles = future.result()
+                except (OSError, zipfile.BadZipFile) as e:
+                    print(f"[WARNING] Vehicle discovery: could not read {os.path.basename(path)}: {e}")
+                    vehicles = []
+                if vehicles is None:
+                    continue
+
+                with self._lock:
+                    self._sources[path] = {
+                        "size": stamp[0],
+                        "mtime_ns": stamp[1],
+                        "kind": kind,
+                        "vehicles": vehicles,
+                    }
+                    self._dirty = True
+
+                for carid, name, spec in vehicles:
+                    if carid not in known:
+                        known.add(carid)
+                        batch.append(VehicleInfo(carid, name, kind, spec))
+
+                if on_update and batch and time.monotonic() - last_update >= UPDATE_INTERVAL:
+                    on_update(batch)
+                    batch = []
+                    last_update = time.monotonic()
+
+        if on_update and batch:
+            on_update(batch)
+
+        self.save()
+        print(f"[DEBUG] Vehicle discovery: {len(sources)} archives, {len(pending)} scanned, "
+              f"{len(self.vehicles())} vehicles known")
+        return len(pending)
+
+    def start_background_refresh(self, beamng_install, mods_folder="", on_update=None, on_complete=None):
+        """
+        Run refresh() in a daemon thread (no-op if one is already running).
+
+        Args:
+            on_update: Optional callable(list of VehicleInfo), from the worker thread
+            on_complete: Optional callable(scanned_count), from the worker thread
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return self._refresh_thread
+
+        def worker():
+            try:
+                scanned = self.refresh(beamng_install, mods_folder, on_update=on_update)
+            except Exception as e:
+                print(f"[ERROR] Vehicle discovery failed: {e}")
+                scanned = 0
+            if on_complete:
+                on_complete(scanned)
+
+        self._refresh_thread = threading.Thread(target=worker, daemon=True, name="VehicleDiscovery")
+        self._refresh_thread.start()
+        return self._refresh_thread
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def vehicles(self):
+        """
+        Every discovered vehicle; install archives win over mods for the same car ID.
+
+        Returns:
+            dict: {carid: VehicleInfo}
+        """
+        self.load()
+        found = {}
+        with self._lock:
+            for record in self._sources.values():
+                for carid, name, spec in record["vehicles"]:
+                    existing = found.get(carid)
+                    if existing is None or (existing.kind == "mod" and record["kind"] == "install"):
+                        found[carid] = VehicleInfo(carid, name, record["kind"], spec)
+        return found
+
+
+def has_template(carid):
+    """True if a SKINNAME template exists for the vehicle (required to generate skins)"""
+    return os.path.isdir(os.path.join("vehicles", carid, "SKINNAME"))
+
+
+def merged_vehicles(vehicle_ids, added_vehicles, templated_only=False):
+    """
+    One {carid: display_name} view of built-in, discovered and developer-added vehicles.
+    Curated names in vehicle_ids win over info.json names; added_vehicles win over both.
+
+    Args:
+        vehicle_ids: Built-in names (core.config.VEHICLE_IDS)
+        added_vehicles: Developer-added vehicles (added_vehicles.json)
+        templated_only: Only include discovered vehicles that have a SKINNAME template
+
+    Returns:
+        dict: {carid: display_name}
+    """
+    merged = {}
+    for carid, info in vehicle_discovery.vehicles().items():
+        if not templated_only or has_template(carid):
+            merged[carid] = info.name
+    merged.update(vehicle_ids)
+    merged.update(added_vehicles)
+    return merged
+
+
+# Shared instance used by the UI
+vehicle_discovery = VehicleDiscovery()
@@ -0,0 +1,111 @@
+"""
+Vehicle Model - Observable set of known vehicles
+
+Views subscribe to the model and apply only what changed: sync() diffs a new
+snapshot against the current one and emits one event per added, removed or
+renamed vehicle, so adding a single vehicle costs the listeners a single
+update instead of a full rebuild. The model is not thread safe; call it from
+the UI thread.
+"""
+from collections import namedtuple
+
+VEHICLE_ADDED = "added"
+VEHICLE_REMOVED = "removed"
+VEHICLE_RENAMED = "renamed"
+
+# origin: "game" (stock archive), "mod" (mods folder) or "added" (developer-added)
+VehicleEntry = namedtuple("VehicleEntry", "carid name origin")
+
+
+class VehicleModel:
+    """carid -> VehicleEntry with add/remove/rename notifications"""
+
+    def __init__(self):
+        self._entries = {}
+        self._listeners = []
+
+    def subscribe(self, callback):
+        """
+        Register callable(event, entry, previous) for model changes.
+
+        previous is the replaced entry for VEHICLE_RENAMED and None otherwise;
+        for VEHICLE_REMOVED, entry is the removed one.
+        """
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _emit(self, event, entry, previous=None):
+        for callback in list(self._listeners):
+            try:
+                callback(event, entry, previous)
+            except Exception as e:
+                print(f"[WARNING] Vehicle model listener failed on {event} {entry.carid}: {e}")
+
+    def __contains__(self, carid):
+        return carid in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, carid):
+        return self._entries.get(carid)
+
+    def entries(self):
+        """Snapshot of all entries"""
+        return list(self._entries.values())
+
+    def upsert(self, entry):
+        """
+        Add a vehicle or update an existing one.
+
+        A changed name is a rename; a changed origin is reported as remove + add,
+        since views may present vehicles of different origins differently.
+        """
+        previous = self._entries.get(entry.carid)
+        if previous == entry:
+            return
+
+        self._entries[entry.carid] = entry
+        if previous is None:
+            self._emit(VEHICLE_ADDED, entry)
+        elif previous.origin != entry.origin:
+            self._emit(VEHICLE_REMOVED, previous)
+            self._emit(VEHICLE_ADDED, entry)
+        else:
+            self._emit(VEHICLE_RENAMED, entry, previous)
+
+    def remove(self, carid):
+        entry = self._entries.pop(carid, None)
+        if entry is not None:
+            self._emit(VEHICLE_REMOVED, entry)
+
+    def sync(self, entries):
+        """
+        Make the model match a full snapshot, emitting only the differences.
+
+        Args:
+            entries: Iterable of VehicleEntry
+
+        Returns:
+            int: Number of vehicles added, removed or changed
+        """
+        snapshot = {entry.carid: entry for entry in entries}
+        changes = 0
+
+        for carid in [c for c in self._entries if c not in snapshot]:
+            self.remove(carid)
+            changes += 1
+
+        for entry in snapshot.values():
+            if self._entries.get(entry.carid) != entry:
+                self.upsert(entry)
+                changes += 1
+
+        return changes
+
+
+# Shared instance used by the UI
+vehicle_model = VehicleModel()
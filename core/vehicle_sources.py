@@ -0,0 +1,178 @@
+"""
+Vehicle Sources - Uniform read access to zipped, unpacked and nested mod content
+
+A source is addressed by a spec string:
+    "<path>.zip"                     a zip archive
+    "<folder>"                       an unpacked mod folder (contains vehicles/...)
+    "<outer>.zip::<inner>.zip"       a zip stored inside another zip
+
+Every source lists its files as "/"-separated paths relative to the mod root
+and reads them as bytes, so discovery and template import do not care how a
+mod is packaged. Nested archives are only opened when a source is actually
+read, and each source has a cheap stamp for cache invalidation.
+"""
+import os
+
+from core.archive_reader import archive_pool
+
+NESTED_SEPARATOR = "::"
+
+# Deflated nested archives are inflated into memory; larger ones are skipped
+MAX_NESTED_ZIP_SIZE = 512 * 1024 * 1024
+
+
+class VehicleSource:
+    """Base class: a mod root whose files can be listed and read"""
+
+    spec = ""
+
+    def names(self):
+        raise NotImplementedError
+
+    def read(self, name):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ZipSource(VehicleSource):
+    """
+    A zip archive on disk (leased from the shared archive pool until close()),
+    or one nested in another zip
+    """
+
+    def __init__(self, spec, archive=None, parent=None):
+        self.spec = spec
+        self._pooled = archive is None
+        self._archive = archive_pool.acquire(spec) if archive is None else archive
+        # Outer source closed along with this one (nested sources opened by open_source)
+        self._parent = parent
+
+    def names(self):
+        return self._archive.names()
+
+    def read(self, name):
+        return self._archive.read(name)
+
+    def nested_archives(self):
+        """Members that are themselves zips and small enough to open"""
+        return [entry.name for entry in self._archive.entries()
+                if entry.name.lower().endswith(".zip") and entry.file_size <= MAX_NESTED_ZIP_SIZE]
+
+    def open_nested(self, member, close_parent=False):
+        """
+        Open a zip stored inside this one as its own source (read in place if stored).
+        It must be closed before this source, unless close_parent hands this
+        source over to it.
+        """
+        spec = f"{self.spec}{NESTED_SEPARATOR}{member}"
+        return ZipSource(spec, self._archive.open_nested(member, spec), self if close_parent else None)
+
+    def close(self):
+        archive, self._archive = self._archive, None
+        if archive is not None and self._pooled:
+            archive_pool.release(archive)
+        parent, self._parent = self._parent, None
+        if parent is not None:
+            parent.close()
+
+
+class DirectorySource(VehicleSource):
+    """An unpacked mod folder; only its vehicles/ tree is listed"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self._names = None
+
+    def names(self):
+        if self._names is None:
+            names = []
+            vehicles_root = os.path.join(self.spec, "vehicles")
+            for root_dir, _, files in os.walk(vehicles_root):
+                rel_dir = os.path.relpath(root_dir, self.spec).replace(os.sep, "/")
+                names.extend(f"{rel_dir}/{filename}" for filename in files)
+            self._names = names
+        return self._names
+
+    def read(self, name):
+        with open(os.path.join(self.spec, *name.split("/")), "rb") as f:
+            return f.read()
+
+
+def open_source(spec):
+    """
+    Open a source from its spec string.
+
+    Raises:
+        OSError, zipfile.BadZipFile, KeyError (missing nested member)
+    """
+    parts = spec.split(NESTED_SEPARATOR)
+    if len(parts) == 1 and os.path.isdir(spec):
+        return DirectorySource(spec)
+
+    source = ZipSource(parts[0])
+    for member in parts[1:]:
+        try:
+            source = source.open_nested(member, close_parent=True)
+        except BaseException:
+            source.close()
+            raise
+    return source
+
+
+def is_unpacked_mod(folder):
+    """True if a folder looks like an unpacked mod (has a vehicles/ subfolder)"""
+    return os.path.isdir(os.path.join(folder, "vehicles"))
+
+
+def source_stamp(spec):
+    """
+    Cheap change stamp for a source: (size, mtime_ns) of the outer file for zips
+    and nested zips; for folders, (vehicle count, newest mtime) over vehicles/,
+    each vehicles/<carid>/ and each info.json.
+
+    Raises:
+        OSError
+    """
+    path = spec.split(NESTED_SEPARATOR)[0]
+    if not os.path.isdir(path):
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+
+    vehicles_root = os.path.join(path, "vehicles")
+    newest = os.stat(vehicles_root).st_mtime_ns
+    count = 0
+    with os.scandir(vehicles_root) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            count += 1
+            newest = max(newest, entry.stat().st_mtime_ns)
+            try:
+                newest = max(newest, os.stat(os.path.join(entry.path, "info.json")).st_mtime_ns)
+            except OSError:
+                pass
+    return count, newest
+
+
+def member_stamp(spec, member):
+    """
+    Change stamp for one member of a source: (size, mtime_ns) of the member
+    file itself in a folder (editing it in place changes no folder mtime),
+    otherwise the source_stamp of the archive.
+
+    Raises:
+        OSError
+    """
+    path = spec.split(NESTED_SEPARATOR)[0]
+    if NESTED_SEPARATOR not in spec and os.path.isdir(path):
+        stat = os.stat(os.path.join(path, *member.split("/")))
+        return stat.st_size, stat.st_mtime_ns
+    return source_stamp(spec)
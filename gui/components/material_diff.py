@@ -0,0 +1,267 @@
+"""
+Material Diff Viewer - Compare a generated materials file against a template or stock file
+"""
+import os
+import re
+import threading
+import customtkinter as ctk
+from tkinter import filedialog
+
+from gui.state import state
+from core.material_diff import diff_material_files, format_diff_entry
+
+# Rendering more lines than this makes the textbox sluggish; the summary still counts everything
+MAX_DISPLAYED_ENTRIES = 5000
+
+# Zip members are addressed as "<archive>.zip::<member path>"
+# (nested archives: "<outer>.zip::<inner>.zip::<member path>")
+ZIP_MEMBER_SEPARATOR = "::"
+
+_SKIN_FOLDER_PATTERN = re.compile(r'[\\/]vehicles[\\/]([^\\/]+)[\\/]([^\\/]+)[\\/]([^\\/]+)$', re.IGNORECASE)
+
+
+def _split_source(source):
+    """Split "archive.zip::member" into (path, member); plain paths return (path, None)"""
+    if ZIP_MEMBER_SEPARATOR in source:
+        path, member = source.rsplit(ZIP_MEMBER_SEPARATOR, 1)
+        return path, member.replace("\\", "/").lstrip("/")
+    return source, None
+
+
+def find_skinname_template(materials_path):
+    """
+    Locate the SKINNAME template matching a generated skin's materials file.
+    ".../vehicles/<carid>/<skin>/skin.materials.json" -> "vehicles/<carid>/SKINNAME/<same or materials.json>"
+
+    Returns:
+        str or None
+    """
+    match = _SKIN_FOLDER_PATTERN.search(materials_path)
+    if not match:
+        return None
+
+    carid, _, filename = match.groups()
+    template_folder = os.path.join("vehicles", carid, "SKINNAME")
+    for candidate in (filename, "skin.materials.json", "materials.json"):
+        candidate_path = os.path.join(template_folder, candidate)
+        if os.path.exists(candidate_path):
+            return os.path.abspath(candidate_path)
+    return None
+
+
+class MaterialDiffDialog:
+    """Window that structurally diffs two materials files in the background"""
+
+    def __init__(self, parent, left_source="", right_source=""):
+
+        print(f"[DEBUG] MaterialDiffDialog.__init__ called")
+        self.parent = parent
+        self._request_id = 0
+
+        self.left_var = ctk.StringVar(value=left_source)
+        self.right_var = ctk.StringVar(value=right_source)
+        self.match_skins_var = ctk.BooleanVar(value=True)
+
+        self.dialog = ctk.CTkToplevel(parent)
+        self.dialog.title("Compare Materials")
+        self.dialog.geometry("980x680")
+        self.dialog.transient(parent)
+        self.dialog.configure(fg_color=state.colors["app_bg"])
+
+        self._setup_ui()
+
+        if left_source and right_source:
+            self.compare()
+
+    def _setup_ui(self):
+        """Build the file pickers, options and result view"""
+        pickers = ctk.CTkFrame(self.dialog, fg_color=state.colors["frame_bg"], corner_radius=12)
+        pickers.pack(fill="x", padx=10, pady=(10, 5))
+        pickers.grid_columnconfigure(1, weight=1)
+
+        for row, (label, variable, placeholder) in enumerate((
+            ("Left (template / stock):", self.left_var, "materials.json, or archive.zip::vehicles/<carid>/<file>"),
+            ("Right (generated):", self.right_var, "Generated skin.materials.json"),
+        )):
+            ctk.CTkLabel(
+                pickers,
+                text=label,
+                font=ctk.CTkFont(size=13),
+                text_color=state.colors["text"]
+            ).grid(row=row, column=0, sticky="w", padx=10, pady=5)
+
+            ctk.CTkEntry(
+                pickers,
+                textvariable=variable,
+                placeholder_text=placeholder,
+                fg_color=state.colors["card_bg"],
+                border_color=state.colors["border"],
+                text_color=state.colors["text"]
+            ).grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+
+            ctk.CTkButton(
+                pickers,
+                text="Browse",
+                width=80,
+                command=lambda v=variable: self._browse(v),
+                fg_color=state.colors["accent"],
+                hover_color=state.colors["accent_hover"],
+                text_color=state.colors["accent_text"]
+            ).grid(row=row, column=2, padx=(5, 10), pady=5)
+
+        actions = ctk.CTkFrame(self.dialog, fg_color="transparent")
+        actions.pack(fill="x", padx=10, pady=5)
+
+        ctk.CTkButton(
+            actions,
+            text="🔍 Compare",
+            width=120,
+            command=self.compare,
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"],
+            text_color=state.colors["accent_text"]
+        ).pack(side="left")
+
+        ctk.CTkButton(
+            actions,
+            text="⇄ Swap",
+            width=80,
+            command=self._swap,
+            fg_color=state.colors["card_bg"],
+            hover_color=state.colors["card_hover"],
+            text_color=state.colors["text"]
+        ).pack(side="left", padx=(8, 0))
+
+        ctk.CTkButton(
+            actions,
+            text="Use SKINNAME Template",
+            width=170,
+            command=self._use_template,
+            fg_color=state.colors["card_bg"],
+            hover_color=state.colors["card_hover"],
+            text_color=state.colors["text"]
+        ).pack(side="left", padx=(8, 0))
+
+        ctk.CTkCheckBox(
+            actions,
+            text="Pair skin materials by prefix",
+            variable=self.match_skins_var,
+            command=self.compare,
+            text_color=state.colors["text"],
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"]
+        ).pack(side="left", padx=(15, 0))
+
+        self.summary_label = ctk.CTkLabel(
+            self.dialog,
+            text="Select two materials files to compare",
+            font=ctk.CTkFont(size=12),
+            text_color=state.colors["text"],
+            anchor="w"
+        )
+        self.summary_label.pack(fill="x", padx=15, pady=(5, 0))
+
+        self.result_box = ctk.CTkTextbox(
+            self.dialog,
+            fg_color=state.colors["frame_bg"],
+            text_color=state.colors["text"],
+            font=ctk.CTkFont(family="Courier", size=12),
+            wrap="none"
+        )
+        self.result_box.pack(fill="both", expand=True, padx=10, pady=(5, 10))
+        self.result_box.tag_config("added", foreground=state.colors["success"])
+        self.result_box.tag_config("removed", foreground=state.colors["error"])
+        self.result_box.tag_config("changed", foreground=state.colors["warning"])
+        self.result_box.configure(state="disabled")
+
+    def _browse(self, variable):
+        filename = filedialog.askopenfilename(
+            parent=self.dialog,
+            title="Select materials file",
+            filetypes=[("Materials files", "*.json"), ("All files", "*.*")]
+        )
+        if filename:
+            variable.set(filename)
+            self.compare()
+
+    def _swap(self):
+        left, right = self.left_var.get(), self.right_var.get()
+        self.left_var.set(right)
+        self.right_var.set(left)
+        self.compare()
+
+    def _use_template(self):
+        template = find_skinname_template(self.right_var.get().strip())
+        if template:
+            self.left_var.set(template)
+            self.compare()
+        else:
+            self.summary_label.configure(text="⚠ No SKINNAME template found for the right-hand file")
+
+    def compare(self):
+        """Parse (through the shared cache) and diff in a worker thread"""
+        left_source = self.left_var.get().strip()
+        right_source = self.right_var.get().strip()
+        if not left_source or not right_source:
+            return
+
+        self._request_id += 1
+        request_id = self._request_id
+        match_skins = self.match_skins_var.get()
+        self.summary_label.configure(text="Comparing...")
+
+        def worker():
+            try:
+                left_path, left_member = _split_source(left_source)
+                right_path, right_member = _split_source(right_source)
+                entries = diff_material_files(left_path, right_path, left_member, right_member, match_skins)
+                error = None
+            except Exception as e:
+                print(f"[ERROR] Material diff failed: {e}")
+                entries, error = [], str(e)
+            self.dialog.after(0, lambda: self._show_results(request_id, entries, error))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show_results(self, request_id, entries, error):
+        # A newer comparison was started while this one ran
+        if request_id != self._request_id or not self.dialog.winfo_exists():
+            return
+
+        self.result_box.configure(state="normal")
+        self.result_box.delete("1.0", "end")
+
+        if error:
+            self.summary_label.configure(text=f"❌ {error}")
+            self.result_box.configure(state="disabled")
+            return
+
+        counts = {"added": 0, "removed": 0, "changed": 0}
+        for entry in entries:
+            counts[entry.kind] += 1
+
+        summary = f"{len(entries)} difference(s): {counts['changed']} changed, {counts['added']} added, {counts['removed']} removed"
+        if len(entries) > MAX_DISPLAYED_ENTRIES:
+            summary += f" (showing first {MAX_DISPLAYED_ENTRIES})"
+        if not entries:
+            summary = "✓ No structural differences"
+        self.summary_label.configure(text=summary)
+
+        # Group lines by kind so each tag is applied with one insert per run of lines
+        current_kind = None
+        run = []
+        for entry in entries[:MAX_DISPLAYED_ENTRIES]:
+            if entry.kind != current_kind and run:
+                self.result_box.insert("end", "\n".join(run) + "\n", current_kind)
+                run = []
+            current_kind = entry.kind
+            run.append(format_diff_entry(entry))
+        if run:
+            self.result_box.insert("end", "\n".join(run) + "\n", current_kind)
+
+        self.result_box.configure(state="disabled")
+
+
+def show_material_diff_dialog(parent, left_source="", right_source=""):
+    """Open the material diff viewer"""
+    return MaterialDiffDialog(parent, left_source, right_source)
@@ -1,11 +1,73 @@
 """
 Navigation Components - Sidebar and Topbar
 """
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 import customtkinter as ctk
 from tkinter import filedialog
 from gui.state import state
 from gui.components.preview import HoverPreviewManager
+from gui.components.virtual_list import VirtualList, VirtualRow
+from gui.components.refresh_scheduler import Debouncer, SEARCH_DEBOUNCE_MS
+from core.search_index import SearchIndex
+from core.vehicle_discovery import merged_vehicles, has_template
+from core.mods_inventory import mods_inventory, format_size
+
+# 38px button + 2px spacing above and below; the expanded row adds the 32px add button
+VEHICLE_ROW_HEIGHT = 42
+VEHICLE_ROW_EXPANDED_EXTRA = 37
+
+
+class _SidebarVehicleRow(VirtualRow):
+    """Recycled sidebar row: vehicle button plus its (expandable) add button"""
+
+    def __init__(self, master, sidebar: "Sidebar"):
+        super().__init__(master)
+        self.sidebar = sidebar
+        self.display_name = ""
+
+        self.container = ctk.CTkFrame(self.frame, corner_radius=8, fg_color="transparent")
+        self.container.pack(fill="x", pady=2, padx=0)
+
+        self.btn = ctk.CTkButton(
+            self.container,
+            text="",
+            fg_color=state.colors["card_bg"],
+            hover_color=state.colors["card_hover"],
+            height=38,
+            corner_radius=8,
+            text_color=state.colors["text"],
+            anchor="w",
+            font=ctk.CTkFont(size=13, weight="bold"),
+            command=lambda: self.sidebar._toggle_vehicle_add_button(self.item_id)
+        )
+        self.btn.pack(fill="x")
+
+        self.add_button_frame = ctk.CTkFrame(self.container, fg_color="transparent")
+
+        ctk.CTkButton(
+            self.add_button_frame,
+            text="➕ Add to Project",
+            command=lambda: self.sidebar._add_vehicle_callback(self.item_id, self.display_name),
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"],
+            text_color=state.colors["accent_text"],
+            height=32,
+            corner_radius=6,
+            font=ctk.CTkFont(size=10, weight="bold")
+        ).pack(fill="x")
+
+        self.btn.bind("<Enter>", lambda e: self.sidebar.preview_manager.schedule_hover_preview(
+            self.item_id, self.btn, neighbours=lambda: self.sidebar.vehicle_list.neighbours(self.item_id)))
+        self.btn.bind("<Leave>", lambda e: self.sidebar.preview_manager.hide_hover_preview())
+
+    def bind(self, item_id, data, expanded):
+        self.display_name = data
+        self.btn.configure(text=data)
+        if expanded:
+            self.add_button_frame.pack(fill="x", padx=5, pady=(0, 5))
+        else:
+            self.add_button_frame.pack_forget()
+
 
 print(f"[DEBUG] Loading class: Sidebar")
 
@@ -24,10 +86,12 @@ class Sidebar(ctk.CTkFrame):
         self.sidebar_search_var = ctk.StringVar()
         self.sidebar_search_placeholder = "🔍 Search vehicles..."
 
-        self.expanded_vehicle_carid: Optional[str] = None
-
         self.custom_output_frame: Optional[ctk.CTkFrame] = None
-        self.sidebar_scroll: Optional[ctk.CTkScrollableFrame] = None
+        self.vehicle_list: Optional[VirtualList] = None
+        self.vehicle_search_index = SearchIndex()
+        # Matching carids for the current search, None when not searching
+        self._vehicle_matches = None
+        self._add_vehicle_callback: Optional[Callable[[str, str], None]] = None
 
         self._setup_ui()
 
@@ -178,6 +242,16 @@ class Sidebar(ctk.CTkFrame):
         )
         custom_browse_btn.pack(side="right", padx=(0, 15))
 
+        self.mods_usage_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=ctk.CTkFont(size=10),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        )
+        self.mods_usage_label.pack(fill="x", padx=15, pady=(2, 0))
+        mods_inventory.add_listener(lambda folder: self.after(0, self.update_mods_usage))
+
         separator = ctk.CTkFrame(self, height=2, fg_color=state.colors["border"])
         separator.pack(fill="x", padx=15, pady=(10, 10))
 
@@ -211,15 +285,19 @@ class Sidebar(ctk.CTkFrame):
         self.sidebar_search_entry.bind("<FocusIn>", self._on_search_focus_in)
         self.sidebar_search_entry.bind("<FocusOut>", self._on_search_focus_out)
 
-        self.sidebar_search_var.trace_add("write", lambda *args: self._filter_vehicles())
+        self.sidebar_search_var.trace_add("write", Debouncer(self, SEARCH_DEBOUNCE_MS, self._filter_vehicles))
 
-        self.sidebar_scroll = ctk.CTkScrollableFrame(
+        # Only the rows in view exist as widgets; they are recycled while scrolling
+        self.vehicle_list = VirtualList(
             self,
-            fg_color="transparent",
+            row_factory=self._create_vehicle_row,
+            row_height=VEHICLE_ROW_HEIGHT,
+            expanded_extra_height=VEHICLE_ROW_EXPANDED_EXTRA,
+            bg_color=state.colors["sidebar_bg"],
             scrollbar_button_color=state.colors["border"],
             scrollbar_button_hover_color=state.colors["card_hover"]
         )
-        self.sidebar_scroll.pack(fill="both", expand=True, padx=15, pady=(0, 10))
+        self.vehicle_list.pack(fill="both", expand=True, padx=15, pady=(0, 10))
 
     def _on_mod_name_focus_in(self, event):
         """Handle focus in for mod name entry"""
@@ -265,27 +343,36 @@ class Sidebar(ctk.CTkFrame):
         else:
             self.custom_output_frame.pack_forget()
 
-    def _filter_vehicles(self):
-        """Filter vehicle buttons based on search"""
-        search_query = self.sidebar_search_var.get()
+    def update_mods_usage(self):
+        """Show how many generated mods are in the mods folder and the space they use"""
+        from core.settings import get_mods_folder_path
 
-        if search_query == self.sidebar_search_placeholder:
-            search_query = ""
+        mods_folder = get_mods_folder_path()
+        if not mods_folder:
+            self.mods_usage_label.configure(text="")
+            return
 
-        search_query = search_query.lower()
+        count, total_bytes = mods_inventory.usage(mods_folder)
+        self.mods_usage_label.configure(text=f"Our mods in folder: {count} ({format_size(total_bytes)})")
 
-        for container, carid, display_name, add_btn_frame in state.sidebar_vehicle_buttons:
+    def _search_query(self) -> str:
+        search_query = self.sidebar_search_var.get()
+        return "" if search_query == self.sidebar_search_placeholder else search_query
 
-            matches = (
-                not search_query or
-                search_query in display_name.lower() or
-                search_query in carid.lower()
-            )
+    def _query_vehicles(self) -> Optional[List[str]]:
+        """Update the search matches; returns the fuzzy ranking (best first) if the fallback was used"""
+        matches = self.vehicle_search_index.query(self._search_query(), fuzzy=True)
+        self._vehicle_matches = None if matches is None else set(matches)
+        return matches if isinstance(matches, list) else None
 
-            if matches:
-                container.pack(fill="x", pady=2, padx=0)
-            else:
-                container.pack_forget()
+    def _filter_vehicles(self):
+        """Filter vehicle buttons based on search (only the visible row set changes)"""
+        ranking = self._query_vehicles()
+
+        if self._vehicle_matches is None:
+            self.vehicle_list.set_filter(None)
+        else:
+            self.vehicle_list.set_filter(lambda carid, display_name: carid in self._vehicle_matches, ranking)
 
     def _get_real_value(self, value: str, placeholder: str) -> str:
         """Get real value, ignoring placeholder"""
@@ -321,104 +408,70 @@ class Sidebar(ctk.CTkFrame):
     def populate_vehicles(self, add_callback: Callable[[str, str], None]):
 
         print(f"[DEBUG] populate_vehicles called")
-        """Populate sidebar with vehicle buttons
+        """Populate sidebar with vehicle buttons (replaces any already listed)
 
         Args:
             add_callback: Function that takes (carid, display_name) and adds vehicle to project
         """
         print("[DEBUG] Populating sidebar with vehicles...")
 
-        all_vehicles = {}
-
-        for carid, display_name in state.vehicle_ids.items():
-            if carid not in state.added_vehicles:
-                all_vehicles[carid] = display_name
+        self._add_vehicle_callback = add_callback
 
-        for carid, carname in state.added_vehicles.items():
-            all_vehicles[carid] = carname
+        # Built-in, developer-added and discovered vehicles that have a template
+        all_vehicles = merged_vehicles(state.vehicle_ids, state.added_vehicles, templated_only=True)
 
-        sorted_vehicles = sorted(all_vehicles.items(), key=lambda x: x[1].lower())
+        self.vehicle_search_index.rebuild((carid, display_name, carid) for carid, display_name in all_vehicles.items())
+        self.vehicle_list.set_ranking(self._query_vehicles())
 
-        for carid, display_name in sorted_vehicles:
-            self._add_vehicle_button(carid, display_name, add_callback)
+        self.vehicle_list.set_items(
+            (carid, display_name.lower(), display_name) for carid, display_name in all_vehicles.items()
+        )
 
-        print(f"[DEBUG] Added {len(state.sidebar_vehicle_buttons)} vehicles to sidebar")
+        print(f"[DEBUG] Added {len(self.vehicle_list)} vehicles to sidebar")
 
-    def _add_vehicle_button(self, carid: str, display_name: str, add_callback: Callable[[str, str], None]):
-        """Add a single vehicle button to the sidebar
+    def add_discovered_vehicles(self, infos):
+        """Add buttons for discovered vehicles that have a template and are not listed yet
 
         Args:
-            carid: Vehicle ID
-            display_name: Display name for the vehicle
-            add_callback: Function that takes (carid, display_name) to add vehicle
+            infos: VehicleInfo items from core.vehicle_discovery
         """
+        if self._add_vehicle_callback is None:
+            return
 
-        insert_position = len(state.sidebar_vehicle_buttons)
-        for i, (container, cid, dname, add_btn_frame) in enumerate(state.sidebar_vehicle_buttons):
-            if dname.lower() > display_name.lower():
-                insert_position = i
-                break
-
-        container_frame = ctk.CTkFrame(self.sidebar_scroll, corner_radius=8, fg_color="transparent")
-
-        btn = ctk.CTkButton(
-            container_frame,
-            text=display_name,
-            fg_color=state.colors["card_bg"],
-            hover_color=state.colors["card_hover"],
-            height=38,
-            corner_radius=8,
-            text_color=state.colors["text"],
-            anchor="w",
-            font=ctk.CTkFont(size=13, weight="bold")
-        )
-        btn.pack(fill="x")
+        for info in infos:
+            if info.carid not in self.vehicle_list and has_template(info.carid):
+                self._add_vehicle_button(info.carid, info.name)
 
-        add_button_frame = ctk.CTkFrame(container_frame, fg_color="transparent")
+    def _add_vehicle_button(self, carid: str, display_name: str):
+        """Add a single vehicle to the sidebar list in sorted position
 
-        add_btn = ctk.CTkButton(
-            add_button_frame,
-            text="➕ Add to Project",
-            command=lambda c=carid, d=display_name: add_callback(c, d),
-            fg_color=state.colors["accent"],
-            hover_color=state.colors["accent_hover"],
-            text_color=state.colors["accent_text"],
-            height=32,
-            corner_radius=6,
-            font=ctk.CTkFont(size=10, weight="bold")
-        )
-        add_btn.pack(fill="x")
-
-        btn.configure(command=lambda c=carid, frame=add_button_frame: self._toggle_vehicle_add_button(c, frame))
-
-        btn.bind("<Enter>", lambda e, c=carid: self.preview_manager.schedule_hover_preview(c, btn))
-        btn.bind("<Leave>", lambda e: self.preview_manager.hide_hover_preview())
-
-        state.sidebar_vehicle_buttons.insert(insert_position, (container_frame, carid, display_name, add_button_frame))
+        Args:
+            carid: Vehicle ID
+            display_name: Display name for the vehicle
+        """
+        self.vehicle_search_index.add(carid, display_name, carid)
+        if self._vehicle_matches is not None:
+            self.vehicle_list.set_ranking(self._query_vehicles())
+        self.vehicle_list.insert(carid, display_name.lower(), display_name)
 
-        for widget in self.sidebar_scroll.winfo_children():
-            if widget in [container for container, _, _, _ in state.sidebar_vehicle_buttons]:
-                widget.pack_forget()
+    def _create_vehicle_row(self, master) -> "_SidebarVehicleRow":
+        return _SidebarVehicleRow(master, self)
 
-        for container, cid, dname, add_frame in state.sidebar_vehicle_buttons:
-            container.pack(fill="x", pady=2, padx=0)
+    @property
+    def expanded_vehicle_carid(self) -> Optional[str]:
+        """Vehicle whose "Add to Project" button is showing"""
+        return self.vehicle_list.expanded_id
 
-    def _toggle_vehicle_add_button(self, carid: str, add_button_frame: ctk.CTkFrame):
+    def _toggle_vehicle_add_button(self, carid: str):
         """Toggle the add button for a vehicle"""
         if self.expanded_vehicle_carid == carid:
-
-            add_button_frame.pack_forget()
-            self.expanded_vehicle_carid = None
+            self.vehicle_list.set_expanded(None)
         else:
+            self.vehicle_list.set_expanded(carid)
 
-            if self.expanded_vehicle_carid is not None:
-                for btn_frame, car_id, _, add_btn_frame in state.sidebar_vehicle_buttons:
-                    if car_id == self.expanded_vehicle_carid:
-                        add_btn_frame.pack_forget()
-                        break
-
-            add_button_frame.pack(fill="x", padx=5, pady=(0, 5))
-            self.expanded_vehicle_carid = carid
+    def collapse_vehicles(self):
+        """Hide any open "Add to Project" button"""
+        self.vehicle_list.set_expanded(None)
 
     def update_icons(self, steam_icon, folder_icon):
 
@@ -1,11 +1,115 @@
 """
 Hover Preview Manager - Handles vehicle preview popups on hover
+
+The overlay's widgets are built once and only reconfigured per hover.
+Thumbnails are decoded and resized once and kept in an LRU cache; while the
+hover delay runs, the hovered vehicle and its neighbours in the list are
+decoded on a background thread so the preview usually shows from the cache.
 """
-from typing import Optional
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Optional
 import customtkinter as ctk
 from PIL import Image
 import os
+import queue
+import threading
 from gui.state import state
+from utils.log import get_logger
+
+log = get_logger(__name__)
+
+PREVIEW_SIZE = (300, 300)
+PREVIEW_CACHE_SIZE = 64
+HOVER_DELAY_MS = 500
+
+FALLBACK_IMAGE = os.path.join("imagesforgui", "common", "imagepreview", "MissingTexture.jpg")
+
+
+def preview_image_path(carid: str) -> Optional[str]:
+    """Preview image of a vehicle, the missing-texture image, or None if neither exists"""
+    image_path = os.path.join("imagesforgui", "vehicles", carid, "default.jpg")
+    if os.path.exists(image_path):
+        return image_path
+    if os.path.exists(FALLBACK_IMAGE):
+        return FALLBACK_IMAGE
+    return None
+
+
+class PreviewImageCache:
+    """LRU cache of resized preview thumbnails (decoded off the UI thread when prefetched)"""
+
+    def __init__(self, capacity: int = PREVIEW_CACHE_SIZE):
+        self.capacity = capacity
+        # carid -> [PIL image or None, CTkImage or None]
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._queued = set()
+        self._worker: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _decode(carid: str):
+        image_path = preview_image_path(carid)
+        if image_path is None:
+            return None
+        with Image.open(image_path) as img:
+            img.thumbnail(PREVIEW_SIZE, Image.Resampling.LANCZOS)
+            img.load()
+            return img.copy()
+
+    def _store(self, carid: str, image):
+        with self._lock:
+            entry = self._entries.get(carid)
+            if entry is None:
+                self._entries[carid] = [image, None]
+                while len(self._entries) > self.capacity:
+                    self._entries.popitem(last=False)
+
+    def get(self, carid: str) -> Optional[ctk.CTkImage]:
+        """CTkImage for a vehicle (decoded now if not cached). Call from the UI thread."""
+        with self._lock:
+            entry = self._entries.get(carid)
+            if entry is not None:
+                self._entries.move_to_end(carid)
+
+        if entry is None:
+            self._store(carid, self._decode(carid))
+            with self._lock:
+                entry = self._entries.get(carid)
+            if entry is None:
+                return None
+
+        image, photo = entry
+        if image is None:
+            return None
+        if photo is None:
+            photo = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
+            entry[1] = photo
+        return photo
+
+    def prefetch(self, carids: Iterable[str]):
+        """Decode thumbnails for these vehicles on the background thread"""
+        with self._lock:
+            for carid in carids:
+                if carid and carid not in self._entries and carid not in self._queued:
+                    self._queued.add(carid)
+                    self._queue.put(carid)
+            if self._worker is None and self._queued:
+                self._worker = threading.Thread(target=self._work, daemon=True, name="PreviewPrefetch")
+                self._worker.start()
+
+    def _work(self):
+        while True:
+            carid = self._queue.get()
+            try:
+                image = self._decode(carid)
+            except Exception as e:
+                log.warning("Could not prefetch preview for %s: %s", carid, e)
+                image = None
+            self._store(carid, image)
+            with self._lock:
+                self._queued.discard(carid)
+
 
 class HoverPreviewManager:
     """Manages hover preview windows for vehicle cards"""
@@ -15,147 +119,108 @@ class HoverPreviewManager:
         self.preview_overlay = preview_overlay
         self.hover_timer: Optional[str] = None
         self.current_hover_carid: Optional[str] = None
+        self.image_cache = PreviewImageCache()
 
-    def show_hover_preview(self, carid: str, x: int, y: int) -> None:
-        """Show preview image for vehicle INSIDE the main window"""
-        print(f"[DEBUG] show_hover_preview called for carid: {carid}")
-        print(f"[DEBUG] Current working directory: {os.getcwd()}")
-
-        mouse_x = self.app.winfo_pointerx() - self.app.winfo_rootx()
-        mouse_y = self.app.winfo_pointery() - self.app.winfo_rooty()
-        print(f"[DEBUG] Mouse position: ({mouse_x}, {mouse_y})")
-
-        for child in self.preview_overlay.winfo_children():
-            child.destroy()
-
-        image_path = os.path.join("imagesforgui", "vehicles", carid, "default.jpg")
-        print(f"[DEBUG] Looking for image at: {image_path}")
-        print(f"[DEBUG] Absolute path: {os.path.abspath(image_path)}")
-        print(f"[DEBUG] Image exists: {os.path.exists(image_path)}")
-
-        if not os.path.exists(image_path):
-            print(f"[DEBUG] Image not found, trying fallback...")
-
-            if os.path.exists("imagesforgui"):
-                print(f"[DEBUG] imagesforgui exists, listing contents:")
-                try:
-                    print(f"[DEBUG] imagesforgui contents: {os.listdir('imagesforgui')}")
-                    if os.path.exists(os.path.join("imagesforgui", "vehicles")):
-                        print(f"[DEBUG] vehicles folder contents: {os.listdir(os.path.join('imagesforgui', 'vehicles'))}")
-                except Exception as e:
-                    print(f"[DEBUG] Error listing directories: {e}")
-            else:
-                print(f"[DEBUG] imagesforgui folder does NOT exist in current directory")
-
-            fallback_path = os.path.join("imagesforgui", "common", "imagepreview", "MissingTexture.jpg")
-            print(f"[DEBUG] Fallback path: {fallback_path}")
-            print(f"[DEBUG] Fallback absolute path: {os.path.abspath(fallback_path)}")
-            print(f"[DEBUG] Fallback exists: {os.path.exists(fallback_path)}")
-            if os.path.exists(fallback_path):
-                image_path = fallback_path
-            else:
-                print(f"[DEBUG] No fallback found, returning early")
-                return
-
-        try:
-            print(f"[DEBUG] Attempting to load image: {image_path}")
-            img = Image.open(image_path)
-            img.thumbnail((300, 300), Image.Resampling.LANCZOS)
-            photo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
-            print(f"[DEBUG] Image loaded successfully, size: {img.size}")
-
-            header = ctk.CTkFrame(self.preview_overlay, fg_color=state.colors["accent"], height=30, corner_radius=8)
-            header.pack(fill="x", padx=2, pady=2)
+        self._header_label: Optional[ctk.CTkLabel] = None
+        self._image_label: Optional[ctk.CTkLabel] = None
 
-            print(f"[DEBUG]   Looking up vehicle name...")
-            print(f"[DEBUG]   Checking state.vehicle_ids: {carid in state.vehicle_ids}")
-            print(f"[DEBUG]   Checking state.added_vehicles: {carid in state.added_vehicles}")
+    def _ensure_overlay_widgets(self):
+        """Build the overlay's header and image label on first use"""
+        if self._image_label is not None:
+            return
 
-            vehicle_name = state.vehicle_ids.get(carid)
-            if not vehicle_name:
-                vehicle_name = state.added_vehicles.get(carid, carid)
-                print(f"[DEBUG]   Found in added_vehicles: {vehicle_name}")
-            else:
-                print(f"[DEBUG]   Found in vehicle_ids: {vehicle_name}")
+        header = ctk.CTkFrame(self.preview_overlay, fg_color=state.colors["accent"], height=30, corner_radius=8)
+        header.pack(fill="x", padx=2, pady=2)
 
-            header_text = f"Name: {vehicle_name} | ID: {carid}"
-            print(f"[DEBUG]   Header text: {header_text}")
+        self._header_label = ctk.CTkLabel(header, text="", text_color=state.colors["accent_text"],
+                                          font=("Segoe UI", 15, "bold"))
+        self._header_label.pack()
 
-            ctk.CTkLabel(header, text=header_text, text_color=state.colors["accent_text"], font=("Segoe UI", 15, "bold")).pack()
+        self._image_label = ctk.CTkLabel(self.preview_overlay, text="")
+        self._image_label.pack(padx=10, pady=5)
 
-            img_label = ctk.CTkLabel(self.preview_overlay, image=photo, text="")
-            img_label.pack(padx=10, pady=5)
+    def show_hover_preview(self, carid: str, x: int, y: int) -> None:
+        """Show preview image for vehicle INSIDE the main window"""
+        try:
+            photo = self.image_cache.get(carid)
+        except Exception as e:
+            log.debug("Error loading preview image for %s: %s", carid, e)
+            return
+        if photo is None:
+            log.debug("No preview image for %s (and no fallback image)", carid)
+            return
 
-            self.app.update_idletasks()
-            app_w = self.app.winfo_width()
-            app_h = self.app.winfo_height()
+        self._ensure_overlay_widgets()
 
-            self.preview_overlay.update_idletasks()
-            p_width = self.preview_overlay.winfo_reqwidth()
-            p_height = self.preview_overlay.winfo_reqheight()
-            print(f"[DEBUG] Preview dimensions: {p_width}x{p_height}, App dimensions: {app_w}x{app_h}")
+        vehicle_name = state.vehicle_ids.get(carid) or state.added_vehicles.get(carid, carid)
+        self._header_label.configure(text=f"Name: {vehicle_name} | ID: {carid}")
+        self._image_label.configure(image=photo)
 
-            pos_x = mouse_x + 20
-            if pos_x + p_width > app_w:
-                pos_x = mouse_x - p_width - 20
+        mouse_x = self.app.winfo_pointerx() - self.app.winfo_rootx()
+        mouse_y = self.app.winfo_pointery() - self.app.winfo_rooty()
+        app_w = self.app.winfo_width()
+        app_h = self.app.winfo_height()
 
-            pos_y = mouse_y + 10
-            if pos_y + p_height > app_h:
-                pos_y = mouse_y - p_height - 10
+        self.preview_overlay.update_idletasks()
+        p_width = self.preview_overlay.winfo_reqwidth()
+        p_height = self.preview_overlay.winfo_reqheight()
 
-            pos_x = max(10, pos_x)
-            pos_y = max(10, pos_y)
-            print(f"[DEBUG] Placing preview at: ({pos_x}, {pos_y})")
+        pos_x = mouse_x + 20
+        if pos_x + p_width > app_w:
+            pos_x = mouse_x - p_width - 20
 
-            self.preview_overlay.place(x=pos_x, y=pos_y)
-            self.preview_overlay.lift()
-            print(f"[DEBUG] Preview displayed successfully")
+        pos_y = mouse_y + 10
+        if pos_y + p_height > app_h:
+            pos_y = mouse_y - p_height - 10
 
-        except Exception as e:
-            print(f"[DEBUG] Error loading image: {e}")
-            import traceback
-            traceback.print_exc()
+        self.preview_overlay.place(x=max(10, pos_x), y=max(10, pos_y))
+        self.preview_overlay.lift()
 
     def hide_hover_preview(self, force: bool = False) -> None:
         """Hide the hover preview overlay"""
-        print(f"[DEBUG] hide_hover_preview called (force={force})")
         if self.hover_timer:
-            print(f"[DEBUG] Cancelling pending hover timer")
             self.app.after_cancel(self.hover_timer)
             self.hover_timer = None
 
         self.current_hover_carid = None
         self.preview_overlay.place_forget()
-        for child in self.preview_overlay.winfo_children():
-            child.destroy()
 
-    def schedule_hover_preview(self, carid: str, widget: ctk.CTkButton) -> None:
-        """Schedule a hover preview with a delay"""
-        print(f"[DEBUG] schedule_hover_preview called for carid: {carid}")
+    def schedule_hover_preview(self, carid: str, widget: ctk.CTkButton,
+                               neighbours: Optional[Callable[[], List[str]]] = None) -> None:
+        """Schedule a hover preview with a delay
 
+        Args:
+            carid: Hovered vehicle
+            widget: Hovered widget
+            neighbours: Optional callable returning the carids listed around this one;
+                        their previews are prefetched during the hover delay
+        """
         if self.hover_timer:
-            print(f"[DEBUG] Cancelling previous timer")
             self.app.after_cancel(self.hover_timer)
 
         self.current_hover_carid = carid
 
+        prefetch = [carid]
+        if neighbours is not None:
+            try:
+                prefetch.extend(neighbours())
+            except Exception as e:
+                log.debug("Could not list preview neighbours of %s: %s", carid, e)
+        self.image_cache.prefetch(prefetch)
+
         def show_after_delay():
-            print(f"[DEBUG] Timer triggered, checking if still hovering: {self.current_hover_carid == carid}")
+            self.hover_timer = None
             if self.current_hover_carid == carid:
-                x = widget.winfo_rootx()
-                y = widget.winfo_rooty()
-                print(f"[DEBUG] Calling show_hover_preview")
-                self.show_hover_preview(carid, x, y)
+                self.show_hover_preview(carid, widget.winfo_rootx(), widget.winfo_rooty())
 
-        print(f"[DEBUG] Setting timer for 500ms")
-        self.hover_timer = self.app.after(500, show_after_delay)
+        self.hover_timer = self.app.after(HOVER_DELAY_MS, show_after_delay)
 
-    def setup_robust_hover(self, widget, carid: str) -> None:
+    def setup_robust_hover(self, widget, carid: str, neighbours: Optional[Callable[[], List[str]]] = None) -> None:
         """Set up hover events recursively for a widget and ALL its descendants"""
 
         def on_enter(event):
 
-            self.schedule_hover_preview(carid, widget)
+            self.schedule_hover_preview(carid, widget, neighbours)
 
         def on_leave(event):
             self.hide_hover_preview()
@@ -174,4 +239,3 @@ class HoverPreviewManager:
                 apply_bindings(child)
 
         apply_bindings(widget)
-        print(f"[DEBUG] Robust recursive hover setup complete for carid: {carid}")
\ No newline at end of file
@@ -0,0 +1,276 @@
+"""
+Project Overview - Virtualized car/skin tree for the Generator tab
+
+Shows the project's cars (and the skins of the expanded car) as rows of a
+VirtualTree. Rows are rebuilt per car only when that car's model version,
+name, selection, expansion or edit state changed, and only rows in view
+exist as widgets, so a click in a project with hundreds of skins redraws a
+handful of rows instead of the whole list.
+"""
+from typing import Callable, Dict, Optional, Set, Tuple
+import customtkinter as ctk
+from gui.state import state
+from gui.components.virtual_list import VirtualTree, VirtualRow
+
+# Row heights including their spacing (see the pady values in each row)
+CAR_ROW_HEIGHT = 42
+SKINS_HEADER_HEIGHT = 26
+SKIN_ROW_HEIGHT = 44
+SKIN_ROW_CONFIG_HEIGHT = 81
+MESSAGE_ROW_HEIGHT = 100
+
+
+class _CarRow(VirtualRow):
+    """Car button with its remove button"""
+
+    def __init__(self, master, overview: "ProjectOverview"):
+        super().__init__(master)
+        self.car_instance_id = None
+
+        self.car_button = ctk.CTkButton(
+            self.frame,
+            text="",
+            height=38,
+            corner_radius=8,
+            anchor="w",
+            font=ctk.CTkFont(size=13, weight="bold"),
+            command=lambda: overview.on_car_click(self.car_instance_id)
+        )
+        self.car_button.pack(fill="x", pady=2)
+
+        remove_btn = ctk.CTkButton(
+            self.car_button,
+            text="✕",
+            width=28,
+            height=28,
+            fg_color=state.colors["error"],
+            hover_color=state.colors["error_hover"],
+            text_color="white",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            corner_radius=6,
+            command=lambda: overview.on_car_remove(self.car_instance_id)
+        )
+        remove_btn.place(relx=1.0, rely=0.5, anchor="e", x=-8)
+
+    def bind(self, item_id, data, token):
+        self.car_instance_id, display_text, is_selected = data
+        self.car_button.configure(
+            text=display_text,
+            fg_color=state.colors["accent"] if is_selected else state.colors["card_bg"],
+            hover_color=state.colors["accent_hover"] if is_selected else state.colors["card_hover"],
+            text_color=state.colors["accent_text"] if is_selected else state.colors["text"]
+        )
+
+
+class _SkinsHeaderRow(VirtualRow):
+    """"Skins:" caption above the expanded car's skins"""
+
+    def __init__(self, master, overview: "ProjectOverview"):
+        super().__init__(master)
+
+        band = ctk.CTkFrame(self.frame, fg_color=state.colors["app_bg"], corner_radius=6, height=21)
+        band.pack(fill="x", padx=5, pady=(5, 0))
+        band.pack_propagate(False)
+
+        ctk.CTkLabel(
+            band,
+            text="Skins:",
+            font=ctk.CTkFont(size=10, weight="bold"),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        ).pack(anchor="w", padx=6, pady=(4, 0))
+
+    def bind(self, item_id, data, token):
+        pass
+
+
+class _SkinRow(VirtualRow):
+    """One skin: name, optional config info and a remove button; click to edit"""
+
+    def __init__(self, master, overview: "ProjectOverview"):
+        super().__init__(master)
+        self.target: Tuple[Optional[str], int] = (None, -1)
+
+        band = ctk.CTkFrame(self.frame, fg_color=state.colors["app_bg"], corner_radius=0)
+        band.pack(fill="both", expand=True, padx=5)
+
+        self.card = ctk.CTkFrame(band, corner_radius=6, height=38, cursor="hand2")
+        self.card.pack(fill="x", padx=6, pady=3)
+        self.card.pack_propagate(False)
+
+        self.icon_label = ctk.CTkLabel(self.card, text="🎨", font=ctk.CTkFont(size=14), cursor="hand2")
+        self.icon_label.pack(side="left", padx=(8, 6), anchor="n", pady=8)
+
+        text_container = ctk.CTkFrame(self.card, fg_color="transparent")
+        text_container.pack(side="left", fill="both", expand=True, padx=(0, 8), pady=4)
+
+        self.name_label = ctk.CTkLabel(
+            text_container,
+            text="",
+            anchor="w",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            cursor="hand2"
+        )
+        self.name_label.pack(anchor="w", fill="x")
+
+        self.config_type_label = ctk.CTkLabel(text_container, text="", anchor="w",
+                                              font=ctk.CTkFont(size=10), cursor="hand2")
+        self.config_name_label = ctk.CTkLabel(text_container, text="", anchor="w",
+                                              font=ctk.CTkFont(size=10), cursor="hand2")
+
+        buttons_frame = ctk.CTkFrame(self.card, fg_color="transparent")
+        buttons_frame.pack(side="right", padx=6, anchor="n", pady=4)
+
+        ctk.CTkButton(
+            buttons_frame,
+            text="✕",
+            width=28,
+            height=28,
+            fg_color=state.colors["error"],
+            hover_color=state.colors["error_hover"],
+            text_color="white",
+            font=ctk.CTkFont(size=13, weight="bold"),
+            corner_radius=6,
+            command=lambda: overview.on_skin_remove(*self.target)
+        ).pack(side="left", padx=2)
+
+        for widget in (self.card, self.icon_label, text_container, self.name_label,
+                       self.config_type_label, self.config_name_label):
+            widget.bind("<Button-1>", lambda e: overview.on_skin_click(*self.target))
+
+    def bind(self, item_id, data, token):
+        car_instance_id, skin_index, skin, is_editing = data
+        self.target = (car_instance_id, skin_index)
+
+        text_color = state.colors["accent_text"] if is_editing else state.colors["text"]
+        detail_color = state.colors["accent_text"] if is_editing else state.colors["text_secondary"]
+        has_config = "config_data" in skin
+
+        self.card.configure(
+            height=75 if has_config else 38,
+            fg_color=state.colors["accent"] if is_editing else state.colors["card_bg"]
+        )
+        self.icon_label.configure(text="✏️" if is_editing else "🎨")
+        self.name_label.configure(text=f"{skin_index + 1}. {skin['name']}", text_color=text_color)
+
+        if has_config:
+            config_data = skin["config_data"]
+            self.config_type_label.configure(text=f"Config Type: {config_data.get('config_type', 'Unknown')}",
+                                             text_color=detail_color)
+            self.config_name_label.configure(text=f"Config Name: {config_data.get('config_name', 'Unknown')}",
+                                             text_color=detail_color)
+            self.config_type_label.pack(anchor="w", fill="x")
+            self.config_name_label.pack(anchor="w", fill="x")
+        else:
+            self.config_type_label.pack_forget()
+            self.config_name_label.pack_forget()
+
+
+class _MessageRow(VirtualRow):
+    """Placeholder text for an empty project or a search without results"""
+
+    def __init__(self, master, overview: "ProjectOverview"):
+        super().__init__(master)
+        self.label = ctk.CTkLabel(self.frame, text="", font=ctk.CTkFont(size=13),
+                                  text_color=state.colors["text_secondary"])
+        self.label.pack(pady=40)
+
+    def bind(self, item_id, data, token):
+        self.label.configure(text=data)
+
+
+class ProjectOverview(VirtualTree):
+    """Car/skin tree of a ProjectModel"""
+
+    def __init__(self, master, on_car_click: Callable[[str], None], on_car_remove: Callable[[str], None],
+                 on_skin_click: Callable[[str, int], None], on_skin_remove: Callable[[str, int], None], **kwargs):
+        row_kinds = {"car": _CarRow, "skins_header": _SkinsHeaderRow, "skin": _SkinRow, "message": _MessageRow}
+        super().__init__(
+            master,
+            row_factories={kind: (lambda m, cls=cls: cls(m, self)) for kind, cls in row_kinds.items()},
+            **kwargs
+        )
+        self.on_car_click = on_car_click
+        self.on_car_remove = on_car_remove
+        self.on_skin_click = on_skin_click
+        self.on_skin_remove = on_skin_remove
+
+        # car_instance_id -> (state the rows were built from, rows)
+        self._car_rows: Dict[str, Tuple[tuple, list]] = {}
+
+    def show(self, project, car_name: Callable[[str], str], matches: Optional[Set[str]] = None,
+             search_query: str = "", selected_car: Optional[str] = None, expanded_car: Optional[str] = None,
+             editing_skin: Optional[Tuple[str, int]] = None) -> int:
+        """
+        Show a project.
+
+        Args:
+            project: core.project_model.ProjectModel
+            car_name: Callable(base_carid) -> display name
+            matches: Car instances matching the search, None to show all
+            search_query: The search text (for the "no results" message)
+            selected_car: Highlighted car instance
+            expanded_car: Car instance whose skins are listed
+            editing_skin: (car_instance_id, skin_index) being edited
+
+        Returns:
+            int: Number of cars shown
+        """
+        cars = project.cars
+        rows = []
+        shown = 0
+
+        for car_instance_id, car_info in cars.items():
+            if matches is not None and car_instance_id not in matches:
+                continue
+            base_carid = car_info.get("base_carid", car_instance_id)
+            name = car_name(base_carid)
+
+            car_state = (
+                project.version(car_instance_id),
+                name,
+                car_instance_id == selected_car,
+                car_instance_id == expanded_car,
+                editing_skin[1] if editing_skin and editing_skin[0] == car_instance_id else None,
+            )
+            cached = self._car_rows.get(car_instance_id)
+            if cached is None or cached[0] != car_state:
+                cached = (car_state, self._build_car_rows(car_instance_id, car_info, car_state))
+                self._car_rows[car_instance_id] = cached
+            rows.extend(cached[1])
+            shown += 1
+
+        for stale in [c for c in self._car_rows if c not in cars]:
+            del self._car_rows[stale]
+
+        if not cars:
+            message = "No cars in project. Add cars from the sidebar →"
+            rows.append((("message",), "message", message, message, MESSAGE_ROW_HEIGHT))
+        elif not shown:
+            message = f"No cars match '{search_query}'"
+            rows.append((("message",), "message", message, message, MESSAGE_ROW_HEIGHT))
+
+        self.set_rows(rows)
+        return shown
+
+    def _build_car_rows(self, car_instance_id, car_info, car_state):
+        version, name, is_selected, is_expanded, editing_index = car_state
+        base_carid = car_info.get("base_carid", car_instance_id)
+        skins = car_info["skins"]
+
+        display_text = name
+        if "_" in car_instance_id and car_instance_id != base_carid:
+            display_text = f"{name} (Instance #{car_instance_id.split('_')[-1]})"
+        display_text += f"  •  {len(skins)} skins"
+
+        rows = [(("car", car_instance_id), "car", (car_instance_id, display_text, is_selected), car_state,
+                 CAR_ROW_HEIGHT)]
+
+        if is_expanded and skins:
+            rows.append((("skins_header", car_instance_id), "skins_header", None, None, SKINS_HEADER_HEIGHT))
+            for skin_index, skin in enumerate(skins):
+                is_editing = editing_index == skin_index
+                height = SKIN_ROW_CONFIG_HEIGHT if "config_data" in skin else SKIN_ROW_HEIGHT
+                rows.append((("skin", car_instance_id, skin_index), "skin",
+                             (car_instance_id, skin_index, skin, is_editing), (version, is_editing), height))
+        return rows
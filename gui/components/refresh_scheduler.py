@@ -0,0 +1,95 @@
+"""
+Refresh Scheduler - Coalesced redraws of named UI regions and debounced input
+
+Code that changes what a region shows calls invalidate(region) instead of
+redrawing it directly. All dirty regions are redrawn in a single after_idle
+pass, once each, so a user action that triggers several refreshes (select a
+car, add a skin, reselect) pays for one redraw per region per frame, and
+redundant refresh calls cost nothing.
+"""
+from typing import Callable, Dict
+
+# Quiet time after the last keystroke before a search runs
+SEARCH_DEBOUNCE_MS = 150
+
+
+class RefreshScheduler:
+    """Per-widget registry of region redraw callbacks with deferred, deduplicated invalidation"""
+
+    def __init__(self, widget):
+        """
+        Args:
+            widget: Any Tk widget; its after_idle is used to schedule the redraw pass
+        """
+        self.widget = widget
+        self._handlers: Dict[str, Callable[[], None]] = {}
+        # Insertion ordered set of dirty regions
+        self._dirty: Dict[str, None] = {}
+        self._pending = None
+        self._running = False
+
+    def register(self, region: str, callback: Callable[[], None]):
+        """Set the redraw callback of a region"""
+        self._handlers[region] = callback
+
+    def invalidate(self, region: str):
+        """Mark a region dirty; it is redrawn once in the next idle pass"""
+        if region not in self._handlers:
+            raise KeyError(f"Unknown refresh region: {region}")
+        self._dirty[region] = None
+        if self._pending is None and not self._running:
+            self._pending = self.widget.after_idle(self._run)
+
+    def is_dirty(self, region: str) -> bool:
+        return region in self._dirty
+
+    def flush(self):
+        """Redraw dirty regions now (for code that has to measure the result right away)"""
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+        self._run()
+
+    def _run(self):
+        self._pending = None
+        self._running = True
+        done = set()
+        try:
+            # Regions dirtied by a redraw in this pass are drawn in it too, unless already drawn
+            while True:
+                regions = [region for region in self._dirty if region not in done]
+                if not regions:
+                    break
+                for region in regions:
+                    del self._dirty[region]
+                    done.add(region)
+                    try:
+                        self._handlers[region]()
+                    except Exception as e:
+                        print(f"[ERROR] Refresh of '{region}' failed: {e}")
+        finally:
+            self._running = False
+
+        # Re-dirtied after drawing: leave it for the next frame
+        if self._dirty and self._pending is None:
+            self._pending = self.widget.after_idle(self._run)
+
+
+class Debouncer:
+    """Run a callback once input has been quiet for delay_ms (e.g. search-as-you-type)"""
+
+    def __init__(self, widget, delay_ms: int, callback: Callable[[], None]):
+        self.widget = widget
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self._pending = None
+
+    def __call__(self, *args):
+        """Restart the delay (accepts and ignores Tk trace/event arguments)"""
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+        self._pending = self.widget.after(self.delay_ms, self._fire)
+
+    def _fire(self):
+        self._pending = None
+        self.callback()
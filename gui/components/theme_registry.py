@@ -0,0 +1,223 @@
+"""
+Theme Registry - Live theme switching without restarting
+
+Knows which theme colour key (token) each widget option uses, so a theme
+change only reconfigures options whose token changed value, spread over
+after_idle passes so the window keeps painting and responding meanwhile.
+
+Tokens are recorded when widgets are built: state.colors hands out
+ThemeColor strings that carry their key, and CustomTkinter keeps the value it
+was given, so a widget built with fg_color=state.colors["card_bg"] reports
+"card_bg" when the theme changes. Plain Tk widgets (e.g. a tk.Canvas
+background) are registered explicitly (register(widget, bg="app_bg")).
+Colours that carry no key (hard-coded literals) are left alone; only a hex
+value passed to register() is matched against the theme, and only when
+exactly one key has that value.
+"""
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+import tkinter as tk
+import customtkinter as ctk
+from gui.state import state
+from utils.log import get_logger
+
+log = get_logger(__name__)
+
+# Widgets reconfigured per idle pass
+RECOLOR_BATCH_SIZE = 150
+
+# CustomTkinter options that can hold a theme colour
+COLOR_OPTIONS = (
+    "fg_color", "hover_color", "text_color", "text_color_disabled", "border_color",
+    "button_color", "button_hover_color", "progress_color", "checkmark_color",
+    "scrollbar_button_color", "scrollbar_button_hover_color", "placeholder_text_color",
+    "selected_color", "selected_hover_color", "unselected_color", "unselected_hover_color",
+    "dropdown_fg_color", "dropdown_hover_color", "dropdown_text_color",
+)
+
+_THEMED_WINDOWS = (ctk.CTk, ctk.CTkToplevel)
+
+
+def _token_of(colors, value, match_hex: bool = False) -> Optional[str]:
+    """
+    Theme key of a colour value: the key a ThemeColor was taken from, or with
+    match_hex the only key with that hex value (None for transparent, tuples,
+    colours not in the theme or shared by several keys).
+    """
+    token = getattr(value, "token", None)
+    if token is not None and token in colors:
+        return token
+    if not match_hex or not isinstance(value, str) or not value.startswith("#"):
+        return None
+    value = value.lower()
+    matches = [key for key, color in colors.items() if isinstance(color, str) and color.lower() == value]
+    return matches[0] if len(matches) == 1 else None
+
+
+class ThemeRegistry:
+    """Widget option -> theme token bindings, applied in batches on theme change"""
+
+    def __init__(self):
+        # widget path -> (widget, {option: token}) registered by the code that built it
+        self._explicit: Dict[str, Tuple[tk.Misc, Dict[str, str]]] = {}
+        # widget class -> colour options it supports
+        self._class_options: Dict[type, Tuple[str, ...]] = {}
+        # Widget paths never recoloured (e.g. colour swatches)
+        self._ignored: Dict[str, tk.Misc] = {}
+        self._listeners: List[Callable[[], None]] = []
+        self._pending_job = None
+        self._queue: List[Tuple[tk.Misc, Dict[str, str]]] = []
+
+    def register(self, widget, **options: str):
+        """
+        Bind widget options to theme tokens.
+
+        Args:
+            widget: Any Tk or CustomTkinter widget
+            **options: option=token (e.g. fg_color="card_bg"), or a state.colors value
+        """
+        bindings = {}
+        for option, token in options.items():
+            if getattr(token, "token", None) is not None or token not in state.colors:
+                token = _token_of(state.colors, token, match_hex=True)
+            if token is not None:
+                bindings[option] = token
+        if bindings:
+            key = str(widget)
+            current = self._explicit.get(key)
+            if current is not None and current[0] is widget:
+                current[1].update(bindings)
+            else:
+                self._explicit[key] = (widget, bindings)
+
+    def ignore(self, widget):
+        """Never recolour this widget (its colours do not follow the theme)"""
+        self._ignored[str(widget)] = widget
+
+    def subscribe(self, callback: Callable[[], None]):
+        """Call back after every theme change has been applied (for colours not held in widget options)"""
+        self._listeners.append(callback)
+
+    def _options_of(self, widget) -> Tuple[str, ...]:
+        cls = type(widget)
+        options = self._class_options.get(cls)
+        if options is None:
+            supported = []
+            for option in COLOR_OPTIONS:
+                try:
+                    widget.cget(option)
+                    supported.append(option)
+                except Exception:
+                    pass
+            options = self._class_options[cls] = tuple(supported)
+        return options
+
+    def _collect(self, root, colors: Dict[str, str]) -> Dict[str, Tuple[tk.Misc, Dict[str, str]]]:
+        """Token bindings of every widget under root, read from the colours it was built with"""
+        bindings = {}
+        stack = [root]
+        while stack:
+            widget = stack.pop()
+            try:
+                stack.extend(widget.winfo_children())
+            except Exception:
+                continue
+
+            if not isinstance(widget, (ctk.CTkBaseClass,) + _THEMED_WINDOWS):
+                continue
+            if self._ignored.get(str(widget)) is widget:
+                continue
+            inferred = {}
+            for option in self._options_of(widget):
+                try:
+                    token = _token_of(colors, widget.cget(option))
+                except Exception:
+                    continue
+                if token is not None:
+                    inferred[option] = token
+            if inferred:
+                bindings[str(widget)] = (widget, inferred)
+
+        for key, (widget, explicit) in list(self._explicit.items()):
+            try:
+                alive = widget.winfo_exists()
+            except Exception:
+                alive = False
+            if not alive:
+                del self._explicit[key]
+                continue
+            if key in bindings:
+                bindings[key][1].update(explicit)
+            else:
+                bindings[key] = (widget, dict(explicit))
+        return bindings
+
+    def apply_theme_change(self, root, change: Callable[[], None]):
+        """
+        Change the theme and recolour the UI live.
+
+        Args:
+            root: Main window; every widget under it is considered
+            change: Callable that switches or edits the theme (updates state.colors)
+        """
+        start = time.perf_counter()
+        # Finish an earlier change first, so every widget shows the outgoing theme when scanned
+        if self._pending_job is not None:
+            root.after_cancel(self._pending_job)
+            self._pending_job = None
+        self._recolor(self._queue)
+        self._queue = []
+
+        old_colors = dict(state.colors)
+        old_mode = ctk.get_appearance_mode().lower()
+        bindings = self._collect(root, old_colors)
+
+        change()
+
+        new_colors = state.colors
+        changed = {key for key, value in new_colors.items() if old_colors.get(key) != value}
+        new_mode = "light" if state.current_theme == "light" else "dark"
+        if new_mode != old_mode:
+            ctk.set_appearance_mode(new_mode)
+
+        work = []
+        for widget, options in bindings.values():
+            updates = {option: new_colors[token] for option, token in options.items() if token in changed}
+            if updates:
+                work.append((widget, updates))
+
+        log.debug("Theme change: %d colour(s) changed, %d of %d themed widget(s) to update (scan %.0f ms)",
+                  len(changed), len(work), len(bindings), (time.perf_counter() - start) * 1000)
+
+        self._queue = work
+        if self._pending_job is None:
+            self._pending_job = root.after_idle(lambda: self._run_batch(root, start))
+
+    @staticmethod
+    def _recolor(items):
+        for widget, updates in items:
+            try:
+                if widget.winfo_exists():
+                    widget.configure(**updates)
+            except Exception as e:
+                log.debug("Could not recolour %s: %s", widget, e)
+
+    def _run_batch(self, root, start: float):
+        self._pending_job = None
+        batch, self._queue = self._queue[:RECOLOR_BATCH_SIZE], self._queue[RECOLOR_BATCH_SIZE:]
+        self._recolor(batch)
+
+        if self._queue:
+            self._pending_job = root.after_idle(lambda: self._run_batch(root, start))
+            return
+
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as e:
+                log.error("Theme change listener failed: %s", e)
+        log.debug("Theme applied in %.0f ms", (time.perf_counter() - start) * 1000)
+
+
+# Shared instance used by the UI
+theme_registry = ThemeRegistry()
@@ -0,0 +1,386 @@
+"""
+Virtual List - Scrollable lists that only realize the rows in view
+
+Rows are drawn on a canvas from small pools of recycled row widgets, so adding,
+filtering or restyling items never creates, destroys or repacks per-item
+widgets. VirtualList keeps a sorted model (bisect insertion) with uniform row
+heights; VirtualTree shows a flat, ordered list of rows of mixed kinds and
+heights (e.g. cars with their skins underneath).
+"""
+import bisect
+import tkinter as tk
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import customtkinter as ctk
+
+from gui.components.theme_registry import theme_registry
+
+
+class VirtualRow:
+    """
+    Base class for a recyclable row. Subclasses build their widgets in
+    __init__ (as children of self.frame) and fill them in bind().
+    """
+
+    def __init__(self, master):
+        self.frame = ctk.CTkFrame(master, fg_color="transparent", corner_radius=0)
+        self.item_id: Optional[Hashable] = None
+        self.token: Any = None
+
+    def bind(self, item_id: Hashable, data: Any, token: Any):
+        """
+        Show an item in this row. Only called when the row is given a different
+        item or the item's token changed (e.g. expanded, selected, edited).
+        """
+        raise NotImplementedError
+
+
+class _RecyclingCanvas(ctk.CTkFrame):
+    """Canvas + scrollbar that positions pooled rows for whatever _visible_rows() returns"""
+
+    # Lets utils.debug.setup_universal_scroll_handler scroll us via _parent_canvas
+    is_virtual_list = True
+
+    def __init__(self, master, bg_color: str = "#000000",
+                 scrollbar_button_color=None, scrollbar_button_hover_color=None, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+
+        # kind -> [(row, canvas window id)]
+        self._pools: Dict[Hashable, List[Tuple[VirtualRow, int]]] = {}
+        self._render_pending = False
+        self._scrollregion = None
+
+        self._parent_canvas = tk.Canvas(self, highlightthickness=0, borderwidth=0, bg=bg_color,
+                                        yscrollincrement=2)
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._parent_canvas.yview,
+                                           button_color=scrollbar_button_color,
+                                           button_hover_color=scrollbar_button_hover_color)
+        self._parent_canvas.configure(yscrollcommand=self._on_canvas_scrolled)
+        theme_registry.register(self._parent_canvas, bg=bg_color)
+
+        self._scrollbar.pack(side="right", fill="y")
+        self._parent_canvas.pack(side="left", fill="both", expand=True)
+        self._parent_canvas.bind("<Configure>", lambda e: self.refresh())
+
+    def _create_row(self, kind: Hashable) -> VirtualRow:
+        raise NotImplementedError
+
+    def _content_height(self) -> int:
+        raise NotImplementedError
+
+    def _visible_rows(self, top: float, bottom: float):
+        """Yield (item_id, kind, data, token, y) for the rows overlapping [top, bottom]"""
+        raise NotImplementedError
+
+    def _invalidate_rows(self, item_id: Optional[Hashable] = None):
+        """Force a rebind of the rows showing item_id (or of all rows)"""
+        for pool in self._pools.values():
+            for row, _ in pool:
+                if item_id is None or row.item_id == item_id:
+                    row.item_id = None
+
+    def refresh(self):
+        """Schedule a redraw; any number of calls before the next idle draw once"""
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def scroll_to_top(self):
+        self._parent_canvas.yview_moveto(0)
+
+    def _on_canvas_scrolled(self, first, last):
+        self._scrollbar.set(first, last)
+        self.refresh()
+
+    def _render(self):
+        self._render_pending = False
+        if not self.winfo_exists():
+            return
+
+        canvas = self._parent_canvas
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+
+        # Only touch the scroll region when it changes: it re-fires yscrollcommand
+        scrollregion = (0, 0, width, max(self._content_height(), height))
+        if scrollregion != self._scrollregion:
+            self._scrollregion = scrollregion
+            canvas.configure(scrollregion=scrollregion)
+
+        top = canvas.canvasy(0)
+        visible = list(self._visible_rows(top, top + height))
+
+        # Rows already showing a visible item keep it, so scrolling only rebinds rows entering the view
+        free = {kind: list(pool) for kind, pool in self._pools.items()}
+        placements = []
+        pending = []
+        for entry in visible:
+            item_id, kind = entry[0], entry[1]
+            pool = free.setdefault(kind, [])
+            for index, (row, window) in enumerate(pool):
+                if row.item_id == item_id:
+                    placements.append((entry, row, window))
+                    del pool[index]
+                    break
+            else:
+                pending.append(entry)
+
+        for entry in pending:
+            kind = entry[1]
+            pool = free[kind]
+            if pool:
+                row, window = pool.pop()
+            else:
+                row = self._create_row(kind)
+                window = canvas.create_window(0, 0, window=row.frame, anchor="nw", width=width, state="hidden")
+                self._pools.setdefault(kind, []).append((row, window))
+            placements.append((entry, row, window))
+
+        for (item_id, kind, data, token, y), row, window in placements:
+            if row.item_id != item_id or row.token != token:
+                row.item_id = item_id
+                row.token = token
+                row.bind(item_id, data, token)
+            canvas.coords(window, 0, y)
+            canvas.itemconfigure(window, state="normal", width=width)
+
+        for pool in free.values():
+            for row, window in pool:
+                canvas.itemconfigure(window, state="hidden")
+
+
+class VirtualList(_RecyclingCanvas):
+    """Sorted, filterable list of uniform rows; one row at a time can be expanded"""
+
+    def __init__(self, master, row_factory: Callable[[tk.Widget], VirtualRow], row_height: int,
+                 expanded_extra_height: int = 0, **kwargs):
+        """
+        Args:
+            row_factory: Callable(master) -> VirtualRow; rows are bound with token=expanded
+            row_height: Height of a collapsed row in pixels (including spacing)
+            expanded_extra_height: Extra height of the expanded row
+            **kwargs: bg_color (should match the parent's color), scrollbar colors
+        """
+        super().__init__(master, **kwargs)
+
+        self.row_factory = row_factory
+        self.row_height = row_height
+        self.expanded_extra_height = expanded_extra_height
+
+        # Sorted [(sort_key, item_id)], the filtered view (same order unless ranked), and item data
+        self._order: List[Tuple[Any, Hashable]] = []
+        self._view: List[Tuple[Any, Hashable]] = []
+        self._keys: Dict[Hashable, Any] = {}
+        self._data: Dict[Hashable, Any] = {}
+        self._filter: Optional[Callable[[Hashable, Any], bool]] = None
+        # item_id -> position in a relevance ranking that orders the view, None for sort order
+        self._ranking: Optional[Dict[Hashable, int]] = None
+        self._expanded_id: Optional[Hashable] = None
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, item_id):
+        return item_id in self._keys
+
+    def visible_count(self) -> int:
+        """Number of items passing the current filter"""
+        return len(self._view)
+
+    def set_items(self, items):
+        """
+        Replace the whole model.
+
+        Args:
+            items: Iterable of (item_id, sort_key, data)
+        """
+        self._keys.clear()
+        self._data.clear()
+        self._invalidate_rows()
+        for item_id, sort_key, data in items:
+            self._keys[item_id] = sort_key
+            self._data[item_id] = data
+        self._order = sorted((key, item_id) for item_id, key in self._keys.items())
+        if self._expanded_id not in self._keys:
+            self._expanded_id = None
+        self._rebuild_view()
+
+    def insert(self, item_id: Hashable, sort_key: Any, data: Any):
+        """Insert or update one item in sorted position (no per-item widgets are created)"""
+        if item_id in self._keys:
+            self.remove(item_id)
+
+        entry = (sort_key, item_id)
+        self._keys[item_id] = sort_key
+        self._data[item_id] = data
+        bisect.insort(self._order, entry)
+        if self._ranking is not None:
+            self._rebuild_view()
+            return
+        if self._filter is None or self._filter(item_id, data):
+            bisect.insort(self._view, entry)
+        self.refresh()
+
+    def remove(self, item_id: Hashable):
+        """Remove one item if present"""
+        if item_id not in self._keys:
+            return
+        self._invalidate_rows(item_id)
+        entry = (self._keys.pop(item_id), item_id)
+        self._data.pop(item_id, None)
+        index = bisect.bisect_left(self._order, entry)
+        if index < len(self._order) and self._order[index] == entry:
+            del self._order[index]
+        index = self._view_index(entry)
+        if index is not None:
+            del self._view[index]
+        if self._expanded_id == item_id:
+            self._expanded_id = None
+        self.refresh()
+
+    def clear(self):
+        self.set_items(())
+
+    def set_filter(self, predicate: Optional[Callable[[Hashable, Any], bool]],
+                   ranking: Optional[Sequence[Hashable]] = None):
+        """
+        Show only items for which predicate(item_id, data) is true (None shows all).
+
+        Args:
+            predicate: Filter, or None
+            ranking: Optional item ids, best first; the view follows this order
+                     (items not in it come last, in sort order)
+        """
+        self._filter = predicate
+        self.set_ranking(ranking)
+        self.scroll_to_top()
+
+    def set_ranking(self, ranking: Optional[Sequence[Hashable]]):
+        """Order the view by a relevance ranking (None restores sort order); keeps the scroll position"""
+        self._ranking = None if ranking is None else {item_id: rank for rank, item_id in enumerate(ranking)}
+        self._rebuild_view()
+
+    def _rebuild_view(self):
+        if self._filter is None:
+            self._view = list(self._order)
+        else:
+            self._view = [entry for entry in self._order if self._filter(entry[1], self._data[entry[1]])]
+        if self._ranking is not None:
+            unranked = len(self._ranking)
+            self._view.sort(key=lambda entry: self._ranking.get(entry[1], unranked))
+        self.refresh()
+
+    def _view_index(self, entry: Tuple[Any, Hashable]) -> Optional[int]:
+        """Position of an entry in the view, None if filtered out"""
+        if self._ranking is not None:
+            try:
+                return self._view.index(entry)
+            except ValueError:
+                return None
+        index = bisect.bisect_left(self._view, entry)
+        return index if index < len(self._view) and self._view[index] == entry else None
+
+    def neighbours(self, item_id: Hashable, radius: int = 2) -> List[Hashable]:
+        """Items shown up to radius rows above and below item_id"""
+        if item_id not in self._keys:
+            return []
+        index = self._view_index((self._keys[item_id], item_id))
+        if index is None:
+            return []
+        around = self._view[max(0, index - radius):index] + self._view[index + 1:index + 1 + radius]
+        return [entry[1] for entry in around]
+
+    @property
+    def expanded_id(self) -> Optional[Hashable]:
+        return self._expanded_id
+
+    def set_expanded(self, item_id: Optional[Hashable]):
+        """Expand one row (or collapse all with None)"""
+        if item_id is not None and item_id not in self._keys:
+            item_id = None
+        if item_id != self._expanded_id:
+            self._expanded_id = item_id
+            self.refresh()
+
+    def _expanded_index(self) -> Optional[int]:
+        if self._expanded_id is None:
+            return None
+        entry = (self._keys[self._expanded_id], self._expanded_id)
+        index = bisect.bisect_left(self._view, entry)
+        if index < len(self._view) and self._view[index] == entry:
+            return index
+        return None
+
+    def _row_top(self, index: int, expanded_index: Optional[int]) -> int:
+        top = index * self.row_height
+        if expanded_index is not None and index > expanded_index:
+            top += self.expanded_extra_height
+        return top
+
+    def _index_at(self, y: float, expanded_index: Optional[int]) -> int:
+        if expanded_index is not None and y >= (expanded_index + 1) * self.row_height:
+            y = max((expanded_index + 1) * self.row_height - 1, y - self.expanded_extra_height)
+        return max(0, int(y // self.row_height))
+
+    def _create_row(self, kind):
+        return self.row_factory(self._parent_canvas)
+
+    def _content_height(self):
+        return self._row_top(len(self._view), self._expanded_index())
+
+    def _visible_rows(self, top, bottom):
+        expanded_index = self._expanded_index()
+        first = self._index_at(top, expanded_index)
+        last = min(self._index_at(bottom, expanded_index), len(self._view) - 1)
+        for index in range(first, last + 1):
+            item_id = self._view[index][1]
+            yield (item_id, None, self._data[item_id], index == expanded_index,
+                   self._row_top(index, expanded_index))
+
+
+class VirtualTree(_RecyclingCanvas):
+    """Ordered rows of mixed kinds and heights, e.g. parents followed by their children"""
+
+    def __init__(self, master, row_factories: Dict[Hashable, Callable[[tk.Widget], VirtualRow]], **kwargs):
+        """
+        Args:
+            row_factories: {kind: Callable(master) -> VirtualRow}
+            **kwargs: bg_color (should match the parent's color), scrollbar colors
+        """
+        super().__init__(master, **kwargs)
+
+        self.row_factories = row_factories
+        self._rows: List[Tuple[Hashable, Hashable, Any, Any]] = []
+        self._offsets: List[int] = [0]
+
+    def __len__(self):
+        return len(self._rows)
+
+    def set_rows(self, rows: Sequence[Tuple[Hashable, Hashable, Any, Any, int]]):
+        """
+        Replace the row list. Cheap: rows in view are only rebound if their
+        (item_id, token) changed.
+
+        Args:
+            rows: [(item_id, kind, data, token, height), ...] in display order
+        """
+        self._rows = [row[:4] for row in rows]
+        offsets = [0]
+        for row in rows:
+            offsets.append(offsets[-1] + row[4])
+        self._offsets = offsets
+        self.refresh()
+
+    def _create_row(self, kind):
+        return self.row_factories[kind](self._parent_canvas)
+
+    def _content_height(self):
+        return self._offsets[-1]
+
+    def _visible_rows(self, top, bottom):
+        first = max(0, bisect.bisect_right(self._offsets, top) - 1)
+        for index in range(first, len(self._rows)):
+            y = self._offsets[index]
+            if y > bottom:
+                break
+            yield self._rows[index] + (y,)
@@ -1,10 +1,11 @@
 """
 Main Window - Entry point for the BeamSkin Studio application
 """
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 import customtkinter as ctk
 from PIL import Image
 import os
+import time
 
 from gui.state import state
 from gui.components.preview import HoverPreviewManager
@@ -19,6 +20,10 @@ from gui.tabs.about import AboutTab
 
 from utils.debug import setup_universal_scroll_handler
 
+# Tabs built in the background after the first paint (if "prebuild_tabs" is on), most used first
+PREBUILD_TAB_ORDER = ("carlist", "settings", "add_vehicles", "howto", "about")
+PREBUILD_DELAY_MS = 1500
+
 print(f"[DEBUG] Loading class: BeamSkinStudioApp")
 
 class BeamSkinStudioApp(ctk.CTk):
@@ -63,7 +68,9 @@ class BeamSkinStudioApp(ctk.CTk):
         self.topbar: Optional[Topbar] = None
         self.sidebar: Optional[Sidebar] = None
         self.main_container: Optional[ctk.CTkFrame] = None
+        # Built tabs; every view has a factory and is only constructed when first needed
         self.tabs: Dict[str, ctk.CTkFrame] = {}
+        self._tab_factories: Dict[str, Callable[[], ctk.CTkFrame]] = {}
         self.current_tab: str = "generator"
 
         self._setup_ui()
@@ -71,6 +78,59 @@ class BeamSkinStudioApp(ctk.CTk):
 
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+        if state.app_settings.get("prebuild_tabs", True):
+            self.after(PREBUILD_DELAY_MS, self._prebuild_next_tab)
+
+        # Index BeamNG content zips in the background (only changed archives are re-read)
+        self.after(1000, self._start_content_index_refresh)
+
+    def _start_content_index_refresh(self):
+        """Bring the persistent content zip index and the UV catalog up to date without blocking the UI"""
+        from core.settings import get_beamng_install_path
+        from core.content_index import content_index
+        from core.uv_catalog import uv_catalog
+
+        beamng_install = get_beamng_install_path()
+        if beamng_install:
+            content_index.start_background_refresh(
+                beamng_install,
+                on_complete=lambda _: uv_catalog.start_background_build(beamng_install)
+            )
+
+        self._start_vehicle_discovery()
+
+        from core.settings import get_mods_folder_path
+        from core.mods_inventory import mods_inventory
+        mods_folder = get_mods_folder_path()
+        if mods_folder:
+            mods_inventory.start_background_refresh(mods_folder)
+
+    def _start_vehicle_discovery(self):
+        """Scan install and mod archives for vehicles, adding new ones to the UI as they are found"""
+        from core.settings import get_beamng_install_path, get_mods_folder_path
+        from core.vehicle_discovery import vehicle_discovery
+
+        beamng_install = get_beamng_install_path()
+        mods_folder = get_mods_folder_path()
+        if not beamng_install and not mods_folder:
+            return
+
+        vehicle_discovery.start_background_refresh(
+            beamng_install,
+            mods_folder,
+            on_update=lambda infos: self.after(0, lambda: self._on_vehicles_discovered(infos))
+        )
+
+    def _on_vehicles_discovered(self, infos):
+        """Add newly discovered vehicles to the sidebar, car list and generator"""
+        print(f"[DEBUG] {len(infos)} new vehicle(s) discovered")
+        for target in (self.sidebar, self.tabs.get("carlist"), self.tabs.get("generator")):
+            if target is not None and hasattr(target, "add_discovered_vehicles"):
+                try:
+                    target.add_discovered_vehicles(infos)
+                except Exception as e:
+                    print(f"[ERROR] Failed to add discovered vehicles to {type(target).__name__}: {e}")
+
     def show_notification(self, message: str, type: str = "info", duration: int = 3000):
 
         print(f"[DEBUG] show_notification called")
@@ -207,48 +267,74 @@ class BeamSkinStudioApp(ctk.CTk):
         self.sidebar = Sidebar(self.main_container, self.preview_manager)
         self.sidebar.pack(fill="y", side="left")
 
-        self._create_tabs()
+        self._register_tabs()
 
         self.sidebar.populate_vehicles(self._add_vehicle_to_project_from_sidebar)
 
-        generator_tab = self.tabs.get("generator")
-        if generator_tab and isinstance(generator_tab, GeneratorTab):
-            generator_tab.set_sidebar_references(
-                self.sidebar.mod_name_entry,
-                self.sidebar.author_entry
-            )
-
         self.switch_view("generator")
 
         self.after(50, lambda: setup_universal_scroll_handler(self))
 
-    def _create_tabs(self):
-        """Create all application tabs"""
-
-        self.tabs["generator"] = GeneratorTab(
-            self.main_container,
-            notification_callback=self.show_notification
-        )
-
-        self.tabs["howto"] = HowToTab(self.main_container)
-
-        self.tabs["carlist"] = CarListTab(self.main_container, self.preview_manager, self)
-
-        self.tabs["add_vehicles"] = AddVehiclesTab(
-            self.main_container,
-            notification_callback=self.show_notification
-        )
-
-        self.tabs["settings"] = SettingsTab(
-            self.main_container,
-            self.main_container,
-            self.topbar.menu_frame,
-            self.topbar.menu_buttons,
-            self.switch_view,
-            notification_callback=self.show_notification
-        )
+    def _register_tabs(self):
+        """Register a factory for every application tab (tabs are built on first use)"""
 
-        self.tabs["about"] = AboutTab(self.main_container)
+        def create_generator():
+            generator_tab = GeneratorTab(
+                self.main_container,
+                notification_callback=self.show_notification
+            )
+            generator_tab.set_sidebar_references(
+                self.sidebar.mod_name_entry,
+                self.sidebar.author_entry
+            )
+            return generator_tab
+
+        self._tab_factories = {
+            "generator": create_generator,
+            "howto": lambda: HowToTab(self.main_container),
+            "carlist": lambda: CarListTab(self.main_container, self.preview_manager, self),
+            "add_vehicles": lambda: AddVehiclesTab(
+                self.main_container,
+                notification_callback=self.show_notification
+            ),
+            "settings": lambda: SettingsTab(
+                self.main_container,
+                self.main_container,
+                self.topbar.menu_frame,
+                self.topbar.menu_buttons,
+                self.switch_view,
+                notification_callback=self.show_notification
+            ),
+            "about": lambda: AboutTab(self.main_container),
+        }
+
+    def get_tab(self, view_name: str) -> Optional[ctk.CTkFrame]:
+        """Return a tab, building it first if it has not been built yet
+
+        Returns:
+            The tab frame, or None if no such view is registered
+        """
+        tab = self.tabs.get(view_name)
+        if tab is not None:
+            return tab
+
+        factory = self._tab_factories.get(view_name)
+        if factory is None:
+            return None
+
+        start = time.perf_counter()
+        tab = factory()
+        self.tabs[view_name] = tab
+        print(f"[DEBUG] Built tab '{view_name}' in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return tab
+
+    def _prebuild_next_tab(self):
+        """Build one not-yet-built tab, then yield to the event loop before the next"""
+        for view_name in PREBUILD_TAB_ORDER:
+            if view_name not in self.tabs:
+                self.get_tab(view_name)
+                self.after(100, lambda: self.after_idle(self._prebuild_next_tab))
+                return
 
     def switch_view(self, view_name: str):
 
@@ -287,9 +373,10 @@ class BeamSkinStudioApp(ctk.CTk):
         else:
             self.topbar.generate_button.pack_forget()
 
-        if view_name in self.tabs:
+        tab = self.get_tab(view_name)
+        if tab is not None:
 
-            self.tabs[view_name].pack(fill="both", expand=True, side="left")
+            tab.pack(fill="both", expand=True, side="left")
             print(f"[DEBUG] Showing tab: {view_name}")
         else:
             print(f"[DEBUG] ERROR: Tab '{view_name}' not found")
@@ -297,13 +384,12 @@ class BeamSkinStudioApp(ctk.CTk):
         self.current_tab = view_name
 
         self.update_idletasks()
-        self.after(50, lambda: setup_universal_scroll_handler(self))
 
     def _generate_mod(self):
         """Generate mod - calls the generator tab's method"""
         print("[DEBUG] Generate mod button clicked")
 
-        generator_tab = self.tabs.get("generator")
+        generator_tab = self.get_tab("generator")
         if generator_tab and isinstance(generator_tab, GeneratorTab):
 
             generator_tab.generate_mod(
@@ -326,17 +412,12 @@ class BeamSkinStudioApp(ctk.CTk):
         """
         print(f"[DEBUG] Sidebar: Add vehicle clicked - {display_name} ({carid})")
 
-        generator_tab = self.tabs.get("generator")
+        generator_tab = self.get_tab("generator")
         if generator_tab and isinstance(generator_tab, GeneratorTab):
 
             generator_tab.add_car_to_project(carid, display_name)
 
-            for btn_frame, car_id, _, add_btn_frame in state.sidebar_vehicle_buttons:
-                if car_id == carid:
-                    add_btn_frame.pack_forget()
-                    break
-
-            self.sidebar.expanded_vehicle_carid = None
+            self.sidebar.collapse_vehicles()
 
             print(f"[DEBUG] Successfully added {display_name} to generator tab")
         else:
@@ -345,6 +426,10 @@ class BeamSkinStudioApp(ctk.CTk):
     def _on_closing(self):
         """Handle window closing"""
         print("[DEBUG] \nShutting down BeamSkin Studio...")
+        from core.content_index import content_index
+        from core.archive_reader import archive_pool
+        content_index.save()
+        archive_pool.close_all()
         self.destroy()
 
     def show_startup_warning(self):
@@ -1,6 +1,7 @@
 """
 State Manager
 """
+from collections.abc import Mapping
 from typing import Dict, List, Tuple, Optional, Any
 import customtkinter as ctk
 from core.settings import colors, current_theme, app_settings, THEMES, EDITABLE_COLOR_KEYS, COLOR_LABELS
@@ -14,6 +15,35 @@ except ImportError:
     print("[WARNING] core/config.py not found, using empty VEHICLE_IDS")
     VEHICLE_IDS = {}
 
+class ThemeColor(str):
+    """A theme colour that remembers its theme key, so widgets built from it can be recoloured by key"""
+
+    def __new__(cls, value, token=None):
+        color = super().__new__(cls, value)
+        color.token = token
+        return color
+
+    def __reduce__(self):
+        return ThemeColor, (str(self), self.token)
+
+
+class ThemeColors(Mapping):
+    """Read-only view of the active theme dict whose values are ThemeColors"""
+
+    def __init__(self, colors: Dict[str, Any]):
+        self.raw = colors
+
+    def __getitem__(self, key):
+        value = self.raw[key]
+        return ThemeColor(value, key) if isinstance(value, str) else value
+
+    def __iter__(self):
+        return iter(self.raw)
+
+    def __len__(self):
+        return len(self.raw)
+
+
 class StateManager:
     """Singleton class to manage application state"""
 
@@ -30,7 +60,7 @@ class StateManager:
             return
         self._initialized = True
 
-        self.colors = colors
+        self._colors = ThemeColors(colors)
         self.current_theme = current_theme
         self.app_settings = app_settings
         self.themes = THEMES
@@ -55,7 +85,6 @@ class StateManager:
         self.selected_display_name: Optional[str] = None
         self.expanded_vehicle_carid: Optional[str] = None
 
-        self.sidebar_vehicle_buttons: List[Tuple[ctk.CTkFrame, str, str, ctk.CTkFrame]] = []
         self.carlist_items: List[Tuple[ctk.CTkFrame, str, str]] = []
         self.car_id_list: List[Tuple[str, str]] = []
 
@@ -67,6 +96,15 @@ class StateManager:
 
         self.output_icons: Dict[str, Any] = {}
 
+    @property
+    def colors(self) -> ThemeColors:
+        """Colours of the active theme (assign the theme dict to switch)"""
+        return self._colors
+
+    @colors.setter
+    def colors(self, value):
+        self._colors = value if isinstance(value, ThemeColors) else ThemeColors(value)
+
     @property
     def added_vehicles(self):
         """Property that always returns the current added_vehicles from settings module"""
@@ -135,7 +173,7 @@ class StateManager:
 
     def update_color(self, key: str, value: str) -> None:
         """Update a theme color"""
-        self.colors[key] = value
+        self.colors.raw[key] = value
 
     def reset_theme_colors(self) -> None:
         """Reset theme colors to defaults"""
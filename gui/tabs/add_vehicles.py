@@ -258,7 +258,7 @@ class AddVehiclesTab(ctk.CTkFrame):
                     print(f"[WARNING] Generator tab missing refresh_vehicle_list method")
                     print(f"[DEBUG] Generator tab methods: {[m for m in dir(generator_tab) if 'refresh' in m.lower()]}")
             else:
-                print(f"[WARNING] Generator tab not found in tabs dict")
+                print(f"[DEBUG] Generator tab not built yet (it loads the current vehicles when opened)")
 
             carlist_tab = main_window.tabs.get('carlist')
             if carlist_tab:
@@ -270,24 +270,12 @@ class AddVehiclesTab(ctk.CTkFrame):
                 else:
                     print(f"[WARNING] Car list tab missing refresh_vehicle_list method")
             else:
-                print(f"[WARNING] Car list tab not found in tabs dict")
+                print(f"[DEBUG] Car list tab not built yet (it loads the current vehicles when opened)")
 
             if hasattr(main_window, 'sidebar'):
                 print(f"[DEBUG] Sidebar found, refreshing...")
                 try:
 
-                    if hasattr(state, 'sidebar_vehicle_buttons'):
-                        print(f"[DEBUG] Clearing {len(state.sidebar_vehicle_buttons)} existing sidebar buttons...")
-
-                        for btn_frame, car_id, car_name, add_btn_frame in state.sidebar_vehicle_buttons:
-                            try:
-                                btn_frame.destroy()
-                            except:
-                                pass
-
-                        state.sidebar_vehicle_buttons.clear()
-                        print(f"[DEBUG] Sidebar state cleared")
-
                     if hasattr(main_window.sidebar, 'populate_vehicles'):
                         print(f"[DEBUG] Calling sidebar.populate_vehicles()...")
 
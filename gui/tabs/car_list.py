@@ -1,15 +1,21 @@
 """
 Car List Tab
 """
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+import bisect
 import os
 import zipfile
-import re
 from tkinter import filedialog
 import customtkinter as ctk
 from gui.state import state
 from gui.components.preview import HoverPreviewManager
 from gui.components.dialogs import show_notification
+from core.uv_catalog import uv_catalog
+from core.vehicle_discovery import vehicle_discovery, merged_vehicles
+from core.vehicle_model import vehicle_model, VehicleEntry, VEHICLE_ADDED, VEHICLE_REMOVED, VEHICLE_RENAMED
+from core.uv_extract import UVExtractionJob, can_convert_dds
+from core.search_index import SearchIndex
+from gui.components.refresh_scheduler import Debouncer, SEARCH_DEBOUNCE_MS
 
 try:
     from utils.file_ops import load_added_vehicles_json
@@ -29,6 +35,14 @@ class CarListTab(ctk.CTkFrame):
         self.carlist_search_var = ctk.StringVar()
         self.carlist_scroll: ctk.CTkScrollableFrame = None
 
+        # Sort keys (name.lower(), carid) parallel to state.carlist_items, and each card's name label
+        self._card_keys: List[Tuple[str, str]] = []
+        self._name_labels: Dict[str, ctk.CTkLabel] = {}
+
+        self.search_index = SearchIndex()
+        # Matching carids for the current search, None when not searching
+        self._search_matches = None
+
         self._setup_ui()
         self._populate_car_list()
 
@@ -48,61 +62,115 @@ class CarListTab(ctk.CTkFrame):
         self.carlist_scroll = ctk.CTkScrollableFrame(self, fg_color=state.colors["frame_bg"])
         self.carlist_scroll.pack(fill="both", expand=True, padx=10, pady=10)
 
-        self.carlist_search_var.trace_add("write", self._update_carlist)
+        self.carlist_search_var.trace_add("write", Debouncer(self, SEARCH_DEBOUNCE_MS, self._update_carlist))
 
-    def _populate_car_list(self):
-        """Populate the car list with all vehicles"""
+    def _collect_vehicles(self) -> List[VehicleEntry]:
+        """Current vehicle snapshot: built-in, discovered and developer-added vehicles"""
 
         vehicles = load_added_vehicles_json()
         state.added_vehicles.clear()
         state.added_vehicles.update(vehicles)
 
-        car_id_list = [
-            ("autobello", "Autobello Piccolina"), ("atv", "FPU Wydra"), ("barstow", "Gavril Barstow"),
-            ("bastion", "Bruckell Bastion"), ("bluebuck", "Gavril Bluebuck"), ("bolide", "Civetta Bolide"),
-            ("burnside", "Burnside Special"), ("covet", "Ibishu Covet"), ("citybus", "Wentward DT40L"),
-            ("bx", "Ibishu BX-Series"), ("dryvan", "Dry Van Trailer"), ("dumptruck", "Hirochi HT-55"),
-            ("etk800", "ETK 800 Series"), ("etkc", "ETK K Series"), ("etki", "ETK I Series"),
-            ("fullsize", "Gavril Grand Marshal"), ("hopper", "Ibishu Hopper"), ("lansdale", "Soliad Lansdale"),
-            ("legran", "Bruckell Legran"), ("midsize", "Newer Ibishu Pessima"), ("miramar", "Ibishu Miramar"),
-            ("moonhawk", "Bruckell Moonhawk"), ("md_series", "Gavril MD-Series"), ("midtruck", "Autobello Stambecco"),
-            ("nine", "Bruckell Nine"), ("pessima", "Older Ibishu Pessima"), ("pickup", "Gavril D Series"),
-            ("pigeon", "Ibishu Pigeon"), ("racetruck", "SP Dunekicker"), ("roamer", "Gavril Roamer"),
-            ("rockbouncer", "SP Rockbasher"), ("sbr", "Hirochi SBR4"), ("scintilla", "Civetta Scintilla"),
-            ("sunburst2", "Hirochi Sunburst"), ("us_semi", "Gavril T Series"), ("utv", "Hirochi Aurata"),
-            ("van", "Gavril H Series"), ("vivace", "Cherrier FCV"), ("wendover", "Soliad Wendover"),
-            ("wigeon", "Ibishu Wigeon"), ("wl40", "Hirochi WL-40")
-        ]
-
-        for carid, name in car_id_list:
-            self._add_carlist_card(carid, name, developer_added=False)
+        entries = []
+
+        # Built-in names plus everything discovered in the install and mods folder
+        discovered = vehicle_discovery.vehicles()
+        for carid, name in merged_vehicles(state.vehicle_ids, {}).items():
+            if carid in state.added_vehicles:
+                continue
+            # Mod vehicles have no install archive to pull UV maps from
+            is_mod = carid in discovered and discovered[carid].kind == "mod" and carid not in state.vehicle_ids
+            entries.append(VehicleEntry(carid, name, "mod" if is_mod else "game"))
 
         for carid, carname in state.added_vehicles.items():
-            self._add_carlist_card(carid, carname, developer_added=True)
+            entries.append(VehicleEntry(carid, carname, "added"))
 
-    def refresh_vehicle_list(self):
-        """Refresh the vehicle list when new vehicles are added"""
-        print(f"[DEBUG] CarListTab: refresh_vehicle_list called")
+        return entries
 
-        for card_frame, carid, name in state.carlist_items:
-            card_frame.destroy()
+    def _populate_car_list(self):
+        """Build cards for the model as it stands, then sync it with the current vehicles"""
 
-        state.carlist_items.clear()
+        for entry in vehicle_model.entries():
+            self._add_carlist_card(entry.carid, entry.name, developer_added=entry.origin != "game")
 
-        self._populate_car_list()
+        vehicle_model.subscribe(self._on_vehicle_event)
+        vehicle_model.sync(self._collect_vehicles())
 
-        self._update_carlist()
+    def refresh_vehicle_list(self):
+        """Refresh the vehicle list when vehicles are added or removed (only the changes are applied)"""
+        print(f"[DEBUG] CarListTab: refresh_vehicle_list called")
+
+        changes = vehicle_model.sync(self._collect_vehicles())
+
+        print(f"[DEBUG] CarListTab: {changes} change(s), {len(state.carlist_items)} vehicles listed")
+
+    def add_discovered_vehicles(self, infos):
+        """Add cards for vehicles found by a background discovery refresh"""
+        added = 0
+        for info in infos:
+            if info.carid in vehicle_model:
+                continue
+            vehicle_model.upsert(VehicleEntry(info.carid, info.name, "mod" if info.kind == "mod" else "game"))
+            added += 1
+
+        if added:
+            print(f"[DEBUG] CarListTab: {added} discovered vehicle(s) added")
+
+    def _on_vehicle_event(self, event: str, entry: VehicleEntry, previous: Optional[VehicleEntry]):
+        """Apply one vehicle model change to the cards"""
+        if event == VEHICLE_ADDED:
+            self._add_carlist_card(entry.carid, entry.name, developer_added=entry.origin != "game")
+        elif event == VEHICLE_REMOVED:
+            self._remove_carlist_card(entry.carid, entry.name)
+        elif event == VEHICLE_RENAMED:
+            self._rename_carlist_card(entry.carid, previous.name, entry.name)
+
+    def _card_index(self, carid: str, name: str) -> int:
+        """Position of a card in the sorted card list, or -1"""
+        key = (name.lower(), carid)
+        index = bisect.bisect_left(self._card_keys, key)
+        if index < len(self._card_keys) and self._card_keys[index] == key:
+            return index
+        return -1
+
+    def _card_neighbours(self, carid: str, radius: int = 2) -> List[str]:
+        """Shown cards up to radius positions above and below a card (for preview prefetch)"""
+        name = self._name_labels[carid].cget("text")
+        index = self._card_index(carid, name)
+        if index < 0:
+            return []
+        shown = lambda entry: self._matches_search(entry[1])
+        before = [entry[1] for entry in state.carlist_items[max(0, index - 8):index] if shown(entry)][-radius:]
+        after = [entry[1] for entry in state.carlist_items[index + 1:index + 9] if shown(entry)][:radius]
+        return before + after
+
+    def _matches_search(self, carid: str) -> bool:
+        return self._search_matches is None or carid in self._search_matches
+
+    def _index_card(self, carid: str, name: str):
+        """(Re)index a card for search and keep the current matches up to date"""
+        self.search_index.add(carid, name, carid)
+        if self._search_matches is not None:
+            self._search_matches = self.search_index.query(self.carlist_search_var.get())
+
+    def _pack_card_at(self, index: int):
+        """Pack the card at index in sorted position without touching the other cards"""
+        card_frame, carid, name = state.carlist_items[index]
+        if not self._matches_search(carid):
+            card_frame.pack_forget()
+            return
 
-        print(f"[DEBUG] CarListTab: Vehicle list refreshed with {len(state.carlist_items)} vehicles")
+        for next_card, _, _ in state.carlist_items[index + 1:]:
+            if next_card.winfo_manager() == "pack":
+                card_frame.pack(fill="x", pady=8, padx=8, before=next_card)
+                return
+        card_frame.pack(fill="x", pady=8, padx=8)
 
     def _add_carlist_card(self, carid: str, name: str, developer_added: bool = False):
         """Add a vehicle card to the car list"""
 
-        insert_position = len(state.carlist_items)
-        for i, (card, cid, cname) in enumerate(state.carlist_items):
-            if cname.lower() > name.lower():
-                insert_position = i
-                break
+        key = (name.lower(), carid)
+        insert_position = bisect.bisect_left(self._card_keys, key)
 
         card_frame = ctk.CTkFrame(
             self.carlist_scroll,
@@ -132,13 +200,14 @@ class CarListTab(ctk.CTkFrame):
         text_stack = ctk.CTkFrame(text_container, fg_color="transparent")
         text_stack.pack(side="left", fill="x", expand=True)
 
-        ctk.CTkLabel(
+        name_label = ctk.CTkLabel(
             text_stack,
             text=name,
             anchor="w",
             font=ctk.CTkFont(size=14, weight="bold"),
             text_color=state.colors["text"]
-        ).pack(anchor="w")
+        )
+        name_label.pack(anchor="w")
 
         ctk.CTkLabel(
             text_stack,
@@ -184,23 +253,62 @@ class CarListTab(ctk.CTkFrame):
         copy_btn.pack(side="left", padx=4)
         copy_btn.bind("<Enter>", lambda e: self.preview_manager.hide_hover_preview(force=True), add=True)
 
-        self.preview_manager.setup_robust_hover(card_frame, carid)
+        self.preview_manager.setup_robust_hover(card_frame, carid, neighbours=lambda: self._card_neighbours(carid))
 
         state.carlist_items.insert(insert_position, (card_frame, carid, name))
+        self._card_keys.insert(insert_position, key)
+        self._name_labels[carid] = name_label
+        self._index_card(carid, name)
+        self._pack_card_at(insert_position)
+
+    def _remove_carlist_card(self, carid: str, name: str):
+        """Destroy one vehicle card"""
+        index = self._card_index(carid, name)
+        if index < 0:
+            return
+        card_frame, _, _ = state.carlist_items.pop(index)
+        del self._card_keys[index]
+        self._name_labels.pop(carid, None)
+        self.search_index.remove(carid)
+        card_frame.destroy()
+
+    def _rename_carlist_card(self, carid: str, old_name: str, new_name: str):
+        """Relabel one vehicle card and move it to its new sorted position"""
+        index = self._card_index(carid, old_name)
+        if index < 0:
+            return
+        card_frame, _, _ = state.carlist_items.pop(index)
+        del self._card_keys[index]
 
-        for widget in self.carlist_scroll.winfo_children():
-            widget.pack_forget()
+        key = (new_name.lower(), carid)
+        insert_position = bisect.bisect_left(self._card_keys, key)
+        state.carlist_items.insert(insert_position, (card_frame, carid, new_name))
+        self._card_keys.insert(insert_position, key)
+        self._name_labels[carid].configure(text=new_name)
+        self._index_card(carid, new_name)
 
-        for card, cid, cname in state.carlist_items:
-            card.pack(fill="x", pady=8, padx=8)
+        card_frame.pack_forget()
+        self._pack_card_at(insert_position)
 
     def _update_carlist(self, *args):
-        """Filter car list based on search query"""
-        query = self.carlist_search_var.get().lower()
-        for row_frame, carid, name in state.carlist_items:
-            row_frame.pack_forget()
-            if query in carid.lower() or query in name.lower():
-                row_frame.pack(fill="x", pady=8, padx=8)
+        """Filter car list based on search query (only cards whose visibility changes are touched)"""
+        previous = self._search_matches
+        self._search_matches = self.search_index.query(self.carlist_search_var.get())
+
+        changed = []
+        for index, (card_frame, carid, name) in enumerate(state.carlist_items):
+            was_shown = previous is None or carid in previous
+            if was_shown != self._matches_search(carid):
+                changed.append(index)
+
+        # Hide first, then show back to front so each card finds its packed successor
+        for index in changed:
+            if not self._matches_search(state.carlist_items[index][1]):
+                state.carlist_items[index][0].pack_forget()
+        for index in reversed(changed):
+            if self._matches_search(state.carlist_items[index][1]):
+                self._pack_card_at(index)
+
         try:
             self.carlist_scroll._parent_canvas.yview_moveto(0)
         except:
@@ -243,245 +351,175 @@ class CarListTab(ctk.CTkFrame):
             return
 
         try:
-            search_common = False
-            common_search_dirs = []
-
-            with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                all_files = zip_ref.namelist()
-                for file_path in all_files:
-                    filename_lower = os.path.basename(file_path).lower()
-                    if "ambulance" in filename_lower:
-                        search_common = True
-                        common_search_dirs.append("vehicles/common/pickup/")
-                        break
-
-            with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                all_files = zip_ref.namelist()
-
-                target_dir = f"vehicles/{carid}/"
-                found_files = []
-
-                for file_path in all_files:
-                    if file_path.startswith(target_dir):
-                        filename_lower = os.path.basename(file_path).lower()
-
-                        if "color" in filename_lower:
-                            continue
-
-                        if filename_lower.startswith("skin_"):
-                            continue
-
-                        if re.search(r'_skin_\w+_uv\d*\.', filename_lower):
-                            continue
-
-                        has_skin_and_uv = "skin" in filename_lower and "uv" in filename_lower
-                        has_uvmap = "uvmap" in filename_lower
-                        has_uv_layout = "uv1_layout" in filename_lower or "uv_layout" in filename_lower
-
-                        if has_skin_and_uv or has_uvmap or has_uv_layout:
-                            if filename_lower.endswith(('.dds', '.png', '.jpg', '.jpeg')):
-                                found_files.append((file_path, zip_file_path))
-
-                if search_common and common_search_dirs:
-                    common_zip_path = os.path.join(beamng_path, "common.zip")
-                    if os.path.exists(common_zip_path):
-                        print(f"[DEBUG] Also searching in common.zip for ambulance UV maps...")
-                        with zipfile.ZipFile(common_zip_path, 'r') as common_zip:
-                            common_files = common_zip.namelist()
-
-                            for search_dir in common_search_dirs:
-                                for file_path in common_files:
-                                    if file_path.startswith(search_dir):
-                                        filename_lower = os.path.basename(file_path).lower()
-
-                                        if "color" in filename_lower:
-                                            continue
-                                        if filename_lower.startswith("skin_"):
-                                            continue
-                                        if re.search(r'_skin_\w+_uv\d*\.', filename_lower):
-                                            continue
-
-                                        has_skin_and_uv = "skin" in filename_lower and "uv" in filename_lower
-                                        has_uvmap = "uvmap" in filename_lower
-                                        has_uv_layout = "uv1_layout" in filename_lower or "uv_layout" in filename_lower
-
-                                        if has_skin_and_uv or has_uvmap or has_uv_layout:
-                                            if filename_lower.endswith(('.dds', '.png', '.jpg', '.jpeg')):
-                                                found_files.append((file_path, common_zip_path))
-
-                if not found_files:
-                    show_notification(self.app, f"❌ No UV map files found for '{carid}'", "error", 4000)
-                    print(f"[DEBUG] UV Map search failed: No UV files found in {zip_file_path}")
-                    return
+            # Instant lookup in the UV catalog (scans this vehicle now if it is not cataloged yet)
+            found_files = uv_catalog.lookup(carid, beamng_install)
+
+            if not found_files:
+                show_notification(self.app, f"❌ No UV map files found for '{carid}'", "error", 4000)
+                print(f"[DEBUG] UV Map search failed: No UV files found in {zip_file_path}")
+                return
+
+            selected_files = []
+            convert_to_png = False
+            if len(found_files) == 1:
+                selected_files = [found_files[0]]
+                file_path, source_zip = found_files[0]
+                print(f"[DEBUG] UV Map found in ZIP: {file_path} (from {os.path.basename(source_zip)})")
+            else:
+                print(f"[DEBUG] Multiple UV maps found ({len(found_files)})")
+
+                dialog = ctk.CTkToplevel(self.app)
+                dialog.title("Select UV Map(s)")
+                dialog.geometry("600x400")
+                dialog.transient(self.app)
+                dialog.grab_set()
+
+                dialog.update_idletasks()
+                x = (dialog.winfo_screenwidth() // 2) - (600 // 2)
+                y = (dialog.winfo_screenheight() // 2) - (400 // 2)
+                dialog.geometry(f"600x400+{x}+{y}")
+
+                ctk.CTkLabel(
+                    dialog,
+                    text=f"Multiple UV maps found for {carid}\nSelect one or more files:",
+                    font=ctk.CTkFont(size=14, weight="bold"),
+                    text_color=state.colors["text"]
+                ).pack(pady=20)
+
+                scroll_frame = ctk.CTkScrollableFrame(dialog, fg_color=state.colors["frame_bg"])
+                scroll_frame.pack(fill="both", expand=True, padx=20, pady=(0,20))
+
+                checkbox_vars = {}
+                convert_var = ctk.BooleanVar(value=False)
+
+                for file_info in found_files:
+                    file_path, source_zip = file_info
+                    filename = os.path.basename(file_path)
+                    source_name = os.path.basename(source_zip)
+                    display_text = f"{filename} (from {source_name})" if source_zip != zip_file_path else filename
+
+                    var = ctk.BooleanVar(value=False)
+                    checkbox_vars[file_info] = var
+
+                    checkbox = ctk.CTkCheckBox(
+                        scroll_frame,
+                        text=display_text,
+                        variable=var,
+                        font=ctk.CTkFont(size=12),
+                        text_color=state.colors["text"]
+                    )
+                    checkbox.pack(anchor="w", pady=5, padx=10)
 
-                selected_files = []
-                if len(found_files) == 1:
-                    selected_files = [found_files[0]]
-                    file_path, source_zip = found_files[0]
-                    print(f"[DEBUG] UV Map found in ZIP: {file_path} (from {os.path.basename(source_zip)})")
-                else:
-                    print(f"[DEBUG] Multiple UV maps found ({len(found_files)})")
-
-                    dialog = ctk.CTkToplevel(self.app)
-                    dialog.title("Select UV Map(s)")
-                    dialog.geometry("600x400")
-                    dialog.transient(self.app)
-                    dialog.grab_set()
-
-                    dialog.update_idletasks()
-                    x = (dialog.winfo_screenwidth() // 2) - (600 // 2)
-                    y = (dialog.winfo_screenheight() // 2) - (400 // 2)
-                    dialog.geometry(f"600x400+{x}+{y}")
-
-                    ctk.CTkLabel(
+                if can_convert_dds() and any(f.lower().endswith(".dds") for f, _ in found_files):
+                    ctk.CTkCheckBox(
                         dialog,
-                        text=f"Multiple UV maps found for {carid}\nSelect one or more files:",
-                        font=ctk.CTkFont(size=14, weight="bold"),
+                        text="Also save PNG copies of DDS maps",
+                        variable=convert_var,
+                        font=ctk.CTkFont(size=12),
                         text_color=state.colors["text"]
-                    ).pack(pady=20)
-
-                    scroll_frame = ctk.CTkScrollableFrame(dialog, fg_color=state.colors["frame_bg"])
-                    scroll_frame.pack(fill="both", expand=True, padx=20, pady=(0,20))
-
-                    checkbox_vars = {}
-
-                    for file_info in found_files:
-                        file_path, source_zip = file_info
-                        filename = os.path.basename(file_path)
-                        source_name = os.path.basename(source_zip)
-                        display_text = f"{filename} (from {source_name})" if source_zip != zip_file_path else filename
-
-                        var = ctk.BooleanVar(value=False)
-                        checkbox_vars[file_info] = var
-
-                        checkbox = ctk.CTkCheckBox(
-                            scroll_frame,
-                            text=display_text,
-                            variable=var,
-                            font=ctk.CTkFont(size=12),
-                            text_color=state.colors["text"]
-                        )
-                        checkbox.pack(anchor="w", pady=5, padx=10)
-
-                    btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-                    btn_frame.pack(fill="x", padx=20, pady=(0,20))
-
-                    def select_all():
-                        for var in checkbox_vars.values():
-                            var.set(True)
-
-                    def deselect_all():
-                        for var in checkbox_vars.values():
-                            var.set(False)
-
-                    def on_select():
-                        nonlocal selected_files
-                        selected_files = [path for path, var in checkbox_vars.items() if var.get()]
-                        if selected_files:
-                            dialog.destroy()
-                        else:
-                            show_notification(self.app, "Please select at least one UV map file", "error", 2000)
-
-                    def on_cancel():
-                        nonlocal selected_files
-                        selected_files = []
-                        dialog.destroy()
+                    ).pack(anchor="w", padx=20, pady=(0, 10))
 
-                    ctk.CTkButton(
-                        btn_frame,
-                        text="Select All",
-                        command=select_all,
-                        fg_color=state.colors["card_bg"],
-                        hover_color=state.colors["card_hover"],
-                        text_color=state.colors["text"],
-                        width=100
-                    ).pack(side="left", padx=5)
-
-                    ctk.CTkButton(
-                        btn_frame,
-                        text="Deselect All",
-                        command=deselect_all,
-                        fg_color=state.colors["card_bg"],
-                        hover_color=state.colors["card_hover"],
-                        text_color=state.colors["text"],
-                        width=100
-                    ).pack(side="left", padx=5)
-
-                    ctk.CTkButton(
-                        btn_frame,
-                        text="OK",
-                        command=on_select,
-                        fg_color=state.colors["accent"],
-                        hover_color=state.colors["accent_hover"],
-                        text_color=state.colors["accent_text"],
-                        width=100
-                    ).pack(side="right", padx=5)
-
-                    ctk.CTkButton(
-                        btn_frame,
-                        text="Cancel",
-                        command=on_cancel,
-                        fg_color=state.colors["error"],
-                        hover_color=state.colors["error_hover"],
-                        text_color=state.colors["accent_text"],
-                        width=100
-                    ).pack(side="right", padx=5)
-
-                    self.app.wait_window(dialog)
-
-                    if not selected_files:
-                        print("[DEBUG] User cancelled UV map selection")
-                        return
-
-                print(f"[DEBUG] Selected UV Map(s): {[(os.path.basename(f), os.path.basename(z)) for f, z in selected_files]}")
-
-                if len(selected_files) == 1:
-                    file_path, source_zip = selected_files[0]
-                    file_ext = os.path.splitext(file_path)[1]
-                    destination = filedialog.asksaveasfilename(
-                        title="Save UV Map As",
-                        defaultextension=file_ext,
-                        initialfile=os.path.basename(file_path),
-                        filetypes=[
-                            ("All Files", "*.*"),
-                            ("DDS Files", "*.dds"),
-                            ("PNG Files", "*.png"),
-                            ("JPG Files", "*.jpg")
-                        ]
-                    )
+                btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+                btn_frame.pack(fill="x", padx=20, pady=(0,20))
 
-                    if destination:
-                        with zipfile.ZipFile(source_zip, 'r') as source_zip_ref:
-                            with source_zip_ref.open(file_path) as source:
-                                with open(destination, 'wb') as target:
-                                    target.write(source.read())
-
-                        show_notification(self.app, f"✅ UV map copied successfully!", "success", 3000)
-                        print(f"[DEBUG] UV Map extracted from {source_zip} to {destination}")
-                else:
-                    destination_folder = filedialog.askdirectory(
-                        title="Select Folder to Save UV Maps"
-                    )
+                def select_all():
+                    for var in checkbox_vars.values():
+                        var.set(True)
 
-                    if destination_folder:
-                        success_count = 0
-                        for file_info in selected_files:
-                            file_path, source_zip = file_info
-                            filename = os.path.basename(file_path)
-                            destination = os.path.join(destination_folder, filename)
-
-                            try:
-                                with zipfile.ZipFile(source_zip, 'r') as source_zip_ref:
-                                    with source_zip_ref.open(file_path) as source:
-                                        with open(destination, 'wb') as target:
-                                            target.write(source.read())
-                                success_count += 1
-                                print(f"[DEBUG] UV Map extracted: {filename} from {os.path.basename(source_zip)} to {destination}")
-                            except Exception as e:
-                                print(f"[DEBUG] Failed to extract {filename}: {e}")
-
-                        show_notification(self.app, f"✅ {success_count} UV map(s) copied successfully!", "success", 3000)
-                        print(f"[DEBUG] {success_count}/{len(selected_files)} UV maps extracted to {destination_folder}")
+                def deselect_all():
+                    for var in checkbox_vars.values():
+                        var.set(False)
+
+                def on_select():
+                    nonlocal selected_files, convert_to_png
+                    selected_files = [path for path, var in checkbox_vars.items() if var.get()]
+                    convert_to_png = convert_var.get()
+                    if selected_files:
+                        dialog.destroy()
+                    else:
+                        show_notification(self.app, "Please select at least one UV map file", "error", 2000)
+
+                def on_cancel():
+                    nonlocal selected_files
+                    selected_files = []
+                    dialog.destroy()
+
+                ctk.CTkButton(
+                    btn_frame,
+                    text="Select All",
+                    command=select_all,
+                    fg_color=state.colors["card_bg"],
+                    hover_color=state.colors["card_hover"],
+                    text_color=state.colors["text"],
+                    width=100
+                ).pack(side="left", padx=5)
+
+                ctk.CTkButton(
+                    btn_frame,
+                    text="Deselect All",
+                    command=deselect_all,
+                    fg_color=state.colors["card_bg"],
+                    hover_color=state.colors["card_hover"],
+                    text_color=state.colors["text"],
+                    width=100
+                ).pack(side="left", padx=5)
+
+                ctk.CTkButton(
+                    btn_frame,
+                    text="OK",
+                    command=on_select,
+                    fg_color=state.colors["accent"],
+                    hover_color=state.colors["accent_hover"],
+                    text_color=state.colors["accent_text"],
+                    width=100
+                ).pack(side="right", padx=5)
+
+                ctk.CTkButton(
+                    btn_frame,
+                    text="Cancel",
+                    command=on_cancel,
+                    fg_color=state.colors["error"],
+                    hover_color=state.colors["error_hover"],
+                    text_color=state.colors["accent_text"],
+                    width=100
+                ).pack(side="right", padx=5)
+
+                self.app.wait_window(dialog)
+
+                if not selected_files:
+                    print("[DEBUG] User cancelled UV map selection")
+                    return
+
+            print(f"[DEBUG] Selected UV Map(s): {[(os.path.basename(f), os.path.basename(z)) for f, z in selected_files]}")
+
+            if len(selected_files) == 1:
+                file_path, source_zip = selected_files[0]
+                file_ext = os.path.splitext(file_path)[1]
+                destination = filedialog.asksaveasfilename(
+                    title="Save UV Map As",
+                    defaultextension=file_ext,
+                    initialfile=os.path.basename(file_path),
+                    filetypes=[
+                        ("All Files", "*.*"),
+                        ("DDS Files", "*.dds"),
+                        ("PNG Files", "*.png"),
+                        ("JPG Files", "*.jpg")
+                    ]
+                )
+
+                if destination:
+                    # Saving a DDS map as .png extracts it next to the PNG and converts it;
+                    # otherwise the PNG copy follows the dialog's checkbox
+                    self._start_uv_extraction([(file_path, source_zip, destination)], convert_to_png)
+            else:
+                destination_folder = filedialog.askdirectory(
+                    title="Select Folder to Save UV Maps"
+                )
+
+                if destination_folder:
+                    items = [(file_path, source_zip, os.path.join(destination_folder, os.path.basename(file_path)))
+                             for file_path, source_zip in selected_files]
+                    self._start_uv_extraction(items, convert_to_png)
 
         except zipfile.BadZipFile:
             show_notification(self.app, f"❌ Invalid ZIP file: {carid}.zip", "error", 4000)
@@ -490,4 +528,78 @@ class CarListTab(ctk.CTkFrame):
             show_notification(self.app, f"❌ Failed to extract UV map: {str(e)}", "error", 4000)
             print(f"[DEBUG] Error extracting UV map: {e}")
             import traceback
-            traceback.print_exc()
\ No newline at end of file
+            traceback.print_exc()
+
+    def _start_uv_extraction(self, items, convert_to_png):
+        """Extract UV maps in the background with a progress window and Cancel button"""
+        progress_window = ctk.CTkToplevel(self.app)
+        progress_window.title("Extracting UV Maps")
+        progress_window.geometry("420x150")
+        progress_window.transient(self.app)
+        progress_window.resizable(False, False)
+
+        status_label = ctk.CTkLabel(
+            progress_window,
+            text=f"Extracting {len(items)} UV map(s)...",
+            font=ctk.CTkFont(size=13),
+            text_color=state.colors["text"]
+        )
+        status_label.pack(padx=20, pady=(20, 10))
+
+        progress_bar = ctk.CTkProgressBar(progress_window, progress_color=state.colors["accent"])
+        progress_bar.pack(fill="x", padx=20)
+        progress_bar.set(0)
+
+        job = UVExtractionJob(items, convert_to_png=convert_to_png)
+
+        cancel_button = ctk.CTkButton(
+            progress_window,
+            text="Cancel",
+            command=job.cancel,
+            fg_color=state.colors["error"],
+            hover_color=state.colors["error_hover"],
+            text_color=state.colors["accent_text"],
+            width=100
+        )
+        cancel_button.pack(pady=15)
+        progress_window.protocol("WM_DELETE_WINDOW", job.cancel)
+
+        # Workers report per chunk; only the latest report is drawn, once per UI tick
+        latest = {"progress": None, "scheduled": False}
+
+        def draw_progress():
+            latest["scheduled"] = False
+            if not progress_window.winfo_exists():
+                return
+            done, total, message = latest["progress"]
+            progress_bar.set(done / total if total else 0)
+            status_label.configure(text=f"{message} ({done / (1024 * 1024):.1f} / {total / (1024 * 1024):.1f} MB)")
+
+        def on_progress(done, total, message):
+            latest["progress"] = (done, total, message)
+            if not latest["scheduled"]:
+                latest["scheduled"] = True
+                self.after(50, draw_progress)
+
+        def on_complete(result):
+            self.after(0, lambda: finish(result))
+
+        def finish(result):
+            if progress_window.winfo_exists():
+                progress_window.destroy()
+
+            extracted = len(result["extracted"])
+            if result["cancelled"]:
+                show_notification(self.app, f"UV map extraction cancelled ({extracted} saved)", "warning", 3000)
+            elif result["failed"]:
+                show_notification(self.app, f"⚠️ {extracted} UV map(s) copied, {len(result['failed'])} failed", "warning", 4000)
+            else:
+                message = f"✅ {extracted} UV map(s) copied successfully!"
+                if result["converted"]:
+                    message = f"✅ {extracted} UV map(s) copied, {len(result['converted'])} converted to PNG"
+                show_notification(self.app, message, "success", 3000)
+            print(f"[DEBUG] UV extraction finished: {extracted} extracted, {len(result['converted'])} converted, "
+                  f"{len(result['failed'])} failed, cancelled={result['cancelled']}")
+
+        job.progress_callback = on_progress
+        job.start(on_complete)
@@ -7,6 +7,7 @@ from typing import Callable, Optional
 import os
 import json
 import sys
+import threading
 
 from gui.state import state
 
@@ -85,6 +86,7 @@ class DeveloperTab(ctk.CTkFrame):
         self.json_path_var = ctk.StringVar()
         self.jbeam_path_var = ctk.StringVar()
         self.image_path_var = ctk.StringVar()
+        self.import_carids_var = ctk.StringVar()
         
         # Search
         self.dev_search_var = ctk.StringVar()
@@ -285,7 +287,7 @@ class DeveloperTab(ctk.CTkFrame):
                     print(f"[WARNING] Generator tab missing refresh_vehicle_list method")
                     print(f"[DEBUG] Generator tab methods: {[m for m in dir(generator_tab) if 'refresh' in m.lower()]}")
             else:
-                print(f"[WARNING] Generator tab not found in tabs dict")
+                print(f"[DEBUG] Generator tab not built yet (it loads the current vehicles when opened)")
             
             # Refresh car list tab
             carlist_tab = main_window.tabs.get('carlist')
@@ -298,26 +300,13 @@ class DeveloperTab(ctk.CTkFrame):
                 else:
                     print(f"[WARNING] Car list tab missing refresh_vehicle_list method")
             else:
-                print(f"[WARNING] Car list tab not found in tabs dict")
+                print(f"[DEBUG] Car list tab not built yet (it loads the current vehicles when opened)")
             
             # Refresh sidebar (this is where vehicles are listed for adding to project)
             if hasattr(main_window, 'sidebar'):
                 print(f"[DEBUG] Sidebar found, refreshing...")
                 try:
-                    # CRITICAL: Clear sidebar state BEFORE repopulating
-                    # This prevents duplicates when refresh is called
-                    if hasattr(state, 'sidebar_vehicle_buttons'):
-                        print(f"[DEBUG] Clearing {len(state.sidebar_vehicle_buttons)} existing sidebar buttons...")
-                        # Destroy all existing vehicle buttons
-                        for btn_frame, car_id, car_name, add_btn_frame in state.sidebar_vehicle_buttons:
-                            try:
-                                btn_frame.destroy()
-                            except:
-                                pass
-                        # Clear the list
-                        state.sidebar_vehicle_buttons.clear()
-                        print(f"[DEBUG] Sidebar state cleared")
-                    
+                    # populate_vehicles replaces the whole list, so no clearing is needed first
                     # Check if sidebar has a refresh method
                     if hasattr(main_window.sidebar, 'populate_vehicles'):
                         print(f"[DEBUG] Calling sidebar.populate_vehicles()...")
@@ -501,6 +490,49 @@ class DeveloperTab(ctk.CTkFrame):
             font=ctk.CTkFont(size=14, weight="bold")
         ).grid(row=5, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 10))
         
+        # Import straight from the game archives (no manual extraction)
+        ctk.CTkLabel(
+            input_frame,
+            text="From Game:",
+            font=ctk.CTkFont(size=13),
+            text_color=state.colors["text"]
+        ).grid(row=6, column=0, sticky="w", padx=10, pady=(0, 10))
+        
+        import_frame = ctk.CTkFrame(input_frame, fg_color="transparent")
+        import_frame.grid(row=6, column=1, sticky="ew", padx=10, pady=(0, 10))
+        import_frame.grid_columnconfigure(0, weight=1)
+        
+        ctk.CTkEntry(
+            import_frame,
+            textvariable=self.import_carids_var,
+            placeholder_text="Car IDs from the game or your mods, comma separated (e.g. etk800, pickup)",
+            fg_color=state.colors["card_bg"],
+            border_color=state.colors["border"],
+            text_color=state.colors["text"]
+        ).grid(row=0, column=0, sticky="ew", padx=(0, 5))
+        
+        self.import_button = ctk.CTkButton(
+            import_frame,
+            text="📦 Import",
+            width=90,
+            command=self.import_from_game,
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"],
+            text_color=state.colors["accent_text"]
+        )
+        self.import_button.grid(row=0, column=1, padx=(0, 5))
+        
+        self.rebuild_button = ctk.CTkButton(
+            import_frame,
+            text="🔄 Rebuild All Templates",
+            width=170,
+            command=self.rebuild_all_templates,
+            fg_color=state.colors["card_bg"],
+            hover_color=state.colors["card_hover"],
+            text_color=state.colors["text"]
+        )
+        self.rebuild_button.grid(row=0, column=2)
+        
         # Status and progress container (always visible, reserved space)
         status_container = ctk.CTkFrame(self, fg_color="transparent", height=60)
         status_container.pack(fill="x", padx=10, pady=(5, 0))
@@ -532,6 +564,17 @@ class DeveloperTab(ctk.CTkFrame):
             text_color=state.colors["text"]
         ).pack(side="left")
         
+        # Material diff viewer (compare generated skins against templates / stock files)
+        ctk.CTkButton(
+            list_header_frame,
+            text="🔍 Compare Materials",
+            width=160,
+            command=self._open_material_diff,
+            fg_color=state.colors["card_bg"],
+            hover_color=state.colors["card_hover"],
+            text_color=state.colors["text"]
+        ).pack(side="right")
+        
         # Centered search using place
         self.dev_search_entry = ctk.CTkEntry(
             list_header_frame,
@@ -595,6 +638,89 @@ class DeveloperTab(ctk.CTkFrame):
         if filename:
             self.image_path_var.set(filename)
     
+    def _open_material_diff(self):
+        """Open the material diff viewer"""
+        from gui.components.material_diff import show_material_diff_dialog
+        show_material_diff_dialog(self.parent)
+    
+    def import_from_game(self):
+        """Import the car IDs typed in the From Game field straight from the game archives"""
+        carids = [c.strip() for c in self.import_carids_var.get().split(",") if c.strip()]
+        if not carids:
+            self.show_notification("Enter one or more car IDs to import", "error")
+            return
+        self._run_stock_import(carids)
+    
+    def rebuild_all_templates(self):
+        """Re-import every template that has a matching archive in the game (e.g. after a game update)"""
+        from core.settings import get_beamng_install_path
+        from core.developer import list_custom_vehicles
+        
+        beamng_install = get_beamng_install_path()
+        if not beamng_install:
+            self.show_notification("⚠️ BeamNG.drive installation path not configured. Please set it in Settings.", "warning", 5000)
+            return
+        
+        vehicles_path = os.path.join(beamng_install, "content", "vehicles")
+        carids = [carid for carid in list_custom_vehicles()
+                  if os.path.exists(os.path.join(vehicles_path, f"{carid}.zip"))]
+        if not carids:
+            self.show_notification("No templates with a matching game archive found", "warning")
+            return
+        self._run_stock_import(carids)
+    
+    def _run_stock_import(self, carids):
+        """Run core.developer.import_stock_vehicles in a worker thread with progress"""
+        from core.settings import get_beamng_install_path
+        
+        beamng_install = get_beamng_install_path()
+        if not beamng_install:
+            self.show_notification("⚠️ BeamNG.drive installation path not configured. Please set it in Settings.", "warning", 5000)
+            return
+        
+        self.import_button.configure(state="disabled")
+        self.rebuild_button.configure(state="disabled")
+        self.dev_status_label.pack(padx=10, pady=(5, 0))
+        self.dev_progress_bar.pack(fill="x", padx=10, pady=(5, 5))
+        self.dev_status_label.configure(text=f"Importing {len(carids)} vehicle(s) from game files...")
+        self.dev_progress_bar.set(0)
+        
+        def on_progress(carid, success, done, total):
+            mark = "✓" if success else "✗"
+            self.after(0, lambda: (
+                self.dev_status_label.configure(text=f"{mark} {carid} ({done}/{total})"),
+                self.dev_progress_bar.set(done / total)
+            ))
+        
+        def worker():
+            from core.developer import import_stock_vehicles
+            results = import_stock_vehicles(carids, beamng_install, progress_callback=on_progress)
+            self.after(0, lambda: self._on_stock_import_done(results))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _on_stock_import_done(self, results):
+        failed = [carid for carid, success in results.items() if not success]
+        imported = len(results) - len(failed)
+        
+        self.import_button.configure(state="normal")
+        self.rebuild_button.configure(state="normal")
+        
+        if failed:
+            self.dev_status_label.configure(text=f"Imported {imported}, failed: {', '.join(failed[:5])}")
+            self.show_notification(f"Imported {imported} vehicle(s), {len(failed)} failed", "warning", 5000)
+        else:
+            self.dev_status_label.configure(text=f"Imported {imported} vehicle(s)")
+            self.show_notification(f"✅ Imported {imported} vehicle(s) from game files", "success", 3000)
+            self.import_carids_var.set("")
+        
+        self._reload_added_vehicles_from_file()
+        self.refresh_developer_list()
+        self._refresh_all_tabs()
+        
+        self.after(3000, lambda: self.dev_progress_bar.pack_forget())
+        self.after(3000, lambda: self.dev_status_label.pack_forget())
+    
     def add_vehicle(self):
     
         print(f"[DEBUG] add_vehicle called")
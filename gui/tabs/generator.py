@@ -1,6 +1,7 @@
 """
 Generator Tab
 """
+import logging
 from typing import Dict, List, Optional, Any, Callable
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
@@ -10,30 +11,46 @@ import json
 import os
 
 from gui.state import state
+from core.material_table import StagePropertyTable
+from core.vehicle_discovery import merged_vehicles, has_template
+from core.mods_inventory import mods_inventory
+from core.content_index import content_index
+from core.project_model import ProjectModel, PROJECT_RESET, CAR_ADDED, CAR_REMOVED
+from core.search_index import SearchIndex
+from gui.components.project_overview import ProjectOverview
+from gui.components.refresh_scheduler import RefreshScheduler, Debouncer, SEARCH_DEBOUNCE_MS
+from utils.log import get_logger
+
+log = get_logger(__name__)
+
+# How long the export success toast stays up; the broken-reference warning follows it
+EXPORT_SUCCESS_TOAST_MS = 5000
+# Pause between one toast closing and the next opening
+TOAST_GAP_MS = 500
 
 try:
     from utils.file_ops import load_added_vehicles_json
 except ImportError:
-    print("[WARNING] load_added_vehicles_json not found in file_ops")
+    log.warning("load_added_vehicles_json not found in file_ops")
     def load_added_vehicles_json():
         return {}
 
 try:
     from core.file_ops import generate_multi_skin_mod
 except ImportError:
-    print("[WARNING] generate_multi_skin_mod not found, using fallback")
+    log.warning("generate_multi_skin_mod not found, using fallback")
     def generate_multi_skin_mod(*args, **kwargs):
-        print(f"[DEBUG] generate_multi_skin_mod called")
+        log.debug("generate_multi_skin_mod called")
         messagebox.showerror("Error", "generate_multi_skin_mod function not available")
 
-print(f"[DEBUG] Loading class: GeneratorTab")
+log.debug("Loading class: GeneratorTab")
 
 class GeneratorTab(ctk.CTkFrame):
     """Complete generator tab - fully functional project creation and mod generation"""
 
     def __init__(self, parent: ctk.CTk, notification_callback: Callable[[str, str, int], None] = None):
 
-        print(f"[DEBUG] __init__ called")
+        log.debug("__init__ called")
         super().__init__(parent, fg_color=state.colors["app_bg"])
 
         self.show_notification = notification_callback or self._fallback_notification
@@ -42,7 +59,7 @@ class GeneratorTab(ctk.CTkFrame):
         self.author_entry_sidebar = None
 
         self.generator_scroll: Optional[ctk.CTkScrollableFrame] = None
-        self.project_overview_frame: Optional[ctk.CTkFrame] = None
+        self.project_overview: Optional[ProjectOverview] = None
         self.project_search_entry: Optional[ctk.CTkEntry] = None
         self.current_car_label: Optional[ctk.CTkLabel] = None
         self.dds_preview_label: Optional[ctk.CTkLabel] = None
@@ -74,15 +91,15 @@ class GeneratorTab(ctk.CTkFrame):
             self.config_types = load_config_types()
         except ImportError:
             self.config_types = ["Factory", "Custom", "Police"]
-            print("[DEBUG] Using default config types")
+            log.debug("Using default config types")
 
-        self.project_data = {
-            "mod_name": "",
-            "author": "",
-            "cars": {}
-        }
+        self.project = ProjectModel()
+        self.project.subscribe(self._on_project_changed)
+        # Car instances by name and base car ID, for the project search
+        self.project_search_index = SearchIndex()
 
         self.selected_car_for_skin: Optional[str] = None
+        self.expanded_car_id: Optional[str] = None
 
         self.selected_skin_index: Optional[int] = None
         self.editing_mode: bool = False
@@ -91,6 +108,10 @@ class GeneratorTab(ctk.CTkFrame):
         self.add_skin_section_card: Optional[ctk.CTkFrame] = None
 
         self.car_id_list = self._build_car_id_list()
+        self.car_names: Dict[str, str] = dict(self.car_id_list)
+
+        self.refresh_scheduler = RefreshScheduler(self)
+        self.refresh_scheduler.register("project_overview", self._redraw_project_overview)
 
         self._setup_ui()
         self._bind_search()
@@ -98,50 +119,86 @@ class GeneratorTab(ctk.CTkFrame):
 
     def set_sidebar_references(self, mod_name_entry, author_entry):
 
-        print(f"[DEBUG] set_sidebar_references called")
+        log.debug("set_sidebar_references called")
         """Called by main window to provide sidebar entry references"""
         self.mod_name_entry_sidebar = mod_name_entry
         self.author_entry_sidebar = author_entry
 
+    @property
+    def project_data(self) -> Dict[str, Any]:
+        """The project dict that is saved, loaded and built (edit it through self.project)"""
+        return self.project.data
+
+    def _on_project_changed(self, event: str, car_instance_id: Optional[str]):
+        """Project model changed: update the search index and redraw the overview (only changed cars are rebuilt)"""
+        if event == PROJECT_RESET:
+            self._rebuild_project_search_index()
+        elif event == CAR_ADDED:
+            self._index_project_car(car_instance_id)
+        elif event == CAR_REMOVED:
+            self.project_search_index.remove(car_instance_id)
+        self.refresh_project_display()
+
+    def _index_project_car(self, car_instance_id: str):
+        base_carid = self.project_data["cars"][car_instance_id].get("base_carid", car_instance_id)
+        self.project_search_index.add(car_instance_id, self._car_name(base_carid), base_carid)
+
+    def _rebuild_project_search_index(self):
+        """Re-index every project car (after a load or when vehicle names change)"""
+        self.project_search_index.clear()
+        for car_instance_id in self.project_data["cars"]:
+            self._index_project_car(car_instance_id)
+
+    def _car_name(self, base_carid: str) -> str:
+        """Display name for a car ID"""
+        return self.car_names.get(base_carid) or state.vehicle_ids.get(base_carid, base_carid)
+
     def _fallback_notification(self, message: str, type: str = "info", duration: int = 3000):
         """Fallback notification if none provided"""
         print(f"[{type.upper()}] {message}")
 
     def _build_car_id_list(self) -> List:
         """Build the car ID list from VEHICLE_IDS - sorted alphabetically by car name"""
-        car_list = []
 
         vehicles = load_added_vehicles_json()
         state.added_vehicles.clear()
         state.added_vehicles.update(vehicles)
 
-        for carid, carname in state.vehicle_ids.items():
-
-            if carid not in state.added_vehicles:
-                car_list.append((carid, carname))
-
-        for carid, carname in state.added_vehicles.items():
-            car_list.append((carid, carname))
+        # Built-in, developer-added and discovered vehicles that have a template
+        car_list = list(merged_vehicles(state.vehicle_ids, state.added_vehicles, templated_only=True).items())
 
         return sorted(car_list, key=lambda x: x[1].lower())
 
+    def add_discovered_vehicles(self, infos):
+        """Make templated vehicles found by a background discovery refresh selectable"""
+        known = {carid for carid, _ in self.car_id_list}
+        new_vehicles = [(info.carid, info.name) for info in infos
+                        if info.carid not in known and has_template(info.carid)]
+        if new_vehicles:
+            self.car_id_list = sorted(self.car_id_list + new_vehicles, key=lambda x: x[1].lower())
+            self.car_names.update(new_vehicles)
+            self._rebuild_project_search_index()
+            log.debug("Generator: %s discovered vehicle(s) added", len(new_vehicles))
+
     def refresh_vehicle_list(self):
         """Refresh the vehicle list when new vehicles are added"""
-        print(f"[DEBUG] refresh_vehicle_list called")
-        print(f"[DEBUG] Rebuilding car ID list from added_vehicles.json...")
+        log.debug("refresh_vehicle_list called")
+        log.debug("Rebuilding car ID list from added_vehicles.json...")
 
         self.car_id_list = self._build_car_id_list()
+        self.car_names = dict(self.car_id_list)
+        self._rebuild_project_search_index()
 
-        print(f"[DEBUG] Car list now has {len(self.car_id_list)} vehicles")
-        print(f"[DEBUG] Custom vehicles in state: {len(state.added_vehicles)}")
+        log.debug("Car list now has %s vehicles", len(self.car_id_list))
+        log.debug("Custom vehicles in state: %s", len(state.added_vehicles))
 
         self.refresh_project_display()
 
-        print(f"[DEBUG] Vehicle list refresh complete")
+        log.debug("Vehicle list refresh complete")
 
     def get_real_value(self, entry: ctk.CTkEntry, placeholder: str) -> str:
 
-        print(f"[DEBUG] get_real_value called")
+        log.debug("get_real_value called")
         """Get real value from entry (not placeholder)"""
         if entry is None:
             return ""
@@ -201,15 +258,15 @@ class GeneratorTab(ctk.CTkFrame):
         self.project_search_entry.pack(fill="x")
         self._setup_placeholder(self.project_search_entry, "🔍 Search cars...")
 
-        self.project_overview_container = ctk.CTkScrollableFrame(
+        self.project_overview = ProjectOverview(
             left_sidebar,
-            corner_radius=0,
-            fg_color="transparent"
+            on_car_click=self._toggle_car_expansion,
+            on_car_remove=self.remove_car_from_project,
+            on_skin_click=self.select_skin_for_editing,
+            on_skin_remove=self.remove_skin_from_car,
+            bg_color=state.colors["sidebar_bg"]
         )
-        self.project_overview_container.pack(fill="both", expand=True, padx=15, pady=(0, 15))
-
-        self.project_overview_frame = ctk.CTkFrame(self.project_overview_container, fg_color="transparent")
-        self.project_overview_frame.pack(fill="both", expand=True, padx=0, pady=0)
+        self.project_overview.pack(fill="both", expand=True, padx=15, pady=(0, 15))
 
         self.generator_scroll = ctk.CTkScrollableFrame(main_container, fg_color="transparent")
         self.generator_scroll.pack(side="right", fill="both", expand=True, padx=0, pady=0)
@@ -584,14 +641,14 @@ class GeneratorTab(ctk.CTkFrame):
 
         def on_focus_in(event):
 
-            print(f"[DEBUG] on_focus_in called")
+            log.debug("on_focus_in called")
             if entry.get() == placeholder:
                 entry.delete(0, "end")
                 entry.configure(text_color=state.colors["text"])
 
         def on_focus_out(event):
 
-            print(f"[DEBUG] on_focus_out called")
+            log.debug("on_focus_out called")
             if not entry.get():
                 entry.insert(0, placeholder)
                 entry.configure(text_color="#888888")
@@ -601,13 +658,13 @@ class GeneratorTab(ctk.CTkFrame):
 
     def _bind_search(self):
         """Bind search functionality"""
-        self.project_search_var.trace_add("write", lambda *args: self.refresh_project_display())
+        self.project_search_var.trace_add("write", Debouncer(self, SEARCH_DEBOUNCE_MS, self.refresh_project_display))
 
     def add_car_to_project(self, carid: str, display_name: str):
 
-        print(f"[DEBUG] add_car_to_project called")
+        log.debug("add_car_to_project called")
         """Add a car to the project"""
-        print(f"[DEBUG] Adding car to project: {display_name} ({carid})")
+        log.debug("Adding car to project: %s (%s)", display_name, carid)
 
         if carid in self.project_data["cars"]:
             self.show_notification(f"{display_name} is already in the project", "warning")
@@ -621,29 +678,25 @@ class GeneratorTab(ctk.CTkFrame):
                 self.select_car_for_skin(existing_car_id)
                 return
 
-        self.project_data["cars"][carid] = {
-            "base_carid": carid,
-            "skins": [],
-            "temp_skin_name": "",
-            "temp_dds_path": ""
-        }
+        self.project.add_car(carid, carid)
 
         self.show_notification(f"Added {display_name} to project", "success")
 
-        print(f"[DEBUG] Selected car for skins: {carid}")
+        log.debug("Selected car for skins: %s", carid)
 
         self.select_car_for_skin(carid)
 
     def remove_car_from_project(self, car_instance_id: str):
 
-        print(f"[DEBUG] remove_car_from_project called")
+        log.debug("remove_car_from_project called")
         """Remove a car instance from the project"""
         if car_instance_id in self.project_data["cars"]:
             base_carid = self.project_data["cars"][car_instance_id].get("base_carid", car_instance_id)
-            del self.project_data["cars"][car_instance_id]
 
             if self.selected_car_for_skin == car_instance_id:
                 self.selected_car_for_skin = None
+
+            self.project.remove_car(car_instance_id)
             
             # Hide the add skin section if no cars remain
             if not self.project_data["cars"]:
@@ -652,17 +705,15 @@ class GeneratorTab(ctk.CTkFrame):
                 if self.add_skin_section_card:
                     self.add_skin_section_card.pack_forget()
 
-            car_name = state.vehicle_ids.get(base_carid, base_carid)
-            self.show_notification(f"Removed {car_name}", "info")
-
-            self.refresh_project_display()
+            self.show_notification(f"Removed {self._car_name(base_carid)}", "info")
 
     def _toggle_car_expansion(self, car_id: str):
         """Toggle expansion of car to show/hide skins"""
-        print(f"[DEBUG] _toggle_car_expansion called for {car_id}")
+        log.debug("_toggle_car_expansion called for %s", car_id)
 
         if self.expanded_car_id == car_id:
             self.expanded_car_id = None
+            self.refresh_project_display()
         else:
 
             self.expanded_car_id = car_id
@@ -670,18 +721,18 @@ class GeneratorTab(ctk.CTkFrame):
 
     def select_car_for_skin(self, car_instance_id: str):
 
-        print(f"[DEBUG] select_car_for_skin called")
+        log.debug("select_car_for_skin called")
         """Select a car to add skins to"""
         if car_instance_id in self.project_data["cars"]:
 
             if self.editing_mode and self.selected_car_for_skin != car_instance_id:
-                print(f"[DEBUG] Canceling editing mode - switching from {self.selected_car_for_skin} to {car_instance_id}")
+                log.debug("Canceling editing mode - switching from %s to %s", self.selected_car_for_skin, car_instance_id)
                 self.editing_mode = False
                 self.selected_skin_index = None
                 self._update_button_ui()
 
             self.selected_car_for_skin = car_instance_id
-            print(f"[DEBUG] Selected car for adding skins: {car_instance_id}")
+            log.debug("Selected car for adding skins: %s", car_instance_id)
             
             # Show the add skin section
             if self.add_skin_section_label:
@@ -696,7 +747,7 @@ class GeneratorTab(ctk.CTkFrame):
 
     def add_skin_to_selected_car(self):
 
-        print(f"[DEBUG] add_skin_to_selected_car called")
+        log.debug("add_skin_to_selected_car called")
         """Add a skin to the currently selected car or update existing skin"""
 
         if self.editing_mode and self.selected_skin_index is not None:
@@ -733,22 +784,22 @@ class GeneratorTab(ctk.CTkFrame):
             pc_path = self.pc_file_path_var.get().strip()
             jpg_path = self.jpg_file_path_var.get().strip()
 
-            print(f"[DEBUG] ===== CONFIG DATA VALIDATION =====")
-            print(f"[DEBUG] Config type: {config_type}")
-            print(f"[DEBUG] Config name: '{config_name}'")
-            print(f"[DEBUG] PC path from StringVar: '{pc_path}'")
-            print(f"[DEBUG] JPG path from StringVar: '{jpg_path}'")
+            log.debug("===== CONFIG DATA VALIDATION =====")
+            log.debug("Config type: %s", config_type)
+            log.debug("Config name: '%s'", config_name)
+            log.debug("PC path from StringVar: '%s'", pc_path)
+            log.debug("JPG path from StringVar: '%s'", jpg_path)
 
             if self.pc_file_entry:
                 entry_value = self.pc_file_entry.get()
-                print(f"[DEBUG] PC Entry widget value: '{entry_value}'")
+                log.debug("PC Entry widget value: '%s'", entry_value)
 
             if not config_name or config_name == "Enter configuration name...":
                 self.show_notification("Please enter a configuration name", "warning")
                 return
 
             if not pc_path or pc_path == "No .pc file selected...":
-                print(f"[DEBUG] PC path validation FAILED: empty or placeholder")
+                log.debug("PC path validation FAILED: empty or placeholder")
                 self.show_notification("Please select a .pc file for config data", "warning")
                 return
 
@@ -756,20 +807,20 @@ class GeneratorTab(ctk.CTkFrame):
                 self.show_notification("Please select a .jpg file for config data", "warning")
                 return
 
-            print(f"[DEBUG] Checking if PC path exists: {pc_path}")
-            print(f"[DEBUG] os.path.exists(pc_path): {os.path.exists(pc_path)}")
-            print(f"[DEBUG] os.path.isfile(pc_path): {os.path.isfile(pc_path)}")
+            log.debug("Checking if PC path exists: %s", pc_path)
+            log.debug("os.path.exists(pc_path): %s", os.path.exists(pc_path))
+            log.debug("os.path.isfile(pc_path): %s", os.path.isfile(pc_path))
 
             if not os.path.exists(pc_path):
-                print(f"[DEBUG] PC FILE PATH DOES NOT EXIST!")
-                print(f"[DEBUG] Path attempted: '{pc_path}'")
-                print(f"[DEBUG] Path length: {len(pc_path)}")
-                print(f"[DEBUG] Path repr: {repr(pc_path)}")
+                log.debug("PC FILE PATH DOES NOT EXIST!")
+                log.debug("Path attempted: '%s'", pc_path)
+                log.debug("Path length: %s", len(pc_path))
+                log.debug("Path repr: %s", repr(pc_path))
                 self.show_notification(".pc file does not exist", "error")
                 return
 
             if not os.path.exists(jpg_path):
-                print(f"[DEBUG] JPG FILE PATH DOES NOT EXIST!")
+                log.debug("JPG FILE PATH DOES NOT EXIST!")
                 self.show_notification(".jpg file does not exist", "error")
                 return
 
@@ -779,17 +830,17 @@ class GeneratorTab(ctk.CTkFrame):
                 "pc_file_path": pc_path,
                 "jpg_file_path": jpg_path
             }
-            print(f"[DEBUG] Adding skin with config data: Type={config_type}, Name={config_name}")
-            print(f"[DEBUG] ===== CONFIG DATA VALIDATION COMPLETE =====")
+            log.debug("Adding skin with config data: Type=%s, Name=%s", config_type, config_name)
+            log.debug("===== CONFIG DATA VALIDATION COMPLETE =====")
 
         if self.add_material_properties_var.get():
             material_properties = self._collect_material_properties()
             if material_properties:
                 skin_data['material_properties'] = material_properties
-                print(f"[DEBUG] Added material properties to skin: {len(material_properties)} materials")
+                log.debug("Added material properties to skin: %s materials", len(material_properties))
 
-        self.project_data["cars"][self.selected_car_for_skin]["skins"].append(skin_data)
-        print(f"[DEBUG] Added skin '{skin_name}'. Total skins: {len(self.project_data['cars'][self.selected_car_for_skin]['skins'])}")
+        self.project.add_skin(self.selected_car_for_skin, skin_data)
+        log.debug("Added skin '%s'. Total skins: %s", skin_name, len(self.project_data['cars'][self.selected_car_for_skin]['skins']))
 
         self.skin_name_var.set("")
         self.dds_path_var.set("")
@@ -805,9 +856,9 @@ class GeneratorTab(ctk.CTkFrame):
                     self.dds_preview_label.configure(image=None, text="")
                 except:
                     pass
-                print(f"[DEBUG] DDS preview cleared")
+                log.debug("DDS preview cleared")
         except Exception as e:
-            print(f"[DEBUG] Error with preview (non-critical, skipping): {e}")
+            log.debug("Error with preview (non-critical, skipping): %s", e)
 
         try:
             if self.skin_name_entry:
@@ -817,9 +868,9 @@ class GeneratorTab(ctk.CTkFrame):
                 self.skin_name_entry.configure(text_color="#888888")
                 if hasattr(self.skin_name_entry, '_placeholder'):
                     self.skin_name_entry.event_generate("<FocusOut>")
-                print(f"[DEBUG] Skin name entry reset with placeholder")
+                log.debug("Skin name entry reset with placeholder")
         except Exception as e:
-            print(f"[DEBUG] Error resetting skin name: {e}")
+            log.debug("Error resetting skin name: %s", e)
 
         try:
             if self.config_name_entry:
@@ -827,7 +878,7 @@ class GeneratorTab(ctk.CTkFrame):
                 self.config_name_entry.insert(0, "Enter configuration name...")
                 self.config_name_entry.configure(text_color="#888888")
         except Exception as e:
-            print(f"[DEBUG] Error resetting config name: {e}")
+            log.debug("Error resetting config name: %s", e)
 
         try:
             if self.pc_file_entry:
@@ -836,7 +887,7 @@ class GeneratorTab(ctk.CTkFrame):
                 self.pc_file_entry.insert(0, "No .pc file selected...")
                 self.pc_file_entry.configure(text_color="#888888", state="readonly")
         except Exception as e:
-            print(f"[DEBUG] Error resetting pc entry: {e}")
+            log.debug("Error resetting pc entry: %s", e)
 
         try:
             if self.jpg_file_entry:
@@ -845,70 +896,11 @@ class GeneratorTab(ctk.CTkFrame):
                 self.jpg_file_entry.insert(0, "No .jpg file selected...")
                 self.jpg_file_entry.configure(text_color="#888888", state="readonly")
         except Exception as e:
-            print(f"[DEBUG] Error resetting jpg entry: {e}")
+            log.debug("Error resetting jpg entry: %s", e)
 
         self.show_notification(f"Added skin '{skin_name}'", "success")
 
-        print(f"[DEBUG] Starting deselect/reselect refresh...")
-
-        current = self.selected_car_for_skin
-        print(f"[DEBUG] Current selection: {current}")
-
-        self.selected_car_for_skin = None
-        print(f"[DEBUG] Deselected - calling refresh...")
-        self.refresh_project_display()
-
-        self.update_idletasks()
-        print(f"[DEBUG] Deselect refresh complete")
-
-        print(f"[DEBUG] Scheduling reselect in 50ms...")
-        self.after(50, lambda: self._reselect_car(current))
-
-        print(f"[DEBUG] Skin addition complete!")
-
-    def _force_scrollable_reflow(self):
-        """Force the scrollable container to recalculate and redraw"""
-        try:
-            canvas = self.project_overview_container._parent_canvas
-            canvas.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.event_generate("<Configure>")
-            print(f"[DEBUG] Scrollable reflow executed successfully")
-        except Exception as e:
-            print(f"[DEBUG] Scrollable reflow error (non-critical): {e}")
-
-    def _reselect_car(self, car_id):
-        """Re-select a car after a forced refresh"""
-        self.selected_car_for_skin = car_id
-        self.refresh_project_display()
-
-        try:
-            if hasattr(self, 'project_overview_frame') and self.project_overview_frame:
-                for widget in self.project_overview_frame.winfo_children():
-                    widget.update()
-                self.project_overview_frame.update()
-
-            if hasattr(self, 'project_overview_container') and self.project_overview_container:
-                self.project_overview_container.update()
-
-            self.update()
-
-            print(f"[DEBUG] Car reselected with forced updates: {car_id}")
-        except Exception as e:
-            print(f"[DEBUG] Update error (non-critical): {e}")
-
-    def _update_scroll_region(self):
-        """Helper method to update the scroll region of the project overview frame"""
-        if hasattr(self, 'project_overview_frame') and self.project_overview_frame:
-            try:
-                self.project_overview_frame.update_idletasks()
-                if hasattr(self.project_overview_frame, '_parent_canvas'):
-                    canvas = self.project_overview_frame._parent_canvas
-                    canvas.configure(scrollregion=canvas.bbox("all"))
-                    canvas.update()
-                    print("[DEBUG] Scroll region updated successfully")
-            except Exception as e:
-                print(f"[DEBUG] Error updating scroll region: {e}")
+        log.debug("Skin addition complete!")
 
     def select_skin_for_editing(self, car_instance_id: str, skin_index: int):
         """Select a skin for editing
@@ -917,15 +909,15 @@ class GeneratorTab(ctk.CTkFrame):
             car_instance_id: The car instance ID
             skin_index: Index of the skin to edit
         """
-        print(f"[DEBUG] select_skin_for_editing called for car {car_instance_id}, skin index {skin_index}")
+        log.debug("select_skin_for_editing called for car %s, skin index %s", car_instance_id, skin_index)
 
         if car_instance_id not in self.project_data["cars"]:
-            print(f"[DEBUG] Car {car_instance_id} not found in project")
+            log.debug("Car %s not found in project", car_instance_id)
             return
 
         skins = self.project_data["cars"][car_instance_id]["skins"]
         if skin_index < 0 or skin_index >= len(skins):
-            print(f"[DEBUG] Invalid skin index {skin_index}")
+            log.debug("Invalid skin index %s", skin_index)
             return
 
         self.selected_car_for_skin = car_instance_id
@@ -935,7 +927,7 @@ class GeneratorTab(ctk.CTkFrame):
         self._update_button_ui()
 
         skin = skins[skin_index]
-        print(f"[DEBUG] Editing skin: {skin['name']}")
+        log.debug("Editing skin: %s", skin['name'])
 
         try:
             if self.skin_name_entry:
@@ -943,7 +935,7 @@ class GeneratorTab(ctk.CTkFrame):
                 self.skin_name_entry.insert(0, skin['name'])
                 self.skin_name_entry.configure(text_color=state.colors["text"])
         except Exception as e:
-            print(f"[DEBUG] Error setting skin name: {e}")
+            log.debug("Error setting skin name: %s", e)
 
         try:
             if 'dds_path' in skin:
@@ -969,9 +961,9 @@ class GeneratorTab(ctk.CTkFrame):
 
                     self.dds_preview_label.update_idletasks()
 
-                    print(f"[DEBUG] Loaded DDS preview for editing: {skin['dds_path']}")
+                    log.debug("Loaded DDS preview for editing: %s", skin['dds_path'])
                 except Exception as e:
-                    print(f"[DEBUG] Could not load DDS preview: {e}")
+                    log.debug("Could not load DDS preview: %s", e)
                     import traceback
                     traceback.print_exc()
                     try:
@@ -981,30 +973,30 @@ class GeneratorTab(ctk.CTkFrame):
                     except:
                         pass
         except Exception as e:
-            print(f"[DEBUG] Error setting DDS path: {e}")
+            log.debug("Error setting DDS path: %s", e)
 
         try:
             if 'config_data' in skin:
                 config_data = skin['config_data']
-                print(f"[DEBUG] Config data found in skin: {config_data}")
+                log.debug("Config data found in skin: %s", config_data)
 
                 self.add_config_data_var.set(True)
-                print(f"[DEBUG] Set add_config_data_var to True")
+                log.debug("Set add_config_data_var to True")
 
                 self._toggle_config_data()
-                print(f"[DEBUG] Called _toggle_config_data to show fields")
+                log.debug("Called _toggle_config_data to show fields")
 
                 self.update_idletasks()
 
                 if 'config_type' in config_data:
                     self.config_type_var.set(config_data['config_type'])
-                    print(f"[DEBUG] Set config_type to: {config_data['config_type']}")
+                    log.debug("Set config_type to: %s", config_data['config_type'])
 
                 if 'config_name' in config_data and self.config_name_entry:
                     self.config_name_entry.delete(0, "end")
                     self.config_name_entry.insert(0, config_data['config_name'])
                     self.config_name_entry.configure(text_color=state.colors["text"])
-                    print(f"[DEBUG] Set config_name to: {config_data['config_name']}")
+                    log.debug("Set config_name to: %s", config_data['config_name'])
 
                 if 'pc_file_path' in config_data and self.pc_file_entry:
 
@@ -1017,7 +1009,7 @@ class GeneratorTab(ctk.CTkFrame):
                     self.pc_file_entry.delete(0, "end")
                     self.pc_file_entry.insert(0, os.path.basename(config_data['pc_file_path']))
                     self.pc_file_entry.configure(text_color=state.colors["text"], state="readonly")
-                    print(f"[DEBUG] Set PC file to: {config_data['pc_file_path']}")
+                    log.debug("Set PC file to: %s", config_data['pc_file_path'])
 
                 if 'jpg_file_path' in config_data and self.jpg_file_entry:
 
@@ -1030,7 +1022,7 @@ class GeneratorTab(ctk.CTkFrame):
                     self.jpg_file_entry.delete(0, "end")
                     self.jpg_file_entry.insert(0, os.path.basename(config_data['jpg_file_path']))
                     self.jpg_file_entry.configure(text_color=state.colors["text"], state="readonly")
-                    print(f"[DEBUG] Set JPG file to: {config_data['jpg_file_path']}")
+                    log.debug("Set JPG file to: %s", config_data['jpg_file_path'])
             else:
 
                 self.add_config_data_var.set(False)
@@ -1058,20 +1050,20 @@ class GeneratorTab(ctk.CTkFrame):
 
                 self._toggle_config_data()
 
-            print(f"[DEBUG] Form populated with skin data")
+            log.debug("Form populated with skin data")
 
         except Exception as e:
-            print(f"[DEBUG] Error populating config data: {e}")
+            log.debug("Error populating config data: %s", e)
             import traceback
             traceback.print_exc()
 
         try:
             if 'material_properties' in skin:
                 material_props = skin['material_properties']
-                print(f"[DEBUG] Material properties found in skin: {len(material_props)} materials")
+                log.debug("Material properties found in skin: %s materials", len(material_props))
 
                 self.add_material_properties_var.set(True)
-                print(f"[DEBUG] Set add_material_properties_var to True")
+                log.debug("Set add_material_properties_var to True")
 
                 self._toggle_material_properties()
 
@@ -1079,15 +1071,15 @@ class GeneratorTab(ctk.CTkFrame):
 
                 self._load_material_properties_into_ui(material_props)
 
-                print(f"[DEBUG] Material properties populated in UI")
+                log.debug("Material properties populated in UI")
             else:
-                print(f"[DEBUG] No material properties in this skin")
+                log.debug("No material properties in this skin")
 
                 self.add_material_properties_var.set(False)
                 self._toggle_material_properties()
 
         except Exception as e:
-            print(f"[DEBUG] Error populating material properties: {e}")
+            log.debug("Error populating material properties: %s", e)
             import traceback
             traceback.print_exc()
 
@@ -1108,7 +1100,7 @@ class GeneratorTab(ctk.CTkFrame):
 
     def cancel_skin_editing(self):
         """Cancel skin editing mode and clear the form"""
-        print(f"[DEBUG] cancel_skin_editing called")
+        log.debug("cancel_skin_editing called")
 
         self.editing_mode = False
         self.selected_skin_index = None
@@ -1123,14 +1115,14 @@ class GeneratorTab(ctk.CTkFrame):
 
     def update_skin(self):
         """Update the selected skin with new values from the form"""
-        print(f"[DEBUG] update_skin called")
+        log.debug("update_skin called")
 
         if not self.editing_mode or self.selected_skin_index is None:
-            print(f"[DEBUG] Not in editing mode or no skin selected")
+            log.debug("Not in editing mode or no skin selected")
             return
 
         if not self.selected_car_for_skin or self.selected_car_for_skin not in self.project_data["cars"]:
-            print(f"[DEBUG] No car selected or car not in project")
+            log.debug("No car selected or car not in project")
             self.cancel_skin_editing()
             return
 
@@ -1147,7 +1139,7 @@ class GeneratorTab(ctk.CTkFrame):
 
         skins = self.project_data["cars"][self.selected_car_for_skin]["skins"]
         if self.selected_skin_index >= len(skins):
-            print(f"[DEBUG] Invalid skin index")
+            log.debug("Invalid skin index")
             self.cancel_skin_editing()
             return
 
@@ -1162,11 +1154,11 @@ class GeneratorTab(ctk.CTkFrame):
             pc_file_path = self.pc_file_path_var.get().strip()
             jpg_file_path = self.jpg_file_path_var.get().strip()
 
-            print(f"[DEBUG] Config name: '{config_name}'")
-            print(f"[DEBUG] PC file path from form: '{pc_file_path}'")
-            print(f"[DEBUG] JPG file path from form: '{jpg_file_path}'")
-            print(f"[DEBUG] PC file from project flag: {self.pc_file_from_project}")
-            print(f"[DEBUG] JPG file from project flag: {self.jpg_file_from_project}")
+            log.debug("Config name: '%s'", config_name)
+            log.debug("PC file path from form: '%s'", pc_file_path)
+            log.debug("JPG file path from form: '%s'", jpg_file_path)
+            log.debug("PC file from project flag: %s", self.pc_file_from_project)
+            log.debug("JPG file from project flag: %s", self.jpg_file_from_project)
 
             if not config_name:
                 self.show_notification("Configuration name is required", "error")
@@ -1176,52 +1168,52 @@ class GeneratorTab(ctk.CTkFrame):
             existing_pc_path = existing_config.get('pc_file_path', '')
             existing_jpg_path = existing_config.get('jpg_file_path', '')
 
-            print(f"[DEBUG] Existing PC path: '{existing_pc_path}'")
-            print(f"[DEBUG] Existing JPG path: '{existing_jpg_path}'")
-            print(f"[DEBUG] PC paths match: {pc_file_path == existing_pc_path}")
-            print(f"[DEBUG] JPG paths match: {jpg_file_path == existing_jpg_path}")
+            log.debug("Existing PC path: '%s'", existing_pc_path)
+            log.debug("Existing JPG path: '%s'", existing_jpg_path)
+            log.debug("PC paths match: %s", pc_file_path == existing_pc_path)
+            log.debug("JPG paths match: %s", jpg_file_path == existing_jpg_path)
 
             if self.pc_file_from_project and pc_file_path == existing_pc_path:
-                print(f"[DEBUG] PC path unchanged from project load, skipping existence check")
+                log.debug("PC path unchanged from project load, skipping existence check")
 
                 if not pc_file_path:
-                    print(f"[DEBUG] PC file path is empty")
+                    log.debug("PC file path is empty")
                     self.show_notification("Please select a valid .pc file", "error")
                     return
             elif pc_file_path != existing_pc_path:
-                print(f"[DEBUG] PC path changed or new, validating existence...")
+                log.debug("PC path changed or new, validating existence...")
 
                 if not pc_file_path or not os.path.exists(pc_file_path):
-                    print(f"[DEBUG] PC file validation failed - path: '{pc_file_path}', exists: {os.path.exists(pc_file_path) if pc_file_path else False}")
+                    log.debug("PC file validation failed - path: '%s', exists: %s", pc_file_path, os.path.exists(pc_file_path) if pc_file_path else False)
                     self.show_notification("Please select a valid .pc file", "error")
                     return
             else:
-                print(f"[DEBUG] PC path unchanged, skipping existence check")
+                log.debug("PC path unchanged, skipping existence check")
 
                 if not pc_file_path:
-                    print(f"[DEBUG] PC file path is empty")
+                    log.debug("PC file path is empty")
                     self.show_notification("Please select a valid .pc file", "error")
                     return
 
             if self.jpg_file_from_project and jpg_file_path == existing_jpg_path:
-                print(f"[DEBUG] JPG path unchanged from project load, skipping existence check")
+                log.debug("JPG path unchanged from project load, skipping existence check")
 
                 if not jpg_file_path:
-                    print(f"[DEBUG] JPG file path is empty")
+                    log.debug("JPG file path is empty")
                     self.show_notification("Please select a valid .jpg file", "error")
                     return
             elif jpg_file_path != existing_jpg_path:
-                print(f"[DEBUG] JPG path changed or new, validating existence...")
+                log.debug("JPG path changed or new, validating existence...")
 
                 if not jpg_file_path or not os.path.exists(jpg_file_path):
-                    print(f"[DEBUG] JPG file validation failed - path: '{jpg_file_path}', exists: {os.path.exists(jpg_file_path) if jpg_file_path else False}")
+                    log.debug("JPG file validation failed - path: '%s', exists: %s", jpg_file_path, os.path.exists(jpg_file_path) if jpg_file_path else False)
                     self.show_notification("Please select a valid .jpg file", "error")
                     return
             else:
-                print(f"[DEBUG] JPG path unchanged, skipping existence check")
+                log.debug("JPG path unchanged, skipping existence check")
 
                 if not jpg_file_path:
-                    print(f"[DEBUG] JPG file path is empty")
+                    log.debug("JPG file path is empty")
                     self.show_notification("Please select a valid .jpg file", "error")
                     return
 
@@ -1240,14 +1232,15 @@ class GeneratorTab(ctk.CTkFrame):
             material_properties = self._collect_material_properties()
             if material_properties:
                 skin['material_properties'] = material_properties
-                print(f"[DEBUG] Updated material properties: {len(material_properties)} materials")
+                log.debug("Updated material properties: %s materials", len(material_properties))
         else:
 
             if 'material_properties' in skin:
                 del skin['material_properties']
-                print(f"[DEBUG] Removed material properties from skin")
+                log.debug("Removed material properties from skin")
 
-        print(f"[DEBUG] Updated skin '{old_name}' -> '{skin_name}'")
+        log.debug("Updated skin '%s' -> '%s'", old_name, skin_name)
+        self.project.skin_updated(self.selected_car_for_skin)
 
         self.editing_mode = False
         self.selected_skin_index = None
@@ -1258,10 +1251,7 @@ class GeneratorTab(ctk.CTkFrame):
 
         self.show_notification(f"Updated skin: {skin_name}", "success")
 
-        current = self.selected_car_for_skin
-        self.selected_car_for_skin = None
         self.refresh_project_display()
-        self.after(50, lambda: self._reselect_car(current))
 
     def _reset_skin_form_fields(self):
         """Reset all skin form fields to their placeholder state"""
@@ -1274,7 +1264,7 @@ class GeneratorTab(ctk.CTkFrame):
                 if hasattr(self.skin_name_entry, '_placeholder'):
                     self.skin_name_entry.event_generate("<FocusOut>")
         except Exception as e:
-            print(f"[DEBUG] Error resetting skin name: {e}")
+            log.debug("Error resetting skin name: %s", e)
 
         try:
 
@@ -1283,13 +1273,13 @@ class GeneratorTab(ctk.CTkFrame):
                 self.dds_preview_label.image = None
                 self.dds_preview_label.configure(image=None, text="No DDS selected")
         except Exception as e:
-            print(f"[DEBUG] Error resetting DDS: {e}")
+            log.debug("Error resetting DDS: %s", e)
 
         try:
 
             self.add_config_data_var.set(False)
         except Exception as e:
-            print(f"[DEBUG] Error resetting config checkbox: {e}")
+            log.debug("Error resetting config checkbox: %s", e)
 
         try:
 
@@ -1298,7 +1288,7 @@ class GeneratorTab(ctk.CTkFrame):
                 self.config_name_entry.insert(0, "Enter configuration name...")
                 self.config_name_entry.configure(text_color="#888888")
         except Exception as e:
-            print(f"[DEBUG] Error resetting config name: {e}")
+            log.debug("Error resetting config name: %s", e)
 
         try:
 
@@ -1311,7 +1301,7 @@ class GeneratorTab(ctk.CTkFrame):
                 self.pc_file_entry.insert(0, "No .pc file selected...")
                 self.pc_file_entry.configure(text_color="#888888", state="readonly")
         except Exception as e:
-            print(f"[DEBUG] Error resetting PC file: {e}")
+            log.debug("Error resetting PC file: %s", e)
 
         try:
 
@@ -1324,13 +1314,13 @@ class GeneratorTab(ctk.CTkFrame):
                 self.jpg_file_entry.insert(0, "No .jpg file selected...")
                 self.jpg_file_entry.configure(text_color="#888888", state="readonly")
         except Exception as e:
-            print(f"[DEBUG] Error resetting JPG file: {e}")
+            log.debug("Error resetting JPG file: %s", e)
 
         try:
 
             self._toggle_config_data()
         except Exception as e:
-            print(f"[DEBUG] Error toggling config data visibility: {e}")
+            log.debug("Error toggling config data visibility: %s", e)
 
         try:
 
@@ -1342,29 +1332,23 @@ class GeneratorTab(ctk.CTkFrame):
                 for widget in self.material_properties_frame.winfo_children():
                     widget.destroy()
                 self.material_properties_entries.clear()
-                print("[DEBUG] Material properties UI cleared")
+                log.debug("Material properties UI cleared")
         except Exception as e:
-            print(f"[DEBUG] Error resetting material properties: {e}")
+            log.debug("Error resetting material properties: %s", e)
 
     def remove_skin_from_car(self, car_instance_id: str, skin_index: int):
 
-        print(f"[DEBUG] remove_skin_from_car called")
+        log.debug("remove_skin_from_car called")
         """Remove a skin from a car"""
         if car_instance_id in self.project_data["cars"]:
             skins = self.project_data["cars"][car_instance_id]["skins"]
             if 0 <= skin_index < len(skins):
-                skin_name = skins[skin_index]["name"]
-                del skins[skin_index]
+                skin_name = self.project.remove_skin(car_instance_id, skin_index)["name"]
                 self.show_notification(f"Removed skin '{skin_name}'", "info")
-                self.refresh_project_display()
-                self.update_idletasks()
-                if hasattr(self, 'project_overview_frame') and self.project_overview_frame:
-                    self.project_overview_frame.update_idletasks()
-                    self.after(10, self._update_scroll_region)
 
     def browse_dds(self):
 
-        print(f"[DEBUG] browse_dds called")
+        log.debug("browse_dds called")
         """Browse for DDS file"""
         filename = filedialog.askopenfilename(
             title="Select DDS Texture",
@@ -1391,9 +1375,9 @@ class GeneratorTab(ctk.CTkFrame):
                 except:
                     pass
 
-                print(f"[DEBUG] DDS preview loaded: {filename}")
+                log.debug("DDS preview loaded: %s", filename)
             except Exception as e:
-                print(f"[DEBUG] Could not load DDS preview: {e}")
+                log.debug("Could not load DDS preview: %s", e)
                 try:
                     if hasattr(self, 'dds_preview_label') and self.dds_preview_label:
                         self.dds_preview_label.image = None
@@ -1412,7 +1396,7 @@ class GeneratorTab(ctk.CTkFrame):
 
             self.config_files_container.pack(fill="x", pady=(0, 10), before=self.material_properties_container)
 
-            print("[DEBUG] Config data section shown")
+            log.debug("Config data section shown")
         else:
 
             self.config_name_label.pack_forget()
@@ -1420,7 +1404,7 @@ class GeneratorTab(ctk.CTkFrame):
             self.config_type_entry_row.pack_forget()
             self.config_files_container.pack_forget()
 
-            print("[DEBUG] Config data section hidden")
+            log.debug("Config data section hidden")
 
     def _browse_pc_file(self):
         """Browse for .pc file in BeamNG vehicles folder"""
@@ -1454,9 +1438,9 @@ class GeneratorTab(ctk.CTkFrame):
             self.pc_file_path_var.set(filename)
 
             self.pc_file_from_project = False
-            print(f"[DEBUG] Selected .pc file: {filename}")
-            print(f"[DEBUG] File exists: {os.path.exists(filename)}")
-            print(f"[DEBUG] StringVar value set to: {self.pc_file_path_var.get()}")
+            log.debug("Selected .pc file: %s", filename)
+            log.debug("File exists: %s", os.path.exists(filename))
+            log.debug("StringVar value set to: %s", self.pc_file_path_var.get())
 
     def _browse_jpg_file(self):
         """Browse for .jpg file in BeamNG vehicles folder"""
@@ -1490,52 +1474,52 @@ class GeneratorTab(ctk.CTkFrame):
             self.jpg_file_path_var.set(filename)
 
             self.jpg_file_from_project = False
-            print(f"[DEBUG] Selected .jpg file: {filename}")
-            print(f"[DEBUG] File exists: {os.path.exists(filename)}")
-            print(f"[DEBUG] StringVar value set to: {self.jpg_file_path_var.get()}")
+            log.debug("Selected .jpg file: %s", filename)
+            log.debug("File exists: %s", os.path.exists(filename))
+            log.debug("StringVar value set to: %s", self.jpg_file_path_var.get())
 
     def _toggle_material_properties(self):
         """Toggle visibility and populate material properties section"""
-        print(f"\n[DEBUG] ========== _toggle_material_properties called ==========")
-        print(f"[DEBUG] Checkbox state: {self.add_material_properties_var.get()}")
+        log.debug("========== _toggle_material_properties called ==========")
+        log.debug("Checkbox state: %s", self.add_material_properties_var.get())
 
         if self.add_material_properties_var.get():
             try:
-                print(f"[DEBUG] Attempting to show material properties...")
+                log.debug("Attempting to show material properties...")
 
-                print(f"[DEBUG] selected_car_for_skin: {self.selected_car_for_skin}")
-                print(f"[DEBUG] Cars in project: {list(self.project_data['cars'].keys())}")
+                log.debug("selected_car_for_skin: %s", self.selected_car_for_skin)
+                log.debug("Cars in project: %s", list(self.project_data['cars'].keys()))
 
                 if not self.selected_car_for_skin or self.selected_car_for_skin not in self.project_data["cars"]:
-                    print(f"[DEBUG] No car selected or car not in project")
+                    log.debug("No car selected or car not in project")
                     self.show_notification("Please select a car first", "warning")
                     self.add_material_properties_var.set(False)
                     return
 
                 car_info = self.project_data["cars"][self.selected_car_for_skin]
                 base_carid = car_info.get("base_carid")
-                print(f"[DEBUG] base_carid: {base_carid}")
+                log.debug("base_carid: %s", base_carid)
 
                 if not base_carid:
-                    print(f"[DEBUG] No base_carid found in car_info")
+                    log.debug("No base_carid found in car_info")
                     self.show_notification("Car configuration error", "error")
                     self.add_material_properties_var.set(False)
                     return
 
                 if self.material_properties_entries:
-                    print(f"[DEBUG] Material properties UI already exists with {len(self.material_properties_entries)} materials")
-                    print(f"[DEBUG] Showing existing UI instead of regenerating...")
+                    log.debug("Material properties UI already exists with %s materials", len(self.material_properties_entries))
+                    log.debug("Showing existing UI instead of regenerating...")
                     if self.material_properties_frame:
                         self.material_properties_frame.pack(fill="both", expand=True, pady=(5, 0))
-                        print("[DEBUG] Material properties section shown (existing UI)")
+                        log.debug("Material properties section shown (existing UI)")
                     return
 
-                print(f"[DEBUG] Calling _load_material_structure for {base_carid}...")
+                log.debug("Calling _load_material_structure for %s...", base_carid)
                 materials = self._load_material_structure(base_carid)
-                print(f"[DEBUG] Materials loaded: {len(materials) if materials else 0} materials")
+                log.debug("Materials loaded: %s materials", len(materials) if materials else 0)
 
                 if not materials:
-                    print(f"[DEBUG] No materials found, showing error message...")
+                    log.debug("No materials found, showing error message...")
 
                     project_root = None
                     cwd_vehicles = os.path.join(os.getcwd(), "vehicles", base_carid)
@@ -1565,36 +1549,36 @@ class GeneratorTab(ctk.CTkFrame):
                     self.add_material_properties_var.set(False)
                     return
 
-                print(f"[DEBUG] Calling _populate_material_properties_ui...")
-                print(f"[DEBUG] Materials to populate: {list(materials.keys())}")
+                log.debug("Calling _populate_material_properties_ui...")
+                log.debug("Materials to populate: %s", list(materials.keys()))
                 self._populate_material_properties_ui(materials)
-                print(f"[DEBUG] _populate_material_properties_ui completed")
+                log.debug("_populate_material_properties_ui completed")
 
-                print(f"[DEBUG] Showing material_properties_frame...")
+                log.debug("Showing material_properties_frame...")
                 if self.material_properties_frame:
                     self.material_properties_frame.pack(fill="both", expand=True, pady=(5, 0))
-                    print("[DEBUG] Material properties section shown")
+                    log.debug("Material properties section shown")
                 else:
-                    print("[DEBUG] ERROR: material_properties_frame is None!")
+                    log.debug("ERROR: material_properties_frame is None!")
                     self.show_notification("Material properties frame not initialized", "error")
                     self.add_material_properties_var.set(False)
 
             except Exception as e:
-                print(f"[DEBUG] !!! EXCEPTION in _toggle_material_properties !!!")
-                print(f"[DEBUG] Error: {e}")
+                log.debug("!!! EXCEPTION in _toggle_material_properties !!!")
+                log.debug("Error: %s", e)
                 import traceback
                 traceback.print_exc()
                 self.show_notification(f"Error loading material properties: {str(e)}", "error", 5000)
                 self.add_material_properties_var.set(False)
         else:
-            print(f"[DEBUG] Hiding material properties section...")
+            log.debug("Hiding material properties section...")
 
             if self.material_properties_frame:
                 self.material_properties_frame.pack_forget()
-                print("[DEBUG] Material properties section hidden (widgets preserved)")
+                log.debug("Material properties section hidden (widgets preserved)")
             else:
-                print("[DEBUG] material_properties_frame is None, cannot hide")
-        print(f"[DEBUG] ========== _toggle_material_properties finished ==========\n")
+                log.debug("material_properties_frame is None, cannot hide")
+        log.debug("========== _toggle_material_properties finished ==========")
 
     def _load_material_structure(self, car_id: str) -> Dict:
         """
@@ -1607,7 +1591,7 @@ class GeneratorTab(ctk.CTkFrame):
         cwd_vehicles = os.path.join(os.getcwd(), "vehicles", car_id)
         if os.path.exists(cwd_vehicles):
             project_root = os.getcwd()
-            print(f"[DEBUG] Found vehicles folder using cwd: {cwd_vehicles}")
+            log.debug("Found vehicles folder using cwd: %s", cwd_vehicles)
 
         if not project_root:
             script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -1616,7 +1600,7 @@ class GeneratorTab(ctk.CTkFrame):
             potential_vehicles = os.path.join(potential_root, "vehicles", car_id)
             if os.path.exists(potential_vehicles):
                 project_root = potential_root
-                print(f"[DEBUG] Found vehicles folder using script dir: {potential_vehicles}")
+                log.debug("Found vehicles folder using script dir: %s", potential_vehicles)
 
         if not project_root:
             current = os.getcwd()
@@ -1624,7 +1608,7 @@ class GeneratorTab(ctk.CTkFrame):
                 test_path = os.path.join(current, "vehicles", car_id)
                 if os.path.exists(test_path):
                     project_root = current
-                    print(f"[DEBUG] Found vehicles folder searching upward: {test_path}")
+                    log.debug("Found vehicles folder searching upward: %s", test_path)
                     break
                 parent = os.path.dirname(current)
                 if parent == current:
@@ -1633,10 +1617,10 @@ class GeneratorTab(ctk.CTkFrame):
 
         if project_root:
             vehicle_base_path = os.path.join(project_root, "vehicles", car_id)
-            print(f"[DEBUG] Using project root: {project_root}")
-            print(f"[DEBUG] Vehicle base path: {vehicle_base_path}")
+            log.debug("Using project root: %s", project_root)
+            log.debug("Vehicle base path: %s", vehicle_base_path)
         else:
-            print(f"[DEBUG] Could not find vehicles folder in project, will try BeamNG installation only")
+            log.debug("Could not find vehicles folder in project, will try BeamNG installation only")
             vehicle_base_path = None
 
         material_data = {}
@@ -1645,7 +1629,7 @@ class GeneratorTab(ctk.CTkFrame):
         search_paths = []
 
         if vehicle_base_path and os.path.exists(vehicle_base_path):
-            print(f"[DEBUG] Vehicle folder exists, scanning for subdirectories...")
+            log.debug("Vehicle folder exists, scanning for subdirectories...")
 
             try:
                 for item in os.listdir(vehicle_base_path):
@@ -1653,12 +1637,12 @@ class GeneratorTab(ctk.CTkFrame):
                     if os.path.isdir(item_path):
 
                         search_paths.append(item_path)
-                        print(f"[DEBUG] Found skin folder: {item_path}")
+                        log.debug("Found skin folder: %s", item_path)
             except Exception as e:
-                print(f"[DEBUG] Error reading vehicle folder: {e}")
+                log.debug("Error reading vehicle folder: %s", e)
         else:
             if vehicle_base_path:
-                print(f"[DEBUG] Vehicle folder does not exist: {vehicle_base_path}")
+                log.debug("Vehicle folder does not exist: %s", vehicle_base_path)
 
         try:
             from core.settings import get_beamng_path
@@ -1678,17 +1662,17 @@ class GeneratorTab(ctk.CTkFrame):
 
         for search_path in search_paths:
             if not os.path.exists(search_path):
-                print(f"[DEBUG] Search path does not exist: {search_path}")
+                log.debug("Search path does not exist: %s", search_path)
                 continue
 
-            print(f"[DEBUG] Searching for materials in: {search_path}")
+            log.debug("Searching for materials in: %s", search_path)
 
             try:
                 for filename in os.listdir(search_path):
                     if filename in ['skin.materials.json', 'materials.json']:
                         filepath = os.path.join(search_path, filename)
                         files_found.append(filepath)
-                        print(f"[DEBUG] Found material file: {filepath}")
+                        log.debug("Found material file: %s", filepath)
 
                         try:
                             with open(filepath, 'r', encoding='utf-8') as f:
@@ -1701,8 +1685,8 @@ class GeneratorTab(ctk.CTkFrame):
                             try:
                                 data = json.loads(content)
                             except json.JSONDecodeError as e:
-                                print(f"[DEBUG] JSON decode error in {filename} even after cleanup: {e}")
-                                print(f"[DEBUG] Error at line {e.lineno}, column {e.colno}")
+                                log.debug("JSON decode error in %s even after cleanup: %s", filename, e)
+                                log.debug("Error at line %s, column %s", e.lineno, e.colno)
                                 import traceback
                                 traceback.print_exc()
                                 continue
@@ -1737,28 +1721,28 @@ class GeneratorTab(ctk.CTkFrame):
                                     }
 
                             if material_data:
-                                print(f"[DEBUG] Loaded {len(material_data)} materials from: {filename}")
+                                log.debug("Loaded %s materials from: %s", len(material_data), filename)
                                 return material_data
                             else:
 
-                                print(f"[DEBUG] Material file exists but contains no editable properties: {filepath}")
+                                log.debug("Material file exists but contains no editable properties: %s", filepath)
 
                         except Exception as e:
-                            print(f"[DEBUG] Error loading {filename}: {e}")
+                            log.debug("Error loading %s: %s", filename, e)
                             import traceback
                             traceback.print_exc()
                             continue
             except Exception as e:
-                print(f"[DEBUG] Error listing directory {search_path}: {e}")
+                log.debug("Error listing directory %s: %s", search_path, e)
                 continue
 
         if files_found:
-            print(f"[DEBUG] Material files found but contained no editable properties:")
+            log.debug("Material files found but contained no editable properties:")
             for f in files_found:
-                print(f"[DEBUG]   - {f}")
-            print(f"[DEBUG] (No clearCoatFactor, clearCoatRoughnessFactor, metallicFactor, or roughnessFactor found)")
+                log.debug("  - %s", f)
+            log.debug("(No clearCoatFactor, clearCoatRoughnessFactor, metallicFactor, or roughnessFactor found)")
         else:
-            print(f"[DEBUG] No material files found for {car_id} in any search path")
+            log.debug("No material files found for %s in any search path", car_id)
 
         return material_data
 
@@ -1874,15 +1858,13 @@ class GeneratorTab(ctk.CTkFrame):
 
     def _collect_material_properties(self) -> Dict:
         """Collect all material property values from the UI"""
-        result = {}
+        log.debug("===== _collect_material_properties called =====")
 
-        print("[DEBUG] ===== _collect_material_properties called =====")
+        table = StagePropertyTable()
 
         for material_name, entries in self.material_properties_entries.items():
-            print(f"[DEBUG] Processing material: {material_name}")
-            material_props = {}
+            log.debug("Processing material: %s", material_name)
 
-            stages = {}
             for entry_key, entry_widget in entries.items():
 
                 parts = entry_key.split('_', 2)
@@ -1892,17 +1874,15 @@ class GeneratorTab(ctk.CTkFrame):
                 stage_num = parts[1]
                 prop_name = parts[2]
 
-                print(f"[DEBUG]   Entry: {entry_key}, Stage: {stage_num}, Prop: {prop_name}")
+                log.debug("  Entry: %s, Stage: %s, Prop: %s", entry_key, stage_num, prop_name)
 
                 try:
                     value = entry_widget.get().strip()
-                    print(f"[DEBUG]   Raw value from UI: '{value}'")
+                    log.debug("  Raw value from UI: '%s'", value)
 
                     if not value or value.lower() == "null":
-                        if stage_num not in stages:
-                            stages[stage_num] = {}
-                        stages[stage_num][prop_name] = None
-                        print(f"[DEBUG]   Set to None")
+                        table.set(material_name, stage_num, prop_name, None)
+                        log.debug("  Set to None")
                         continue
 
                     if '.' in value:
@@ -1910,70 +1890,84 @@ class GeneratorTab(ctk.CTkFrame):
                     else:
                         numeric_value = int(value)
 
-                    print(f"[DEBUG]   Converted to numeric: {numeric_value} (type: {type(numeric_value).__name__})")
+                    log.debug("  Converted to numeric: %s (type: %s)", numeric_value, type(numeric_value).__name__)
 
                     if numeric_value < 0 or numeric_value > 1:
-                        print(f"[WARNING] Value out of range for {material_name}.{prop_name}: {numeric_value} (must be 0-1)")
+                        log.warning("Value out of range for %s.%s: %s (must be 0-1)", material_name, prop_name, numeric_value)
                         self.show_notification(f"Warning: {prop_name} value {numeric_value} is out of range (0-1)", "warning", 4000)
 
                         numeric_value = max(0, min(1, numeric_value))
-                        print(f"[WARNING] Clamped to: {numeric_value}")
+                        log.warning("Clamped to: %s", numeric_value)
 
-                    if stage_num not in stages:
-                        stages[stage_num] = {}
-                    stages[stage_num][prop_name] = numeric_value
-                    print(f"[DEBUG]   ✓ Stored: stages['{stage_num}']['{prop_name}'] = {numeric_value}")
+                    table.set(material_name, stage_num, prop_name, numeric_value)
+                    log.debug("  ✓ Stored: (%s, stage %s, %s) = %s", material_name, stage_num, prop_name, numeric_value)
 
                 except ValueError as e:
-                    print(f"[WARNING] Invalid value for {material_name}.{prop_name}: '{value}' - Error: {e}")
+                    log.warning("Invalid value for %s.%s: '%s' - Error: %s", material_name, prop_name, value, e)
                     self.show_notification(f"Invalid value for {prop_name}: '{value}'", "warning", 3000)
                     continue
 
-            if stages:
-                result[material_name] = stages
-                print(f"[DEBUG] ✓ Added {material_name} with {len(stages)} stages")
+        result = table.to_nested()
 
-                import json
-                print(f"[DEBUG] Final structure for {material_name}:")
-                print(f"[DEBUG] {json.dumps(stages, indent=4)}")
-
-        print(f"[DEBUG] ===== Collected material properties from {len(result)} materials =====")
-        if result:
-            import json
-            print(f"[DEBUG] Complete result structure:")
-            print(f"[DEBUG] {json.dumps(result, indent=2)}")
+        log.debug("===== Collected %s material properties from %s materials =====", len(table), len(result))
+        if result and log.isEnabledFor(logging.DEBUG):
+            log.debug("Complete result structure:")
+            log.debug("%s", json.dumps(result, indent=2))
 
         return result
 
     def _load_material_properties_into_ui(self, material_props: Dict):
         """Load saved material properties into the UI entries"""
-        for material_name, stages in material_props.items():
+        for material_name, stage_num, prop_name, prop_value in StagePropertyTable.from_nested(material_props).rows():
             if material_name not in self.material_properties_entries:
-                print(f"[DEBUG] Material {material_name} not found in UI, skipping")
+                log.debug("Material %s not found in UI, skipping", material_name)
                 continue
 
             entries = self.material_properties_entries[material_name]
+            entry_key = f"stage_{stage_num}_{prop_name}"
 
-            for stage_num, properties in stages.items():
-                for prop_name, prop_value in properties.items():
-                    entry_key = f"stage_{stage_num}_{prop_name}"
-
-                    if entry_key in entries:
-                        entry = entries[entry_key]
-                        entry.delete(0, "end")
+            if entry_key in entries:
+                entry = entries[entry_key]
+                entry.delete(0, "end")
 
-                        if prop_value is None:
-                            entry.insert(0, "null")
-                            print(f"[DEBUG] Set {material_name}.{entry_key} = null")
-                        else:
-                            entry.insert(0, str(prop_value))
-                            print(f"[DEBUG] Set {material_name}.{entry_key} = {prop_value}")
-                    else:
-                        print(f"[DEBUG] Entry {entry_key} not found for {material_name}")
+                if prop_value is None:
+                    entry.insert(0, "null")
+                    log.debug("Set %s.%s = null", material_name, entry_key)
+                else:
+                    entry.insert(0, str(prop_value))
+                    log.debug("Set %s.%s = %s", material_name, entry_key, prop_value)
+            else:
+                log.debug("Entry %s not found for %s", entry_key, material_name)
+
+    def _pack_project_data(self, project_data: Dict) -> Dict:
+        """Copy of project data with material properties stored as compact columnar tables"""
+        packed = dict(project_data)
+        packed["cars"] = {}
+        for car_instance_id, car_info in project_data["cars"].items():
+            packed_car = dict(car_info)
+            packed_car["skins"] = []
+            for skin in car_info.get("skins", []):
+                if skin.get("material_properties"):
+                    skin = dict(skin)
+                    skin["material_table"] = StagePropertyTable.from_nested(skin.pop("material_properties")).to_compact()
+                packed_car["skins"].append(skin)
+            packed["cars"][car_instance_id] = packed_car
+        return packed
+
+    def _unpack_project_data(self, project_data: Dict) -> Dict:
+        """Expand compact material tables back into nested material properties (older files pass through)"""
+        for car_info in project_data.get("cars", {}).values():
+            for skin in car_info.get("skins", []):
+                if "material_table" in skin:
+                    try:
+                        skin["material_properties"] = StagePropertyTable.from_compact(skin.pop("material_table")).to_nested()
+                    except (ValueError, KeyError) as e:
+                        log.warning("Could not read material table for skin '%s': %s", skin.get('name', '?'), e)
+        return project_data
 
     def save_project(self):
 
-        print(f"[DEBUG] save_project called")
+        log.debug("save_project called")
         """Save current project to file"""
         if not self.project_data["cars"]:
             self.show_notification("No cars in project to save", "warning")
@@ -2000,16 +1994,16 @@ class GeneratorTab(ctk.CTkFrame):
         if filename:
             try:
                 with open(filename, 'w') as f:
-                    json.dump(self.project_data, f, indent=2)
-                print(f"[DEBUG] Project saved to: {filename}")
+                    json.dump(self._pack_project_data(self.project_data), f, indent=2)
+                log.debug("Project saved to: %s", filename)
                 self.show_notification("Project saved successfully", "success")
             except Exception as e:
-                print(f"[DEBUG] Error saving project: {e}")
+                log.debug("Error saving project: %s", e)
                 self.show_notification(f"Error saving project: {str(e)}", "error")
 
     def load_project(self):
 
-        print(f"[DEBUG] load_project called")
+        log.debug("load_project called")
         """Load project from file"""
         filename = filedialog.askopenfilename(
             title="Load Project",
@@ -2025,8 +2019,10 @@ class GeneratorTab(ctk.CTkFrame):
                     self.show_notification("Invalid project file", "error")
                     return
 
-                self.project_data = loaded_data
+                loaded_data = self._unpack_project_data(loaded_data)
+
                 self.selected_car_for_skin = None
+                self.expanded_car_id = None
 
                 self.editing_mode = False
                 self.selected_skin_index = None
@@ -2052,18 +2048,18 @@ class GeneratorTab(ctk.CTkFrame):
                     if self.add_skin_section_card:
                         self.add_skin_section_card.pack_forget()
 
-                print(f"[DEBUG] Project loaded from: {filename}")
-                self.show_notification(f"Loaded project with {len(loaded_data['cars'])} cars", "success")
+                self.project.replace(loaded_data)
 
-                self.refresh_project_display()
+                log.debug("Project loaded from: %s", filename)
+                self.show_notification(f"Loaded project with {len(loaded_data['cars'])} cars", "success")
 
             except Exception as e:
-                print(f"[DEBUG] Error loading project: {e}")
+                log.debug("Error loading project: %s", e)
                 self.show_notification(f"Error loading project: {str(e)}", "error")
 
     def clear_project(self):
 
-        print(f"[DEBUG] clear_project called")
+        log.debug("clear_project called")
         """Clear the current project"""
         if not self.project_data["cars"]:
             self.show_notification("Project is already empty", "info")
@@ -2079,8 +2075,8 @@ class GeneratorTab(ctk.CTkFrame):
 
         if confirmed:
 
-            self.project_data["cars"] = {}
             self.selected_car_for_skin = None
+            self.expanded_car_id = None
 
             self.editing_mode = False
             self.selected_skin_index = None
@@ -2099,275 +2095,56 @@ class GeneratorTab(ctk.CTkFrame):
                 self.mod_name_entry_sidebar.delete(0, "end")
                 self.mod_name_entry_sidebar.insert(0, "Enter mod name...")
                 self.mod_name_entry_sidebar.configure(text_color="#888888")
-                print(f"[DEBUG] Cleared mod name entry and restored placeholder")
+                log.debug("Cleared mod name entry and restored placeholder")
 
             if self.author_entry_sidebar:
                 self.author_entry_sidebar.delete(0, "end")
                 self.author_entry_sidebar.insert(0, "Your name...")
                 self.author_entry_sidebar.configure(text_color="#888888")
-                print(f"[DEBUG] Cleared author entry and restored placeholder")
+                log.debug("Cleared author entry and restored placeholder")
+
+            self.project.clear()
 
             self.show_notification("Project cleared", "info")
-            self.refresh_project_display()
 
     def refresh_project_display(self):
+        """Schedule a project overview refresh; any number of calls before the next idle pass redraw once"""
+        self.refresh_scheduler.invalidate("project_overview")
 
-        print(f"[DEBUG] refresh_project_display called")
-        """Refresh the project overview display with 2-column grid layout"""
-        print(f"[DEBUG] ========== REFRESH PROJECT DISPLAY ==========")
-        print(f"[DEBUG] Cars in project: {len(self.project_data['cars'])}")
-
-        for widget in self.project_overview_frame.winfo_children():
-            widget.destroy()
-
-        if not self.project_data["cars"]:
-            empty_label = ctk.CTkLabel(
-                self.project_overview_frame,
-                text="No cars in project. Add cars from the sidebar →",
-                font=ctk.CTkFont(size=13),
-                text_color=state.colors["text_secondary"]
-            )
-            empty_label.pack(pady=40)
-            self.update_current_car_label()
-            print(f"[DEBUG] ========== REFRESH COMPLETE (EMPTY) ==========\n")
-            return
-
+    def _redraw_project_overview(self):
+        """Redraw the project overview; only cars whose data or state changed get new rows"""
         search_query = self.project_search_var.get().lower().strip()
         if search_query == "🔍 search cars...":
             search_query = ""
 
-        filtered_cars = {}
-        for car_instance_id, car_info in self.project_data["cars"].items():
-            base_carid = car_info.get("base_carid", car_instance_id)
-
-            car_name = state.vehicle_ids.get(base_carid, base_carid)
-            for cid, cname in self.car_id_list:
-                if cid == base_carid:
-                    car_name = cname
-                    break
-
-            if not search_query or search_query in car_name.lower() or search_query in base_carid.lower():
-                filtered_cars[car_instance_id] = car_info
-
-        print(f"[DEBUG] Filtered cars: {len(filtered_cars)} (search: '{search_query}')")
-
-        if not filtered_cars:
-            no_results_label = ctk.CTkLabel(
-                self.project_overview_frame,
-                text=f"No cars match '{search_query}'",
-                font=ctk.CTkFont(size=13),
-                text_color=state.colors["text_secondary"]
-            )
-            no_results_label.pack(pady=40)
-            self.update_current_car_label()
-            print(f"[DEBUG] ========== REFRESH COMPLETE (NO RESULTS) ==========\n")
-            return
-
-        if not hasattr(self, 'expanded_car_id'):
-            self.expanded_car_id = None
-
-        for idx, (car_instance_id, car_info) in enumerate(filtered_cars.items()):
-            base_carid = car_info.get("base_carid", car_instance_id)
-
-            car_name = state.vehicle_ids.get(base_carid, base_carid)
-            for cid, cname in self.car_id_list:
-                if cid == base_carid:
-                    car_name = cname
-                    break
-
-            print(f"[DEBUG]   - {car_instance_id}: {car_name} ({len(car_info['skins'])} skins)")
-
-            is_selected = (car_instance_id == self.selected_car_for_skin)
-            is_expanded = (car_instance_id == self.expanded_car_id)
-
-            car_container = ctk.CTkFrame(self.project_overview_frame, fg_color="transparent", corner_radius=8)
-            car_container.pack(fill="x", pady=2, padx=0)
-
-            display_text = f"{car_name}"
-            if "_" in car_instance_id and car_instance_id != base_carid:
-                instance_num = car_instance_id.split("_")[-1]
-                display_text = f"{car_name} (Instance #{instance_num})"
-
-            display_text += f"  •  {len(car_info['skins'])} skins"
-
-            car_button = ctk.CTkButton(
-                car_container,
-                text=display_text,
-                fg_color=state.colors["accent"] if is_selected else state.colors["card_bg"],
-                hover_color=state.colors["accent_hover"] if is_selected else state.colors["card_hover"],
-                height=38,
-                corner_radius=8,
-                text_color=state.colors["accent_text"] if is_selected else state.colors["text"],
-                anchor="w",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                command=lambda cid=car_instance_id: self._toggle_car_expansion(cid)
-            )
-            car_button.pack(fill="x")
-
-            remove_btn = ctk.CTkButton(
-                car_button,
-                text="✕",
-                width=28,
-                height=28,
-                fg_color=state.colors["error"],
-                hover_color=state.colors["error_hover"],
-                text_color="white",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                corner_radius=6,
-                command=lambda c=car_instance_id: self.remove_car_from_project(c)
-            )
-            remove_btn.place(relx=1.0, rely=0.5, anchor="e", x=-8)
-
-            if is_expanded and car_info["skins"]:
-                skins_container = ctk.CTkFrame(
-                    car_container,
-                    fg_color=state.colors["app_bg"],
-                    corner_radius=6
-                )
-                skins_container.pack(fill="x", padx=5, pady=(5, 0))
-
-                skins_header = ctk.CTkLabel(
-                    skins_container,
-                    text="Skins:",
-                    font=ctk.CTkFont(size=10, weight="bold"),
-                    text_color=state.colors["text_secondary"],
-                    anchor="w"
-                )
-                skins_header.pack(anchor="w", padx=6, pady=(4, 3))
-
-                print(f"[DEBUG]     Rendering {len(car_info['skins'])} skins for {car_instance_id}...")
-                for skin_idx, skin in enumerate(car_info["skins"]):
-                    print(f"[DEBUG]       Creating skin row {skin_idx + 1}: {skin['name']}")
-
-                    is_editing_this_skin = (
-                        self.editing_mode and
-                        self.selected_skin_index == skin_idx and
-                        self.selected_car_for_skin == car_instance_id
-                    )
-
-                    row_color = state.colors["accent"] if is_editing_this_skin else state.colors["app_bg"]
-
-                    has_config = "config_data" in skin
-
-                    row_height = 75 if has_config else 38
-
-                    skin_row = ctk.CTkFrame(
-                        skins_container,
-                        fg_color=state.colors["card_bg"] if not is_editing_this_skin else state.colors["accent"],
-                        corner_radius=6,
-                        height=row_height,
-                        cursor="hand2"
-                    )
-                    skin_row.pack(fill="x", padx=6, pady=3)
-                    skin_row.pack_propagate(False)
-
-                    def edit_skin_handler(cid=car_instance_id, idx=skin_idx):
-                        self.select_skin_for_editing(cid, idx)
-
-                    skin_row.bind("<Button-1>", lambda e, cid=car_instance_id, idx=skin_idx: edit_skin_handler(cid, idx))
-
-                    icon_label = ctk.CTkLabel(
-                        skin_row,
-                        text="✏️" if is_editing_this_skin else "🎨",
-                        font=ctk.CTkFont(size=14),
-                        cursor="hand2"
-                    )
-                    icon_label.pack(side="left", padx=(8, 6), anchor="n", pady=8)
-                    icon_label.bind("<Button-1>", lambda e, cid=car_instance_id, idx=skin_idx: edit_skin_handler(cid, idx))
-
-                    text_container = ctk.CTkFrame(skin_row, fg_color="transparent")
-                    text_container.pack(side="left", fill="both", expand=True, padx=(0, 8), pady=4)
-                    text_container.bind("<Button-1>", lambda e, cid=car_instance_id, idx=skin_idx: edit_skin_handler(cid, idx))
-
-                    skin_name_label = ctk.CTkLabel(
-                        text_container,
-                        text=f"{skin_idx + 1}. {skin['name']}",
-                        text_color=state.colors["accent_text"] if is_editing_this_skin else state.colors["text"],
-                        anchor="w",
-                        font=ctk.CTkFont(size=12, weight="bold"),
-                        cursor="hand2"
-                    )
-                    skin_name_label.pack(anchor="w", fill="x")
-                    skin_name_label.bind("<Button-1>", lambda e, cid=car_instance_id, idx=skin_idx: edit_skin_handler(cid, idx))
-
-                    if has_config:
-                        config_data = skin["config_data"]
-                        config_type = config_data.get('config_type', 'Unknown')
-                        config_name = config_data.get('config_name', 'Unknown')
-                        print(f"[DEBUG]       Config data: Type='{config_type}', Name='{config_name}'")
-
-                        config_type_label = ctk.CTkLabel(
-                            text_container,
-                            text=f"Config Type: {config_type}",
-                            text_color=state.colors["accent_text"] if is_editing_this_skin else state.colors["text_secondary"],
-                            anchor="w",
-                            font=ctk.CTkFont(size=10),
-                            cursor="hand2"
-                        )
-                        config_type_label.pack(anchor="w", fill="x")
-                        config_type_label.bind("<Button-1>", lambda e, cid=car_instance_id, idx=skin_idx: edit_skin_handler(cid, idx))
-
-                        config_name_label = ctk.CTkLabel(
-                            text_container,
-                            text=f"Config Name: {config_name}",
-                            text_color=state.colors["accent_text"] if is_editing_this_skin else state.colors["text_secondary"],
-                            anchor="w",
-                            font=ctk.CTkFont(size=10),
-                            cursor="hand2"
-                        )
-                        config_name_label.pack(anchor="w", fill="x")
-                        config_name_label.bind("<Button-1>", lambda e, cid=car_instance_id, idx=skin_idx: edit_skin_handler(cid, idx))
-
-                    buttons_frame = ctk.CTkFrame(skin_row, fg_color="transparent")
-                    buttons_frame.pack(side="right", padx=6, anchor="n", pady=4)
-
-                    remove_skin_btn = ctk.CTkButton(
-                        buttons_frame,
-                        text="✕",
-                        width=28,
-                        height=28,
-                        fg_color=state.colors["error"],
-                        hover_color=state.colors["error_hover"],
-                        text_color="white",
-                        font=ctk.CTkFont(size=13, weight="bold"),
-                        corner_radius=6,
-                        command=lambda c=car_instance_id, i=skin_idx: self.remove_skin_from_car(c, i)
-                    )
-                    remove_skin_btn.pack(side="left", padx=2)
-                    print(f"[DEBUG]       Skin row {skin_idx + 1} packed successfully")
-
-                print(f"[DEBUG]     Finished rendering all {len(car_info['skins'])} skins")
-
-                skins_container.update()
-
-            car_container.update()
+        editing_skin = None
+        if self.editing_mode and self.selected_skin_index is not None:
+            editing_skin = (self.selected_car_for_skin, self.selected_skin_index)
+
+        shown = self.project_overview.show(
+            self.project,
+            self._car_name,
+            matches=self.project_search_index.query(search_query),
+            search_query=search_query,
+            selected_car=self.selected_car_for_skin,
+            expanded_car=self.expanded_car_id,
+            editing_skin=editing_skin
+        )
 
         self.update_current_car_label()
 
-        if self.project_overview_frame:
-            self.project_overview_frame.update()
-
-        if self.project_overview_container:
-            self.project_overview_container.update()
-
-        self.after(1, self._force_scrollable_reflow)
-
-        print(f"[DEBUG] ========== REFRESH COMPLETE (SUCCESS - {len(filtered_cars)} cars displayed) ==========\n")
+        log.debug("Project overview: %s/%s cars shown (search: '%s')", shown, len(self.project_data['cars']), search_query)
 
     def update_current_car_label(self):
 
-        print(f"[DEBUG] update_current_car_label called")
+        log.debug("update_current_car_label called")
         """Update the label showing which car is selected - DISABLED"""
 
         pass
 
     def generate_mod(self, generate_button_topbar, output_mode_var, custom_output_var):
-
-        print(f"[DEBUG] generate_mod called")
         """Generate the mod with all cars and skins"""
-        print("[DEBUG] \n" + "="*50)
-        print("[DEBUG] MULTI-SKIN MOD GENERATION INITIATED")
-        print("[DEBUG] ="*50)
+        log.debug("MULTI-SKIN MOD GENERATION INITIATED")
 
         mod_name = ""
         author_name = ""
@@ -2413,7 +2190,7 @@ class GeneratorTab(ctk.CTkFrame):
             if len(missing_files) > 5:
                 error_msg += f"\n... and {len(missing_files) - 5} more"
             self.show_notification(error_msg, "error", 6000)
-            print(f"[ERROR] Missing config files:")
+            log.error("Missing config files:")
             for missing in missing_files:
                 print(f"  - {missing}")
             return
@@ -2426,7 +2203,7 @@ class GeneratorTab(ctk.CTkFrame):
             if not output_path:
                 self.show_notification("Please select a custom output location", "error")
                 return
-            print(f"[DEBUG] Output mode: Custom - {output_path}")
+            log.debug("Output mode: Custom - %s", output_path)
         elif output_mode == "steam":
 
             try:
@@ -2441,23 +2218,66 @@ class GeneratorTab(ctk.CTkFrame):
                     self.show_notification(f"Mods folder does not exist: {output_path}", "error", 4000)
                     return
 
-                print(f"[DEBUG] Output mode: Steam - {output_path}")
+                log.debug("Output mode: Steam - %s", output_path)
             except ImportError:
                 self.show_notification("Could not load settings. Please configure mods folder path.", "error", 4000)
                 return
         else:
 
-            output_path = None
-            print(f"[DEBUG] Output mode: Default/Unknown")
+            # Resolve the folder generate_multi_skin_mod would fall back to, so the checks below
+            # look at the folder the mod is actually written to
+            from core.file_ops import get_beamng_mods_path
+            output_path = get_beamng_mods_path()
+            log.debug("Output mode: Default - %s", output_path)
+
+        # Catch name and skin-path collisions before spending time on the build. New or changed zips
+        # in the output folder have to be opened for that, so the inventory is refreshed on a worker
+        # and the export continues on the UI thread once it is current
+        generate_button_topbar.configure(state="disabled")
+        self.export_status_label.configure(text="Checking mods folder...")
+        self.export_status_label.pack(padx=20, pady=(10, 5))
+
+        def refresh_inventory():
+            try:
+                mods_inventory.refresh(output_path)
+            except Exception as e:
+                log.warning("Could not refresh the mods inventory before export: %s", e)
+            self.after(0, lambda: self._generate_after_preflight(
+                generate_button_topbar, mod_name, author_name, output_path))
+
+        threading.Thread(target=refresh_inventory, daemon=True, name="ModsPreflight").start()
+
+    def _generate_after_preflight(self, generate_button_topbar, mod_name, author_name, output_path):
+        """Second half of generate_mod: collision checks against the refreshed mods inventory, then the build"""
+        preflight = mods_inventory.preflight(self.project_data, mod_name, output_path)
+        if preflight.name_taken:
+            self.show_notification(
+                f"A mod named '{os.path.basename(preflight.zip_path)}' already exists. Choose a different name.",
+                "error", 5000)
+            generate_button_topbar.configure(state="normal")
+            self.export_status_label.pack_forget()
+            return
+        if preflight.skin_collisions:
+            from gui.components.dialogs import show_confirmation_dialog
+            lines = [f"• {carid}/{skin_folder} (in {owner})"
+                     for carid, skin_folder, owner in preflight.skin_collisions[:6]]
+            if len(preflight.skin_collisions) > 6:
+                lines.append(f"... and {len(preflight.skin_collisions) - 6} more")
+            message = ("These skin folders already exist in other mods and will conflict in game:\n\n"
+                       + "\n".join(lines) + "\n\nGenerate anyway?")
+            if not show_confirmation_dialog(self.winfo_toplevel(), "Skin Path Conflict", message):
+                generate_button_topbar.configure(state="normal")
+                self.export_status_label.pack_forget()
+                return
 
         self.project_data["mod_name"] = mod_name
         self.project_data["author"] = author_name if author_name else "Unknown"
 
-        print(f"[DEBUG] Mod Name: {mod_name}")
-        print(f"[DEBUG] Author: {self.project_data['author']}")
-        print(f"[DEBUG] Cars: {len(self.project_data['cars'])}")
+        log.debug("Mod Name: %s", mod_name)
+        log.debug("Author: %s", self.project_data['author'])
+        log.debug("Cars: %s", len(self.project_data['cars']))
         total_skins = sum(len(car_info['skins']) for car_info in self.project_data['cars'].values())
-        print(f"[DEBUG] Total Skins: {total_skins}")
+        log.debug("Total Skins: %s", total_skins)
 
         self.export_status_label.configure(text="Preparing to export...")
         self.export_status_label.pack(padx=20, pady=(10, 5))
@@ -2467,25 +2287,25 @@ class GeneratorTab(ctk.CTkFrame):
 
         def update_status(message):
 
-            print(f"[DEBUG] update_status called")
+            log.debug("update_status called")
             self.export_status_label.configure(text=message)
 
         def update_progress(value):
 
-            print(f"[DEBUG] update_progress called")
+            log.debug("update_progress called")
             if self.progress_bar.winfo_ismapped():
                 self.progress_bar.set(value)
 
         def thread_fn():
 
-            print(f"[DEBUG] thread_fn called")
+            log.debug("thread_fn called")
             try:
-                print("[DEBUG] \nStarting mod generation thread...")
+                log.debug("\nStarting mod generation thread...")
                 update_status("Processing skins...")
 
                 def progress_with_status(value):
 
-                    print(f"[DEBUG] progress_with_status called")
+                    log.debug("progress_with_status called")
                     update_progress(value)
                     if value < 0.3:
                         update_status("Copying template files...")
@@ -2494,17 +2314,38 @@ class GeneratorTab(ctk.CTkFrame):
                     else:
                         update_status("Creating ZIP archive...")
 
+                def report_broken_references(broken_references):
+
+                    if not broken_references:
+                        return
+                    broken_total = sum(len(refs) for refs in broken_references.values())
+                    skins = ", ".join(f"{car_id}/{skin}" for car_id, skin in list(broken_references)[:3])
+                    if len(broken_references) > 3:
+                        skins += f" and {len(broken_references) - 3} more"
+                    self.after(EXPORT_SUCCESS_TOAST_MS + TOAST_GAP_MS, lambda: self.show_notification(
+                        f"⚠ {broken_total} texture path(s) do not resolve in: {skins}. See debug console.",
+                        "warning", 6000))
+
                 if generate_multi_skin_mod:
+                    # Stock game paths can only be validated once the install's content index is built;
+                    # until then only references into the skin's own folders are checked
+                    install_index = content_index.install_paths() if content_index.ready else None
+                    log.debug("Reference check against install index: %s", install_index is not None)
                     generate_multi_skin_mod(
                         self.project_data,
                         output_path=output_path,
-                        progress_callback=progress_with_status
+                        progress_callback=progress_with_status,
+                        install_index=install_index,
+                        reference_callback=report_broken_references
                     )
 
+                    if output_path:
+                        mods_inventory.refresh(output_path)
+
                     update_status("Export completed successfully!")
-                    print("[DEBUG] Mod generation completed successfully!")
-                    print("[DEBUG] ="*50 + "\n")
-                    self.show_notification(f"✓ Mod '{mod_name}' created with {total_skins} skins!", "success", 5000)
+                    log.debug("Mod generation completed successfully!")
+                    self.show_notification(f"✓ Mod '{mod_name}' created with {total_skins} skins!", "success",
+                                           EXPORT_SUCCESS_TOAST_MS)
 
                     self.after(2000, lambda: self.show_notification("Project kept. Click 'Clear Project' to start new one.", "info", 4000))
                 else:
@@ -2513,11 +2354,11 @@ class GeneratorTab(ctk.CTkFrame):
 
             except FileExistsError as e:
                 update_status("Error: File already exists")
-                print(f"[DEBUG] ERROR: File already exists - {e}")
+                log.debug("ERROR: File already exists - %s", e)
                 self.show_notification(f"File already exists: {str(e)}", "error", 5000)
             except Exception as e:
                 update_status("Error: Export failed")
-                print(f"[DEBUG] ERROR: {e}")
+                log.debug("ERROR: %s", e)
                 import traceback
                 traceback.print_exc()
                 self.show_notification(f"Error: {str(e)}", "error", 5000)
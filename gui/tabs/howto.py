@@ -1,9 +1,23 @@
 """
 How To Tab - Professional Documentation Interface
+
+Search goes through an inverted index of the chapter text (built on first
+search) and lists matching lines as highlighted snippets. View All renders
+the intro and the first chapter, then appends chapters as the reader
+scrolls towards the end.
 """
 import customtkinter as ctk
 from typing import Dict, Tuple, List
 from gui.state import state
+from core.doc_index import DocIndex
+from gui.components.refresh_scheduler import Debouncer, SEARCH_DEBOUNCE_MS
+from gui.components.theme_registry import theme_registry
+
+# Snippets listed per chapter in search results
+MAX_SNIPPETS = 5
+
+# View All appends the next chapter once the bottom of the view passes this fraction of the text
+LAZY_RENDER_THRESHOLD = 0.85
 
 class HowToTab(ctk.CTkFrame):
     """Professional documentation tab with comprehensive BeamSkin Studio guide"""
@@ -15,6 +29,10 @@ class HowToTab(ctk.CTkFrame):
         self.search_entry: ctk.CTkEntry = None
         self.chapter_buttons: List[Tuple[ctk.CTkButton, str]] = []
         self.current_chapter: str = "all"
+        self._doc_index: DocIndex = None
+        self._last_query: str = ""
+        self._pending_chapters: List[str] = []
+        self._render_job = None
 
         self.chapters = {
             "getting_started": {
@@ -117,6 +135,8 @@ class HowToTab(ctk.CTkFrame):
         )
         self.search_entry.pack(side="left")
         self.search_entry.bind("<Return>", lambda e: self._search_content())
+        # Search as you type (a textvariable would disable the entry's placeholder text)
+        self.search_entry.bind("<KeyRelease>", Debouncer(self, SEARCH_DEBOUNCE_MS, self._search_content))
 
         nav_frame = ctk.CTkFrame(
             main_container,
@@ -174,35 +194,98 @@ class HowToTab(ctk.CTkFrame):
             activate_scrollbars=True
         )
         self.content_textbox.pack(fill="both", expand=True, padx=15, pady=15)
+        self.content_textbox._textbox.configure(yscrollcommand=self._on_text_scroll)
+
+        self._configure_tags()
+        theme_registry.subscribe(self._configure_tags)
+        for chapter_key in self.chapters:
+            tag = f"open_{chapter_key}"
+            self.content_textbox.tag_bind(tag, "<Button-1>", lambda e, k=chapter_key: self._open_search_result(k))
+            self.content_textbox.tag_bind(tag, "<Enter>", lambda e: self.content_textbox.configure(cursor="hand2"))
+            self.content_textbox.tag_bind(tag, "<Leave>", lambda e: self.content_textbox.configure(cursor=""))
+
+    def _configure_tags(self):
+        """(Re)apply the text tag colours (tags are not widget options, so the theme registry calls this)"""
+        self.content_textbox.tag_config(
+            "match",
+            background=state.colors["accent"],
+            foreground=state.colors["accent_text"]
+        )
+        self.content_textbox.tag_config("result_title", foreground=state.colors["accent"])
+
+    def _on_text_scroll(self, first, last):
+        """yscrollcommand of the textbox: update the scrollbar, render more chapters near the bottom"""
+        self.content_textbox._y_scrollbar.set(first, last)
+        if self._pending_chapters and self._render_job is None and float(last) >= LAZY_RENDER_THRESHOLD:
+            self._render_job = self.after_idle(self._render_next_chapter)
+
+    def _get_index(self) -> DocIndex:
+        """Inverted index over the chapter content, built on first use"""
+        if self._doc_index is None:
+            self._doc_index = DocIndex()
+            self._doc_index.build((key, data["content"]) for key, data in self.chapters.items())
+        return self._doc_index
+
+    def _insert_highlighted(self, text: str, spans: List[Tuple[int, int]], tags: Tuple[str, ...] = ()):
+        """Insert text at the end, tagging the spans as matches"""
+        position = 0
+        for start, end in spans:
+            if start > position:
+                self.content_textbox.insert("end", text[position:start], tags)
+            self.content_textbox.insert("end", text[start:end], ("match",) + tags)
+            position = end
+        self.content_textbox.insert("end", text[position:], tags)
+
+    def _open_search_result(self, chapter_key: str):
+        """Open a chapter from the search results with the query highlighted"""
+        self.load_chapter(chapter_key, highlight=self._last_query)
 
     def _search_content(self):
-        """Search through documentation content"""
-        search_term = self.search_entry.get().lower().strip()
-
-        if not search_term:
-            self.load_all_chapters()
+        """Search the documentation through the inverted index and list matching snippets"""
+        query = self.search_entry.get().strip()
+        if not query:
+            if self.current_chapter == "search":
+                self.load_all_chapters()
+            return
+        if query == self._last_query and self.current_chapter == "search":
             return
 
-        results = []
-        for chapter_key, chapter_data in self.chapters.items():
-            content = chapter_data['content'].lower()
-            if search_term in content:
-                results.append((chapter_key, chapter_data))
+        hits = self._get_index().search(query, max_snippets=MAX_SNIPPETS)
+        self._last_query = query
+        self.current_chapter = "search"
+        self._pending_chapters = []
 
         self.content_textbox.configure(state="normal")
         self.content_textbox.delete("0.0", "end")
 
-        if results:
-            self.content_textbox.insert("0.0", f"🔍 Search Results for '{search_term}'\n")
+        if hits:
+            line_count = sum(hit.score for hit in hits)
+            self.content_textbox.insert(
+                "0.0",
+                f"🔍 Search Results for '{query}' - {line_count} matching line(s) in {len(hits)} chapter(s)\n"
+            )
             self.content_textbox.insert("end", "=" * 60 + "\n\n")
 
-            for chapter_key, chapter_data in results:
-                self.content_textbox.insert("end", f"{chapter_data['icon']} {chapter_data['title']}\n")
-                self.content_textbox.insert("end", "-" * 60 + "\n")
-                self.content_textbox.insert("end", chapter_data['content'])
-                self.content_textbox.insert("end", "\n\n")
+            for hit in hits:
+                chapter_data = self.chapters[hit.doc_id]
+                link = (f"open_{hit.doc_id}",)
+                self.content_textbox.insert(
+                    "end",
+                    f"{chapter_data['icon']} {chapter_data['title']} ({hit.score} match{'es' if hit.score != 1 else ''})\n",
+                    ("result_title",) + link
+                )
+                self.content_textbox.insert("end", "-" * 60 + "\n", link)
+                for snippet in hit.snippets:
+                    self.content_textbox.insert("end", "  ", link)
+                    self._insert_highlighted(snippet.text, snippet.spans, link)
+                    self.content_textbox.insert("end", "\n", link)
+                if hit.score > len(hit.snippets):
+                    self.content_textbox.insert(
+                        "end", f"  … {hit.score - len(hit.snippets)} more - click to open the chapter\n", link
+                    )
+                self.content_textbox.insert("end", "\n")
         else:
-            self.content_textbox.insert("0.0", f"❌ No results found for '{search_term}'\n\n")
+            self.content_textbox.insert("0.0", f"❌ No results found for '{query}'\n\n")
             self.content_textbox.insert("end", "Try different keywords or browse chapters above.")
 
         self.content_textbox.configure(state="disabled")
@@ -212,16 +295,24 @@ class HowToTab(ctk.CTkFrame):
             hover_color=state.colors["card_hover"],
             text_color=state.colors["text"]
         )
-
         self._reset_button_colors()
 
-    def load_chapter(self, chapter_key: str):
-        """Load a specific chapter"""
+        print(f"[DEBUG] Search '{query}': {len(hits)} chapter(s)")
+
+    def load_chapter(self, chapter_key: str, highlight: str = ""):
+        """
+        Load a specific chapter
+
+        Args:
+            chapter_key: Key into self.chapters
+            highlight: Search query whose matches are highlighted (the view scrolls to the first)
+        """
         if chapter_key not in self.chapters:
             return
 
         chapter_data = self.chapters[chapter_key]
         self.current_chapter = chapter_key
+        self._pending_chapters = []
 
         self.content_textbox.configure(state="normal")
         self.content_textbox.delete("0.0", "end")
@@ -229,10 +320,16 @@ class HowToTab(ctk.CTkFrame):
         self.content_textbox.insert("0.0", f"{chapter_data['icon']} {chapter_data['title']}\n")
         self.content_textbox.insert("end", "=" * 60 + "\n\n")
 
-        self.content_textbox.insert("end", chapter_data['content'])
+        spans = self._get_index().document_spans(chapter_key, highlight) if highlight else []
+        self._insert_highlighted(chapter_data['content'], spans)
 
         self.content_textbox.configure(state="disabled")
 
+        if spans:
+            first_match = self.content_textbox.tag_nextrange("match", "1.0")
+            if first_match:
+                self.content_textbox.see(first_match[0])
+
         self.view_all_btn.configure(
             fg_color=state.colors["card_bg"],
             hover_color=state.colors["card_hover"],
@@ -241,14 +338,12 @@ class HowToTab(ctk.CTkFrame):
 
         for btn, key in self.chapter_buttons:
             if key == chapter_key:
-
                 btn.configure(
                     fg_color=state.colors["accent"],
                     hover_color=state.colors["accent"],
                     text_color=state.colors["accent_text"]
                 )
             else:
-
                 btn.configure(
                     fg_color=state.colors["card_bg"],
                     hover_color=state.colors["card_hover"],
@@ -258,7 +353,7 @@ class HowToTab(ctk.CTkFrame):
         print(f"[DEBUG] Loaded chapter: {chapter_data['title']}")
 
     def load_all_chapters(self):
-        """Load all chapters in sequence"""
+        """Load the intro and the first chapter; the rest are appended as the user scrolls down"""
         self.current_chapter = "all"
 
         self.content_textbox.configure(state="normal")
@@ -280,15 +375,11 @@ Let's get started!
 """
         self.content_textbox.insert("0.0", intro_text)
         self.content_textbox.insert("end", "=" * 60 + "\n\n")
-
-        for chapter_key, chapter_data in self.chapters.items():
-            self.content_textbox.insert("end", f"{chapter_data['icon']} {chapter_data['title']}\n")
-            self.content_textbox.insert("end", "-" * 60 + "\n")
-            self.content_textbox.insert("end", chapter_data['content'])
-            self.content_textbox.insert("end", "\n\n")
-
         self.content_textbox.configure(state="disabled")
 
+        self._pending_chapters = list(self.chapters)
+        self._render_next_chapter()
+
         self.view_all_btn.configure(
             fg_color=state.colors["accent"],
             hover_color=state.colors["accent"],
@@ -299,6 +390,20 @@ Let's get started!
 
         print("[DEBUG] Loaded all chapters")
 
+    def _render_next_chapter(self):
+        """Append the next not yet rendered chapter to the View All text"""
+        self._render_job = None
+        if not self._pending_chapters:
+            return
+
+        chapter_data = self.chapters[self._pending_chapters.pop(0)]
+        self.content_textbox.configure(state="normal")
+        self.content_textbox.insert("end", f"{chapter_data['icon']} {chapter_data['title']}\n")
+        self.content_textbox.insert("end", "-" * 60 + "\n")
+        self.content_textbox.insert("end", chapter_data['content'])
+        self.content_textbox.insert("end", "\n\n")
+        self.content_textbox.configure(state="disabled")
+
     def _reset_button_colors(self):
         """Reset all chapter buttons to default colors"""
         for btn, _ in self.chapter_buttons:
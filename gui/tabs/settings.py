@@ -4,12 +4,11 @@ Settings Tab
 from typing import Dict, Tuple, Optional
 import customtkinter as ctk
 from tkinter import messagebox, colorchooser
-import sys
-import os
 from gui.state import state
-from core.settings import reset_theme_colors, update_theme_color, DEFAULT_THEMES
+from core.settings import reset_theme_colors, update_theme_color, set_theme, toggle_theme, DEFAULT_THEMES, save_settings
 from utils.debug import toggle_debug_mode
 from gui.components.path_configuration import PathConfigurationSection
+from gui.components.theme_registry import theme_registry
 
 print(f"[DEBUG] Loading class: SettingsTab")
 
@@ -59,6 +58,7 @@ class SettingsTab(ctk.CTkFrame):
         """Set up the settings UI"""
 
         self.settings_canvas = ctk.CTkCanvas(self, bg=state.colors["app_bg"], highlightthickness=0)
+        theme_registry.register(self.settings_canvas, bg="app_bg")
         self.settings_scrollbar = ctk.CTkScrollbar(self, orientation="vertical", command=self.settings_canvas.yview)
         self.settings_scrollable_frame = ctk.CTkFrame(self.settings_canvas, fg_color=state.colors["app_bg"])
 
@@ -129,7 +129,7 @@ class SettingsTab(ctk.CTkFrame):
 
         ctk.CTkLabel(
             self.settings_scrollable_frame,
-            text="Customize theme colors (requires restart to apply)",
+            text="Customize theme colors",
             font=ctk.CTkFont(size=11),
             text_color=state.colors["text_secondary"]
         ).pack(anchor="w", padx=10, pady=(0, 10))
@@ -177,11 +177,23 @@ class SettingsTab(ctk.CTkFrame):
         print(f"[DEBUG] root_app is CTk: {isinstance(self.root_app, ctk.CTk)}")
 
         if self.root_app:
-            toggle_debug_mode(self.root_app, state.colors, on_close=self._on_debug_window_closed)
+            toggle_debug_mode(
+                self.root_app,
+                state.colors,
+                on_close=self._on_debug_window_closed,
+                level=state.app_settings.get("debug_console_level", "DEBUG"),
+                log_file=state.app_settings.get("debug_log_file") or None,
+                on_level_change=self._on_debug_level_changed
+            )
         else:
             print("[ERROR] Cannot toggle debug mode - no root window found!")
             self.debug_mode_var.set(False)
 
+    def _on_debug_level_changed(self, level: str):
+        """Remember the console level picked in the debug window"""
+        state.app_settings["debug_console_level"] = level
+        save_settings()
+
     def _on_debug_window_closed(self):
         """Called when debug window is closed - turn off the toggle"""
         print("[DEBUG] Debug window closed, turning off toggle")
@@ -208,45 +220,24 @@ class SettingsTab(ctk.CTkFrame):
                     self.settings_window_id, width=self.settings_canvas.winfo_width()))
 
     def _toggle_theme(self):
-        """Toggle between light and dark themes with app restart"""
+        """Toggle between light and dark themes (applied live)"""
         print("[DEBUG] _toggle_theme called")
 
         new_theme = "light" if state.current_theme == "dark" else "dark"
 
-        from gui.confirmation_dialog import askyesno
-        response = askyesno(
-            self.winfo_toplevel(),
-            "Restart Required",
-            f"Switch to {new_theme.title()} Mode?\n\n"
-            f"The application will restart to apply the theme change.",
-            state.colors,
-            icon="🔄",
-            danger=False
-        )
-
-        if response:
-            print(f"[DEBUG] User confirmed theme switch to {new_theme}")
-
-            try:
-                from core.settings import toggle_theme
-                toggle_theme(self.root_app)
-                print(f"[DEBUG] Theme setting saved to {new_theme}")
-            except Exception as e:
-                print(f"[ERROR] Failed to toggle theme: {e}")
-                from gui.confirmation_dialog import showerror
-                showerror(
-                    self.winfo_toplevel(),
-                    "Error",
-                    f"Failed to save theme setting:\n{e}",
-                    state.colors
-                )
-
-                self._revert_theme_switch()
-                return
-
-            self._restart_application()
-        else:
-            print("[DEBUG] User cancelled theme switch - reverting toggle")
+        try:
+            theme_registry.apply_theme_change(self.root_app or self.winfo_toplevel(),
+                                              lambda: toggle_theme(self.root_app))
+            print(f"[DEBUG] Theme switched to {new_theme}")
+        except Exception as e:
+            print(f"[ERROR] Failed to toggle theme: {e}")
+            from gui.confirmation_dialog import showerror
+            showerror(
+                self.winfo_toplevel(),
+                "Error",
+                f"Failed to switch theme:\n{e}",
+                state.colors
+            )
 
             self._revert_theme_switch()
 
@@ -262,62 +253,23 @@ class SettingsTab(ctk.CTkFrame):
             if self.theme_switch.get():
                 self.theme_switch.deselect()
 
-    def _restart_application(self):
-        """Restart the application to apply theme changes"""
-        print("[DEBUG] _restart_application called")
-
-        try:
-            python = sys.executable
-
-            if getattr(sys, 'frozen', False):
-
-                script = sys.executable
-            else:
-                script = os.path.abspath(sys.argv[0])
-
-            print(f"[DEBUG] Python executable: {python}")
-            print(f"[DEBUG] Script path: {script}")
-
-            print("[DEBUG] Closing current application window...")
-            if self.root_app:
-                self.root_app.withdraw()
-                self.root_app.quit()
-
-            print("[DEBUG] Starting new application instance...")
-            import subprocess
-
-            if sys.platform == 'win32':
-                if getattr(sys, 'frozen', False):
-
-                    subprocess.Popen([script], creationflags=subprocess.CREATE_NO_WINDOW)
-                else:
-
-                    pythonw = python.replace('python.exe', 'pythonw.exe')
-                    if os.path.exists(pythonw):
-                        subprocess.Popen([pythonw, script])
-                    else:
-                        subprocess.Popen([python, script], creationflags=subprocess.CREATE_NO_WINDOW)
-            else:
-
-                subprocess.Popen([python, script])
-
-            print("[DEBUG] New instance started, exiting current process...")
-
-            sys.exit(0)
-
-        except Exception as e:
-            print(f"[ERROR] Failed to restart application: {e}")
-            import traceback
-            traceback.print_exc()
-
-            messagebox.showerror(
-                "Restart Failed",
-                f"Failed to restart the application:\n\n{e}\n\n"
-                f"Please close and restart the application manually to see the theme changes."
-            )
-
-            if self.root_app:
-                self.root_app.quit()
+    def _reset_theme_colors(self, theme_name: str) -> bool:
+        """Reset a theme to its defaults (recolouring the UI if it is the active theme)"""
+        result = []
+        self._apply_theme_edit(theme_name, lambda: result.append(reset_theme_colors(theme_name)))
+        return bool(result and result[0])
+
+    def _apply_theme_edit(self, theme_name: str, change):
+        """Run a colour edit of a theme; recolour the UI live if it is the active theme"""
+        if theme_name == state.current_theme:
+            def change_and_reload():
+                change()
+                # Resets replace the theme dict; re-point state.colors at the current one
+                set_theme(theme_name, self.root_app)
+
+            theme_registry.apply_theme_change(self.root_app or self.winfo_toplevel(), change_and_reload)
+        else:
+            change()
 
     def _toggle_dark_theme_editor(self):
         """Toggle dark theme editor visibility"""
@@ -389,6 +341,8 @@ class SettingsTab(ctk.CTkFrame):
             corner_radius=4
         )
         preview.pack(side="left", padx=(0, 10))
+        # The swatch shows this theme's colour, whatever the active theme is
+        theme_registry.ignore(preview)
 
         entry = ctk.CTkEntry(
             row_frame,
@@ -549,7 +503,7 @@ class SettingsTab(ctk.CTkFrame):
 
         if response:
             print("[DEBUG] User confirmed dark theme reset")
-            if reset_theme_colors("dark"):
+            if self._reset_theme_colors("dark"):
                 for color_key, (entry, preview) in self.dark_color_entries.items():
                     default_color = DEFAULT_THEMES["dark"][color_key]
                     entry.delete(0, 'end')
@@ -559,7 +513,7 @@ class SettingsTab(ctk.CTkFrame):
                 print("[DEBUG] Dark theme reset complete")
                 messagebox.showinfo(
                     "Theme Reset",
-                    "Dark theme has been reset to default colors.\n\nRestart the application to see changes."
+                    "Dark theme has been reset to default colors."
                 )
         else:
             print("[DEBUG] User cancelled dark theme reset")
@@ -575,7 +529,7 @@ class SettingsTab(ctk.CTkFrame):
 
         if response:
             print("[DEBUG] User confirmed light theme reset")
-            if reset_theme_colors("light"):
+            if self._reset_theme_colors("light"):
                 for color_key, (entry, preview) in self.light_color_entries.items():
                     default_color = DEFAULT_THEMES["light"][color_key]
                     entry.delete(0, 'end')
@@ -585,7 +539,7 @@ class SettingsTab(ctk.CTkFrame):
                 print("[DEBUG] Light theme reset complete")
                 messagebox.showinfo(
                     "Theme Reset",
-                    "Light theme has been reset to default colors.\n\nRestart the application to see changes."
+                    "Light theme has been reset to default colors."
                 )
         else:
             print("[DEBUG] User cancelled light theme reset")
@@ -593,6 +547,7 @@ class SettingsTab(ctk.CTkFrame):
     def _apply_dark_theme_changes(self):
         """Apply dark theme color changes"""
         print("[DEBUG] apply_dark_theme_changes called")
+        new_colors = {}
         for color_key, (entry, preview) in self.dark_color_entries.items():
             color_value = entry.get().strip()
 
@@ -603,20 +558,26 @@ class SettingsTab(ctk.CTkFrame):
                     f"Invalid color code for {state.color_labels[color_key]}: {color_value}\n\nPlease use format #RGB or #RRGGBB"
                 )
                 return
+            new_colors[color_key] = color_value
 
-            update_theme_color("dark", color_key, color_value)
-            preview.configure(fg_color=color_value)
-            print(f"[DEBUG] Updated dark.{color_key} = {color_value}")
+        def update_colors():
+            for color_key, color_value in new_colors.items():
+                update_theme_color("dark", color_key, color_value)
+                self.dark_color_entries[color_key][1].configure(fg_color=color_value)
+                print(f"[DEBUG] Updated dark.{color_key} = {color_value}")
+
+        self._apply_theme_edit("dark", update_colors)
 
         print("[DEBUG] All dark theme colors applied")
         messagebox.showinfo(
             "Colors Applied",
-            "Dark theme colors have been saved!\n\nRestart the application to see changes."
+            "Dark theme colors have been saved!"
         )
 
     def _apply_light_theme_changes(self):
         """Apply light theme color changes"""
         print("[DEBUG] apply_light_theme_changes called")
+        new_colors = {}
         for color_key, (entry, preview) in self.light_color_entries.items():
             color_value = entry.get().strip()
 
@@ -627,15 +588,20 @@ class SettingsTab(ctk.CTkFrame):
                     f"Invalid color code for {state.color_labels[color_key]}: {color_value}\n\nPlease use format #RGB or #RRGGBB"
                 )
                 return
+            new_colors[color_key] = color_value
+
+        def update_colors():
+            for color_key, color_value in new_colors.items():
+                update_theme_color("light", color_key, color_value)
+                self.light_color_entries[color_key][1].configure(fg_color=color_value)
+                print(f"[DEBUG] Updated light.{color_key} = {color_value}")
 
-            update_theme_color("light", color_key, color_value)
-            preview.configure(fg_color=color_value)
-            print(f"[DEBUG] Updated light.{color_key} = {color_value}")
+        self._apply_theme_edit("light", update_colors)
 
         print("[DEBUG] All light theme colors applied")
         messagebox.showinfo(
             "Colors Applied",
-            "Light theme colors have been saved!\n\nRestart the application to see changes."
+            "Light theme colors have been saved!"
         )
 
     def show_notification(self, message: str, type: str = "info", duration: int = 3000):
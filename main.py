@@ -5,6 +5,12 @@ import platform
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 os.chdir(script_dir)
+
+# Before anything logs: levels come from data/app_settings.json
+from core.settings import app_settings
+from utils.log import configure_logging
+configure_logging(app_settings)
+
 print(f"[DEBUG] Working directory: {os.getcwd()}")
 print(f"[DEBUG] Platform: {platform.system()}")
 
@@ -33,6 +39,10 @@ def center_window(window):
 
 if __name__ == "__main__":
 
+    # Needed for process pools (DDS -> PNG conversion) in frozen builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     try:
         from utils.single_instance import check_single_instance, release_global_lock
         import atexit
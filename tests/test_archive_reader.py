@@ -0,0 +1,56 @@
+"""
+Regression tests for core.archive_reader.ArchivePool
+
+Usage (from the repository root):
+    python -m unittest discover -s tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.archive_reader import ArchivePool
+
+
+class ArchivePoolLeaseTests(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="test_archive_pool_")
+        self.paths = []
+        for index in range(20):
+            path = os.path.join(self.work_dir, f"archive{index}.zip")
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr("info.json", f'{{"index": {index}}}')
+            self.paths.append(path)
+        self.pool = ArchivePool(max_open=4)
+
+    def tearDown(self):
+        self.pool.close_all()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_held_archive_survives_eviction(self):
+        held = self.pool.acquire(self.paths[0])
+        for path in self.paths[1:]:
+            with self.pool.lease(path) as archive:
+                archive.read("info.json")
+        self.assertEqual(held.read("info.json"), b'{"index": 0}')
+        self.pool.release(held)
+        self.assertNotIn(id(held), self.pool._open)
+
+    def test_cached_archive_is_reused_and_capped(self):
+        with self.pool.lease(self.paths[0]) as first:
+            pass
+        with self.pool.lease(self.paths[0]) as second:
+            self.assertIs(first, second)
+        for path in self.paths:
+            with self.pool.lease(path):
+                pass
+        self.assertEqual(len(self.pool._open), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Regression tests for core.material_diff.MaterialParseCache
+
+Usage (from the repository root):
+    python -m unittest discover -s tests
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.material_diff import MaterialParseCache
+
+MEMBER = "vehicles/etk800/skin.materials.json"
+
+
+class UnpackedModCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.mod_dir = tempfile.mkdtemp(prefix="test_material_diff_")
+        os.makedirs(os.path.join(self.mod_dir, "vehicles", "etk800"))
+        self.path = os.path.join(self.mod_dir, *MEMBER.split("/"))
+
+    def tearDown(self):
+        shutil.rmtree(self.mod_dir, ignore_errors=True)
+
+    def write(self, data, mtime_ns):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_edit_in_place_is_not_served_stale(self):
+        cache = MaterialParseCache()
+        self.write({"a": {"version": 1}}, 1_000_000_000)
+        self.assertEqual(cache.get(self.mod_dir, MEMBER), {"a": {"version": 1}})
+
+        self.write({"a": {"version": 2}}, 2_000_000_000)
+        self.assertEqual(cache.get(self.mod_dir, MEMBER), {"a": {"version": 2}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Regression tests for core.material_table.StagePropertyTable
+
+Usage (from the repository root):
+    python -m unittest discover -s tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.material_table import StagePropertyTable
+
+NESTED = {
+    "etk800_main.skin.a": {
+        "1": {"metallicFactor": 1.0, "roughnessFactor": 0, "clearCoatFactor": 0.25},
+        "Stage_2": {"clearCoatRoughnessFactor": None, "instanceDiffuse": True},
+    }
+}
+
+
+class StagePropertyTableTests(unittest.TestCase):
+
+    def test_values_keep_their_type(self):
+        nested = StagePropertyTable.from_nested(NESTED).to_nested()
+        stage_1 = nested["etk800_main.skin.a"]["1"]
+        self.assertIs(type(stage_1["metallicFactor"]), float)
+        self.assertIs(type(stage_1["roughnessFactor"]), int)
+        self.assertEqual(nested["etk800_main.skin.a"]["2"],
+                         {"clearCoatRoughnessFactor": None, "instanceDiffuse": True})
+
+    def test_compact_round_trip(self):
+        table = StagePropertyTable.from_nested(NESTED)
+        restored = StagePropertyTable.from_compact(table.to_compact())
+        self.assertEqual(list(restored.rows()), list(table.rows()))
+        self.assertIs(type(restored.get("etk800_main.skin.a", 1, "metallicFactor")), float)
+
+    def test_bad_stages_and_values_are_skipped_row_by_row(self):
+        table = StagePropertyTable.from_nested({
+            "m": {
+                "-1": {"metallicFactor": 0.5},
+                "256": {"metallicFactor": 0.5},
+                "stage": {"metallicFactor": 0.5},
+                "0": {"metallicFactor": "shiny", "roughnessFactor": 0.5},
+            }
+        })
+        self.assertEqual(list(table.rows()), [("m", 0, "roughnessFactor", 0.5)])
+
+    def test_set_rejects_out_of_range_stage(self):
+        table = StagePropertyTable()
+        with self.assertRaises(ValueError):
+            table.set("m", 300, "metallicFactor", 0.5)
+        self.assertEqual(len(table), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Regression tests for core.materials_writer
+
+Usage (from the repository root):
+    python -m unittest discover -s tests
+"""
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.materials_writer import MaterialsDocument, parse_relaxed_json
+
+MATERIALS = """{
+    // skin material
+    "etk800.skin.SKINNAME": {
+        "name": "etk800.skin.SKINNAME",
+        "Stages": [
+            {"baseColorMap": "vehicles/etk800/etk800_b.color.png"},
+            {
+                "metallicFactor": 1,
+                "roughnessFactor": 0.5
+            },
+            {}
+        ],
+    }
+}
+"""
+
+
+def _stages(doc):
+    return doc.root.get("etk800.skin.SKINNAME").get("Stages").items
+
+
+class SetPropertyTests(unittest.TestCase):
+
+    def render_and_parse(self, doc):
+        text = doc.render()
+        self.assertEqual(parse_relaxed_json(text), doc.to_python())
+        self.assertEqual(MaterialsDocument(text).to_python(), doc.to_python())
+        return text
+
+    def test_two_missing_keys_on_multiline_object(self):
+        doc = MaterialsDocument(MATERIALS)
+        stage = _stages(doc)[1]
+        doc.set_property(stage, "clearCoatFactor", 0.2)
+        doc.set_property(stage, "clearCoatRoughnessFactor", 0.1)
+        text = self.render_and_parse(doc)
+        self.assertEqual(text.count("etk800.skin.SKINNAME\": {"), 1)
+        self.assertIn('"roughnessFactor": 0.5,\n                "clearCoatFactor": 0.2,\n'
+                      '                "clearCoatRoughnessFactor": 0.1', text)
+
+    def test_missing_keys_on_inline_and_empty_objects(self):
+        doc = MaterialsDocument(MATERIALS)
+        inline, _, empty = _stages(doc)
+        for stage in (inline, empty):
+            doc.set_property(stage, "metallicFactor", 0)
+            doc.set_property(stage, "roughnessFactor", 1)
+            doc.set_property(stage, "clearCoatFactor", 0.5)
+        self.render_and_parse(doc)
+        self.assertEqual(doc.to_python()["etk800.skin.SKINNAME"]["Stages"][2],
+                         {"metallicFactor": 0, "roughnessFactor": 1, "clearCoatFactor": 0.5})
+
+    def test_setting_an_appended_key_again(self):
+        doc = MaterialsDocument(MATERIALS)
+        stage = _stages(doc)[1]
+        doc.set_property(stage, "clearCoatFactor", 0.2)
+        doc.set_property(stage, "clearCoatFactor", 0.7)
+        doc.set_property(stage, "roughnessFactor", 0.25)
+        self.render_and_parse(doc)
+        self.assertEqual(doc.to_python()["etk800.skin.SKINNAME"]["Stages"][1],
+                         {"metallicFactor": 1, "roughnessFactor": 0.25, "clearCoatFactor": 0.7})
+
+    def test_comments_survive(self):
+        doc = MaterialsDocument(MATERIALS)
+        doc.set_property(_stages(doc)[1], "clearCoatFactor", 0.2)
+        self.assertIn("// skin material", self.render_and_parse(doc))
+
+    def test_strict_json_round_trip(self):
+        data = json.loads(json.dumps({"m": {"Stages": [{"a": 1}, {}]}}, indent=2))
+        doc = MaterialsDocument(json.dumps(data, indent=2))
+        stages = doc.root.get("m").get("Stages").items
+        doc.set_property(stages[0], "b", 2)
+        doc.set_property(stages[0], "c", "x")
+        doc.set_property(stages[1], "d", True)
+        self.assertEqual(json.loads(self.render_and_parse(doc)),
+                         {"m": {"Stages": [{"a": 1, "b": 2, "c": "x"}, {"d": True}]}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Regression tests for core.project_model
+
+Usage (from the repository root):
+    python -m unittest discover -s tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.project_model import ProjectModel, PROJECT_RESET
+
+
+def _project(skin_count):
+    skins = [{"name": f"Skin {index}"} for index in range(skin_count)]
+    return {"mod_name": "", "author": "", "cars": {"etk800": {"base_carid": "etk800", "skins": skins}}}
+
+
+class ReplaceTests(unittest.TestCase):
+
+    def test_replace_gives_reused_car_ids_a_new_version(self):
+        model = ProjectModel()
+        model.replace(_project(3))
+        first = model.version("etk800")
+        model.replace(_project(5))
+        self.assertNotEqual(model.version("etk800"), first)
+        self.assertNotEqual(model.version("etk800"), 0)
+
+    def test_replace_notifies_reset(self):
+        model = ProjectModel()
+        events = []
+        model.subscribe(lambda event, car_instance_id: events.append((event, car_instance_id)))
+        model.replace(_project(1))
+        self.assertEqual(events, [(PROJECT_RESET, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Benchmark - Single-member reads from a large vehicle-like archive
+
+Builds a zip with many entries (a few large stored/deflated textures plus
+thousands of small files), then times repeated reads of one small member
+through zipfile (open + central directory parse per read, as before) and
+through the shared memory-mapped archive pool, and checks both return the
+same bytes.
+
+Usage (from the repository root):
+    python tools/bench_archive_reader.py [entry_count] [reads]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.archive_reader import ArchivePool
+
+CARID = "benchcar"
+
+
+def build_archive(path, entry_count):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for index in range(4):
+            data = os.urandom(4 * 1024 * 1024)
+            zf.writestr(f"vehicles/{CARID}/texture_{index}.dds", data, compress_type=zipfile.ZIP_STORED)
+        for index in range(entry_count):
+            zf.writestr(f"vehicles/{CARID}/parts/part_{index}.jbeam", f'{{"part_{index}": {{"slotType": "x"}}}}' * 20)
+        zf.writestr(f"vehicles/{CARID}/skin.materials.json", '{"benchcar.skin.a": {"mapTo": "benchcar.skin.a"}}' * 200)
+
+
+def timed(reads, fn):
+    start = time.perf_counter()
+    for _ in range(reads):
+        result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    entry_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    reads = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    work_dir = tempfile.mkdtemp(prefix="bench_archive_")
+    try:
+        zip_path = os.path.join(work_dir, f"{CARID}.zip")
+        build_archive(zip_path, entry_count)
+        member = f"vehicles/{CARID}/skin.materials.json"
+
+        def read_zipfile():
+            with zipfile.ZipFile(zip_path) as zf:
+                return zf.read(member)
+
+        pool = ArchivePool()
+
+        def pooled(read):
+            with pool.lease(zip_path) as archive:
+                return read(archive)
+
+        legacy, legacy_data = timed(reads, read_zipfile)
+        current, current_data = timed(reads, lambda: pooled(lambda archive: archive.read(member)))
+
+        texture = f"vehicles/{CARID}/texture_0.dds"
+        view_time, _ = timed(reads, lambda: pooled(lambda archive: archive.read_view(texture)))
+        pool.close_all()
+
+        print(f"entries:              {entry_count + 5}  ({os.path.getsize(zip_path) / (1024 * 1024):.1f} MB)")
+        print(f"zipfile ({reads} reads):   {legacy * 1000:8.1f} ms")
+        print(f"pool ({reads} reads):      {current * 1000:8.1f} ms")
+        print(f"speedup:              {legacy / current:8.2f}x")
+        print(f"4 MB stored view x{reads}: {view_time * 1000:8.1f} ms  (zero-copy)")
+        print(f"identical output:     {legacy_data == current_data}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark - Cost of debug logging during a mod build
+
+Builds a synthetic multi-skin mod (a template with many materials and extra
+files, every skin overriding material properties on every material) with
+log_level DEBUG (every debug line formatted and written, as the unconditional
+prints used to be) and with log_level INFO (debug calls return before
+formatting and the listing loops are skipped). Times the material property
+pass on its own, since that per-property loop is where most debug lines come
+from, and the whole generate_multi_skin_mod build, whose time is mostly file
+copying, zipping and reference checks. Output goes to an in-memory stream, so
+the numbers exclude terminal speed.
+
+Usage (from the repository root):
+    python tools/bench_build_logging.py [skin_count] [material_count] [repeats]
+"""
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.file_ops import generate_multi_skin_mod, process_material_properties
+from utils.log import configure_logging
+
+CARID = "benchcar"
+EXTRA_FILES = 300
+
+
+def build_template(root, material_count):
+    """vehicles/<CARID>/SKINNAME with material_count skin materials and EXTRA_FILES filler files"""
+    template = os.path.join(root, "vehicles", CARID, "SKINNAME")
+    os.makedirs(os.path.join(template, "extra"))
+
+    materials = {}
+    for index in range(material_count):
+        name = f"{CARID}_part{index}.skin.skinname"
+        materials[name] = {
+            "name": name,
+            "mapTo": name,
+            "class": "Material",
+            "Stages": [
+                {"baseColorMap": f"/vehicles/{CARID}/part{index}_b.color.png", "metallicFactor": 1},
+                {"baseColorMap": f"/vehicles/{CARID}/skinname/{CARID}_skin_skinname.dds",
+                 "clearCoatFactor": 0.2, "roughnessFactor": 0},
+                {},
+                {}
+            ],
+            "version": 1.5
+        }
+    with open(os.path.join(template, "skin.materials.json"), "w", encoding="utf-8") as f:
+        json.dump(materials, f, indent=2)
+
+    with open(os.path.join(template, f"{CARID}_skin.jbeam"), "w", encoding="utf-8") as f:
+        f.write('{"%s_skin_skinname": {"information": {"authors": "x", "name": "skinname"},'
+                ' "slotType": "paint_design", "globalSkin": "skinname"}}' % CARID)
+
+    for index in range(EXTRA_FILES):
+        with open(os.path.join(template, "extra", f"filler{index}.txt"), "w") as f:
+            f.write("x")
+
+    return list(materials)
+
+
+def build_project(root, skin_count, material_names):
+    dds_path = os.path.join(root, f"{CARID}_skin_skinname.dds")
+    with open(dds_path, "wb") as f:
+        f.write(b"DDS " + bytes(124))
+
+    properties = {name: {"Stage_2": {"clearCoatFactor": 0.5, "roughnessFactor": 0.25}}
+                  for name in material_names}
+    skins = [{"name": f"Bench Skin {index}", "dds_path": dds_path, "material_properties": properties}
+             for index in range(skin_count)]
+    return {"mod_name": "bench_build_logging", "author": "bench",
+            "cars": {CARID: {"base_carid": CARID, "skins": skins}}}
+
+
+def time_material_pass(root, project, level, repeats):
+    """Best time of process_material_properties over fresh copies of every skin's folder"""
+    configure_logging({"log_level": level})
+    template = os.path.join(root, "vehicles", CARID, "SKINNAME")
+    skins = project["cars"][CARID]["skins"]
+    best = None
+    written = 0
+    for run in range(repeats):
+        folders = []
+        for index in range(len(skins)):
+            folder = os.path.join(root, "material_pass", f"{level}_{run}_{index}")
+            shutil.copytree(template, folder)
+            folders.append(folder)
+        sink = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(sink):
+            for skin, folder in zip(skins, folders):
+                process_material_properties(skin, CARID, "skinname", folder)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        written = len(sink.getvalue())
+    return best, written
+
+
+def time_builds(project, output_dir, levels, repeats):
+    """Best build time per level; levels alternate each round so disk cache effects even out"""
+    zip_path = os.path.join(output_dir, "bench_build_logging.zip")
+    results = {}
+    for _ in range(repeats):
+        for level in levels:
+            configure_logging({"log_level": level})
+            if os.path.exists(zip_path):
+                os.remove(zip_path)
+            sink = io.StringIO()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(sink):
+                generate_multi_skin_mod(project, output_path=output_dir)
+            elapsed = time.perf_counter() - start
+            best = results.get(level, (elapsed, 0))[0]
+            results[level] = (min(best, elapsed), len(sink.getvalue()))
+    return results
+
+
+def report(label, debug, info):
+    (debug_time, debug_chars), (info_time, info_chars) = debug, info
+    print(label)
+    print(f"  log_level DEBUG: {debug_time * 1000:9.1f} ms  ({debug_chars:>9,} chars of output)")
+    print(f"  log_level INFO:  {info_time * 1000:9.1f} ms  ({info_chars:>9,} chars of output)")
+    print(f"  speedup:         {debug_time / info_time:9.2f}x")
+
+
+def main():
+    skin_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    material_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    root = tempfile.mkdtemp(prefix="bench_build_logging_")
+    cwd = os.getcwd()
+    try:
+        material_names = build_template(root, material_count)
+        project = build_project(root, skin_count, material_names)
+        output_dir = os.path.join(root, "out")
+        os.makedirs(output_dir)
+
+        material = {level: time_material_pass(root, project, level, repeats) for level in ("DEBUG", "INFO")}
+
+        # Templates are looked up relative to the working directory
+        os.chdir(root)
+        build = time_builds(project, output_dir, ("DEBUG", "INFO"), repeats)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(root, ignore_errors=True)
+
+    print(f"{skin_count} skins x {material_count} materials, best of {repeats}")
+    report("material property pass:", material["DEBUG"], material["INFO"])
+    report("full build:", build["DEBUG"], build["INFO"])
+
+
+if __name__ == "__main__":
+    main()
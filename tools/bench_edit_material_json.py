@@ -0,0 +1,137 @@
+"""
+Benchmark - edit_material_json on a large synthetic materials.json
+
+Generates a materials file with 5,000 entries (skin groups spread over every
+supported prefix plus unrelated materials), then times the current
+edit_material_json against the previous per-key/per-prefix regex + deepcopy
+implementation and checks that both produce identical output.
+
+Usage (from the repository root):
+    python tools/bench_edit_material_json.py [entry_count] [repeats]
+"""
+import contextlib
+import copy
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.file_ops import edit_material_json, fix_stage_two_material_properties
+
+CARID = "benchcar"
+SUFFIXES = ("", "_body", "_extra", "_aftermarket", "_main", "_mechanical")
+
+
+def build_materials(entry_count):
+    """Synthetic materials: ~60% skin entries across many skins, the rest plain materials"""
+    data = {}
+    skin_count = max(1, entry_count // 60)
+    index = 0
+    while len(data) < entry_count:
+        if index % 5 < 3:
+            skin = f"skin{index % skin_count}"
+            prefix = f"{CARID}{SUFFIXES[index % len(SUFFIXES)]}"
+            key = f"{prefix}.skin.{skin}_{index}" if index % 7 else f"{prefix}.skin_lbe.{skin}"
+        else:
+            key = f"{CARID}_part{index}"
+        data[key] = {
+            "name": key,
+            "mapTo": key,
+            "class": "Material",
+            "colorPaletteMap": "/vehicles/common/palette.png",
+            "metallicFactor": 0.3,
+            "Stages": [
+                {"baseColorMap": f"vehicles/{CARID}/{key}/base_b.color.png", "colorPaletteMapUseUV": 1,
+                 "normalMap": f"vehicles/{CARID}/{key}_n.dds"},
+                {"baseColorMap": f"vehicles/{CARID}/{key}/skin.dds", "instanceDiffuse": True,
+                 "metallicMap": "m.png", "roughnessFactor": 0.4},
+                {}, {}
+            ],
+            "translucentBlendOp": "None",
+        }
+        index += 1
+    return data
+
+
+def legacy_edit_material_json(data, carid):
+    """The grouping/normalization loop as it was before (regex per key x prefix, deepcopy)"""
+    prefixes = [f"{carid}{suffix}" for suffix in SUFFIXES]
+    skin_groups = {}
+    for key, value in data.items():
+        for prefix in prefixes:
+            match = re.match(rf"^{re.escape(prefix)}\.skin[^.]*\.(.+)$", key)
+            if match:
+                skinname = match.group(1)
+                if skinname:
+                    skin_groups.setdefault(skinname, {})[key] = (key, value, prefix)
+                break
+
+    selected_skinname = max(skin_groups.keys(), key=lambda k: len(skin_groups[k]))
+    filtered_data = {}
+    for key, (original_key, value, prefix) in skin_groups[selected_skinname].items():
+        normalized_key = f"{prefix}.skin.skinname"
+        new_value = copy.deepcopy(value)
+        for field in ("name", "mapTo"):
+            if field in new_value and isinstance(new_value[field], str):
+                new_value[field] = new_value[field].replace(".skin_lbe.", ".skin.").replace(selected_skinname, "skinname")
+        for stage in new_value["Stages"]:
+            if isinstance(stage, dict) and isinstance(stage.get("baseColorMap"), str):
+                stage["baseColorMap"] = stage["baseColorMap"].replace(selected_skinname, "skinname")
+        if len(new_value["Stages"]) >= 2:
+            new_value["Stages"][1] = fix_stage_two_material_properties(new_value["Stages"][1], carid, prefix)
+        for field in ("colorPaletteMap", "colorPaletteMapUseUV", "clearCoatFactor",
+                      "clearCoatRoughnessFactor", "instanceDiffuse", "metallicFactor"):
+            new_value.pop(field, None)
+        new_value["Stages"] = new_value["Stages"][:2]
+        for stage in new_value["Stages"]:
+            for field in ("colorPaletteMap", "colorPaletteMapUseUV"):
+                stage.pop(field, None)
+        filtered_data[normalized_key] = new_value
+    return filtered_data
+
+
+def best_of(repeats, fn):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    entry_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    data = build_materials(entry_count)
+    work_dir = tempfile.mkdtemp(prefix="bench_materials_")
+    source_path = os.path.join(work_dir, "source.materials.json")
+    with open(source_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    out_dir = os.path.join(work_dir, "out")
+    os.makedirs(out_dir)
+
+    current = best_of(repeats, lambda: edit_material_json(source_path, out_dir, CARID))
+    legacy = best_of(repeats, lambda: legacy_edit_material_json(json.loads(open(source_path).read()), CARID))
+
+    with open(os.path.join(out_dir, "materials.json"), encoding="utf-8") as f:
+        current_output = json.load(f)
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy_output = legacy_edit_material_json(json.loads(open(source_path).read()), CARID)
+
+    print(f"entries:           {entry_count}")
+    print(f"legacy (best of {repeats}): {legacy * 1000:8.1f} ms")
+    print(f"current (best of {repeats}): {current * 1000:7.1f} ms  (includes file read/write)")
+    print(f"speedup:           {legacy / current:8.2f}x")
+    print(f"identical output:  {current_output == legacy_output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark - Generator project overview click-to-paint latency
+
+Builds a project with 50 cars and 1,000 skins on the expanded car, then times
+"click a skin to edit it" (which restyles two skin rows) from the click until
+Tk has flushed the redraw, once with the previous destroy-and-rebuild overview
+and once with the virtualized ProjectOverview. Needs a display.
+
+Usage (from the repository root):
+    python tools/bench_project_overview.py [skin_count] [clicks]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import customtkinter as ctk
+
+from core.project_model import ProjectModel
+from gui.components.project_overview import ProjectOverview
+
+CAR_COUNT = 50
+
+
+def build_project(skin_count):
+    project = ProjectModel()
+    for index in range(CAR_COUNT):
+        project.add_car(f"car{index}", f"car{index}")
+    for index in range(skin_count):
+        skin = {"name": f"Skin {index}", "dds_path": "skin.dds"}
+        if index % 4 == 0:
+            skin["config_data"] = {"config_type": "Factory", "config_name": f"Config {index}"}
+        project.add_skin("car0", skin)
+    return project
+
+
+def legacy_refresh(frame, project, expanded_car, editing_skin):
+    """The previous overview: destroy every widget, then recreate all car and skin rows"""
+    for widget in frame.winfo_children():
+        widget.destroy()
+
+    for car_instance_id, car_info in project.cars.items():
+        container = ctk.CTkFrame(frame, fg_color="transparent")
+        container.pack(fill="x", pady=2)
+        button = ctk.CTkButton(container, text=f"{car_instance_id}  •  {len(car_info['skins'])} skins", height=38)
+        button.pack(fill="x")
+        ctk.CTkButton(button, text="✕", width=28, height=28).place(relx=1.0, rely=0.5, anchor="e", x=-8)
+
+        if car_instance_id != expanded_car:
+            continue
+        skins_container = ctk.CTkFrame(container, corner_radius=6)
+        skins_container.pack(fill="x", padx=5, pady=(5, 0))
+        ctk.CTkLabel(skins_container, text="Skins:").pack(anchor="w", padx=6, pady=(4, 3))
+        for skin_index, skin in enumerate(car_info["skins"]):
+            editing = editing_skin == (car_instance_id, skin_index)
+            row = ctk.CTkFrame(skins_container, height=75 if "config_data" in skin else 38, corner_radius=6)
+            row.pack(fill="x", padx=6, pady=3)
+            row.pack_propagate(False)
+            ctk.CTkLabel(row, text="✏️" if editing else "🎨").pack(side="left", padx=(8, 6), anchor="n", pady=8)
+            text_container = ctk.CTkFrame(row, fg_color="transparent")
+            text_container.pack(side="left", fill="both", expand=True, padx=(0, 8), pady=4)
+            ctk.CTkLabel(text_container, text=f"{skin_index + 1}. {skin['name']}", anchor="w").pack(anchor="w", fill="x")
+            if "config_data" in skin:
+                ctk.CTkLabel(text_container, text="Config Type: Factory", anchor="w").pack(anchor="w", fill="x")
+                ctk.CTkLabel(text_container, text="Config Name: ...", anchor="w").pack(anchor="w", fill="x")
+            buttons = ctk.CTkFrame(row, fg_color="transparent")
+            buttons.pack(side="right", padx=6, anchor="n", pady=4)
+            ctk.CTkButton(buttons, text="✕", width=28, height=28).pack(side="left", padx=2)
+
+
+def click_latency(root, clicks, on_click):
+    """Average ms from a click to the end of the idle redraw it caused"""
+    root.update()
+    start = time.perf_counter()
+    for click in range(clicks):
+        on_click(click)
+        root.update_idletasks()
+    return (time.perf_counter() - start) * 1000 / clicks
+
+
+def main():
+    skin_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    clicks = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    project = build_project(skin_count)
+    root = ctk.CTk()
+    root.geometry("320x900")
+
+    legacy_scroll = ctk.CTkScrollableFrame(root)
+    legacy_scroll.pack(fill="both", expand=True)
+    build_start = time.perf_counter()
+    legacy_refresh(legacy_scroll, project, "car0", None)
+    root.update_idletasks()
+    legacy_build = (time.perf_counter() - build_start) * 1000
+    legacy = click_latency(root, clicks, lambda click: legacy_refresh(legacy_scroll, project, "car0", ("car0", click)))
+    legacy_scroll.destroy()
+
+    noop = lambda *args: None
+    overview = ProjectOverview(root, on_car_click=noop, on_car_remove=noop, on_skin_click=noop,
+                               on_skin_remove=noop)
+    overview.pack(fill="both", expand=True)
+    root.update()
+    build_start = time.perf_counter()
+    overview.show(project, lambda carid: carid, expanded_car="car0")
+    root.update_idletasks()
+    current_build = (time.perf_counter() - build_start) * 1000
+    current = click_latency(root, clicks, lambda click: overview.show(project, lambda carid: carid,
+                                                                      expanded_car="car0",
+                                                                      editing_skin=("car0", click)))
+    root.destroy()
+
+    print(f"cars / skins:            {CAR_COUNT} / {skin_count}")
+    print(f"first paint (rebuild):   {legacy_build:8.1f} ms")
+    print(f"first paint (virtual):   {current_build:8.1f} ms")
+    print(f"click-to-paint (rebuild):{legacy:8.1f} ms")
+    print(f"click-to-paint (virtual):{current:8.1f} ms")
+    print(f"speedup:                 {legacy / current:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark - Time to interactive of the main window
+
+Creates BeamSkinStudioApp with idle tab prebuilding off and times construction
+until the first paint has been flushed (only the Generator tab is built, as at
+a normal start). It then builds every remaining tab, which is what the old
+eager startup paid up front, and reports both totals. Needs a display; run it
+from a configured checkout so settings and vehicle data load as usual.
+
+Usage (from the repository root):
+    python tools/bench_startup.py
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    with contextlib.redirect_stdout(io.StringIO()):
+        from gui.state import state
+        from gui.main_window import BeamSkinStudioApp
+
+        state.app_settings["prebuild_tabs"] = False
+
+        start = time.perf_counter()
+        app = BeamSkinStudioApp()
+        app.update()
+        lazy = time.perf_counter() - start
+
+        remaining = {}
+        for view_name in app._tab_factories:
+            if view_name in app.tabs:
+                continue
+            tab_start = time.perf_counter()
+            app.get_tab(view_name)
+            app.update_idletasks()
+            remaining[view_name] = time.perf_counter() - tab_start
+
+        app.destroy()
+
+    eager = lazy + sum(remaining.values())
+    print(f"time to interactive (lazy):  {lazy * 1000:8.1f} ms")
+    for view_name, seconds in sorted(remaining.items(), key=lambda item: -item[1]):
+        print(f"  + {view_name:<24} {seconds * 1000:8.1f} ms")
+    print(f"time to interactive (eager): {eager * 1000:8.1f} ms")
+    print(f"speedup:                     {eager / lazy:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
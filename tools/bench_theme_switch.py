@@ -0,0 +1,61 @@
+"""
+Benchmark - Live theme switch of the fully built main window
+
+Creates BeamSkinStudioApp, builds every tab, then toggles the theme through
+the theme registry and times the scan and the batched recolour until the
+last idle pass has run and been painted. Toggles twice so the theme is back
+where it started; the saved theme setting is restored as well. Needs a
+display.
+
+Usage (from the repository root):
+    python tools/bench_theme_switch.py
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    with contextlib.redirect_stdout(io.StringIO()):
+        from gui.state import state
+        from gui.main_window import BeamSkinStudioApp
+        from gui.components.theme_registry import theme_registry
+        from core.settings import toggle_theme
+
+        state.app_settings["prebuild_tabs"] = False
+        app = BeamSkinStudioApp()
+        for view_name in app._tab_factories:
+            app.get_tab(view_name)
+        app.update()
+
+        widget_count = 0
+        stack = [app]
+        while stack:
+            widget = stack.pop()
+            widget_count += 1
+            stack.extend(widget.winfo_children())
+
+        results = []
+        for _ in range(2):
+            theme = "light" if state.current_theme == "dark" else "dark"
+            start = time.perf_counter()
+            theme_registry.apply_theme_change(app, lambda: toggle_theme(app))
+            scanned = time.perf_counter() - start
+            while theme_registry._pending_job is not None:
+                app.update()
+            app.update_idletasks()
+            results.append((theme, scanned, time.perf_counter() - start))
+
+        app.destroy()
+
+    print(f"widgets in window: {widget_count}")
+    for theme, scanned, total in results:
+        print(f"to {theme:<5}  scan + switch {scanned * 1000:8.1f} ms   total {total * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
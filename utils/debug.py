@@ -2,83 +2,322 @@
 import customtkinter as ctk
 import sys
 import io
+import logging
+import os
+import threading
+import time
+from collections import deque
 from datetime import datetime
 
 debug_mode_enabled = False
 debug_window = None
 debug_textbox = None
+debug_output = None
+
+# Wheel scrolling: units per notch, frame interval for applying accumulated scrolls,
+# and acceleration for notches arriving in quick succession
+SCROLL_UNITS_PER_NOTCH = 25
+SCROLL_FRAME_MS = 16
+SCROLL_ACCEL_WINDOW_S = 0.08
+SCROLL_ACCEL_STEP = 0.25
+SCROLL_ACCEL_MAX = 3.0
+
+
+def _is_scrollable(widget):
+    return isinstance(widget, ctk.CTkScrollableFrame) or getattr(widget, "is_virtual_list", False)
+
+
+class _ScrollRouter:
+    """
+    Routes wheel events to the scrollable frame under the pointer.
+
+    The scrollable that encloses a widget is looked up once by walking its
+    masters and then cached by widget path until that widget or the
+    scrollable is destroyed. Notches are accumulated and applied once per
+    frame, so a fast wheel causes one yview_scroll per frame per target.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        # widget path -> enclosing scrollable (or None), and scrollable path -> cached widget paths
+        self._targets = {}
+        self._dependents = {}
+        self._pending = {}
+        self._flush_job = None
+        self._last_notch = 0.0
+        self._last_direction = 0
+        self._acceleration = 1.0
+
+    def _target_for(self, widget):
+        key = str(widget)
+        try:
+            return self._targets[key]
+        except KeyError:
+            pass
+
+        target = None
+        current = widget
+        while current is not None:
+            if _is_scrollable(current):
+                target = current
+                break
+            current = getattr(current, "master", None)
+
+        self._targets[key] = target
+        if target is not None:
+            self._dependents.setdefault(str(target), set()).add(key)
+        return target
+
+    def forget(self, event):
+        """<Destroy>: drop cache entries of the destroyed widget (and of everything it enclosed)"""
+        key = str(event.widget)
+        self._targets.pop(key, None)
+        for dependent in self._dependents.pop(key, ()):
+            self._targets.pop(dependent, None)
+
+    def on_wheel(self, event):
+        x, y = self.app.winfo_pointerxy()
+        widget = self.app.winfo_containing(x, y)
+        if not widget:
+            return
+
+        target = self._target_for(widget)
+        if target is None:
+            return
+
+        if event.num == 4 or (event.num != 5 and event.delta > 0):
+            direction = -1
+        elif event.num == 5 or event.delta < 0:
+            direction = 1
+        else:
+            return
+
+        now = time.perf_counter()
+        if direction == self._last_direction and now - self._last_notch < SCROLL_ACCEL_WINDOW_S:
+            self._acceleration = min(SCROLL_ACCEL_MAX, self._acceleration + SCROLL_ACCEL_STEP)
+        else:
+            self._acceleration = 1.0
+        self._last_notch = now
+        self._last_direction = direction
+
+        key = str(target)
+        units = self._pending.get(key, (target, 0.0))[1]
+        self._pending[key] = (target, units + direction * SCROLL_UNITS_PER_NOTCH * self._acceleration)
+        if self._flush_job is None:
+            self._flush_job = self.app.after(SCROLL_FRAME_MS, self._flush)
+        return "break"
+
+    def _flush(self):
+        self._flush_job = None
+        pending, self._pending = self._pending, {}
+        for target, units in pending.values():
+            units = int(round(units))
+            if not units:
+                continue
+            try:
+                if target.winfo_exists():
+                    target._parent_canvas.yview_scroll(units, "units")
+            except Exception:
+                pass
+
+
+_scroll_router = None
+
 
 def setup_universal_scroll_handler(app):
-    """Sets up intelligent scroll handling"""
+    """Sets up intelligent scroll handling (once per application; later calls do nothing)"""
+    global _scroll_router
+    if _scroll_router is not None and _scroll_router.app is app:
+        return
+
     app.unbind_all("<MouseWheel>")
     app.unbind_all("<Button-4>")
     app.unbind_all("<Button-5>")
 
-    def universal_scroll(event):
-        x, y = app.winfo_pointerxy()
-        widget = app.winfo_containing(x, y)
-        if not widget:
-            return
+    _scroll_router = _ScrollRouter(app)
+    app.bind_all("<MouseWheel>", _scroll_router.on_wheel, add="+")
+    app.bind_all("<Button-4>", _scroll_router.on_wheel, add="+")
+    app.bind_all("<Button-5>", _scroll_router.on_wheel, add="+")
+    app.bind_all("<Destroy>", _scroll_router.forget, add="+")
 
-        scrollable_frame = None
-        current = widget
-        while current:
-            if isinstance(current, ctk.CTkScrollableFrame):
-                scrollable_frame = current
-                break
-            try:
-                current = current.master
-            except:
-                break
+# Console flush rate, most lines inserted per flush, and lines kept in the textbox
+CONSOLE_FLUSH_MS = 100
+CONSOLE_BATCH_LINES = 500
+CONSOLE_MAX_LINES = 5000
+# Chunks buffered between flushes; the oldest are dropped beyond this
+CONSOLE_BUFFER_CHUNKS = 20000
 
-        if scrollable_frame:
-            try:
-                if event.num == 4 or event.delta > 0:
-                    scrollable_frame._parent_canvas.yview_scroll(-25, "units")
-                elif event.num == 5 or event.delta < 0:
-                    scrollable_frame._parent_canvas.yview_scroll(25, "units")
-                return "break"
-            except:
-                pass
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+console_level = "DEBUG"
+# Root logger level to restore when the console closes
+_saved_log_level = None
+
+
+def _line_level(line):
+    """Level of a "[LEVEL] ..." line (untagged lines count as INFO)"""
+    stripped = line.lstrip()
+    if stripped.startswith("["):
+        tag = stripped[1:stripped.find("]")]
+        if tag in LOG_LEVELS:
+            return tag
+    return "INFO"
+
+
+def set_console_level(level):
+    """Show only console lines at or above level (DEBUG, INFO, WARNING or ERROR)"""
+    global console_level
+    if level not in LOG_LEVELS:
+        raise ValueError(f"Unknown log level: {level}")
+    console_level = level
+    if _saved_log_level is not None:
+        _lower_log_level()
+
+
+def _lower_log_level():
+    """Let loggers emit down to the console level while the console is open"""
+    root = logging.getLogger()
+    root.setLevel(min(_saved_log_level, logging.getLevelName(console_level)))
 
-    app.bind_all("<MouseWheel>", universal_scroll, add="+")
-    app.bind_all("<Button-4>", universal_scroll, add="+")
-    app.bind_all("<Button-5>", universal_scroll, add="+")
 
 class DebugOutput(io.StringIO):
-    """Custom output stream for debug window"""
-    def __init__(self):
+    """
+    Custom output stream for debug window
+
+    write() may be called from any thread: it writes through to the terminal
+    (and the log file, if set) and appends to a bounded deque. A timer on the
+    Tk main thread drains the deque every CONSOLE_FLUSH_MS and inserts the
+    batch with a single textbox insert, trimming the console to
+    CONSOLE_MAX_LINES.
+    """
+    def __init__(self, log_file=None):
         super().__init__()
 
         self.terminal = sys.stdout
         self.enabled = True
+        self._pending = deque(maxlen=CONSOLE_BUFFER_CHUNKS)
+        self._partial_line = ""
+        self._flush_job = None
 
-    def write(self, message):
+        self._log_file = None
+        self._log_lock = threading.Lock()
+        if log_file:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+                self._log_file = open(log_file, "a", encoding="utf-8")
+                self._log_file.write(f"\n===== Debug session {datetime.now():%Y-%m-%d %H:%M:%S} =====\n")
+            except OSError as e:
+                self._write_terminal(f"[WARNING] Could not open debug log file {log_file}: {e}\n")
 
+    def _write_terminal(self, message):
         if self.terminal is not None:
             try:
                 self.terminal.write(message)
             except Exception:
                 pass
 
-        if self.enabled and debug_mode_enabled and debug_textbox is not None:
-            try:
-                if debug_textbox.winfo_exists():
-                    timestamp = datetime.now().strftime("%H:%M:%S")
+    def write(self, message):
+
+        self._write_terminal(message)
+
+        if self._log_file is not None:
+            with self._log_lock:
+                try:
+                    self._log_file.write(message)
+                except Exception:
+                    pass
+
+        if self.enabled and debug_mode_enabled:
+            # deque.append is atomic, so worker threads never wait on (or touch) Tk here
+            self._pending.append(message)
 
-                    debug_textbox.insert("end", f"[{timestamp}] {message}")
-                    debug_textbox.see("end")
+        return len(message)
+
+    def start(self, widget):
+        """Start flushing buffered output into debug_textbox from widget's event loop"""
+        if self._flush_job is None:
+            self._flush_job = widget.after(CONSOLE_FLUSH_MS, lambda: self._flush_to_console(widget))
+
+    def stop(self, widget=None):
+        """Stop the flush timer and close the log file"""
+        if self._flush_job is not None and widget is not None:
+            try:
+                widget.after_cancel(self._flush_job)
             except Exception:
                 pass
+        self._flush_job = None
+        if self._log_file is not None:
+            with self._log_lock:
+                self._log_file.close()
+                self._log_file = None
+
+    def _take_lines(self):
+        """Complete lines buffered so far (a trailing partial line waits for the next flush)"""
+        chunks = [self._partial_line]
+        pending = self._pending
+        while pending:
+            chunks.append(pending.popleft())
+        lines = "".join(chunks).split("\n")
+        self._partial_line = lines.pop()
+        return lines
+
+    def _flush_to_console(self, widget):
+        self._flush_job = None
+        if debug_textbox is None or not debug_textbox.winfo_exists():
+            return
 
-        return len(message)
+        try:
+            lines = self._take_lines()
+            if lines:
+                minimum = LOG_LEVELS.index(console_level)
+                timestamp = datetime.now().strftime("%H:%M:%S")
+                shown = [f"[{timestamp}] {line}\n" for line in lines
+                         if line.strip() and LOG_LEVELS.index(_line_level(line)) >= minimum]
+                # A burst larger than the batch only shows its newest lines
+                shown = shown[-CONSOLE_BATCH_LINES:]
+                if shown:
+                    at_bottom = debug_textbox.yview()[1] >= 0.999
+                    debug_textbox.insert("end", "".join(shown))
+
+                    line_count = int(debug_textbox.index("end-1c").split(".")[0])
+                    if line_count > CONSOLE_MAX_LINES:
+                        debug_textbox.delete("1.0", f"{line_count - CONSOLE_MAX_LINES + 1}.0")
+
+                    if at_bottom:
+                        debug_textbox.see("end")
+        except Exception as e:
+            self._write_terminal(f"[ERROR] Debug console flush failed: {e}\n")
+
+        self._flush_job = widget.after(CONSOLE_FLUSH_MS, lambda: self._flush_to_console(widget))
 
     def flush(self):
         if self.terminal is not None and hasattr(self.terminal, 'flush'):
             self.terminal.flush()
-
-def create_debug_window(app, colors, on_close_callback=None):
-    """Create debug console window"""
+        if self._log_file is not None:
+            with self._log_lock:
+                self._log_file.flush()
+
+def _restore_stdout():
+    """Stop the console sink and give stdout back to the terminal"""
+    global debug_output, _saved_log_level
+    if debug_output is not None:
+        debug_output.stop(debug_window)
+        debug_output = None
+    if _saved_log_level is not None:
+        logging.getLogger().setLevel(_saved_log_level)
+        _saved_log_level = None
+    if hasattr(sys, '_original_stdout'):
+        sys.stdout = sys._original_stdout
+
+def create_debug_window(app, colors, on_close_callback=None, on_level_change=None):
+    """Create debug console window
+
+    Args:
+        app: Root window
+        colors: Theme colors
+        on_close_callback: Called after the window is closed
+        on_level_change: Called with the level picked in the console (e.g. to save it)
+    """
     global debug_window, debug_textbox, debug_mode_enabled
 
     if debug_window is not None and debug_window.winfo_exists():
@@ -114,6 +353,11 @@ def create_debug_window(app, colors, on_close_callback=None):
         app.clipboard_append(content)
         print("[DEBUG] Content copied")
 
+    def change_level(level):
+        set_console_level(level)
+        if on_level_change and callable(on_level_change):
+            on_level_change(level)
+
     ctk.CTkButton(header_frame, text="Copy All", width=80, command=copy_debug,
                  fg_color=colors["card_bg"],
                  hover_color=colors["card_hover"]).pack(side="right", padx=5, pady=10)
@@ -122,6 +366,12 @@ def create_debug_window(app, colors, on_close_callback=None):
                  fg_color=colors["card_bg"],
                  hover_color=colors["card_hover"]).pack(side="right", padx=5, pady=10)
 
+    level_menu = ctk.CTkOptionMenu(header_frame, values=list(LOG_LEVELS), width=110, command=change_level,
+                                   fg_color=colors["card_bg"], button_color=colors["card_bg"],
+                                   button_hover_color=colors["card_hover"])
+    level_menu.set(console_level)
+    level_menu.pack(side="right", padx=5, pady=10)
+
     text_color = colors["accent"] if colors["app_bg"] == "#0a0a0a" else "#1a1a1a"
 
     debug_textbox = ctk.CTkTextbox(debug_window, wrap="word",
@@ -133,6 +383,7 @@ def create_debug_window(app, colors, on_close_callback=None):
     def on_close():
         global debug_mode_enabled
         debug_mode_enabled = False
+        _restore_stdout()
         debug_window.destroy()
 
         if on_close_callback and callable(on_close_callback):
@@ -141,24 +392,40 @@ def create_debug_window(app, colors, on_close_callback=None):
     debug_window.protocol("WM_DELETE_WINDOW", on_close)
     print("[DEBUG] Debug console opened")
 
-def toggle_debug_mode(app, colors, on_close=None):
-    """Toggle debug mode on/off"""
-    global debug_mode_enabled, debug_output
+def toggle_debug_mode(app, colors, on_close=None, level=None, log_file=None, on_level_change=None):
+    """Toggle debug mode on/off
+
+    Args:
+        app: Root window
+        colors: Theme colors
+        on_close: Called when debug mode ends
+        level: Lowest level shown in the console (default: keep the current one)
+        log_file: Optional path that receives the full, unfiltered output
+        on_level_change: Called with the level picked in the console
+    """
+    global debug_mode_enabled, debug_output, _saved_log_level
     if debug_mode_enabled:
+        debug_mode_enabled = False
+        _restore_stdout()
         if debug_window and debug_window.winfo_exists():
             debug_window.destroy()
-        debug_mode_enabled = False
-
-        if hasattr(sys, '_original_stdout'):
-            sys.stdout = sys._original_stdout
 
         if on_close and callable(on_close):
             on_close()
     else:
-        create_debug_window(app, colors, on_close_callback=on_close)
+        if level in LOG_LEVELS:
+            set_console_level(level)
+        create_debug_window(app, colors, on_close_callback=on_close, on_level_change=on_level_change)
 
-        debug_output = DebugOutput()
         if not hasattr(sys, '_original_stdout'):
             sys._original_stdout = sys.stdout
+        sys.stdout = sys._original_stdout
+        debug_output = DebugOutput(log_file=log_file)
         sys.stdout = debug_output
-        print("[DEBUG] Debug console activated - output redirection enabled")
\ No newline at end of file
+        debug_output.start(debug_window)
+        if _saved_log_level is None:
+            _saved_log_level = logging.getLogger().level
+        _lower_log_level()
+        print("[DEBUG] Debug console activated - output redirection enabled")
+        if log_file:
+            print(f"[DEBUG] Full debug log: {log_file}")
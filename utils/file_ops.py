@@ -1,6 +1,7 @@
 # file_ops.py
 # edits the attached files in Add vehicles tab
 
+import logging
 import os
 import shutil
 import tempfile
@@ -8,23 +9,27 @@ import zipfile
 import getpass
 import re
 import json
+import functools
+from utils.log import get_logger
+
+log = get_logger(__name__)
 
 VEHICLE_FOLDER = "vehicles"
 ADDED_VEHICLES_JSON = os.path.join("vehicles", "added_vehicles.json")
 
 def sanitize_skin_id(name):
 
-    print(f"[DEBUG] sanitize_skin_id called")
+    log.debug("sanitize_skin_id called")
     return name.lower().replace(" ", "_")
 
 def sanitize_mod_name(name):
 
-    print(f"[DEBUG] sanitize_mod_name called")
+    log.debug("sanitize_mod_name called")
     return name.strip().replace(" ", "_")
 
 def get_beamng_mods_path():
 
-    print(f"[DEBUG] get_beamng_mods_path called")
+    log.debug("get_beamng_mods_path called")
     username = getpass.getuser()
     return os.path.join(
         "C:\\Users",
@@ -39,7 +44,7 @@ def get_beamng_mods_path():
 
 def zip_folder(source_dir, zip_path):
 
-    print(f"[DEBUG] zip_folder called")
+    log.debug("zip_folder called")
     with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
         for root_dir, _, files in os.walk(source_dir):
             for file in files:
@@ -48,52 +53,52 @@ def zip_folder(source_dir, zip_path):
                 zipf.write(full_path, relative_path)
 
 def create_vehicle_folders(carid):
-    print(f"[DEBUG] create_vehicle_folders called for: {carid}")
+    log.debug("create_vehicle_folders called for: %s", carid)
 
     vehicle_path = os.path.join(VEHICLE_FOLDER, carid, "SKINNAME")
     os.makedirs(vehicle_path, exist_ok=True)
 
-    print(f"[DEBUG] Created vehicle folders: {vehicle_path}")
+    log.debug("Created vehicle folders: %s", vehicle_path)
     return True
 
 def delete_vehicle_folders(carid):
-    print(f"[DEBUG] delete_vehicle_folders called for: {carid}")
+    log.debug("delete_vehicle_folders called for: %s", carid)
 
     try:
 
         vehicle_path = os.path.join(VEHICLE_FOLDER, carid)
         if os.path.exists(vehicle_path):
             shutil.rmtree(vehicle_path)
-            print(f"[DEBUG] Deleted vehicle folder: {vehicle_path}")
+            log.debug("Deleted vehicle folder: %s", vehicle_path)
 
         preview_path = os.path.join("imagesforgui", "vehicles", carid)
         if os.path.exists(preview_path):
             shutil.rmtree(preview_path)
-            print(f"[DEBUG] Deleted preview folder: {preview_path}")
+            log.debug("Deleted preview folder: %s", preview_path)
 
         return True
     except Exception as e:
-        print(f"[ERROR] Failed to delete vehicle folders: {e}")
+        log.error("Failed to delete vehicle folders: %s", e)
         raise
 
 def load_added_vehicles_json():
-    print(f"[DEBUG] load_added_vehicles_json called")
+    log.debug("load_added_vehicles_json called")
 
     if not os.path.exists(ADDED_VEHICLES_JSON):
-        print(f"[DEBUG] {ADDED_VEHICLES_JSON} not found, returning empty dict")
+        log.debug("%s not found, returning empty dict", ADDED_VEHICLES_JSON)
         return {}
 
     try:
         with open(ADDED_VEHICLES_JSON, 'r', encoding='utf-8') as f:
             vehicles = json.load(f)
-            print(f"[DEBUG] Loaded {len(vehicles)} vehicles from {ADDED_VEHICLES_JSON}")
+            log.debug("Loaded %s vehicles from %s", len(vehicles), ADDED_VEHICLES_JSON)
             return vehicles
     except Exception as e:
-        print(f"[ERROR] Failed to load {ADDED_VEHICLES_JSON}: {e}")
+        log.error("Failed to load %s: %s", ADDED_VEHICLES_JSON, e)
         return {}
 
 def save_added_vehicles_json(vehicles_dict):
-    print(f"[DEBUG] save_added_vehicles_json called with {len(vehicles_dict)} vehicles")
+    log.debug("save_added_vehicles_json called with %s vehicles", len(vehicles_dict))
 
     try:
 
@@ -101,14 +106,14 @@ def save_added_vehicles_json(vehicles_dict):
 
         with open(ADDED_VEHICLES_JSON, 'w', encoding='utf-8') as f:
             json.dump(vehicles_dict, f, indent=2)
-        print(f"[DEBUG] Successfully saved to {ADDED_VEHICLES_JSON}")
+        log.debug("Successfully saved to %s", ADDED_VEHICLES_JSON)
         return True
     except Exception as e:
-        print(f"[ERROR] Failed to save {ADDED_VEHICLES_JSON}: {e}")
+        log.error("Failed to save %s: %s", ADDED_VEHICLES_JSON, e)
         raise
 
 def add_vehicle_to_json(carid, carname):
-    print(f"[DEBUG] add_vehicle_to_json called: {carid} = {carname}")
+    log.debug("add_vehicle_to_json called: %s = %s", carid, carname)
 
     vehicles = load_added_vehicles_json()
 
@@ -116,25 +121,25 @@ def add_vehicle_to_json(carid, carname):
 
     save_added_vehicles_json(vehicles)
 
-    print(f"[DEBUG] Vehicle {carid} added to JSON successfully")
+    log.debug("Vehicle %s added to JSON successfully", carid)
     return True
 
 def remove_vehicle_from_json(carid):
-    print(f"[DEBUG] remove_vehicle_from_json called: {carid}")
+    log.debug("remove_vehicle_from_json called: %s", carid)
 
     vehicles = load_added_vehicles_json()
 
     if carid in vehicles:
         del vehicles[carid]
         save_added_vehicles_json(vehicles)
-        print(f"[DEBUG] Vehicle {carid} removed from JSON successfully")
+        log.debug("Vehicle %s removed from JSON successfully", carid)
         return True
     else:
-        print(f"[WARNING] Vehicle {carid} not found in JSON")
+        log.warning("Vehicle %s not found in JSON", carid)
         return False
 
 def fix_stage_two_material_properties(stage2, carid, prefix):
-    print(f"[DEBUG] Fixing Stage 2 material properties for prefix: {prefix}...")
+    log.debug("Fixing Stage 2 material properties for prefix: %s...", prefix)
 
     properties_to_remove = [
         "instanceDiffuse",
@@ -150,7 +155,7 @@ def fix_stage_two_material_properties(stage2, carid, prefix):
         if prop in stage2:
             del stage2[prop]
             removed_count += 1
-            print(f"[DEBUG]   ✓ Removed incorrect property: {prop}")
+            log.debug("  ✓ Removed incorrect property: %s", prop)
 
     required_properties = {
         "baseColorMap": "vehicles/carid/skinname/carid_skin_skinname.dds",
@@ -164,48 +169,135 @@ def fix_stage_two_material_properties(stage2, carid, prefix):
         if prop not in stage2:
             stage2[prop] = value
             added_count += 1
-            print(f"[DEBUG]   ✓ Added missing property: {prop} = {value}")
+            log.debug("  ✓ Added missing property: %s = %s", prop, value)
         elif prop == "baseColorMap":
 
             old_value = stage2[prop]
             stage2[prop] = value
-            print(f"[DEBUG]   ✓ Replaced baseColorMap:")
-            print(f"[DEBUG]     Old: {old_value}")
-            print(f"[DEBUG]     New: {value}")
+            log.debug("  ✓ Replaced baseColorMap:")
+            log.debug("    Old: %s", old_value)
+            log.debug("    New: %s", value)
 
     if removed_count > 0:
-        print(f"[DEBUG] Removed {removed_count} incorrect properties from Stage 2")
+        log.debug("Removed %s incorrect properties from Stage 2", removed_count)
     if added_count > 0:
-        print(f"[DEBUG] Added {added_count} missing properties to Stage 2")
+        log.debug("Added %s missing properties to Stage 2", added_count)
 
     return stage2
 
+# Prefixes whose "<prefix>.skin<suffix>.<skinname>" entries make up a vehicle skin
+SKIN_MATERIAL_PREFIX_SUFFIXES = ("", "_body", "_extra", "_aftermarket", "_main", "_mechanical")
+
+MATERIAL_FIELDS_TO_REMOVE = (
+    "colorPaletteMap",
+    "colorPaletteMapUseUV",
+    "clearCoatFactor",
+    "clearCoatRoughnessFactor",
+    "instanceDiffuse",
+    "metallicFactor"
+)
+
+STAGE_FIELDS_TO_REMOVE = ("colorPaletteMap", "colorPaletteMapUseUV")
+
+@functools.lru_cache(maxsize=64)
+def _skin_key_pattern(carid):
+    """
+    Single precompiled pattern for every skin material key of a vehicle.
+    Group 1 is the matched prefix (e.g. "etk800_body"), group 2 the skin name.
+    The suffixes are mutually exclusive because each is followed by a literal ".skin".
+    """
+    alternation = "|".join(re.escape(f"{carid}{suffix}") for suffix in SKIN_MATERIAL_PREFIX_SUFFIXES)
+    return re.compile(rf"^({alternation})\.skin[^.]*\.(.+)$")
+
+def _normalize_skin_material(value, selected_skinname, carid, prefix, normalized_key):
+    """
+    Build the template version of one skin material without touching the source.
+
+    Copy-on-write: only the material dict and the (at most two) kept Stage dicts
+    are shallow-copied, since those are the only containers that get modified.
+    """
+    new_value = dict(value)
+
+    if "name" in new_value and isinstance(new_value["name"], str):
+        # First remove _lbe if present, then replace the skinname
+        new_value["name"] = new_value["name"].replace(".skin_lbe.", ".skin.").replace(selected_skinname, "skinname")
+
+    if "mapTo" in new_value and isinstance(new_value["mapTo"], str):
+        # First remove _lbe if present, then replace the skinname
+        new_value["mapTo"] = new_value["mapTo"].replace(".skin_lbe.", ".skin.").replace(selected_skinname, "skinname")
+
+    for field in MATERIAL_FIELDS_TO_REMOVE:
+        if field in new_value:
+            del new_value[field]
+            log.debug("Removed field: %s from %s", field, normalized_key)
+
+    stages = new_value.get("Stages")
+    if isinstance(stages, list):
+        original_length = len(stages)
+        kept_stages = [dict(stage) if isinstance(stage, dict) else stage for stage in stages[:2]]
+
+        for stage in kept_stages:
+            if isinstance(stage, dict) and isinstance(stage.get("baseColorMap"), str):
+                stage["baseColorMap"] = stage["baseColorMap"].replace(selected_skinname, "skinname")
+
+        if len(kept_stages) >= 2 and isinstance(kept_stages[1], dict):
+            kept_stages[1] = fix_stage_two_material_properties(kept_stages[1], carid, prefix)
+
+        for stage_idx, stage in enumerate(kept_stages):
+            if isinstance(stage, dict):
+                for field in STAGE_FIELDS_TO_REMOVE:
+                    if field in stage:
+                        del stage[field]
+                        log.debug("Removed %s from %s Stage %s", field, normalized_key, stage_idx)
+
+        new_value["Stages"] = kept_stages
+        log.debug("Trimmed Stages array in %s: %s -> %s stages", normalized_key, original_length, len(kept_stages))
+
+    return new_value
+
 def edit_material_json(source_json_path, target_folder, carid):
-    print(f"[DEBUG] edit_material_json called")
-    print(f"[DEBUG]   Source: {source_json_path}")
-    print(f"[DEBUG]   Target: {target_folder}")
-    print(f"[DEBUG]   CarID: {carid}")
+    log.debug("edit_material_json called")
+    log.debug("  Source: %s", source_json_path)
+
+    with open(source_json_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    return edit_material_json_content(content, os.path.basename(source_json_path), target_folder, carid)
+
+def edit_material_json_content(content, source_basename, target_folder, carid, output_name=None):
+    """
+    Build the SKINNAME materials template from materials text already in memory
+    (e.g. read straight from a game zip).
+
+    Args:
+        content: Source materials file text
+        source_basename: Source file name, used to pick the output name
+        target_folder: SKINNAME folder to write into
+        carid: Vehicle ID
+        output_name: Optional explicit output file name
+    """
+    log.debug("edit_material_json_content called")
+    log.debug("  Source name: %s", source_basename)
+    log.debug("  Target: %s", target_folder)
+    log.debug("  CarID: %s", carid)
 
     try:
 
-        source_basename = os.path.basename(source_json_path)
-
-        if source_basename.startswith("skin."):
-            output_name = "skin.materials.json"
-        else:
-            output_name = "materials.json"
+        if output_name is None:
+            if source_basename.startswith("skin."):
+                output_name = "skin.materials.json"
+            else:
+                output_name = "materials.json"
 
         target_path = os.path.join(target_folder, output_name)
-
-        with open(source_json_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        original_content = content
 
         try:
             data = json.loads(content)
-            print(f"[DEBUG] Parsed JSON successfully (standard format)")
+            log.debug("Parsed JSON successfully (standard format)")
         except json.JSONDecodeError as e:
-            print(f"[DEBUG] Standard JSON parse failed: {e}")
-            print(f"[DEBUG] Attempting to fix JSON5 format (trailing commas, comments)...")
+            log.debug("Standard JSON parse failed: %s", e)
+            log.debug("Attempting to fix JSON5 format (trailing commas, comments)...")
 
             content = re.sub(r'//[^\n]*', '', content)
 
@@ -215,52 +307,39 @@ def edit_material_json(source_json_path, target_folder, carid):
 
             try:
                 data = json.loads(content)
-                print(f"[DEBUG] Successfully parsed after JSON5 fixes")
+                log.debug("Successfully parsed after JSON5 fixes")
             except json.JSONDecodeError as e2:
-                print(f"[ERROR] Still cannot parse JSON after fixes: {e2}")
-                print(f"[DEBUG] Falling back to direct copy without validation...")
+                log.error("Still cannot parse JSON after fixes: %s", e2)
+                log.debug("Falling back to direct copy without validation...")
 
-                with open(source_json_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
                 with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                print(f"[DEBUG] Copied file directly (BeamNG will parse it)")
+                    f.write(original_content)
+                log.debug("Copied file directly (BeamNG will parse it)")
                 return True
 
-        skin_pattern_prefixes = [
-            f"{carid}",
-            f"{carid}_body",
-            f"{carid}_extra",
-            f"{carid}_aftermarket",
-            f"{carid}_main",
-            f"{carid}_mechanical"
-        ]
+        skin_key_pattern = _skin_key_pattern(carid)
 
         skin_groups = {}
 
-        print(f"[DEBUG] Scanning for skin entries matching carid: {carid}")
+        log.debug("Scanning for skin entries matching carid: %s", carid)
 
         for key, value in data.items():
 
-            for prefix in skin_pattern_prefixes:
+            match = skin_key_pattern.match(key)
 
-                pattern = rf"^{re.escape(prefix)}\.skin[^.]*\.(.+)$"
-                match = re.match(pattern, key)
+            if match:
 
-                if match:
+                prefix, skinname = match.group(1), match.group(2)
 
-                    skinname = match.group(1)
+                if skinname:
 
-                    if skinname:
-
-                        if skinname not in skin_groups:
-                            skin_groups[skinname] = {}
-                        skin_groups[skinname][key] = (key, value, prefix)
-                        print(f"[DEBUG] Found skin entry: {key} (skinname: {skinname})")
-                    break
+                    if skinname not in skin_groups:
+                        skin_groups[skinname] = {}
+                    skin_groups[skinname][key] = (key, value, prefix)
+                    log.debug("Found skin entry: %s (skinname: %s)", key, skinname)
 
         if not skin_groups:
-            print(f"[WARNING] No skin entries found matching carid: {carid}")
+            log.warning("No skin entries found matching carid: %s", carid)
             with open(target_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
             return True
@@ -268,8 +347,8 @@ def edit_material_json(source_json_path, target_folder, carid):
         selected_skinname = max(skin_groups.keys(), key=lambda k: len(skin_groups[k]))
         selected_entries = skin_groups[selected_skinname]
 
-        print(f"[DEBUG] Selected skinname: {selected_skinname} ({len(selected_entries)} entries)")
-        print(f"[DEBUG] Available skin groups: {list(skin_groups.keys())}")
+        log.debug("Selected skinname: %s (%s entries)", selected_skinname, len(selected_entries))
+        log.debug("Available skin groups: %s", list(skin_groups.keys()))
 
         filtered_data = {}
 
@@ -277,87 +356,31 @@ def edit_material_json(source_json_path, target_folder, carid):
 
             normalized_key = f"{prefix}.skin.skinname"
 
-            print(f"[DEBUG] Transforming: {original_key} → {normalized_key}")
-
-            import copy
-            new_value = copy.deepcopy(value)
-
-            if "name" in new_value and isinstance(new_value["name"], str):
-                # First remove _lbe if present
-                new_value["name"] = new_value["name"].replace(".skin_lbe.", ".skin.")
-                # Then replace the skinname
-                new_value["name"] = new_value["name"].replace(selected_skinname, "skinname")
-
-            if "mapTo" in new_value and isinstance(new_value["mapTo"], str):
-                # First remove _lbe if present
-                new_value["mapTo"] = new_value["mapTo"].replace(".skin_lbe.", ".skin.")
-                # Then replace the skinname
-                new_value["mapTo"] = new_value["mapTo"].replace(selected_skinname, "skinname")
-
-            if "Stages" in new_value and isinstance(new_value["Stages"], list):
-                for stage in new_value["Stages"]:
-                    if isinstance(stage, dict) and "baseColorMap" in stage:
-                        if isinstance(stage["baseColorMap"], str):
-                            stage["baseColorMap"] = stage["baseColorMap"].replace(selected_skinname, "skinname")
-
-            if "Stages" in new_value and isinstance(new_value["Stages"], list):
-                if len(new_value["Stages"]) >= 2:
-                    stage2 = new_value["Stages"][1]
-                    if isinstance(stage2, dict):
-
-                        new_value["Stages"][1] = fix_stage_two_material_properties(stage2, carid, prefix)
-
-            fields_to_remove = [
-                "colorPaletteMap",
-                "colorPaletteMapUseUV",
-                "clearCoatFactor",
-                "clearCoatRoughnessFactor",
-                "instanceDiffuse",
-                "metallicFactor"
-            ]
-
-            for field in fields_to_remove:
-                if field in new_value:
-                    del new_value[field]
-                    print(f"[DEBUG] Removed field: {field} from {normalized_key}")
-
-            if "Stages" in new_value and isinstance(new_value["Stages"], list):
-                original_length = len(new_value["Stages"])
-
-                new_value["Stages"] = new_value["Stages"][:2]
-
-                stage_fields_to_remove = ["colorPaletteMap", "colorPaletteMapUseUV"]
-                for stage_idx, stage in enumerate(new_value["Stages"]):
-                    if isinstance(stage, dict):
-                        for field in stage_fields_to_remove:
-                            if field in stage:
-                                del stage[field]
-                                print(f"[DEBUG] Removed {field} from {normalized_key} Stage {stage_idx}")
-
-                new_length = len(new_value["Stages"])
-                print(f"[DEBUG] Trimmed Stages array in {normalized_key}: {original_length} -> {new_length} stages")
+            log.debug("Transforming: %s → %s", original_key, normalized_key)
+
+            new_value = _normalize_skin_material(value, selected_skinname, carid, prefix, normalized_key)
 
             filtered_data[normalized_key] = new_value
-            print(f"[DEBUG] Transformed: {original_key} -> {normalized_key}")
+            log.debug("Transformed: %s -> %s", original_key, normalized_key)
 
         with open(target_path, 'w', encoding='utf-8') as f:
             json.dump(filtered_data, f, indent=2)
 
-        print(f"[DEBUG] Wrote {len(filtered_data)} skin entries to: {target_path}")
-        print(f"[DEBUG] Removed {len(data) - len(filtered_data)} non-matching entries")
+        log.debug("Wrote %s skin entries to: %s", len(filtered_data), target_path)
+        log.debug("Removed %s non-matching entries", len(data) - len(filtered_data))
         return True
 
     except Exception as e:
-        print(f"[ERROR] Failed to process materials JSON: {e}")
+        log.error("Failed to process materials JSON: %s", e)
         import traceback
         traceback.print_exc()
         raise
 
 def edit_jbeam_material(source_jbeam_path, target_folder, carid):
-    print(f"[DEBUG] edit_jbeam_material called")
-    print(f"[DEBUG]   Source: {source_jbeam_path}")
-    print(f"[DEBUG]   Target: {target_folder}")
-    print(f"[DEBUG]   CarID: {carid}")
+    log.debug("edit_jbeam_material called")
+    log.debug("  Source: %s", source_jbeam_path)
+    log.debug("  Target: %s", target_folder)
+    log.debug("  CarID: %s", carid)
 
     try:
 
@@ -379,20 +402,20 @@ def edit_jbeam_material(source_jbeam_path, target_folder, carid):
         with open(target_path, 'w', encoding='utf-8') as f:
             f.write(template)
 
-        print(f"[DEBUG] Created template JBeam file: {target_path}")
-        print(f"[DEBUG] Template uses carid: {carid}")
+        log.debug("Created template JBeam file: %s", target_path)
+        log.debug("Template uses carid: %s", carid)
         return True
 
     except Exception as e:
-        print(f"[ERROR] Failed to process JBeam file: {e}")
+        log.error("Failed to process JBeam file: %s", e)
         import traceback
         traceback.print_exc()
         raise
 
 def edit_info_json(source_json_path, target_folder):
-    print(f"[DEBUG] edit_info_json called")
-    print(f"[DEBUG]   Source: {source_json_path}")
-    print(f"[DEBUG]   Target: {target_folder}")
+    log.debug("edit_info_json called")
+    log.debug("  Source: %s", source_json_path)
+    log.debug("  Target: %s", target_folder)
 
     try:
 
@@ -407,11 +430,11 @@ def edit_info_json(source_json_path, target_folder):
         with open(target_path, 'w', encoding='utf-8') as f:
             json.dump(info_template, f, indent=2)
 
-        print(f"[DEBUG] Created template info file: {target_path}")
+        log.debug("Created template info file: %s", target_path)
         return True
 
     except Exception as e:
-        print(f"[ERROR] Failed to process info JSON: {e}")
+        log.error("Failed to process info JSON: %s", e)
         import traceback
         traceback.print_exc()
         raise
@@ -427,7 +450,7 @@ def create_single_skin_mod(
     progress_callback=None
 ):
 
-    print(f"[DEBUG] create_single_skin_mod called")
+    log.debug("create_single_skin_mod called")
     temp_dir = tempfile.mkdtemp(prefix="beamng_mod_")
 
     try:
@@ -523,7 +546,7 @@ def create_multi_skin_mod(
     progress_callback=None
 ):
 
-    print(f"[DEBUG] create_multi_skin_mod called")
+    log.debug("create_multi_skin_mod called")
     temp_dir = tempfile.mkdtemp(prefix="beamng_mod_multi_")
 
     try:
@@ -558,7 +581,7 @@ def create_multi_skin_mod(
             template_path = os.path.join(VEHICLE_FOLDER, vehicle_id, "SKINNAME")
 
             if not os.path.exists(template_path):
-                print(f"[WARNING] No template found for vehicle '{vehicle_id}', skipping...")
+                log.warning("No template found for vehicle '%s', skipping...", vehicle_id)
                 continue
 
             mod_vehicle_dir = os.path.join(temp_dir, "vehicles", vehicle_id, skin_id)
@@ -628,12 +651,13 @@ def create_multi_skin_mod(
                 f"Please choose a different name or delete the existing file."
             )
 
-        print(f"\n[DEBUG] Files being zipped from {temp_dir}:")
-        for root, dirs, files in os.walk(temp_dir):
-            for file in files:
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, temp_dir)
-                print(f"[DEBUG]   {rel_path}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Files being zipped from %s:", temp_dir)
+            for root, dirs, files in os.walk(temp_dir):
+                for file in files:
+                    full_path = os.path.join(root, file)
+                    rel_path = os.path.relpath(full_path, temp_dir)
+                    log.debug("  %s", rel_path)
 
         zip_folder(temp_dir, zip_path)
 
@@ -655,7 +679,7 @@ def create_multi_skin_mod(
 
 def process_jbeam_files(folder_path, dds_identifier, skin_display_name, author):
 
-    print(f"[DEBUG] process_jbeam_files called")
+    log.debug("process_jbeam_files called")
     for root_dir, _, files in os.walk(folder_path):
         for file in files:
             if not file.endswith(".jbeam"):
@@ -682,7 +706,7 @@ def process_jbeam_files(folder_path, dds_identifier, skin_display_name, author):
             )
 
             def replace_first_skin_key(match):
-                print(f"[DEBUG] replace_first_skin_key called")
+                log.debug("replace_first_skin_key called")
                 return f'"{match.group(1)}{dds_identifier}":'
 
             content = re.sub(
@@ -699,7 +723,7 @@ def process_jbeam_files(folder_path, dds_identifier, skin_display_name, author):
             )
 
             def replace_extra_skin(match):
-                print(f"[DEBUG] replace_extra_skin called")
+                log.debug("replace_extra_skin called")
                 return f'"{match.group(1)}{dds_identifier}"'
 
             content = re.sub(
@@ -710,7 +734,7 @@ def process_jbeam_files(folder_path, dds_identifier, skin_display_name, author):
 
             def replace_extra_skin_name(match):
 
-                print(f"[DEBUG] replace_extra_skin_name called")
+                log.debug("replace_extra_skin_name called")
                 return f'{match.group(1)}{dds_identifier}"'
 
             content = re.sub(
@@ -728,10 +752,10 @@ def process_jbeam_files(folder_path, dds_identifier, skin_display_name, author):
                 f.write(content)
 
 def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename, dds_identifier):
-    print(f"[DEBUG] process_json_files called")
-    print(f"[DEBUG]   vehicle_id: {vehicle_id}")
-    print(f"[DEBUG]   skin_folder_name: {skin_folder_name}")
-    print(f"[DEBUG]   dds_identifier: {dds_identifier}")
+    log.debug("process_json_files called")
+    log.debug("  vehicle_id: %s", vehicle_id)
+    log.debug("  skin_folder_name: %s", skin_folder_name)
+    log.debug("  dds_identifier: %s", dds_identifier)
 
     for root_dir, _, files in os.walk(folder_path):
         for file in files:
@@ -739,7 +763,7 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
                 continue
 
             file_path = os.path.join(root_dir, file)
-            print(f"[DEBUG] Processing JSON file: {file_path}")
+            log.debug("Processing JSON file: %s", file_path)
 
             try:
 
@@ -750,7 +774,7 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
                     if not isinstance(material_data, dict):
                         continue
 
-                    print(f"[DEBUG]   Processing material: {material_key}")
+                    log.debug("  Processing material: %s", material_key)
 
                     if "name" in material_data and (".skin." in material_data["name"] or ".skin_lbe." in material_data["name"]):
                         old_name = material_data["name"]
@@ -763,7 +787,7 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
                             material_data["name"]
                         )
                         if old_name != material_data["name"]:
-                            print(f"[DEBUG]     Updated name: {old_name} -> {material_data['name']}")
+                            log.debug("    Updated name: %s -> %s", old_name, material_data['name'])
 
                     if "mapTo" in material_data and (".skin." in material_data["mapTo"] or ".skin_lbe." in material_data["mapTo"]):
                         old_mapTo = material_data["mapTo"]
@@ -776,7 +800,7 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
                             material_data["mapTo"]
                         )
                         if old_mapTo != material_data["mapTo"]:
-                            print(f"[DEBUG]     Updated mapTo: {old_mapTo} -> {material_data['mapTo']}")
+                            log.debug("    Updated mapTo: %s -> %s", old_mapTo, material_data['mapTo'])
 
                     if "Stages" in material_data and isinstance(material_data["Stages"], list):
                         stages = material_data["Stages"]
@@ -789,21 +813,21 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
                             if "baseColorMap" in stage2:
                                 original_path = stage2["baseColorMap"]
                                 stage2["baseColorMap"] = new_path
-                                print(f"[DEBUG]     Updated Stage 2 baseColorMap:")
-                                print(f"[DEBUG]       From: {original_path}")
-                                print(f"[DEBUG]       To:   {new_path}")
+                                log.debug("    Updated Stage 2 baseColorMap:")
+                                log.debug("      From: %s", original_path)
+                                log.debug("      To:   %s", new_path)
                             else:
                                 stage2["baseColorMap"] = new_path
-                                print(f"[DEBUG]     Added Stage 2 baseColorMap: {new_path}")
+                                log.debug("    Added Stage 2 baseColorMap: %s", new_path)
 
                 with open(file_path, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
 
-                print(f"[DEBUG]   Successfully processed: {file_path}")
+                log.debug("  Successfully processed: %s", file_path)
 
             except json.JSONDecodeError as e:
-                print(f"[ERROR] Failed to parse JSON file {file_path}: {e}")
-                print(f"[DEBUG] Falling back to regex-based processing for malformed JSON")
+                log.error("Failed to parse JSON file %s: %s", file_path, e)
+                log.debug("Falling back to regex-based processing for malformed JSON")
 
                 try:
                     with open(file_path, "r", encoding="utf-8") as f:
@@ -864,23 +888,23 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
                     with open(file_path, "w", encoding="utf-8") as f:
                         f.write(content)
 
-                    print(f"[DEBUG]   Processed via regex fallback: {file_path}")
+                    log.debug("  Processed via regex fallback: %s", file_path)
 
                 except Exception as fallback_error:
-                    print(f"[ERROR] Regex fallback also failed for {file_path}: {fallback_error}")
+                    log.error("Regex fallback also failed for %s: %s", file_path, fallback_error)
                     import traceback
                     traceback.print_exc()
 
             except Exception as e:
-                print(f"[ERROR] Failed to process {file_path}: {e}")
+                log.error("Failed to process %s: %s", file_path, e)
                 import traceback
                 traceback.print_exc()
 
 def process_skin_config_data(skin, vehicle_id, skin_id, temp_dir, template_path):
-    print(f"[DEBUG] process_skin_config_data called for {skin_id}")
+    log.debug("process_skin_config_data called for %s", skin_id)
 
     if "config_data" not in skin:
-        print(f"[DEBUG] No config data found for {skin_id}")
+        log.debug("No config data found for %s", skin_id)
         return True
 
     try:
@@ -894,11 +918,11 @@ def process_skin_config_data(skin, vehicle_id, skin_id, temp_dir, template_path)
         with open(config_file_path, 'w', encoding='utf-8') as f:
             json.dump(config_data, f, indent=2)
 
-        print(f"[DEBUG] Created config file: {config_file_path}")
+        log.debug("Created config file: %s", config_file_path)
         return True
 
     except Exception as e:
-        print(f"[ERROR] Failed to process config data: {e}")
+        log.error("Failed to process config data: %s", e)
         import traceback
         traceback.print_exc()
         return False
\ No newline at end of file
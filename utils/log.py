@@ -0,0 +1,76 @@
+"""
+Log - Level-gated logging for hot paths
+
+Modules create a logger with get_logger(__name__) and log with %-style
+arguments (log.debug("Copied %s", path)), so nothing is formatted unless the
+record's level is enabled. Records are written to the current sys.stdout as
+"[LEVEL] message", the same shape as the print-based output, so the debug
+console's level filter and file sink see them too.
+
+Levels come from app_settings:
+    "log_level":  level of everything (default INFO)
+    "log_levels": {"core.file_ops": "DEBUG", ...} per-module overrides
+"""
+import logging
+import sys
+
+DEFAULT_LOG_LEVEL = "INFO"
+
+# Third-party loggers that are far too chatty at DEBUG
+QUIET_LOGGERS = ("PIL",)
+
+
+class _StdoutHandler(logging.Handler):
+    """Writes to whatever sys.stdout is at emit time (it is swapped by the debug console)"""
+
+    def emit(self, record):
+        try:
+            stream = sys.stdout
+            if stream is not None:
+                stream.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+_handler = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module (pass __name__)"""
+    return logging.getLogger(name)
+
+
+def _parse_level(level, default: int) -> int:
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    if isinstance(value, int):
+        return value
+    print(f"[WARNING] Unknown log level '{level}', using {logging.getLevelName(default)}")
+    return default
+
+
+def configure_logging(settings: dict) -> None:
+    """
+    Install the stdout handler and apply the levels from app settings.
+    Safe to call again after the settings changed.
+
+    Args:
+        settings: app_settings dict
+    """
+    global _handler
+
+    root = logging.getLogger()
+    if _handler is None:
+        _handler = _StdoutHandler()
+        _handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        root.addHandler(_handler)
+
+    default_level = logging.getLevelName(DEFAULT_LOG_LEVEL)
+    root.setLevel(_parse_level(settings.get("log_level", DEFAULT_LOG_LEVEL), default_level))
+
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    for name, level in (settings.get("log_levels") or {}).items():
+        logging.getLogger(name).setLevel(_parse_level(level, default_level))
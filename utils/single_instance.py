@@ -6,14 +6,17 @@ import os
 import sys
 import tempfile
 import platform
+from utils.log import get_logger
 
-print(f"[DEBUG] Loading class: SingleInstanceLock")
+log = get_logger(__name__)
+
+log.debug("Loading class: SingleInstanceLock")
 
 class SingleInstanceLock:
     """Ensures only one instance of the application can run at a time"""
 
     def __init__(self, app_name="BeamSkinStudio"):
-        print(f"[DEBUG] __init__ called")
+        log.debug("__init__ called")
         self.app_name = app_name
         self.lock_file = None
         self.lock_file_path = None
@@ -30,10 +33,10 @@ class SingleInstanceLock:
             lock_dir = os.environ.get('XDG_RUNTIME_DIR', tempfile.gettempdir())
 
         self.lock_file_path = os.path.join(lock_dir, f"{app_name}.lock")
-        print(f"[DEBUG] Lock file path: {self.lock_file_path}")
+        log.debug("Lock file path: %s", self.lock_file_path)
 
     def acquire(self):
-        print(f"[DEBUG] acquire called")
+        log.debug("acquire called")
         """Try to acquire the lock. Returns True if successful, False if another instance is running"""
         try:
 
@@ -43,15 +46,15 @@ class SingleInstanceLock:
                         pid = int(f.read().strip())
 
                     if self._is_process_running(pid):
-                        print(f"[DEBUG] Another instance is running (PID: {pid})")
+                        log.debug("Another instance is running (PID: %s)", pid)
                         return False
                     else:
 
-                        print(f"[DEBUG] Removing stale lock file (PID: {pid} not running)")
+                        log.debug("Removing stale lock file (PID: %s not running)", pid)
                         os.remove(self.lock_file_path)
                 except (ValueError, IOError):
 
-                    print(f"[DEBUG] Removing invalid lock file")
+                    log.debug("Removing invalid lock file")
                     try:
                         os.remove(self.lock_file_path)
                     except:
@@ -65,25 +68,25 @@ class SingleInstanceLock:
                     import fcntl
                     self.file_handle = open(self.lock_file_path, 'r')
                     fcntl.flock(self.file_handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                    print(f"[DEBUG] File lock acquired using fcntl")
+                    log.debug("File lock acquired using fcntl")
                 except ImportError:
-                    print(f"[DEBUG] fcntl not available, using PID-based locking only")
+                    log.debug("fcntl not available, using PID-based locking only")
                 except IOError:
-                    print(f"[DEBUG] Could not acquire file lock, another instance may be running")
+                    log.debug("Could not acquire file lock, another instance may be running")
                     if self.file_handle:
                         self.file_handle.close()
                     return False
 
             self.lock_file = self.lock_file_path
-            print(f"[DEBUG] Lock acquired: {self.lock_file_path}")
+            log.debug("Lock acquired: %s", self.lock_file_path)
             return True
 
         except Exception as e:
-            print(f"[ERROR] Failed to acquire lock: {e}")
+            log.error("Failed to acquire lock: %s", e)
             return True
 
     def release(self):
-        print(f"[DEBUG] release called")
+        log.debug("release called")
         """Release the lock by removing the lock file"""
 
         if self.file_handle:
@@ -91,16 +94,16 @@ class SingleInstanceLock:
                 import fcntl
                 fcntl.flock(self.file_handle.fileno(), fcntl.LOCK_UN)
                 self.file_handle.close()
-                print(f"[DEBUG] File lock released")
+                log.debug("File lock released")
             except:
                 pass
 
         if self.lock_file and os.path.exists(self.lock_file):
             try:
                 os.remove(self.lock_file)
-                print(f"[DEBUG] Lock released: {self.lock_file}")
+                log.debug("Lock released: %s", self.lock_file)
             except Exception as e:
-                print(f"[ERROR] Failed to release lock: {e}")
+                log.error("Failed to release lock: %s", e)
 
     def _is_process_running(self, pid):
         """Check if a process with the given PID is running"""
@@ -131,7 +134,7 @@ class SingleInstanceLock:
         self.release()
 
 def check_single_instance(app_name="BeamSkinStudio"):
-    print(f"[DEBUG] check_single_instance called")
+    log.debug("check_single_instance called")
     """
     Check if another instance is running and show error dialog if so.
     Returns True if this is the only instance, False otherwise.
@@ -139,7 +142,7 @@ def check_single_instance(app_name="BeamSkinStudio"):
     lock = SingleInstanceLock(app_name)
 
     if not lock.acquire():
-        print(f"[DEBUG] Another instance detected, attempting to bring it to front...")
+        log.debug("Another instance detected, attempting to bring it to front...")
 
         try:
             if sys.platform == "win32":
@@ -149,7 +152,7 @@ def check_single_instance(app_name="BeamSkinStudio"):
                     import win32con
 
                     def callback(hwnd, extra):
-                        print(f"[DEBUG] callback called")
+                        log.debug("callback called")
                         if app_name.lower() in win32gui.GetWindowText(hwnd).lower():
                             win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
                             win32gui.SetForegroundWindow(hwnd)
@@ -158,7 +161,7 @@ def check_single_instance(app_name="BeamSkinStudio"):
 
                     win32gui.EnumWindows(callback, None)
                 except ImportError:
-                    print("[DEBUG] pywin32 not available, cannot bring window to front")
+                    log.debug("pywin32 not available, cannot bring window to front")
 
             elif sys.platform == "linux" or sys.platform == "linux2":
 
@@ -176,10 +179,10 @@ def check_single_instance(app_name="BeamSkinStudio"):
                             if 'BeamSkin Studio' in line or app_name in line:
                                 window_id = line.split()[0]
                                 subprocess.run(['wmctrl', '-i', '-a', window_id])
-                                print(f"[DEBUG] Activated existing window using wmctrl")
+                                log.debug("Activated existing window using wmctrl")
                                 break
                 except (subprocess.SubprocessError, FileNotFoundError):
-                    print("[DEBUG] wmctrl not available, cannot bring window to front")
+                    log.debug("wmctrl not available, cannot bring window to front")
 
             elif sys.platform == "darwin":
 
@@ -190,12 +193,12 @@ def check_single_instance(app_name="BeamSkinStudio"):
                         'osascript', '-e',
                         f'tell application "System Events" to set frontmost of every process whose name contains "{app_name}" to true'
                     ], timeout=2)
-                    print(f"[DEBUG] Activated existing window using osascript")
+                    log.debug("Activated existing window using osascript")
                 except (subprocess.SubprocessError, FileNotFoundError):
-                    print("[DEBUG] osascript not available, cannot bring window to front")
+                    log.debug("osascript not available, cannot bring window to front")
 
         except Exception as e:
-            print(f"[DEBUG] Could not bring existing window to front: {e}")
+            log.debug("Could not bring existing window to front: %s", e)
 
         try:
             import tkinter as tk
@@ -217,8 +220,8 @@ def check_single_instance(app_name="BeamSkinStudio"):
             )
             root.destroy()
         except Exception as e:
-            print(f"[ERROR] Failed to show dialog: {e}")
-            print(f"[ERROR] {app_name} is already running!")
+            log.error("Failed to show dialog: %s", e)
+            log.error("%s is already running!", app_name)
 
         return False
 
@@ -227,14 +230,14 @@ def check_single_instance(app_name="BeamSkinStudio"):
 _global_lock = None
 
 def acquire_global_lock(app_name="BeamSkinStudio"):
-    print(f"[DEBUG] acquire_global_lock called")
+    log.debug("acquire_global_lock called")
     """Acquire a global lock. Call this at program start."""
     global _global_lock
     _global_lock = SingleInstanceLock(app_name)
     return _global_lock.acquire()
 
 def release_global_lock():
-    print(f"[DEBUG] release_global_lock called")
+    log.debug("release_global_lock called")
     """Release the global lock. Call this at program exit."""
     global _global_lock
     if _global_lock: